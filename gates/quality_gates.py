@@ -10,7 +10,7 @@ import re
 import xml.etree.ElementTree as ET
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 
 # ── Gate 1: Intake Validation ────────────────────────────────
@@ -147,39 +147,58 @@ def gate_5_template(plan_config: Dict, derived: Dict):
 
 # ── Gate 6: Workout Files ───────────────────────────────────
 
-def gate_6_workouts(workouts_dir: Path, derived: Dict):
-    """Validate ZWO files: count, valid XML, sane power targets."""
+def gate_6_workouts(workouts_dir: Path, derived: Dict, workouts: Optional[List] = None):
+    """Validate ZWO files: count, valid XML, sane power targets.
+
+    Step 6 passes its in-memory workouts so they're checked before being
+    written — only each workout's blocks need parsing. Without them the
+    .zwo files in workouts_dir are read from disk.
+    """
     plan_duration = derived["plan_duration"]
-    zwo_files = list(workouts_dir.glob("*.zwo"))
+    if workouts is None:
+        zwo_files = list(workouts_dir.glob("*.zwo"))
+        names = [f.name for f in zwo_files]
+    else:
+        names = [w.filename for w in workouts]
 
     # Expect 7 ZWO files per week, minus up to 6 for partial first week
     # (plan may start mid-week, so W01 has fewer days)
     min_expected = plan_duration * 7 - 6
-    assert len(zwo_files) >= min_expected, (
-        f"Gate 6: Too few ZWO files: {len(zwo_files)} (expected >= {min_expected} for {plan_duration} weeks)"
+    assert len(names) >= min_expected, (
+        f"Gate 6: Too few ZWO files: {len(names)} (expected >= {min_expected} for {plan_duration} weeks)"
     )
 
     # Verify strength workouts exist
-    strength_files = [f for f in zwo_files if "Strength" in f.name or "strength" in f.name]
+    strength_files = [n for n in names if "Strength" in n or "strength" in n]
     assert len(strength_files) > 0, "Gate 6: No strength workout ZWO files found"
 
     # Verify rest/recovery day files exist
-    rest_files = [f for f in zwo_files if "Rest" in f.name or "Off" in f.name or "Recovery_Day" in f.name]
+    rest_files = [n for n in names if "Rest" in n or "Off" in n or "Recovery_Day" in n]
     assert len(rest_files) > 0, "Gate 6: No rest/off-day ZWO files found"
 
     # Verify filename format: W01_1Mon_Feb02_Type.zwo (sortable, with dates)
     name_pattern = re.compile(
         r"^W\d{2}_[1-7](Mon|Tue|Wed|Thu|Fri|Sat|Sun)_[A-Z][a-z]{2}\d{2}_.+\.zwo$"
     )
-    for zwo in zwo_files:
-        if "Race_Day" in zwo.name:
+    for name in names:
+        if "Race_Day" in name:
             continue  # Race day has a different format
-        assert name_pattern.match(zwo.name), (
-            f"Gate 6: Bad filename format '{zwo.name}'. "
+        assert name_pattern.match(name), (
+            f"Gate 6: Bad filename format '{name}'. "
             f"Expected W{{week}}_{{daynum}}{{Day}}_{{MmmDD}}_{{Type}}.zwo "
             f"(e.g. W01_1Mon_Feb02_Strength_Base.zwo)"
         )
 
+    if workouts is not None:
+        # The rest of the document is generated from escaped text
+        for w in workouts:
+            try:
+                workout = ET.fromstring(f"<workout>{w.blocks}</workout>")
+            except ET.ParseError as e:
+                raise AssertionError(f"Gate 6: Invalid XML in {w.filename}: {e}")
+            _check_workout_targets(workout, w.filename)
+        return
+
     for zwo in zwo_files:
         try:
             tree = ET.parse(zwo)
@@ -193,26 +212,29 @@ def gate_6_workouts(workouts_dir: Path, derived: Dict):
 
         workout = root.find("workout")
         assert workout is not None, f"Gate 6: No <workout> element in {zwo.name}"
+        _check_workout_targets(workout, zwo.name)
 
-        # Power target sanity check
-        for elem in workout.iter():
-            for attr in ["Power", "PowerLow", "PowerHigh", "OnPower", "OffPower"]:
-                if attr in elem.attrib:
-                    try:
-                        power = float(elem.attrib[attr])
-                    except ValueError:
-                        continue
-                    assert 0.3 <= power <= 2.0, (
-                        f"Gate 6: Insane power target {power} in {zwo.name} ({attr})"
-                    )
-
-            # Duration must be positive
-            if "Duration" in elem.attrib:
+
+def _check_workout_targets(workout: ET.Element, name: str):
+    """Power targets within 30–200% FTP, durations positive."""
+    for elem in workout.iter():
+        for attr in ["Power", "PowerLow", "PowerHigh", "OnPower", "OffPower"]:
+            if attr in elem.attrib:
                 try:
-                    dur = int(elem.attrib["Duration"])
+                    power = float(elem.attrib[attr])
                 except ValueError:
                     continue
-                assert dur > 0, f"Gate 6: Zero/negative duration in {zwo.name}"
+                assert 0.3 <= power <= 2.0, (
+                    f"Gate 6: Insane power target {power} in {name} ({attr})"
+                )
+
+        # Duration must be positive
+        if "Duration" in elem.attrib:
+            try:
+                dur = int(elem.attrib["Duration"])
+            except ValueError:
+                continue
+            assert dur > 0, f"Gate 6: Zero/negative duration in {name}"
 
 
 # ── Gate 7: Guide Quality ───────────────────────────────────
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Gravel God MCP Server — 328-race gravel database for AI agents.
 
-Standalone FastMCP server. Loads race-index.json at startup, lazy-loads
-individual profiles from race-data/*.json. No dependency on mission_control.
+Standalone FastMCP server. Loads race-index.json at startup; profiles come
+from the shared race-data corpus snapshot (scripts/race_corpus.py) on first
+profile access. No dependency on mission_control.
 
 Tools:
     search_races       — filter + free-text search
@@ -31,6 +32,9 @@ from typing import Optional
 
 from fastmcp import FastMCP
 
+from scripts.race_corpus import load_corpus
+from scripts.race_query import RaceQueryIndex
+
 logger = logging.getLogger(__name__)
 
 PROJECT_ROOT = Path(__file__).resolve().parent
@@ -124,7 +128,9 @@ class RaceDB:
         self._index: list[dict] = []
         self._slug_set: set[str] = set()
         self._profiles: dict[str, dict] = {}
+        self._corpus: Optional[dict[str, dict]] = None
         self._regions: set[str] = set()
+        self._query: Optional[RaceQueryIndex] = None
         self._loaded_index = False
 
     def _ensure_index(self) -> None:
@@ -145,7 +151,7 @@ class RaceDB:
         self._loaded_index = True
 
     def _load_profile(self, slug: str) -> Optional[dict]:
-        """Lazy-load a single profile from disk.
+        """Look up a single profile in the race corpus (loaded on first use).
 
         Only accepts canonical slugs already validated against the index.
         """
@@ -160,29 +166,33 @@ class RaceDB:
             logger.warning("Rejected unsafe slug: %r", slug)
             return None
 
-        f = self._data_dir / f"{slug}.json"
-        # Verify the resolved path is still inside the data dir
-        try:
-            f.resolve().relative_to(self._data_dir.resolve())
-        except ValueError:
-            logger.warning("Path traversal attempt blocked: %r", slug)
-            return None
+        if self._corpus is None:
+            if self._data_dir.is_dir():
+                corpus = load_corpus(self._data_dir)
+                for name, err in corpus.errors.items():
+                    logger.error("Failed to load profile %s: %s", name, err)
+                self._corpus = corpus.profiles
+            else:
+                self._corpus = {}
 
-        if f.exists():
-            try:
-                data = json.loads(f.read_text())
-                self._profiles[slug] = data
-                return data
-            except (json.JSONDecodeError, OSError) as e:
-                logger.error("Failed to load profile %s: %s", slug, e)
-                return None
-        return None
+        data = self._corpus.get(slug)
+        if data is not None:
+            self._profiles[slug] = data
+        return data
 
     @property
     def index(self) -> list[dict]:
         self._ensure_index()
         return self._index
 
+    @property
+    def query_index(self) -> RaceQueryIndex:
+        """Filter/sort index over the race index, built on first search."""
+        self._ensure_index()
+        if self._query is None or self._query.entries is not self._index:
+            self._query = RaceQueryIndex(self._index)
+        return self._query
+
     @property
     def regions(self) -> set[str]:
         self._ensure_index()
@@ -365,38 +375,21 @@ def search_races(
         valid_regions = sorted(db.regions)
         warnings.append(f"Unknown region '{region}'. Known regions: {', '.join(valid_regions)}.")
 
-    results = list(db.index)
-
-    if tier is not None:
-        results = [r for r in results if r.get("tier") == tier]
-    if region:
-        region_lower = region.lower()
-        results = [r for r in results if (r.get("region") or "").lower() == region_lower]
-    if discipline:
-        disc_lower = discipline.lower()
-        results = [r for r in results if (r.get("discipline") or "gravel").lower() == disc_lower]
-    if month:
-        month_lower = month.lower()
-        results = [r for r in results if (r.get("month") or "").lower() == month_lower]
-    if distance_min is not None:
-        results = [r for r in results if _num(r.get("distance_mi")) >= distance_min]
-    if distance_max is not None:
-        results = [r for r in results if _num(r.get("distance_mi")) <= distance_max]
-    if query:
-        q = query.lower()
-        results = [
-            r for r in results
-            if q in (r.get("name") or "").lower()
-            or q in (r.get("location") or "").lower()
-            or q in (r.get("tagline") or "").lower()
-            or q in (r.get("st") or "").lower()
-        ]
-
-    results.sort(key=lambda r: r.get("overall_score") or 0, reverse=True)
     limit = min(max(limit, 1), 100)
-    page = results[:limit]
-
-    response = {"count": len(results), "results": page}
+    total, page = db.query_index.search(
+        tiers=None if tier is None else [tier],
+        region=region,
+        discipline=discipline,
+        month=month,
+        distance_min=distance_min,
+        distance_max=distance_max,
+        text=query,
+        text_fields=("name", "location", "tagline", "st"),
+        sort="score",
+        limit=limit,
+    )
+
+    response = {"count": total, "results": page}
     if warnings:
         response["warnings"] = warnings
     return response
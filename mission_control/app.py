@@ -30,6 +30,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Scheduler failed to start: %s", e)
 
+    # Pipeline worker pool — resumes any runs still queued from before a restart
+    try:
+        from mission_control.services.pipeline_runner import get_pool
+        get_pool().notify()
+    except Exception as e:
+        logger.warning("Pipeline pool failed to start: %s", e)
+
     # Startup probe: record whether race-dates fetches work from THIS
     # environment. The countdown job aborted silently for weeks because the
     # fetch failed only in prod — this writes the pass/fail (with the actual
@@ -59,6 +66,11 @@ async def lifespan(app: FastAPI):
         scheduler.shutdown(wait=False)
     except Exception:
         pass
+    try:
+        from mission_control.services.pipeline_runner import shutdown_pool
+        shutdown_pool()
+    except Exception:
+        pass
 
 
 def create_app() -> FastAPI:
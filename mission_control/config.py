@@ -20,6 +20,10 @@ PLANS_DIR = REPO_ROOT / "plans"
 PIPELINE_SCRIPT = REPO_ROOT / "run_pipeline.py"
 PRE_DELIVERY_AUDIT = REPO_ROOT / "scripts" / "pre_delivery_audit.py"
 
+# Pipeline runs executed at once; further triggers wait in the queue.
+# Each slot keeps a warm worker process, so this also caps memory use.
+PIPELINE_CONCURRENCY = int(os.environ.get("PIPELINE_CONCURRENCY", "2"))
+
 # Jinja2 templates for the web UI
 WEB_TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 STATIC_DIR = Path(__file__).resolve().parent / "static"
@@ -33,6 +37,10 @@ RESEND_API_KEY = os.environ.get("RESEND_API_KEY", "")
 RESEND_FROM_EMAIL = os.environ.get("RESEND_FROM_EMAIL", "plans@gravelgodcycling.com")
 RESEND_FROM_NAME = os.environ.get("RESEND_FROM_NAME", "Gravel God Training")
 
+# Concurrent Resend calls while draining due sequence sends. Keep within
+# the Resend account's request rate limit.
+SEQUENCE_SEND_CONCURRENCY = int(os.environ.get("SEQUENCE_SEND_CONCURRENCY", "4"))
+
 # Sequence email identity (marketing automation)
 SEQUENCE_FROM_EMAIL = os.environ.get("SEQUENCE_FROM_EMAIL", "matti@gravelgodcycling.com")
 SEQUENCE_FROM_NAME = os.environ.get("SEQUENCE_FROM_NAME", "Matti at Gravel God")
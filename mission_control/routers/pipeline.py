@@ -8,6 +8,7 @@ from mission_control.config import WEB_TEMPLATES_DIR
 from mission_control import supabase_client as db
 from mission_control.services.pipeline_runner import (
     get_run_status,
+    queue_position,
     trigger_audit,
     trigger_pipeline,
 )
@@ -43,6 +44,7 @@ async def pipeline_run_detail(request: Request, run_id: str):
         "active_page": "pipeline",
         "run": run,
         "athlete": athlete,
+        "queue_position": queue_position(run_id) if run["status"] == "pending" else None,
     })
 
 
@@ -74,8 +76,8 @@ async def pipeline_trigger(
     return HTMLResponse(
         f'<div id="run-status" hx-get="/pipeline/status/{run_id}" hx-trigger="every 2s" '
         f'hx-swap="outerHTML" class="gg-alert gg-alert--warning">'
-        f'<span class="gg-alert__label">Running</span>'
-        f'<span class="gg-alert__message">Pipeline running for {athlete["name"]}...</span>'
+        f'<span class="gg-alert__label">Queued</span>'
+        f'<span class="gg-alert__message">Pipeline queued for {athlete["name"]}...</span>'
         f'</div>'
     )
 
@@ -86,15 +88,29 @@ async def pipeline_status(run_id: str):
     if not run:
         return HTMLResponse('<div class="gg-alert gg-alert--error"><span class="gg-alert__label">Error</span><span class="gg-alert__message">Run not found</span></div>')
 
+    if run["status"] == "pending":
+        athlete = db.get_athlete_by_id(run["athlete_id"])
+        name = athlete["name"] if athlete else "Unknown"
+        position = queue_position(run_id)
+        where = f"position {position} in queue" if position else "starting"
+        return HTMLResponse(
+            f'<div id="run-status" hx-get="/pipeline/status/{run_id}" hx-trigger="every 2s" '
+            f'hx-swap="outerHTML" class="gg-alert gg-alert--warning">'
+            f'<span class="gg-alert__label">Queued</span>'
+            f'<span class="gg-alert__message">Pipeline queued for {name}... {where}</span>'
+            f'</div>'
+        )
+
     if run["status"] == "running":
         athlete = db.get_athlete_by_id(run["athlete_id"])
         name = athlete["name"] if athlete else "Unknown"
-        step = run.get("current_step", "")
+        step = _escape(run.get("current_step") or "")
+        done = sum(1 for s in run.get("steps_completed") or [] if s.get("status") == "completed")
         return HTMLResponse(
             f'<div id="run-status" hx-get="/pipeline/status/{run_id}" hx-trigger="every 2s" '
             f'hx-swap="outerHTML" class="gg-alert gg-alert--warning">'
             f'<span class="gg-alert__label">Running</span>'
-            f'<span class="gg-alert__message">Pipeline running for {name}... Step: {step}</span>'
+            f'<span class="gg-alert__message">Pipeline running for {name}... Step: {step} ({done} done)</span>'
             f'</div>'
         )
 
@@ -69,40 +69,18 @@ async def list_races(
 ):
     _check_rate_limit(request, _LIST_RATE_LIMIT)
     db = get_race_db()
-    results = list(db.index)
-
-    # Filters
-    if tier:
-        results = [r for r in results if r.get("tier") in tier]
-    if region:
-        results = [r for r in results if r.get("region", "").lower() == region.lower()]
-    if discipline:
-        results = [r for r in results if r.get("discipline", "gravel").lower() == discipline.lower()]
-    if month:
-        results = [r for r in results if r.get("month", "").lower() == month.lower()]
-    if distance_min is not None:
-        results = [r for r in results if (r.get("distance_mi") or 0) >= distance_min]
-    if distance_max is not None:
-        results = [r for r in results if (r.get("distance_mi") or 0) <= distance_max]
-    if q:
-        q_lower = q.lower()
-        results = [
-            r for r in results
-            if q_lower in r.get("name", "").lower()
-            or q_lower in r.get("location", "").lower()
-            or q_lower in r.get("tagline", "").lower()
-        ]
-
-    # Sort
-    if sort == "name":
-        results.sort(key=lambda r: r.get("name", "").lower())
-    elif sort == "distance":
-        results.sort(key=lambda r: r.get("distance_mi") or 0, reverse=True)
-    else:  # default: score descending
-        results.sort(key=lambda r: r.get("overall_score") or 0, reverse=True)
-
-    total = len(results)
-    page = results[offset:offset + limit]
+    total, page = db.query_index.search(
+        tiers=tier,
+        region=region,
+        discipline=discipline,
+        month=month,
+        distance_min=distance_min,
+        distance_max=distance_max,
+        text=q,
+        sort=sort,
+        offset=offset,
+        limit=limit,
+    )
 
     # Build next link
     next_url = None
@@ -143,27 +121,21 @@ async def recommend_races(
 ):
     _check_rate_limit(request, _LIST_RATE_LIMIT)
     db = get_race_db()
-    results = list(db.index)
-
-    if tier:
-        results = [r for r in results if r.get("tier") in tier]
-    if region:
-        results = [r for r in results if r.get("region", "").lower() == region.lower()]
-    if discipline:
-        results = [r for r in results if r.get("discipline", "gravel").lower() == discipline.lower()]
-    if month:
-        results = [r for r in results if r.get("month", "").lower() == month.lower()]
-    if distance_min is not None:
-        results = [r for r in results if (r.get("distance_mi") or 0) >= distance_min]
-    if distance_max is not None:
-        results = [r for r in results if (r.get("distance_mi") or 0) <= distance_max]
-
-    # Always sort by score descending for recommendations
-    results.sort(key=lambda r: r.get("overall_score") or 0, reverse=True)
+    # Always sorted by score descending for recommendations
+    _, results = db.query_index.search(
+        tiers=tier,
+        region=region,
+        discipline=discipline,
+        month=month,
+        distance_min=distance_min,
+        distance_max=distance_max,
+        sort="score",
+        limit=limit,
+    )
 
     return {
-        "count": len(results[:limit]),
-        "results": results[:limit],
+        "count": len(results),
+        "results": results,
     }
 
 
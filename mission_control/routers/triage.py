@@ -12,6 +12,7 @@ from fastapi.templating import Jinja2Templates
 from mission_control import supabase_client as db
 from mission_control.config import WEB_TEMPLATES_DIR
 from mission_control.services.deals import move_stage
+from mission_control.services.panel_loader import Panel, load_panels
 from mission_control.services.triage import (
     STALE_DEAL_HOURS,
     approve_plan,
@@ -88,58 +89,69 @@ def _oob_response(primary_html: str = "") -> HTMLResponse:
 # GET /triage — main page
 # ---------------------------------------------------------------------------
 
-@router.get("/triage")
-async def triage(request: Request):
-    load_error = False
-    try:
-        # Action required
-        pending_intakes = get_pending_intakes()
-        unanswered_replies = get_unanswered_replies()
-        plans = get_plans_needing_action()
-        stale_deals = get_stale_deals()
-        due_touchpoints = get_due_touchpoints()
+def _empty_health() -> dict:
+    return {"checks": [], "ok_count": 0, "warning_count": 0, "error_count": 0}
 
-        # Automated FYI
-        recent_sends = get_recent_sends()
-        recent_enrollments = get_recent_enrollments()
-        upcoming_races = get_upcoming_races()
-        recent_bounces = get_recent_bounces()
-        recent_unsubscribes = get_recent_unsubscribes()
 
-        # System health
-        health = get_system_health()
-        summary = triage_summary(
-            pending_intakes=pending_intakes,
-            plans_needing_action=plans,
-        )
+def _empty_summary() -> dict:
+    return {
+        "action_required": 0, "pending_intakes": 0,
+        "unread_replies": 0, "plans_needing_action": 0,
+        "due_touchpoints": 0,
+    }
 
-        # GA4
-        ga4 = get_triage_ga4_summary()
 
-        # API costs
-        api_costs = get_api_cost_summary()
+def _not_configured() -> dict:
+    return {"configured": False}
 
-    except Exception:
-        logger.exception("Triage page failed to load data")
-        load_error = True
-        pending_intakes = []
-        unanswered_replies = []
-        plans = []
-        stale_deals = []
-        due_touchpoints = []
-        recent_sends = []
-        recent_enrollments = []
-        upcoming_races = []
-        recent_bounces = []
-        recent_unsubscribes = []
-        health = {"checks": [], "ok_count": 0, "warning_count": 0, "error_count": 0}
-        summary = {
-            "action_required": 0, "pending_intakes": 0,
-            "unread_replies": 0, "plans_needing_action": 0,
-            "due_touchpoints": 0,
-        }
-        ga4 = {"configured": False}
-        api_costs = {"configured": False}
+
+def _summary(pending_intakes, plans):
+    return triage_summary(pending_intakes=pending_intakes, plans_needing_action=plans)
+
+
+def _triage_panels() -> list[Panel]:
+    # Built per request so the helpers are looked up at call time
+    return [
+        # Action required
+        Panel("pending_intakes", get_pending_intakes),
+        Panel("unanswered_replies", get_unanswered_replies),
+        Panel("plans", get_plans_needing_action),
+        Panel("stale_deals", get_stale_deals),
+        Panel("due_touchpoints", get_due_touchpoints),
+        # Automated FYI
+        Panel("recent_sends", get_recent_sends),
+        Panel("recent_enrollments", get_recent_enrollments),
+        Panel("upcoming_races", get_upcoming_races),
+        Panel("recent_bounces", get_recent_bounces),
+        Panel("recent_unsubscribes", get_recent_unsubscribes),
+        # System health
+        Panel("health", get_system_health, _empty_health),
+        Panel("summary", _summary, _empty_summary, deps=("pending_intakes", "plans")),
+        # GA4 + API costs (external API / aggregate queries)
+        Panel("ga4", get_triage_ga4_summary, _not_configured),
+        Panel("api_costs", get_api_cost_summary, _not_configured),
+    ]
+
+
+@router.get("/triage")
+async def triage(request: Request):
+    data, degraded = await load_panels(_triage_panels())
+    load_error = bool(degraded)
+
+    pending_intakes = data["pending_intakes"]
+    unanswered_replies = data["unanswered_replies"]
+    plans = data["plans"]
+    stale_deals = data["stale_deals"]
+    due_touchpoints = data["due_touchpoints"]
+    recent_sends = data["recent_sends"]
+    recent_enrollments = data["recent_enrollments"]
+    upcoming_races = data["upcoming_races"]
+    recent_bounces = data["recent_bounces"]
+    recent_unsubscribes = data["recent_unsubscribes"]
+    health = data["health"]
+    summary = data["summary"]
+    ga4 = data["ga4"]
+    api_costs = data["api_costs"]
 
     # First-run detection: all sections empty and no load error
     is_first_run = (
@@ -160,6 +172,7 @@ async def triage(request: Request):
         "request": request,
         "active_page": "triage",
         "load_error": load_error,
+        "degraded_panels": degraded,
         "is_first_run": is_first_run,
         "stale_hours": STALE_DEAL_HOURS,
         # Action required
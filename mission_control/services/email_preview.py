@@ -7,6 +7,7 @@ from pathlib import Path
 
 from mission_control.config import TEMPLATES_DIR
 from mission_control import supabase_client as db
+from mission_control.services.email_templates import load_template
 
 
 def list_templates() -> list[dict]:
@@ -31,13 +32,12 @@ def list_templates() -> list[dict]:
 
 def preview_template(template_name: str, athlete_slug: str | None = None) -> dict:
     """Preview a template rendered with real or sample athlete data."""
-    template_path = TEMPLATES_DIR / f"{template_name}.html"
-    if not template_path.exists():
+    try:
+        template = load_template(TEMPLATES_DIR / f"{template_name}.html")
+    except FileNotFoundError:
         return {"html": f"<p>Template not found: {template_name}.html</p>",
                 "template_name": template_name, "athlete_name": "N/A"}
 
-    html = template_path.read_text()
-
     # Get athlete data
     athlete = None
     if athlete_slug:
@@ -52,25 +52,25 @@ def preview_template(template_name: str, athlete_slug: str | None = None) -> dic
             intake = json.loads(intake)
 
         replacements = {
-            "{athlete_name}": intake.get("name", athlete.get("name", "Sample Athlete")),
-            "{race_name}": athlete.get("race_name", "Sample Race"),
-            "{race_date}": str(athlete.get("race_date", "2026-07-04")),
-            "{plan_duration}": str(athlete.get("plan_weeks", 12)),
-            "{week_number}": "4",
+            "athlete_name": intake.get("name", athlete.get("name", "Sample Athlete")),
+            "race_name": athlete.get("race_name", "Sample Race"),
+            "race_date": str(athlete.get("race_date", "2026-07-04")),
+            "plan_duration": str(athlete.get("plan_weeks", 12)),
+            "week_number": "4",
         }
         athlete_name = athlete["name"]
     else:
         replacements = {
-            "{athlete_name}": "Sample Athlete",
-            "{race_name}": "Sample Race",
-            "{race_date}": "2026-07-04",
-            "{plan_duration}": "12",
-            "{week_number}": "4",
+            "athlete_name": "Sample Athlete",
+            "race_name": "Sample Race",
+            "race_date": "2026-07-04",
+            "plan_duration": "12",
+            "week_number": "4",
         }
         athlete_name = "Sample Data"
 
-    for placeholder, value in replacements.items():
-        html = html.replace(placeholder, value)
+    # Preview shows the template as the touchpoint sender fills it — unescaped
+    html = template.render(replacements, escape=False)
 
     return {"html": html, "template_name": template_name, "athlete_name": athlete_name}
 
@@ -0,0 +1,210 @@
+"""Compiled email templates — parse each template once, render in one pass.
+
+Rendering a sequence email used to read its .html from disk, resolve
+{{#key}}/{{^key}} blocks by re-running a regex until nothing changed, do
+one str.replace per placeholder, then rescan the whole result twice more
+to add UTM params to brand links and splice in the unsubscribe footer.
+
+compile_template() parses the source once into a segment tree:
+
+  - literal text
+  - {placeholder}s, filled from the values passed to render() (HTML
+    escaped unless the caller opts out); unknown ones stay literal
+  - {{#key}}...{{/key}} / {{^key}}...{{/key}} blocks, kept when
+    flags[key] is truthy / falsy; blocks nest to any depth
+  - href="..." link slots: a static brand-site URL gets the UTM query
+    with its separator worked out at compile time; a URL built from
+    placeholders (href="{prep_kit_url}") is checked once filled in
+  - footer slots before </body> (else </html>, else at the very end)
+
+load_template() caches compiled templates by path and recompiles when a
+file's mtime or size changes, so an edited template is picked up without
+a restart.
+"""
+
+from __future__ import annotations
+
+import re
+from html import escape as html_escape
+from pathlib import Path
+
+# Links that get UTM params — same hosts the sends have always tagged
+_BRAND_URL = re.compile(r"https://(?:gravelgodcycling|roadielabs|xcskilabs)\.com")
+
+_TOKEN = re.compile(
+    r"\{\{([#^/])(\w+)\}\}"              # block open / close
+    r'|href="((?:[^"{]|\{(?!\{))*)"'     # link (no block tags inside)
+    r"|\{([^{}]+)\}"                     # placeholder
+)
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+# Segment kinds; a plain str segment is literal text
+_VAR, _IF, _LINK, _FOOTER = range(4)
+
+_FOOTER_MARKERS = ("</body>", "</html>")
+
+
+def inject_footer(html: str, footer: str) -> str:
+    """Insert footer before </body> (else </html>, else append it)."""
+    for marker in _FOOTER_MARKERS:
+        if marker in html:
+            return html.replace(marker, footer + marker)
+    return html + footer
+
+
+class EmailTemplate:
+    """A compiled template. render() fills it in without rescanning."""
+
+    __slots__ = ("segments", "_scan_footer")
+
+    def __init__(self, segments: list, scan_footer: bool = False):
+        self.segments = segments
+        # True when </body> or </html> only appears inside a block, so
+        # where the footer goes depends on what render() keeps
+        self._scan_footer = scan_footer
+
+    def render(self, values: dict[str, str], flags: dict | None = None, *,
+               utm: str = "", footer: str = "", escape: bool = True) -> str:
+        """Fill in the template.
+
+        values maps placeholder names to text; flags decides which blocks
+        are kept. utm is an encoded query string for brand links and
+        footer the HTML for the footer slot (both optional).
+        """
+        if escape:
+            values = {k: html_escape(v, quote=True) for k, v in values.items()}
+        out: list[str] = []
+        _emit(self.segments, values, flags or {}, utm,
+              "" if self._scan_footer else footer, out)
+        html = "".join(out)
+        if footer and self._scan_footer:
+            html = inject_footer(html, footer)
+        return html
+
+
+def _emit(segments: list, values: dict, flags: dict, utm: str, footer: str,
+          out: list[str]) -> None:
+    for seg in segments:
+        if type(seg) is str:
+            out.append(seg)
+            continue
+        kind = seg[0]
+        if kind == _VAR:
+            out.append(values.get(seg[1], seg[2]))
+        elif kind == _IF:
+            if bool(flags.get(seg[1])) != seg[2]:
+                _emit(seg[3], values, flags, utm, footer, out)
+        elif kind == _LINK:
+            _, parts, sep = seg
+            url = "".join(p if type(p) is str else values.get(p[1], p[2]) for p in parts)
+            if utm:
+                if sep is None and _BRAND_URL.match(url):
+                    sep = "&" if "?" in url else "?"
+                if sep:
+                    url = f"{url}{sep}{utm}"
+            out.append(f'href="{url}"')
+        else:
+            out.append(footer)
+
+
+def _link(url: str):
+    """Segment for href="url"."""
+    parts: list = []
+    pos = 0
+    for m in _PLACEHOLDER.finditer(url):
+        if m.start() > pos:
+            parts.append(url[pos:m.start()])
+        parts.append((_VAR, m.group(1), m.group()))
+        pos = m.end()
+    if not parts:
+        if not _BRAND_URL.match(url):
+            return f'href="{url}"'
+        return (_LINK, [url], "&" if "?" in url else "?")
+    if pos < len(url):
+        parts.append(url[pos:])
+    return (_LINK, parts, None)
+
+
+def _close_unmatched(stack: list) -> None:
+    """An open tag that never closed is literal text, as is its body."""
+    tag, _, body = stack.pop()
+    stack[-1][2].extend([tag, *body])
+
+
+def _nested_text(segments: list):
+    for seg in segments:
+        if type(seg) is not str and seg[0] == _IF:
+            for child in seg[3]:
+                if type(child) is str:
+                    yield child
+            yield from _nested_text(seg[3])
+
+
+def _place_footer(root: list) -> tuple[list, bool]:
+    """Add footer slots to the top level. Returns (segments, scan_footer)."""
+    nested = list(_nested_text(root))
+    for marker in _FOOTER_MARKERS:
+        if any(marker in text for text in nested):
+            return root, True
+        if not any(type(seg) is str and marker in seg for seg in root):
+            continue
+        placed: list = []
+        for seg in root:
+            if type(seg) is str and marker in seg:
+                pieces = seg.split(marker)
+                for piece in pieces[:-1]:
+                    placed += [piece, (_FOOTER,), marker]
+                placed.append(pieces[-1])
+            else:
+                placed.append(seg)
+        return placed, False
+    return root + [(_FOOTER,)], False
+
+
+def compile_template(source: str) -> EmailTemplate:
+    """Parse template source into an EmailTemplate."""
+    root: list = []
+    stack: list = [(None, None, root)]  # (open tag, key, body) per open block
+    pos = 0
+    for m in _TOKEN.finditer(source):
+        if m.start() > pos:
+            stack[-1][2].append(source[pos:m.start()])
+        pos = m.end()
+        op, key, url, name = m.groups()
+        if url is not None:
+            stack[-1][2].append(_link(url))
+        elif name is not None:
+            stack[-1][2].append((_VAR, name, m.group()))
+        elif op != "/":
+            stack.append((m.group(), key, []))
+        else:
+            depth = next((d for d in range(len(stack) - 1, 0, -1) if stack[d][1] == key), 0)
+            if not depth:
+                stack[-1][2].append(m.group())
+                continue
+            while len(stack) - 1 > depth:
+                _close_unmatched(stack)
+            tag, key, body = stack.pop()
+            stack[-1][2].append((_IF, key, tag[2] == "^", body))
+    if pos < len(source):
+        stack[-1][2].append(source[pos:])
+    while len(stack) > 1:
+        _close_unmatched(stack)
+    return EmailTemplate(*_place_footer(root))
+
+
+_cache: dict[Path, tuple[int, int, EmailTemplate]] = {}
+
+
+def load_template(path: Path) -> EmailTemplate:
+    """Compiled template at path, recompiled if the file has changed.
+
+    Raises FileNotFoundError if it doesn't exist.
+    """
+    st = path.stat()
+    cached = _cache.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    template = compile_template(path.read_text())
+    _cache[path] = (st.st_mtime_ns, st.st_size, template)
+    return template
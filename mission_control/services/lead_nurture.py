@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import hashlib
 import html
+import logging
 import re
 import statistics
 from difflib import SequenceMatcher
@@ -22,6 +23,8 @@ from email.utils import parseaddr
 from mission_control import supabase_client as db
 from mission_control.sequences import get_sequence
 
+logger = logging.getLogger(__name__)
+
 
 MAX_BODY_CHARS = 30_000
 MAX_SUBJECT_CHARS = 500
@@ -301,29 +304,6 @@ def get_sync_candidates(limit: int = 500) -> list[dict]:
     return sorted(contacts.values(), key=lambda row: row["email"])[:limit]
 
 
-def _contact_record(email: str) -> dict | None:
-    # Existing rows predate strict lower-casing; compare normalized addresses.
-    deal = next((
-        row for row in db.select("gg_deals", limit=1000)
-        if normalize_email(row.get("contact_email", "")) == email
-    ), None)
-    enrollments = [
-        row for row in db.select("gg_sequence_enrollments", limit=1000)
-        if normalize_email(row.get("contact_email", "")) == email
-    ]
-    if not deal and not enrollments:
-        return None
-    enrollment = enrollments[-1] if enrollments else {}
-    seq = get_sequence(enrollment.get("sequence_id", "")) or {}
-    return {
-        "email": email,
-        "name": (deal or {}).get("contact_name") or enrollment.get("contact_name", ""),
-        "brand": seq.get("brand", "gravelgod"),
-        "deal_id": (deal or {}).get("id"),
-        "enrollments": enrollments,
-    }
-
-
 def _message_contact(message: dict, candidate_emails: set[str]) -> str:
     addresses = [normalize_email(message.get("from", ""))]
     addresses.extend(normalize_email(v) for v in message.get("to", []) or [])
@@ -363,24 +343,224 @@ def _reply_token(message: dict) -> str:
     return ""
 
 
-def _exact_sequence_attribution(message: dict) -> tuple[dict | None, str]:
+class _SyncBatch:
+    """Rows one Gmail sync can touch, read up front, and the writes it makes.
+
+    Ingesting used to cost several Supabase round trips per message: the
+    known-id check, two full scans to find the contact, the conversation,
+    attribution and suggestion lookups, then one insert each. The batch
+    reads everything a payload can touch in a fixed number of .in_()
+    queries, the thread logic below works on those rows in memory, and
+    flush() writes the result in bulk. Messages and suggestions are
+    upserted skipping duplicates, so overlapping or concurrent syncs stay
+    idempotent on gmail_message_id.
+    """
+
+    def __init__(self, threads: list[dict], candidate_emails: set[str]):
+        self.candidate_emails = candidate_emails
+        self.now = datetime.now(timezone.utc).isoformat()
+
+        # Existing rows predate strict lower-casing; key by normalized address.
+        self.deals: dict[str, dict] = {}
+        for row in db.select("gg_deals", limit=1000):
+            self.deals.setdefault(normalize_email(row.get("contact_email", "")), row)
+        self.enrollments: dict[str, list[dict]] = {}
+        for row in db.select("gg_sequence_enrollments", limit=1000):
+            email = normalize_email(row.get("contact_email", ""))
+            self.enrollments.setdefault(email, []).append(row)
+        self._contacts: dict[str, dict | None] = {}
+
+        leads = [lead for lead in map(self.thread_lead, threads) if lead[2]]
+        messages = [message for _, thread_messages, _ in leads for message in thread_messages]
+        message_ids = sorted({_message_id(message) for message in messages} - {""})
+
+        self.known_message_ids = {
+            row["gmail_message_id"] for row in db.select_in(
+                "gg_lead_messages", "gmail_message_id", "gmail_message_id", message_ids,
+            )
+        }
+
+        self.conversations = {
+            row["gmail_thread_id"]: row for row in db.select_in(
+                "gg_lead_conversations", "*", "gmail_thread_id",
+                sorted({thread_id for thread_id, _, _ in leads}),
+            )
+        }
+        new_conversations: dict[str, dict] = {}
+        for thread_id, _, contact in leads:
+            if thread_id not in self.conversations:
+                new_conversations.setdefault(thread_id, {
+                    "gmail_thread_id": thread_id,
+                    "contact_email": contact["email"],
+                    "contact_name": contact.get("name", ""),
+                    "brand": contact.get("brand", "gravelgod"),
+                    "deal_id": contact.get("deal_id"),
+                    "status": "needs_reply",
+                })
+        for row in db.insert_many("gg_lead_conversations", list(new_conversations.values())):
+            self.conversations[row["gmail_thread_id"]] = row
+        conversation_ids = sorted(row["id"] for row in self.conversations.values())
+
+        self.thread_messages: dict[str, list[dict]] = {}
+        for row in db.select_in(
+            "gg_lead_messages", "gmail_message_id,conversation_id,direction,message_at,question_type",
+            "conversation_id", conversation_ids,
+        ):
+            self.thread_messages.setdefault(row["conversation_id"], []).append(row)
+
+        suggestions = {
+            row["id"]: row for row in (
+                db.select_in("gg_lead_reply_suggestions", "*", "conversation_id", conversation_ids)
+                + db.select_in("gg_lead_reply_suggestions", "*", "inbound_message_id", message_ids)
+            )
+        }
+        self.suggestions: dict[str, list[dict]] = {}
+        self.suggestion_by_inbound: dict[str, dict] = {}
+        for row in suggestions.values():
+            self.suggestions.setdefault(row["conversation_id"], []).append(row)
+            self.suggestion_by_inbound[row["inbound_message_id"]] = row
+
+        tokens = sorted({_reply_token(message) for message in messages} - {""})
+        enrollment_ids = sorted({
+            enrollment["id"] for _, _, contact in leads for enrollment in contact["enrollments"]
+        })
+        self.sends = {
+            row["id"]: row for row in (
+                db.select_in("gg_sequence_sends", "*", "reply_token", tokens)
+                + db.select_in("gg_sequence_sends", "*", "enrollment_id", enrollment_ids)
+            )
+        }
+        self.send_by_token = {
+            row["reply_token"]: row for row in self.sends.values() if row.get("reply_token")
+        }
+        self.sends_by_enrollment: dict[str, list[dict]] = {}
+        for row in self.sends.values():
+            self.sends_by_enrollment.setdefault(row.get("enrollment_id"), []).append(row)
+
+        self.paused: list[str] = []
+        self.messages: list[dict] = []
+        self.new_suggestions: list[dict] = []
+        self.suggestion_updates: dict[str, dict] = {}
+        self.send_updates: dict[str, dict] = {}
+        self.conversation_updates: dict[str, dict] = {}
+        self.log: list[tuple[str, str, str, str]] = []
+
+    def contact(self, email: str) -> dict | None:
+        if email not in self._contacts:
+            deal = self.deals.get(email)
+            enrollments = self.enrollments.get(email, [])
+            if not deal and not enrollments:
+                self._contacts[email] = None
+            else:
+                enrollment = enrollments[-1] if enrollments else {}
+                seq = get_sequence(enrollment.get("sequence_id", "")) or {}
+                self._contacts[email] = {
+                    "email": email,
+                    "name": (deal or {}).get("contact_name") or enrollment.get("contact_name", ""),
+                    "brand": seq.get("brand", "gravelgod"),
+                    "deal_id": (deal or {}).get("id"),
+                    "enrollments": enrollments,
+                }
+        return self._contacts[email]
+
+    def thread_lead(self, thread: dict) -> tuple[str, list[dict], dict | None]:
+        """(thread id, messages, contact); no messages if the thread is empty,
+        no contact if it isn't with a known lead."""
+        thread_id = str(thread.get("id", ""))[:255]
+        messages = (thread.get("messages") or [])[:MAX_MESSAGES_PER_THREAD]
+        if not thread_id or not messages:
+            return thread_id, [], None
+        contact_email = ""
+        for message in messages:
+            contact_email = _message_contact(message, self.candidate_emails)
+            if contact_email:
+                break
+        return thread_id, messages, self.contact(contact_email) if contact_email else None
+
+    def add_message(self, row: dict) -> None:
+        self.messages.append(row)
+        self.known_message_ids.add(row["gmail_message_id"])
+        self.thread_messages.setdefault(row["conversation_id"], []).append(row)
+
+    def add_suggestion(self, row: dict) -> dict:
+        self.new_suggestions.append(row)
+        self.suggestions.setdefault(row["conversation_id"], []).append(row)
+        self.suggestion_by_inbound[row["inbound_message_id"]] = row
+        return row
+
+    def update_suggestion(self, row: dict, changes: dict) -> None:
+        row.update(changes)
+        if "id" in row:  # not one added by this sync
+            self.suggestion_updates.setdefault(row["id"], {}).update(changes)
+
+    def update_send(self, send: dict, changes: dict) -> None:
+        send.update(changes)
+        self.send_updates.setdefault(send["id"], {}).update(changes)
+
+    def update_conversation(self, conversation: dict, changes: dict) -> None:
+        conversation.update(changes)
+        self.conversation_updates[conversation["id"]] = conversation
+
+    def flush(self) -> None:
+        # Pause before anything else: a failed write further down must never
+        # leave the marketing sequence free to send again.
+        db.update_in("gg_sequence_enrollments", {"status": "paused_reply"}, "id", self.paused)
+        db.upsert_many("gg_lead_messages", self.messages,
+                       on_conflict="gmail_message_id", ignore_duplicates=True)
+        db.upsert_many("gg_lead_reply_suggestions", [
+            {**{key: row.get(key) for key in _NEW_SUGGESTION_COLUMNS},
+             "updated_at": row.get("updated_at") or self.now}
+            for row in self.new_suggestions
+        ], on_conflict="inbound_message_id", ignore_duplicates=True)
+        # Superseding a run of suggestions gives them all the same change
+        groups: dict[tuple, list[str]] = {}
+        for suggestion_id, changes in self.suggestion_updates.items():
+            groups.setdefault(tuple(sorted(changes.items())), []).append(suggestion_id)
+        for changes, ids in groups.items():
+            db.update_in("gg_lead_reply_suggestions", dict(changes), "id", ids)
+        # Reply counters differ per send; only sends that got a reply are written
+        for send_id, changes in self.send_updates.items():
+            db.update("gg_sequence_sends", changes, {"id": send_id})
+        # Full rows, so one upsert carries every conversation's new counters
+        db.upsert_many("gg_lead_conversations", list(self.conversation_updates.values()),
+                       on_conflict="id")
+        if self.log:
+            db.log_actions(self.log)
+
+
+# Bulk inserts need one key set. A suggestion superseded by an outbound reply
+# in the same sync is inserted as sent, so sent_at and updated_at are always
+# written (updated_at defaults to the sync time in flush()).
+_NEW_SUGGESTION_COLUMNS = (
+    "conversation_id", "inbound_message_id", "initial_draft_text", "draft_text",
+    "suggested_question", "question_type", "needs_coach_answer", "rationale",
+    "status", "gmail_draft_message_id", "sent_at", "updated_at",
+)
+
+
+def _message_id(message: dict) -> str:
+    return str(message.get("id", ""))[:255]
+
+
+def _exact_sequence_attribution(message: dict, batch: _SyncBatch) -> tuple[dict | None, str]:
     token = _reply_token(message)
     if token:
-        exact = db.select_one("gg_sequence_sends", match={"reply_token": token})
+        exact = batch.send_by_token.get(token)
         if exact:
             return exact, "exact"
     return None, "none"
 
 
-def _sequence_attribution(contact: dict, message: dict) -> tuple[dict | None, str]:
-    exact, confidence = _exact_sequence_attribution(message)
+def _sequence_attribution(contact: dict, message: dict,
+                          batch: _SyncBatch) -> tuple[dict | None, str]:
+    exact, confidence = _exact_sequence_attribution(message, batch)
     if exact:
         return exact, confidence
 
     inbound_at = _parse_message_at(message.get("date", "")).isoformat()
     candidates: list[dict] = []
     for enrollment in contact.get("enrollments", []):
-        for send in db.select("gg_sequence_sends", match={"enrollment_id": enrollment.get("id")}):
+        for send in batch.sends_by_enrollment.get(enrollment.get("id"), []):
             sent_at = send.get("sent_at") or ""
             if not sent_at or sent_at <= inbound_at:
                 candidates.append(send)
@@ -390,7 +570,7 @@ def _sequence_attribution(contact: dict, message: dict) -> tuple[dict | None, st
     return candidates[-1], "email_time"
 
 
-def _pause_marketing_sequences(contact: dict) -> int:
+def _pause_marketing_sequences(contact: dict, batch: _SyncBatch) -> int:
     paused = 0
     for enrollment in contact.get("enrollments", []):
         if enrollment.get("status") != "active":
@@ -398,36 +578,21 @@ def _pause_marketing_sequences(contact: dict) -> int:
         seq = get_sequence(enrollment.get("sequence_id", "")) or {}
         if seq.get("trigger") in _POST_PURCHASE_TRIGGERS:
             continue
-        db.update("gg_sequence_enrollments", {"status": "paused_reply"}, {"id": enrollment["id"]})
+        batch.paused.append(enrollment["id"])
         enrollment["status"] = "paused_reply"
         paused += 1
     return paused
 
 
-def _conversation(thread_id: str, contact: dict) -> dict:
-    existing = db.select_one("gg_lead_conversations", match={"gmail_thread_id": thread_id})
-    if existing:
-        return existing
-    return db.insert("gg_lead_conversations", {
-        "gmail_thread_id": thread_id,
-        "contact_email": contact["email"],
-        "contact_name": contact.get("name", ""),
-        "brand": contact.get("brand", "gravelgod"),
-        "deal_id": contact.get("deal_id"),
-        "status": "needs_reply",
-    })
-
-
-def _record_suggestion(conversation: dict, message: dict, body: str) -> dict:
-    existing = db.select_one(
-        "gg_lead_reply_suggestions", match={"inbound_message_id": message["id"]},
-    )
+def _record_suggestion(conversation: dict, message: dict, body: str,
+                       batch: _SyncBatch) -> dict:
+    existing = batch.suggestion_by_inbound.get(message["id"])
     if existing:
         return existing
-    prior_messages = db.select(
-        "gg_lead_messages", match={"conversation_id": conversation["id"]},
-        order="message_at", order_desc=True, limit=12,
-    )
+    prior_messages = sorted(
+        batch.thread_messages.get(conversation["id"], []),
+        key=lambda row: row.get("message_at") or "", reverse=True,
+    )[:12]
     prior_outbound = next((
         row for row in prior_messages
         if row.get("direction") == "outbound"
@@ -437,14 +602,9 @@ def _record_suggestion(conversation: dict, message: dict, body: str) -> dict:
 
     # Consecutive inbound messages are one editor job. Approved or drafted work
     # remains visible, but older unapproved alternatives leave the queue.
-    now = datetime.now(timezone.utc).isoformat()
-    for pending in db.select(
-        "gg_lead_reply_suggestions", match={"conversation_id": conversation["id"]},
-    ):
+    for pending in batch.suggestions.get(conversation["id"], []):
         if pending.get("status") in {"suggested", "needs_coach_answer"}:
-            db.update("gg_lead_reply_suggestions", {
-                "status": "superseded", "updated_at": now,
-            }, {"id": pending["id"]})
+            batch.update_suggestion(pending, {"status": "superseded", "updated_at": batch.now})
     first_name = (conversation.get("contact_name") or "").split(" ", 1)[0]
     suggestion = build_reply_suggestion(
         text=body,
@@ -454,7 +614,7 @@ def _record_suggestion(conversation: dict, message: dict, body: str) -> dict:
         lead_turn=lead_turn,
     )
     status = "needs_coach_answer" if suggestion["needs_coach_answer"] else "suggested"
-    return db.insert("gg_lead_reply_suggestions", {
+    return batch.add_suggestion({
         "conversation_id": conversation["id"],
         "inbound_message_id": message["id"],
         "initial_draft_text": suggestion["draft_text"],
@@ -468,23 +628,19 @@ def _record_suggestion(conversation: dict, message: dict, body: str) -> dict:
 
 
 def _record_existing_draft_conflict(
-    conversation: dict, message: dict, body: str,
+    conversation: dict, message: dict, body: str, batch: _SyncBatch,
 ) -> dict | None:
     """Surface an untracked Gmail draft without ever replacing or duplicating it."""
     tracked = next((
-        row for row in db.select(
-            "gg_lead_reply_suggestions", match={"conversation_id": conversation["id"]},
-        )
+        row for row in batch.suggestions.get(conversation["id"], [])
         if row.get("gmail_draft_message_id") == message["id"]
     ), None)
     if tracked:
         return None
-    existing = db.select_one(
-        "gg_lead_reply_suggestions", match={"inbound_message_id": message["id"]},
-    )
+    existing = batch.suggestion_by_inbound.get(message["id"])
     if existing:
         return existing
-    return db.insert("gg_lead_reply_suggestions", {
+    return batch.add_suggestion({
         "conversation_id": conversation["id"],
         # The schema uses this as the unique source-message key. For a conflict,
         # the source is deliberately the existing Gmail draft itself.
@@ -503,25 +659,15 @@ def _record_existing_draft_conflict(
     })
 
 
-def _ingest_thread(thread: dict, candidate_map: dict[str, dict]) -> dict:
-    thread_id = str(thread.get("id", ""))[:255]
-    messages = (thread.get("messages") or [])[:MAX_MESSAGES_PER_THREAD]
-    if not thread_id or not messages:
+def _ingest_thread(thread: dict, batch: _SyncBatch) -> dict:
+    thread_id, messages, contact = batch.thread_lead(thread)
+    if not messages:
         return {"status": "ignored", "reason": "empty_thread"}
-
-    candidate_emails = set(candidate_map)
-    contact_email = ""
-    for message in messages:
-        contact_email = _message_contact(message, candidate_emails)
-        if contact_email:
-            break
-    if not contact_email:
-        return {"status": "ignored", "reason": "not_a_known_lead"}
-    contact = _contact_record(contact_email)
     if not contact:
         return {"status": "ignored", "reason": "not_a_known_lead"}
+    contact_email = contact["email"]
 
-    conversation = _conversation(thread_id, contact)
+    conversation = batch.conversations[thread_id]
     inserted = 0
     latest_direction = None
     latest_message_id = None
@@ -536,8 +682,8 @@ def _ingest_thread(thread: dict, candidate_map: dict[str, dict]) -> dict:
     paused = 0
 
     for message in sorted(messages, key=lambda row: row.get("date", "")):
-        message_id = str(message.get("id", ""))[:255]
-        if not message_id or db.select_one("gg_lead_messages", match={"gmail_message_id": message_id}):
+        message_id = _message_id(message)
+        if not message_id or message_id in batch.known_message_ids:
             continue
         direction = _direction(message, contact_email)
         message_at = _parse_message_at(message.get("date", ""))
@@ -547,16 +693,16 @@ def _ingest_thread(thread: dict, candidate_map: dict[str, dict]) -> dict:
         if direction == "inbound":
             # Pause before any downstream drafting work. A suggestion failure
             # must never leave the marketing sequence free to send again.
-            paused += _pause_marketing_sequences(contact)
-            sequence_send, confidence = _sequence_attribution(contact, message)
+            paused += _pause_marketing_sequences(contact, batch)
+            sequence_send, confidence = _sequence_attribution(contact, message, batch)
         elif direction == "outbound":
             # Only exact Reply-To token attribution is safe for an outbound
             # Gmail message. A nearest-send guess could mistake Matti's real
             # reply for automation and erase it from the learning loop.
-            sequence_send, confidence = _exact_sequence_attribution(message)
+            sequence_send, confidence = _exact_sequence_attribution(message, batch)
         question_type = classify_question(body) if direction in {"outbound", "draft"} else "other"
 
-        db.insert("gg_lead_messages", {
+        batch.add_message({
             "gmail_message_id": message_id,
             "conversation_id": conversation["id"],
             "gmail_thread_id": thread_id,
@@ -583,49 +729,43 @@ def _ingest_thread(thread: dict, candidate_map: dict[str, dict]) -> dict:
         if direction == "inbound":
             inbound_delta += 1
             substantive_delta += int(quality == "substantive")
-            suggestion = _record_suggestion(conversation, message, body)
+            suggestion = _record_suggestion(conversation, message, body, batch)
             latest_intent = classify_intent(body)
             latest_question_type = suggestion.get("question_type", "other")
             if sequence_send:
-                current_send = db.select_one(
-                    "gg_sequence_sends", match={"id": sequence_send["id"]},
-                ) or sequence_send
-                updates = {"reply_count": int(current_send.get("reply_count") or 0) + 1}
-                if not current_send.get("first_reply_at"):
+                updates = {"reply_count": int(sequence_send.get("reply_count") or 0) + 1}
+                if not sequence_send.get("first_reply_at"):
                     updates["first_reply_at"] = message_at.isoformat()
                     try:
                         sent_at = datetime.fromisoformat(
-                            (current_send.get("sent_at") or "").replace("Z", "+00:00")
+                            (sequence_send.get("sent_at") or "").replace("Z", "+00:00")
                         )
                         first_reply_latency_seconds = max(
                             0, int((message_at - sent_at).total_seconds()),
                         )
                     except (TypeError, ValueError):
                         pass
-                db.update("gg_sequence_sends", updates, {"id": sequence_send["id"]})
+                batch.update_send(sequence_send, updates)
                 last_sequence_send_id = sequence_send["id"]
         elif direction == "outbound":
             outbound_delta += 1
             # A real sent reply supersedes every still-pending suggestion in this thread.
-            for pending in db.select("gg_lead_reply_suggestions", match={"conversation_id": conversation["id"]}):
+            for pending in batch.suggestions.get(conversation["id"], []):
                 if pending.get("status") in {"suggested", "needs_coach_answer", "approved_for_gmail", "gmail_drafted"}:
-                    db.update("gg_lead_reply_suggestions", {
+                    batch.update_suggestion(pending, {
                         "status": "sent", "sent_at": message_at.isoformat(),
-                        "updated_at": datetime.now(timezone.utc).isoformat(),
-                    }, {"id": pending["id"]})
+                        "updated_at": batch.now,
+                    })
         elif direction == "draft":
-            _record_existing_draft_conflict(conversation, message, body)
+            _record_existing_draft_conflict(conversation, message, body, batch)
 
     if inserted:
-        now = datetime.now(timezone.utc).isoformat()
         status = conversation.get("status", "needs_reply")
         if latest_direction == "inbound":
             status = "suggested"
         elif latest_direction == "draft":
             tracked = next((
-                row for row in db.select(
-                    "gg_lead_reply_suggestions", match={"conversation_id": conversation["id"]},
-                )
+                row for row in batch.suggestions.get(conversation["id"], [])
                 if row.get("gmail_draft_message_id") == latest_message_id
                 and row.get("status") == "gmail_drafted"
             ), None)
@@ -641,25 +781,38 @@ def _ingest_thread(thread: dict, candidate_map: dict[str, dict]) -> dict:
             "inbound_count": int(conversation.get("inbound_count") or 0) + inbound_delta,
             "outbound_count": int(conversation.get("outbound_count") or 0) + outbound_delta,
             "substantive_reply_count": int(conversation.get("substantive_reply_count") or 0) + substantive_delta,
-            "updated_at": now,
+            "updated_at": batch.now,
         }
         if latest_at and latest_direction == "inbound":
             updates["last_inbound_at"] = latest_at.isoformat()
         elif latest_at and latest_direction == "outbound":
             updates["last_outbound_at"] = latest_at.isoformat()
-        db.update("gg_lead_conversations", updates, {"id": conversation["id"]})
-        db.log_action(
+        batch.update_conversation(conversation, updates)
+        batch.log.append((
             "gmail_lead_sync", "lead_conversation", conversation["id"],
             f"{inserted} new message(s); {paused} marketing enrollment(s) paused",
-        )
+        ))
     return {"status": "recorded", "messages": inserted, "paused": paused}
 
 
 def ingest_gmail_sync(payload: dict) -> dict:
     threads = (payload.get("threads") or [])[:MAX_THREADS_PER_SYNC]
     candidates = get_sync_candidates()
-    candidate_map = {row["email"]: row for row in candidates}
-    results = [_ingest_thread(thread, candidate_map) for thread in threads]
+    batch = _SyncBatch(threads, {row["email"] for row in candidates})
+    results = []
+    try:
+        for thread in threads:
+            results.append(_ingest_thread(thread, batch))
+    except Exception:
+        # A failing thread must not drop the pauses (and messages) recorded
+        # for the threads before it; flush() writes pauses first. The
+        # thread's error is the one that propagates.
+        try:
+            batch.flush()
+        except Exception:
+            logger.exception("Failed to flush Gmail sync writes after a thread error")
+        raise
+    batch.flush()
     return {
         "threads": len(results),
         "recorded": sum(1 for row in results if row["status"] == "recorded"),
@@ -0,0 +1,75 @@
+"""Panel loader — run a page's independent blocking queries concurrently.
+
+Dashboard pages like /triage call a dozen synchronous Supabase helpers.
+Called in turn from an async route they block the event loop (and the
+scheduler running on it) for the sum of their round trips. load_panels()
+runs them on a bounded thread pool instead, so the page waits roughly as
+long as its slowest query. Each panel has its own timeout; a panel that
+raises or times out gets its fallback value and is reported as degraded,
+and every other panel still renders.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# Seconds a single panel may take before the page renders without it
+PANEL_TIMEOUT = 8.0
+
+# Shared by all requests; bounds concurrent Supabase queries from page loads
+_MAX_WORKERS = 8
+_executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="mc-panel")
+
+
+@dataclass(frozen=True)
+class Panel:
+    """One independently loadable block of page data.
+
+    load is called with the results of the panels named in deps (in
+    order); fallback builds the value used when it fails.
+    """
+    name: str
+    load: Callable[..., Any]
+    fallback: Callable[[], Any] = list
+    deps: tuple[str, ...] = ()
+    timeout: float = PANEL_TIMEOUT
+
+
+async def load_panels(panels: list[Panel]) -> tuple[dict[str, Any], list[str]]:
+    """Load every panel concurrently.
+
+    Returns ({name: value}, [names of degraded panels]). Never raises for
+    a panel failure. A timed-out query keeps its worker thread until it
+    returns, but the page no longer waits for it.
+    """
+    loop = asyncio.get_running_loop()
+    tasks: dict[str, asyncio.Task] = {}
+    degraded: list[str] = []
+
+    async def _load(panel: Panel):
+        args = [await tasks[dep] for dep in panel.deps]
+        start = time.monotonic()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(_executor, panel.load, *args), panel.timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Panel %s timed out after %.1fs", panel.name, panel.timeout)
+        except Exception:
+            logger.exception("Panel %s failed to load", panel.name)
+        finally:
+            logger.debug("Panel %s took %.3fs", panel.name, time.monotonic() - start)
+        degraded.append(panel.name)
+        return panel.fallback()
+
+    for panel in panels:
+        tasks[panel.name] = asyncio.ensure_future(_load(panel))
+    values = await asyncio.gather(*tasks.values())
+    order = {p.name: i for i, p in enumerate(panels)}
+    degraded.sort(key=order.__getitem__)
+    return dict(zip(tasks, values)), degraded
@@ -1,25 +1,51 @@
-"""Pipeline runner — subprocess wrapper for run_pipeline.py.
-
-Runs pipeline as subprocess for process isolation (run_pipeline.py calls sys.exit).
-Background thread keeps HTTP response non-blocking.
-Uploads artifacts to Supabase Storage on completion.
+"""Pipeline runner — durable queue and warm worker pool for run_pipeline.py.
+
+trigger_pipeline() only records the run: a gg_pipeline_runs row with
+status "pending" is the queue entry, so queued runs survive a restart.
+PIPELINE_CONCURRENCY worker threads claim the oldest pending run (a
+conditional pending -> running update, so two workers never share one)
+and hand it to a warm child process (pipeline_worker) that has already
+imported the pipeline — no interpreter startup per run, and sys.exit in
+run_pipeline.py still can't take down the app.
+
+Progress streams back as the pipeline prints: each "[Step N] LABEL"
+line updates current_step and steps_completed, which the run detail
+page polls along with the run's queue position.
+
+Audits are quick read-only checks and still run straight away as a
+subprocess. Uploads artifacts to Supabase Storage on completion.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import queue
+import re
 import subprocess
+import sys
 import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 
-from mission_control.config import ATHLETES_DIR, PIPELINE_SCRIPT, PRE_DELIVERY_AUDIT
+from mission_control.config import (
+    ATHLETES_DIR,
+    PIPELINE_CONCURRENCY,
+    PRE_DELIVERY_AUDIT,
+    REPO_ROOT,
+)
 from mission_control import supabase_client as db
 
 logger = logging.getLogger(__name__)
 
+PIPELINE_TIMEOUT = 600
+# Fallback poll for runs queued by another process; local triggers wake a worker at once
+_POLL_SECS = 30.0
+_WARMUP_TIMEOUT = 120.0
+# Recycle a worker process after this many runs so leaked state stays bounded
+_MAX_JOBS_PER_WORKER = 25
+
 
 def trigger_pipeline(
     athlete_id: str,
@@ -29,12 +55,12 @@ def trigger_pipeline(
     skip_deploy: bool = True,
     skip_deliver: bool = True,
 ) -> str:
-    """Start a pipeline run in background thread. Returns pipeline_run UUID."""
+    """Queue a pipeline run for the worker pool. Returns pipeline_run UUID."""
     intake_path = ATHLETES_DIR / slug / "intake.json"
     if not intake_path.exists():
         raise FileNotFoundError(f"No intake.json for {slug}")
 
-    # Create run record
+    # Create run record — status "pending" is its place in the queue
     run = db.create_pipeline_run(
         athlete_id=athlete_id,
         run_type=run_type,
@@ -43,34 +69,16 @@ def trigger_pipeline(
         skip_deliver=skip_deliver,
     )
     run_id = run["id"]
+    db.update_pipeline_run(run_id, {"current_step": "queued"})
 
     # Update athlete status
     db.update_athlete(slug, {"plan_status": "pipeline_running"})
 
-    # Update run to running
-    db.update_pipeline_run(run_id, {"status": "running", "current_step": "starting"})
-
     # Log audit
     db.log_action("pipeline_triggered", "athlete", str(athlete_id),
                   f"run_type={run_type}, run_id={run_id}")
 
-    # Build command
-    cmd = ["python3", str(PIPELINE_SCRIPT), str(intake_path)]
-    if skip_pdf:
-        cmd.append("--skip-pdf")
-    if skip_deploy:
-        cmd.append("--skip-deploy")
-    if skip_deliver:
-        cmd.append("--skip-deliver")
-
-    # Run in background thread (non-daemon so shutdown waits for completion)
-    thread = threading.Thread(
-        target=_run_pipeline_subprocess,
-        args=(run_id, athlete_id, slug, cmd),
-        name=f"pipeline-{run_id[:8]}",
-    )
-    thread.start()
-
+    get_pool().notify()
     return run_id
 
 
@@ -102,66 +110,316 @@ def get_run_status(run_id: str) -> dict | None:
     return db.get_pipeline_run(run_id)
 
 
+def queue_position(run_id: str) -> int | None:
+    """1-based place of a pending run in the queue (None once it has started)."""
+    for position, run in enumerate(db.get_queued_pipeline_runs(), start=1):
+        if run["id"] == run_id:
+            return position
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+class _WarmWorker:
+    """A long-lived pipeline_worker child process."""
+
+    def __init__(self):
+        self.jobs = 0
+        self._proc = subprocess.Popen(
+            [sys.executable, "-m", "mission_control.services.pipeline_worker"],
+            cwd=str(REPO_ROOT),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        self._messages: queue.Queue = queue.Queue()
+        threading.Thread(target=self._read, daemon=True,
+                         name=f"pipeline-worker-{self._proc.pid}").start()
+        ready = self._next(_WARMUP_TIMEOUT)
+        if "error" in ready:
+            self.close()
+            raise RuntimeError(f"Pipeline worker failed to start:\n{ready['error']}")
+
+    def _read(self) -> None:
+        for line in self._proc.stdout:
+            self._messages.put(json.loads(line))
+        self._messages.put(None)
+
+    def _next(self, timeout: float) -> dict:
+        try:
+            msg = self._messages.get(timeout=max(timeout, 0))
+        except queue.Empty:
+            raise subprocess.TimeoutExpired(self._proc.args, timeout)
+        if msg is None:
+            raise RuntimeError(f"Pipeline worker exited (code {self._proc.wait()})")
+        return msg
+
+    def run(self, job: dict, on_output, timeout: float) -> tuple[int, str]:
+        """Run one job; on_output gets printed text as it arrives.
+
+        Returns (exit code, stderr). Raises TimeoutExpired after timeout.
+        """
+        self.jobs += 1
+        self._proc.stdin.write(json.dumps(job) + "\n")
+        self._proc.stdin.flush()
+        deadline = time.monotonic() + timeout
+        while True:
+            msg = self._next(deadline - time.monotonic())
+            if "out" in msg:
+                on_output(msg["out"])
+            else:
+                return msg["exit"], msg.get("stderr", "")
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            self._proc.kill()
+        self._proc.wait()
+
+
+class PipelinePool:
+    """Fixed set of worker threads draining the gg_pipeline_runs queue."""
+
+    def __init__(self, concurrency: int = PIPELINE_CONCURRENCY, worker_factory=_WarmWorker):
+        self.concurrency = max(1, concurrency)
+        self._worker_factory = worker_factory
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """Fail runs orphaned by a restart, then start the workers."""
+        if self._threads:
+            return
+        db.update("gg_pipeline_runs", {
+            "status": "failed",
+            "current_step": "interrupted",
+            "error_message": "Interrupted by a restart — trigger the run again",
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+        }, {"status": "running"})
+        for i in range(self.concurrency):
+            thread = threading.Thread(target=self._loop, name=f"pipeline-pool-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def notify(self) -> None:
+        """Wake idle workers to look at the queue."""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """Let in-flight runs finish, then shut the workers down."""
+        self._stopping.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _loop(self) -> None:
+        worker = None
+        while not self._stopping.is_set():
+            # Clear before looking so a notify() during the claim isn't lost
+            self._wake.clear()
+            try:
+                run = _claim_next_run()
+            except Exception:
+                logger.exception("Pipeline queue: claim failed")
+                run = None
+            if run is None:
+                self._wake.wait(_POLL_SECS)
+                continue
+            worker = self.execute(run, worker)
+        if worker:
+            worker.close()
+
+    def execute(self, run: dict, worker=None):
+        """Run a claimed run on worker (starting one if needed).
+
+        Returns the worker to reuse for the next run, or None if it had to
+        be discarded.
+        """
+        run_id = run["id"]
+        athlete_id = run["athlete_id"]
+        start = time.time()
+        progress = _Progress(run_id)
+        slug = ""
+        try:
+            athlete = db.get_athlete_by_id(athlete_id)
+            if not athlete:
+                raise RuntimeError(f"Athlete {athlete_id} not found")
+            slug = athlete["slug"]
+            job = {
+                "intake": str(ATHLETES_DIR / slug / "intake.json"),
+                "skip_pdf": run.get("skip_pdf", True),
+                "skip_deploy": run.get("skip_deploy", True),
+                "skip_deliver": run.get("skip_deliver", True),
+            }
+            if worker is not None and worker.jobs >= _MAX_JOBS_PER_WORKER:
+                worker.close()
+                worker = None
+            if worker is None:
+                worker = self._worker_factory()
+            code, stderr = worker.run(job, progress.feed, PIPELINE_TIMEOUT)
+            _record_result(run_id, athlete_id, slug, code, progress.stdout, stderr,
+                           time.time() - start, progress.finish(code == 0))
+        except subprocess.TimeoutExpired:
+            worker = _discard(worker)
+            _record_failure(run_id, "timeout", "Pipeline timed out after 10 minutes",
+                            start, progress.finish(False))
+        except Exception as e:
+            worker = _discard(worker)
+            _record_failure(run_id, "error", str(e)[:2000], start, progress.finish(False))
+        return worker
+
+
+def _discard(worker) -> None:
+    if worker is not None:
+        worker.close()
+    return None
+
+
+def _claim_next_run() -> dict | None:
+    """Claim the oldest pending run, or None if the queue is empty."""
+    for run in db.get_queued_pipeline_runs(limit=PIPELINE_CONCURRENCY + 1):
+        claimed = db.claim_pipeline_run(run["id"])
+        if claimed:
+            return claimed
+    return None
+
+
+_pool: PipelinePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> PipelinePool:
+    """The process-wide pool, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PipelinePool()
+            _pool.start()
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the pool if it was started (app shutdown)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool:
+        pool.stop()
+
+
+_STEP_LINE = re.compile(r"\[Step (\S+)\] (.*\S)")
+
+
+class _Progress:
+    """Turns run_pipeline's "[Step N] LABEL ... OK" output into run updates."""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.steps: list[dict] = []
+        self._chunks: list[str] = []
+        self._step_started = 0.0
+
+    @property
+    def stdout(self) -> str:
+        return "".join(self._chunks)
+
+    def feed(self, text: str) -> None:
+        self._chunks.append(text)
+        m = _STEP_LINE.match(text)
+        if m:
+            self._close("completed")
+            num, label = m.groups()
+            self.steps.append({"step": label, "status": "running", "message": f"Step {num}"})
+            self._step_started = time.monotonic()
+            db.update_pipeline_run(self.run_id, {"current_step": label, "steps_completed": self.steps})
+        elif text.startswith("... OK") and self._close("completed"):
+            db.update_pipeline_run(self.run_id, {"steps_completed": self.steps})
+
+    def finish(self, ok: bool) -> list[dict]:
+        """Close the open step and return the step list."""
+        self._close("completed" if ok else "failed")
+        return self.steps
+
+    def _close(self, status: str) -> bool:
+        if not self.steps or self.steps[-1]["status"] != "running":
+            return False
+        self.steps[-1]["status"] = status
+        self.steps[-1]["duration_ms"] = round((time.monotonic() - self._step_started) * 1000)
+        return True
+
+
 def _run_pipeline_subprocess(run_id: str, athlete_id: str, slug: str, cmd: list[str]) -> None:
-    """Execute pipeline subprocess, updating Supabase with progress."""
+    """Execute a one-off subprocess (audits), updating Supabase with the result."""
     start = time.time()
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
-            timeout=600,
+            timeout=PIPELINE_TIMEOUT,
         )
+        _record_result(run_id, athlete_id, slug, result.returncode,
+                       result.stdout, result.stderr, time.time() - start)
 
-        duration = time.time() - start
-        stdout = result.stdout[-10000:] if len(result.stdout) > 10000 else result.stdout
-        stderr = result.stderr[-5000:] if len(result.stderr) > 5000 else result.stderr
-
-        if result.returncode == 0:
-            db.update_pipeline_run(run_id, {
-                "status": "completed",
-                "current_step": "done",
-                "stdout": stdout,
-                "duration_secs": round(duration, 1),
-                "finished_at": datetime.now(timezone.utc).isoformat(),
-            })
+    except subprocess.TimeoutExpired:
+        _record_failure(run_id, "timeout", "Pipeline timed out after 10 minutes", start)
 
-            # Update athlete with derived/methodology data
-            _sync_athlete_artifacts(athlete_id, slug)
-
-            db.update_athlete(slug, {"plan_status": "pipeline_complete"})
-        else:
-            error_msg = stderr or stdout or f"Exit code {result.returncode}"
-            db.update_pipeline_run(run_id, {
-                "status": "failed",
-                "current_step": "error",
-                "error_message": error_msg[-2000:],
-                "stdout": stdout,
-                "duration_secs": round(duration, 1),
-                "finished_at": datetime.now(timezone.utc).isoformat(),
-            })
+    except Exception as e:
+        _record_failure(run_id, "error", str(e)[:2000], start)
 
-    except subprocess.TimeoutExpired:
-        duration = time.time() - start
+
+def _record_result(run_id: str, athlete_id: str, slug: str, returncode: int,
+                   stdout: str, stderr: str, duration: float,
+                   steps: list[dict] | None = None) -> None:
+    """Store a finished run; on success sync artifacts to the athlete."""
+    stdout = stdout[-10000:] if len(stdout) > 10000 else stdout
+    stderr = stderr[-5000:] if len(stderr) > 5000 else stderr
+    extra = {"steps_completed": steps} if steps is not None else {}
+
+    if returncode == 0:
         db.update_pipeline_run(run_id, {
-            "status": "failed",
-            "current_step": "timeout",
-            "error_message": "Pipeline timed out after 10 minutes",
+            "status": "completed",
+            "current_step": "done",
+            "stdout": stdout,
             "duration_secs": round(duration, 1),
             "finished_at": datetime.now(timezone.utc).isoformat(),
+            **extra,
         })
 
-    except Exception as e:
-        duration = time.time() - start
+        # Update athlete with derived/methodology data
+        _sync_athlete_artifacts(athlete_id, slug)
+
+        db.update_athlete(slug, {"plan_status": "pipeline_complete"})
+    else:
+        error_msg = stderr or stdout or f"Exit code {returncode}"
         db.update_pipeline_run(run_id, {
             "status": "failed",
             "current_step": "error",
-            "error_message": str(e)[:2000],
+            "error_message": error_msg[-2000:],
+            "stdout": stdout,
             "duration_secs": round(duration, 1),
             "finished_at": datetime.now(timezone.utc).isoformat(),
+            **extra,
         })
 
 
+def _record_failure(run_id: str, step: str, message: str, start: float,
+                    steps: list[dict] | None = None) -> None:
+    data = {
+        "status": "failed",
+        "current_step": step,
+        "error_message": message,
+        "duration_secs": round(time.time() - start, 1),
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+    }
+    if steps is not None:
+        data["steps_completed"] = steps
+    db.update_pipeline_run(run_id, data)
+
+
 def _sync_athlete_artifacts(athlete_id: str, slug: str) -> None:
     """After pipeline completion, sync derived data and upload artifacts."""
     athlete_dir = ATHLETES_DIR / slug
@@ -0,0 +1,93 @@
+"""Warm pipeline worker — runs run_pipeline.py jobs in a long-lived process.
+
+pipeline_runner keeps one of these per worker slot. It imports the
+pipeline (and everything the steps import at module level) once, then
+reads one JSON job per line on stdin and answers with JSON lines:
+
+  {"ready": true}                  imports done, waiting for jobs
+  {"error": "..."}                 imports failed; the process exits
+  {"out": "..."}                   text the pipeline printed
+  {"exit": 0, "stderr": "..."}     job finished (non-zero = failed)
+
+run_pipeline() calls sys.exit on fatal errors, so SystemExit ends the
+job, not the worker. Started with `python -m mission_control.services.pipeline_worker`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import sys
+import traceback
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _send(channel, msg: dict) -> None:
+    channel.write(json.dumps(msg) + "\n")
+    channel.flush()
+
+
+class _Forward(io.TextIOBase):
+    """stdout replacement that relays every write to the parent."""
+
+    def __init__(self, channel):
+        self._channel = channel
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            _send(self._channel, {"out": text})
+        return len(text)
+
+
+def _run(pipeline, job: dict, channel) -> dict:
+    stderr = io.StringIO()
+    code = 0
+    with contextlib.redirect_stdout(_Forward(channel)), contextlib.redirect_stderr(stderr):
+        try:
+            pipeline.run_pipeline(
+                job["intake"],
+                skip_pdf=job.get("skip_pdf", True),
+                skip_deploy=job.get("skip_deploy", True),
+                skip_deliver=job.get("skip_deliver", True),
+            )
+        except SystemExit as e:
+            if isinstance(e.code, int) or e.code is None:
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except Exception:
+            traceback.print_exc()
+            code = 1
+    return {"exit": code, "stderr": stderr.getvalue()}
+
+
+def main() -> None:
+    # Keep fd 1 for the protocol; anything a child process (Playwright,
+    # git) writes to its inherited stdout lands on stderr instead.
+    channel = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+
+    sys.path.insert(0, str(REPO_ROOT))
+    os.chdir(REPO_ROOT)
+    try:
+        import run_pipeline
+    except Exception:
+        _send(channel, {"error": traceback.format_exc()})
+        sys.exit(1)
+    _send(channel, {"ready": True})
+
+    for line in sys.stdin:
+        if line.strip():
+            _send(channel, _run(run_pipeline, json.loads(line), channel))
+
+
+if __name__ == "__main__":
+    main()
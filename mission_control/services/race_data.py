@@ -1,8 +1,9 @@
 """Race database service — singleton loader for the races API.
 
 Wraps scripts.race_lookup.RaceLookup in a FastAPI-friendly singleton
-that loads race-index.json (for list queries) and individual race-data/*.json
-(for full profile lookups) once at import time.
+that loads race-index.json (for list queries) and the race-data/ corpus
+(for full profile lookups, via the shared scripts/race_corpus.py snapshot)
+once at import time.
 """
 
 from __future__ import annotations
@@ -13,6 +14,8 @@ from pathlib import Path
 from typing import Optional
 
 from mission_control.config import REPO_ROOT
+from scripts.race_corpus import load_corpus
+from scripts.race_query import RaceQueryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +43,7 @@ class RaceDB:
             "leadville": "leadville-100",
             "mid_south": "mid-south",
         }
+        self._query: RaceQueryIndex | None = None
         self._loaded = False
 
     def load(self, index_path: Path | None = None, data_dir: Path | None = None) -> None:
@@ -59,12 +63,7 @@ class RaceDB:
 
         # Load individual profiles
         if ddir.is_dir():
-            for f in sorted(ddir.glob("*.json")):
-                try:
-                    data = json.loads(f.read_text())
-                    self._profiles[f.stem] = data
-                except (json.JSONDecodeError, KeyError):
-                    continue
+            self._profiles = load_corpus(ddir).profiles
             logger.info("Loaded %d race profiles", len(self._profiles))
         else:
             logger.warning("Race data dir not found at %s", ddir)
@@ -76,6 +75,14 @@ class RaceDB:
         self.load()
         return self._index
 
+    @property
+    def query_index(self) -> RaceQueryIndex:
+        """Filter/sort index over self.index, rebuilt if the index is replaced."""
+        index = self.index
+        if self._query is None or self._query.entries is not index:
+            self._query = RaceQueryIndex(index)
+        return self._query
+
     def get_profile(self, slug: str) -> Optional[dict]:
         """Get full race profile by slug, with fuzzy/alias matching."""
         self.load()
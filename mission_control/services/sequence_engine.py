@@ -10,15 +10,18 @@ import random
 import re
 import secrets
 import urllib.parse
-from html import escape as html_escape
 from datetime import datetime, timedelta, timezone
 from email.utils import formataddr, parseaddr
 
 from mission_control import supabase_client as db
 from mission_control.config import (
-    PUBLIC_URL, RESEND_API_KEY, UNSUBSCRIBE_SECRET, WEB_TEMPLATES_DIR,
+    PUBLIC_URL, RESEND_API_KEY, SEQUENCE_SEND_CONCURRENCY, UNSUBSCRIBE_SECRET,
+    WEB_TEMPLATES_DIR,
 )
 from mission_control.sequences import get_sequence, SEQUENCES
+from mission_control.services.email_templates import (
+    EmailTemplate, inject_footer, load_template,
+)
 
 # Triggers that are post-purchase — should NOT be suppressed for customers
 _POST_PURCHASE_TRIGGERS = {"plan_purchased"}
@@ -195,6 +198,8 @@ async def process_due_sends() -> dict:
 
     Uses an async lock to prevent concurrent invocations from sending
     duplicate emails (e.g. if scheduler fires twice in quick succession).
+    Due enrollments are handled in batches (see _process_batch) so a large
+    enrollment wave fits in the 15-minute scheduler window.
 
     Returns dict with counts: {processed, sent, errors, skipped}.
     """
@@ -212,54 +217,214 @@ async def process_due_sends() -> dict:
         enrollments = result.data or []
 
         sent = 0
-        errors = 0
+        for i in range(0, len(enrollments), _BATCH_SIZE):
+            batch = enrollments[i:i + _BATCH_SIZE]
+            try:
+                outcomes = await _process_batch(batch)
+            except Exception:
+                logger.exception("Error processing batch of %d enrollments", len(batch))
+                continue
+            sent += sum(outcomes)
+
+        return {"processed": len(enrollments), "sent": sent,
+                "errors": len(enrollments) - sent, "skipped": False}
+
+
+async def _send_next_step(enrollment: dict) -> bool:
+    """Send the current step for an enrollment and advance to next."""
+    return (await _process_batch([enrollment]))[0]
+
+
+# Enrollments per batch: suppression lookup, sends, then bulk writes. Bounds
+# how many sends could go unrecorded if the process dies mid-batch.
+_BATCH_SIZE = 50
+
+_SUPPRESSING_PLAN_STATUSES = ("delivered", "approved", "audit_passed")
+
+
+class _BatchWrites:
+    """Enrollment updates and send rows collected during one batch.
+
+    Enrollments that end up with identical updates (same completion, or
+    same next step and next_send_at — the norm in an enrollment wave)
+    share one UPDATE ... WHERE id IN (...). Only changed columns are
+    written, so an unsubscribe or bounce landing mid-batch isn't
+    overwritten the way a full-row upsert would.
+    """
 
-        for enrollment in enrollments:
+    def __init__(self, now: datetime):
+        self.now = now
+        self.updates: dict[tuple, list] = {}
+        self.sends: list[dict] = []
+
+    def update(self, enrollment_id, data: dict) -> None:
+        key = tuple(sorted(data.items()))
+        self.updates.setdefault(key, []).append(enrollment_id)
+
+    def complete(self, enrollment_id, **extra) -> None:
+        self.update(enrollment_id, {
+            "status": "completed", "completed_at": self.now.isoformat(), **extra,
+        })
+
+    def flush(self) -> set:
+        """Write everything queued; return the enrollment ids whose writes failed.
+
+        Each write is attempted regardless of the others: a send row that
+        lands while its enrollment update fails still stops the step being
+        re-sent (see _recorded_steps), and vice versa.
+        """
+        failed = set()
+        # Enrollments advance first: the emails are already out, and an
+        # enrollment left due would be sent the same step on the next tick.
+        for key, ids in self.updates.items():
             try:
-                success = await _send_next_step(enrollment)
-                if success:
-                    sent += 1
-                else:
-                    errors += 1
+                db.update_in("gg_sequence_enrollments", dict(key), "id", ids)
             except Exception as e:
-                errors += 1
-                logger.exception("Error sending step for enrollment %s", enrollment["id"])
+                logger.exception("Failed to update %d sequence enrollments", len(ids))
+                db.log_actions([
+                    ("sequence_send_error", "enrollment", str(eid),
+                     f"Enrollment update failed: {e}")
+                    for eid in ids
+                ])
+                failed.update(ids)
+        try:
+            db.insert_many("gg_sequence_sends", self.sends)
+        except Exception as e:
+            logger.exception("Failed to record %d sequence sends", len(self.sends))
+            db.log_action("sequence_send_record_error", "sequence_sends", "",
+                          f"{len(self.sends)} sends not recorded: {e}")
+            failed.update(row["enrollment_id"] for row in self.sends)
+        return failed
+
+
+def _suppressed_customers(emails: list[str]) -> dict[str, str]:
+    """{email: plan_status} for emails belonging to existing customers."""
+    if not emails:
+        return {}
+    rows = db.select_in("gg_athletes", "email,plan_status", "email", emails)
+    return {
+        r["email"]: r["plan_status"] for r in rows
+        if r.get("plan_status") in _SUPPRESSING_PLAN_STATUSES
+    }
+
+
+def _recorded_steps(enrollment_ids: list) -> set[tuple]:
+    """(enrollment_id, step_index) pairs that already have a send row."""
+    if not enrollment_ids:
+        return set()
+    rows = db.select_in("gg_sequence_sends", "enrollment_id,step_index",
+                        "enrollment_id", enrollment_ids)
+    return {(r["enrollment_id"], r["step_index"]) for r in rows}
+
+
+async def _process_batch(enrollments: list[dict]) -> list[bool]:
+    """Send the current step of each enrollment and advance them.
+
+    One suppression query covers every marketing recipient, Resend calls
+    run SEQUENCE_SEND_CONCURRENCY at a time, and sends and enrollment
+    updates are written in bulk at the end. Returns one success flag per
+    enrollment.
+    """
+    outcomes = [False] * len(enrollments)
+    writes = _BatchWrites(datetime.now(timezone.utc))
+    sequences = {sid: get_sequence(sid) for sid in {e["sequence_id"] for e in enrollments}}
+
+    # Customer suppression — don't send marketing emails to existing customers
+    marketing = sorted({
+        e["contact_email"] for e in enrollments
+        if sequences[e["sequence_id"]]
+        and sequences[e["sequence_id"]].get("trigger") not in _POST_PURCHASE_TRIGGERS
+    })
+    try:
+        customers = _suppressed_customers(marketing)
+        recorded = _recorded_steps([e["id"] for e in enrollments])
+    except Exception as e:
+        # Nothing sent; the enrollments stay due and are retried next tick
+        logger.exception("Batch lookups failed for %d enrollments", len(enrollments))
+        db.log_actions([
+            ("sequence_send_error", "enrollment", str(enrollment["id"]),
+             f"Suppression/send lookup failed: {e}")
+            for enrollment in enrollments
+        ])
+        return outcomes
+
+    jobs = []
+    for i, enrollment in enumerate(enrollments):
+        try:
+            job = _plan_step(enrollment, sequences[enrollment["sequence_id"]],
+                             customers, writes, recorded)
+        except Exception as e:
+            logger.exception("Error sending step for enrollment %s", enrollment["id"])
+            db.log_action("sequence_send_error", "enrollment", str(enrollment["id"]), str(e))
+            continue
+        if isinstance(job, bool):
+            outcomes[i] = job
+        else:
+            jobs.append((i, job))
+
+    if jobs:
+        from mission_control.services.lead_nurture import classify_question
+
+        limit = asyncio.Semaphore(max(SEQUENCE_SEND_CONCURRENCY, 1))
+
+        async def _send(job: dict):
+            async with limit:
+                return await asyncio.to_thread(
+                    _send_email_sync, job["to"], job["subject"], job["html"],
+                    job["brand"], job["reply_token"],
+                )
+
+        results = await asyncio.gather(*(_send(job) for _, job in jobs),
+                                       return_exceptions=True)
+        for (i, job), resend_id in zip(jobs, results):
+            enrollment = enrollments[i]
+            if isinstance(resend_id, BaseException):
                 db.log_action(
                     "sequence_send_error",
                     "enrollment",
                     str(enrollment["id"]),
-                    str(e),
+                    f"Resend error on step {job['step_index']}: {resend_id}",
                 )
-
-        return {"processed": len(enrollments), "sent": sent, "errors": errors, "skipped": False}
-
-
-async def _send_next_step(enrollment: dict) -> bool:
-    """Send the current step for an enrollment and advance to next."""
-    seq = get_sequence(enrollment["sequence_id"])
+                continue
+            step = job["step"]
+            writes.sends.append({
+                "enrollment_id": enrollment["id"],
+                "step_index": job["step_index"],
+                "template": step["template"],
+                "subject": job["subject"],
+                "resend_id": resend_id,
+                "status": "sent",
+                "reply_token": job["reply_token"],
+                "question_type": step.get("question_type") or classify_question(job["html"]),
+            })
+            _advance(enrollment, job["steps"], job["step_index"], writes)
+            outcomes[i] = True
+
+    failed = writes.flush()
+    return [ok and enrollment["id"] not in failed
+            for ok, enrollment in zip(outcomes, enrollments)]
+
+
+def _plan_step(enrollment: dict, seq: dict | None, customers: dict[str, str],
+               writes: _BatchWrites, recorded: set[tuple] = frozenset()):
+    """Decide what to do with one due enrollment.
+
+    Returns a send job dict, or a bool when no email goes out (True when
+    the enrollment was completed, suppressed, or its step was already
+    sent; False on a config problem).
+    """
     if not seq:
         return False
 
-    # Customer suppression — don't send marketing emails to existing customers
-    if seq.get("trigger") not in _POST_PURCHASE_TRIGGERS:
-        customer = db.select_one(
-            "gg_athletes",
-            columns="plan_status",
-            match={"email": enrollment["contact_email"]},
+    plan_status = customers.get(enrollment["contact_email"])
+    if plan_status and seq.get("trigger") not in _POST_PURCHASE_TRIGGERS:
+        writes.complete(enrollment["id"])
+        db.log_action(
+            "sequence_suppressed", "enrollment", str(enrollment["id"]),
+            f"Customer suppression: {enrollment['contact_email']} "
+            f"has plan_status={plan_status}",
         )
-        if customer and customer.get("plan_status") in (
-            "delivered", "approved", "audit_passed",
-        ):
-            db.update("gg_sequence_enrollments", {
-                "status": "completed",
-                "completed_at": datetime.now(timezone.utc).isoformat(),
-            }, {"id": enrollment["id"]})
-            db.log_action(
-                "sequence_suppressed", "enrollment", str(enrollment["id"]),
-                f"Customer suppression: {enrollment['contact_email']} "
-                f"has plan_status={customer['plan_status']}",
-            )
-            return True
+        return True
 
     variant_key = enrollment["variant"]
     variant = seq["variants"].get(variant_key)
@@ -271,10 +436,12 @@ async def _send_next_step(enrollment: dict) -> bool:
 
     if step_index >= len(steps):
         # Sequence complete
-        db.update("gg_sequence_enrollments", {
-            "status": "completed",
-            "completed_at": datetime.now(timezone.utc).isoformat(),
-        }, {"id": enrollment["id"]})
+        writes.complete(enrollment["id"])
+        return True
+
+    if (enrollment["id"], step_index) in recorded:
+        # Sent on an earlier tick whose enrollment update failed
+        _advance(enrollment, steps, step_index, writes)
         return True
 
     step = steps[step_index]
@@ -283,87 +450,56 @@ async def _send_next_step(enrollment: dict) -> bool:
     # Render subject with source_data substitutions
     subject = _render_subject(step["subject"], enrollment.get("source_data") or {})
 
-    # Render email template, inject UTM tracking, and inject unsubscribe link
-    html = _render_template(step["template"], enrollment)
-    html = _inject_utm_params(
-        html,
-        sequence_id=enrollment["sequence_id"],
-        variant=enrollment["variant"],
-        step_index=step_index,
-        brand=brand,
+    # Render email template with UTM tracking and the unsubscribe link
+    html = _render_template(
+        step["template"], enrollment,
+        utm=_utm_query(enrollment["sequence_id"], enrollment["variant"], step_index, brand),
+        footer=_unsubscribe_block(enrollment["contact_email"]),
     )
-    html = _inject_unsubscribe(html, enrollment["contact_email"])
 
-    # Send via Resend (in thread to avoid blocking event loop)
     if not RESEND_API_KEY:
         logger.warning("RESEND_API_KEY not set — skipping send for %s step %d",
                         enrollment["contact_email"], step_index)
         return False
 
-    try:
-        reply_token = secrets.token_hex(16)
-        resend_id = await asyncio.to_thread(
-            _send_email_sync,
-            enrollment["contact_email"],
-            subject,
-            html,
-            brand,
-            reply_token,
-        )
-    except Exception as e:
-        db.log_action(
-            "sequence_send_error",
-            "enrollment",
-            str(enrollment["id"]),
-            f"Resend error on step {step_index}: {e}",
-        )
-        return False
-
-    # Record send
-    from mission_control.services.lead_nurture import classify_question
-
-    db.insert("gg_sequence_sends", {
-        "enrollment_id": enrollment["id"],
-        "step_index": step_index,
-        "template": step["template"],
+    return {
+        "to": enrollment["contact_email"],
         "subject": subject,
-        "resend_id": resend_id,
-        "status": "sent",
-        "reply_token": reply_token,
-        "question_type": step.get("question_type") or classify_question(html),
-    })
+        "html": html,
+        "brand": brand,
+        "reply_token": secrets.token_hex(16),
+        "step": step,
+        "steps": steps,
+        "step_index": step_index,
+    }
 
-    # Advance to next step
+
+def _advance(enrollment: dict, steps: list[dict], step_index: int,
+             writes: _BatchWrites) -> None:
+    """Queue the enrollment update that follows a successful send."""
     next_step = step_index + 1
-    now = datetime.now(timezone.utc)
 
     if next_step >= len(steps):
         # Sequence complete after this send
-        db.update("gg_sequence_enrollments", {
-            "current_step": next_step,
-            "status": "completed",
-            "completed_at": now.isoformat(),
-            "next_send_at": None,
-        }, {"id": enrollment["id"]})
-    else:
-        # Schedule next send.
-        # delay_days is CUMULATIVE from enrollment (day 0, 3, 7 = gaps of 3, 4).
-        # Delta = next step's delay minus current step's delay.
-        # min 1 day gap to prevent same-day sends from config errors.
-        # _step_delay_days() also resolves delay_from_completion_days steps
-        # (plan_weeks*7 + N) — see that function for fallback semantics.
-        source_data = enrollment.get("source_data") or {}
-        next_delay = _step_delay_days(steps[next_step], source_data)
-        current_delay = _step_delay_days(step, source_data)
-        delta_days = next_delay - current_delay
-        next_send = now + timedelta(days=max(delta_days, 1))
-
-        db.update("gg_sequence_enrollments", {
-            "current_step": next_step,
-            "next_send_at": next_send.isoformat(),
-        }, {"id": enrollment["id"]})
+        writes.complete(enrollment["id"], current_step=next_step, next_send_at=None)
+        return
+
+    # Schedule next send.
+    # delay_days is CUMULATIVE from enrollment (day 0, 3, 7 = gaps of 3, 4).
+    # Delta = next step's delay minus current step's delay.
+    # min 1 day gap to prevent same-day sends from config errors.
+    # _step_delay_days() also resolves delay_from_completion_days steps
+    # (plan_weeks*7 + N) — see that function for fallback semantics.
+    source_data = enrollment.get("source_data") or {}
+    next_delay = _step_delay_days(steps[next_step], source_data)
+    current_delay = _step_delay_days(steps[step_index], source_data)
+    delta_days = next_delay - current_delay
+    next_send = writes.now + timedelta(days=max(delta_days, 1))
 
-    return True
+    writes.update(enrollment["id"], {
+        "current_step": next_step,
+        "next_send_at": next_send.isoformat(),
+    })
 
 
 def _render_subject(subject: str, source_data: dict) -> str:
@@ -377,50 +513,28 @@ def _render_subject(subject: str, source_data: dict) -> str:
     return subject.replace("{race_name}", "your race")
 
 
-def _apply_conditionals(html: str, data: dict) -> str:
-    """Mustache-style conditional blocks for optional personalization.
-
-    {{#key}}...{{/key}}  kept only when data[key] is truthy
-    {{^key}}...{{/key}}  kept only when data[key] is missing/empty
-
-    Lets one template serve both known-race signups (race_profile /
-    prep_kit captures carry race_name) and anonymous ones (exit_intent)
-    — the friend-opener rule: talk about THEM when you know anything
-    about them, and never leak an empty placeholder when you don't.
-
-    Blocks may nest (e.g. {{^any_context}} wrapping {{^offseason}}/
-    {{#offseason}} in welcome_value) — a single regex pass only resolves
-    the outermost block and leaves inner tags raw inside its kept body,
-    so this re-applies to a fixed point (repeats until a pass makes no
-    further change) to resolve arbitrary nesting depth.
-    """
-    import re as _re
-
-    def _repl(m):
-        inverse, key, body = m.group(1) == "^", m.group(2), m.group(3)
-        has = bool(data.get(key))
-        return body if has != inverse else ""
-
-    pattern = _re.compile(r"\{\{([#^])(\w+)\}\}(.*?)\{\{/\2\}\}", _re.S)
-    prev = None
-    while prev != html:
-        prev = html
-        html = pattern.sub(_repl, html)
-    return html
-
-
-def _render_template(template_name: str, enrollment: dict) -> str:
-    """Render a sequence email template."""
+def _load_template(template_name: str) -> EmailTemplate:
+    """Compiled sequence email template (cached; see email_templates)."""
     template_path = WEB_TEMPLATES_DIR / "emails" / "sequences" / f"{template_name}.html"
-
-    if not template_path.exists():
-        raise FileNotFoundError(f"Sequence email template '{template_name}' not found at {template_path}")
-
-    html = template_path.read_text()
-
-    # Replace placeholders with enrollment data
+    try:
+        return load_template(template_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Sequence email template '{template_name}' not found at {template_path}"
+        ) from None
+
+
+def _render_template(template_name: str, enrollment: dict, *,
+                     utm: str = "", footer: str = "") -> str:
+    """Render a sequence email template.
+
+    {{#key}}/{{^key}} blocks are kept when source_data[key] is truthy /
+    missing or empty, which lets one template serve both known-race
+    signups (race_profile / prep_kit captures carry race_name) and
+    anonymous ones (exit_intent). utm and footer fill the template's link
+    and unsubscribe slots (see _utm_query and _unsubscribe_block).
+    """
     source_data = enrollment.get("source_data") or {}
-    html = _apply_conditionals(html, source_data)
     # Most templates open with a bare address ("Roberto —"). A missing name used
     # to fall through to the "there" fallback and render "there —", which reads
     # like a broken merge field. {greeting} carries the dash so the nameless case
@@ -436,40 +550,46 @@ def _render_template(template_name: str, enrollment: dict) -> str:
     # from page JS (race_name, wb_guide, viewed_races) which the intake worker
     # only length-truncates. Without escaping, a crafted race_name closes the
     # paragraph and injects arbitrary HTML — including an <a> to another domain
-    # — into an email sent from our own sending domain. Escape on the way in.
-    replacements = {}
-    for key, val in source_data.items():
-        if val is not None:
-            replacements[f"{{{key}}}"] = html_escape(str(val), quote=True)
-    replacements.update({
-        "{contact_name}": html_escape(enrollment.get("contact_name", ""), quote=True),
-        "{contact_email}": html_escape(enrollment.get("contact_email", ""), quote=True),
-        "{first_name}": html_escape(_first or "there", quote=True),
-        "{greeting}": html_escape(f"{_first} —" if _first else "Hey —", quote=True),
+    # — into an email sent from our own sending domain. render() escapes every
+    # value on the way in.
+    values = {key: str(val) for key, val in source_data.items() if val is not None}
+    values.update({
+        "contact_name": enrollment.get("contact_name", ""),
+        "contact_email": enrollment.get("contact_email", ""),
+        "first_name": _first or "there",
+        "greeting": f"{_first} —" if _first else "Hey —",
     })
-
-    for placeholder, value in replacements.items():
-        html = html.replace(placeholder, value)
-
     # race_name is not guaranteed in source_data — never leak the placeholder
-    return html.replace("{race_name}", "your race")
+    values.setdefault("race_name", "your race")
 
+    return _load_template(template_name).render(values, source_data, utm=utm, footer=footer)
 
-def _inject_utm_params(
-    html: str, sequence_id: str, variant: str, step_index: int,
-    brand: str = "gravelgod",
-) -> str:
-    """Append UTM tracking params to all brand-site links in HTML."""
+
+def _utm_query(sequence_id: str, variant: str, step_index: int,
+               brand: str = "gravelgod") -> str:
+    """Encoded UTM params for brand-site links in one sequence step."""
     from mission_control.config import BRAND_SEQUENCE_SENDERS
 
     sender = BRAND_SEQUENCE_SENDERS.get(brand, BRAND_SEQUENCE_SENDERS["gravelgod"])
-    utm = urllib.parse.urlencode({
+    return urllib.parse.urlencode({
         "utm_source": sender["utm_source"],
         "utm_medium": "email",
         "utm_campaign": sequence_id,
         "utm_content": f"{variant}_{step_index}",
     })
 
+
+def _inject_utm_params(
+    html: str, sequence_id: str, variant: str, step_index: int,
+    brand: str = "gravelgod",
+) -> str:
+    """Append UTM tracking params to all brand-site links in HTML.
+
+    Sequence sends get this from the compiled template instead (see
+    _render_template's utm); this is for already-rendered HTML.
+    """
+    utm = _utm_query(sequence_id, variant, step_index, brand)
+
     def _add_utm(match: re.Match) -> str:
         url = match.group(1)
         sep = "&" if "?" in url else "?"
@@ -520,10 +640,10 @@ def _tagged_reply_to(reply_to: str, token: str) -> str:
     return formataddr((display_name, tagged)) if display_name else tagged
 
 
-def _inject_unsubscribe(html: str, email: str) -> str:
-    """Inject unsubscribe link into email HTML before closing </body> or at end."""
+def _unsubscribe_block(email: str) -> str:
+    """Unsubscribe footer HTML for email."""
     unsub_url = build_unsubscribe_url(email)
-    unsub_block = (
+    return (
         '<div style="text-align:center;padding:16px 32px;font-family:\'Courier New\',monospace;'
         'font-size:11px;color:#8c7568;border-top:1px solid #d4c5b9">'
         f'<a href="{unsub_url}" style="color:#8c7568;text-decoration:underline">'
@@ -531,14 +651,10 @@ def _inject_unsubscribe(html: str, email: str) -> str:
         '</div>'
     )
 
-    if '</body>' in html:
-        html = html.replace('</body>', f'{unsub_block}</body>')
-    elif '</html>' in html:
-        html = html.replace('</html>', f'{unsub_block}</html>')
-    else:
-        html += unsub_block
 
-    return html
+def _inject_unsubscribe(html: str, email: str) -> str:
+    """Inject unsubscribe link into email HTML before closing </body> or at end."""
+    return inject_footer(html, _unsubscribe_block(email))
 
 
 def record_event(resend_id: str, event_type: str) -> bool:
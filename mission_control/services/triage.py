@@ -307,7 +307,11 @@ def get_expanded_health() -> dict:
     warn = sum(1 for c in checks if c["status"] == "warning")
     err = sum(1 for c in checks if c["status"] == "error")
 
-    return {"checks": checks, "ok_count": ok, "warning_count": warn, "error_count": err}
+    return {
+        "checks": checks, "ok_count": ok, "warning_count": warn, "error_count": err,
+        # Informational, not pass/fail — kept out of the counts above
+        "caches": _query_cache_stats(),
+    }
 
 
 def _check_env_vars() -> list[dict]:
@@ -352,6 +356,22 @@ def _check_supabase_tables() -> list[dict]:
     return results
 
 
+def _query_cache_stats() -> list[dict]:
+    """Hit/miss counters for each cached supabase_client helper."""
+    results = []
+    for stats in db.cache_stats():
+        lookups = stats["hits"] + stats["misses"]
+        rate = f"{stats['hits'] / lookups:.0%} hit rate" if lookups else "unused"
+        results.append({
+            "name": stats["name"],
+            "detail": (
+                f"{stats['hits']} hits / {stats['misses']} misses ({rate}); "
+                f"{stats['size']}/{stats['maxsize']} entries, {stats['ttl']:g}s TTL"
+            ),
+        })
+    return results
+
+
 def _check_self_health() -> dict:
     """HTTP GET to PUBLIC_URL/health to verify the service is reachable."""
     from mission_control.config import PUBLIC_URL
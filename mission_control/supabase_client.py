@@ -1,8 +1,12 @@
 """Supabase connection and query helpers for all gg_* tables."""
 from __future__ import annotations
 
+import copy
+import functools
 import re
 import threading
+import time
+from collections import OrderedDict
 from datetime import date, datetime, timezone
 from typing import Any
 
@@ -26,10 +30,105 @@ def get_client() -> Client:
     return _client
 
 
+# ---------------------------------------------------------------------------
+# Read-through cache
+# ---------------------------------------------------------------------------
+# Dashboard pages call the same small read helpers on every view. @cached
+# keeps a helper's results in-process for its TTL; a write through the
+# generic helpers below to any table it reads drops its entries. Writes
+# that bypass them (other processes, raw _table() calls) only show up once
+# the TTL runs out, so TTLs stay short.
+
+class _QueryCache:
+    """LRU of one helper's results, each valid for ttl seconds."""
+
+    def __init__(self, name: str, ttl: float, maxsize: int):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self.generation = 0  # bumped by every invalidation
+        self.hits = 0
+        self.misses = 0
+
+
+_cache_lock = threading.Lock()
+_caches: list[_QueryCache] = []
+_caches_by_table: dict[str, list[_QueryCache]] = {}
+
+
+def cached(*tables: str, ttl: float = 30.0, maxsize: int = 64):
+    """Cache a read helper's results; tables are the ones it reads.
+
+    Callers get a copy, so mutating a result never changes the cache.
+    """
+    def decorator(fn):
+        cache = _QueryCache(fn.__name__, ttl, maxsize)
+        _caches.append(cache)
+        for table in tables:
+            _caches_by_table.setdefault(table, []).append(cache)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with _cache_lock:
+                entry = cache.entries.get(key)
+                if entry and entry[0] > now:
+                    cache.entries.move_to_end(key)
+                    cache.hits += 1
+                    return copy.deepcopy(entry[1])
+                cache.misses += 1
+                generation = cache.generation
+            value = fn(*args, **kwargs)
+            with _cache_lock:
+                # A write that landed while we queried may not be in value
+                if cache.generation == generation:
+                    cache.entries[key] = (now + cache.ttl, value)
+                    cache.entries.move_to_end(key)
+                    while len(cache.entries) > cache.maxsize:
+                        cache.entries.popitem(last=False)
+            return copy.deepcopy(value)
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
+
+
+def invalidate(table: str) -> None:
+    """Drop cached results of every helper that reads table."""
+    with _cache_lock:
+        for cache in _caches_by_table.get(table, ()):
+            cache.entries.clear()
+            cache.generation += 1
+
+
+def clear_cache() -> None:
+    """Drop every cached result and reset the hit/miss counters."""
+    with _cache_lock:
+        for cache in _caches:
+            cache.entries.clear()
+            cache.generation += 1
+            cache.hits = cache.misses = 0
+
+
+def cache_stats() -> list[dict]:
+    """Hit/miss counters and size of each cached helper."""
+    with _cache_lock:
+        return [{
+            "name": cache.name, "hits": cache.hits, "misses": cache.misses,
+            "size": len(cache.entries), "maxsize": cache.maxsize, "ttl": cache.ttl,
+        } for cache in _caches]
+
+
 # ---------------------------------------------------------------------------
 # Generic helpers
 # ---------------------------------------------------------------------------
 
+# Values per in.(...) filter — PostgREST filters travel in the URL
+IN_CHUNK = 200
+
+
 def _table(name: str):
     """Return a table query builder."""
     return get_client().table(name)
@@ -38,9 +137,19 @@ def _table(name: str):
 def insert(table: str, data: dict) -> dict:
     """Insert a row and return it."""
     result = _table(table).insert(data).execute()
+    invalidate(table)
     return result.data[0] if result.data else {}
 
 
+def insert_many(table: str, rows: list[dict]) -> list[dict]:
+    """Insert rows in one request and return them. Rows must share keys."""
+    if not rows:
+        return []
+    result = _table(table).insert(rows).execute()
+    invalidate(table)
+    return result.data or []
+
+
 def upsert(table: str, data: dict, on_conflict: str = "") -> dict:
     """Upsert a row and return it."""
     if on_conflict:
@@ -48,24 +157,54 @@ def upsert(table: str, data: dict, on_conflict: str = "") -> dict:
     else:
         q = _table(table).upsert(data)
     result = q.execute()
+    invalidate(table)
     return result.data[0] if result.data else {}
 
 
+def upsert_many(table: str, rows: list[dict], on_conflict: str,
+                ignore_duplicates: bool = False) -> list[dict]:
+    """Upsert rows in one request and return those written.
+
+    With ignore_duplicates, rows that conflict are skipped rather than
+    merged, so the first writer of a key wins.
+    """
+    if not rows:
+        return []
+    q = _table(table).upsert(rows, on_conflict=on_conflict,
+                             ignore_duplicates=ignore_duplicates)
+    result = q.execute()
+    invalidate(table)
+    return result.data or []
+
+
 def update(table: str, data: dict, match: dict) -> dict:
     """Update rows matching conditions."""
     q = _table(table).update(data)
     for k, v in match.items():
         q = q.eq(k, v)
     result = q.execute()
+    invalidate(table)
     return result.data[0] if result.data else {}
 
 
+def update_in(table: str, data: dict, column: str, values: list) -> list[dict]:
+    """Apply one update to every row whose column is in values."""
+    rows = []
+    for i in range(0, len(values), IN_CHUNK):
+        q = _table(table).update(data).in_(column, values[i:i + IN_CHUNK])
+        rows.extend(q.execute().data or [])
+    if values:
+        invalidate(table)
+    return rows
+
+
 def delete(table: str, match: dict) -> list:
     """Delete rows matching conditions."""
     q = _table(table).delete()
     for k, v in match.items():
         q = q.eq(k, v)
     result = q.execute()
+    invalidate(table)
     return result.data
 
 
@@ -87,6 +226,15 @@ def select(table: str, columns: str = "*", match: dict | None = None,
     return result.data or []
 
 
+def select_in(table: str, columns: str, column: str, values: list) -> list[dict]:
+    """Select rows whose column is in values (chunked to keep URLs short)."""
+    rows = []
+    for i in range(0, len(values), IN_CHUNK):
+        q = _table(table).select(columns).in_(column, values[i:i + IN_CHUNK])
+        rows.extend(q.execute().data or [])
+    return rows
+
+
 def select_one(table: str, columns: str = "*", match: dict | None = None) -> dict | None:
     """Select a single row."""
     rows = select(table, columns, match, limit=1)
@@ -107,6 +255,7 @@ def count(table: str, match: dict | None = None) -> int:
 # Athletes
 # ---------------------------------------------------------------------------
 
+@cached("gg_athletes", ttl=30)
 def get_athletes(status: str | None = None, search: str | None = None,
                  order: str = "created_at", limit: int = 50, offset: int = 0) -> list[dict]:
     """Get athletes with optional status filter and search."""
@@ -142,6 +291,7 @@ def update_athlete(slug: str, data: dict) -> dict:
     return update("gg_athletes", data, {"slug": slug})
 
 
+@cached("gg_athletes", ttl=30)
 def count_athletes(status: str | None = None) -> int:
     """Count athletes with optional status filter."""
     match = {"plan_status": status} if status else None
@@ -176,6 +326,25 @@ def get_pipeline_run(run_id: str) -> dict | None:
     return select_one("gg_pipeline_runs", match={"id": run_id})
 
 
+def get_queued_pipeline_runs(limit: int = 100) -> list[dict]:
+    """Pending plan runs, oldest first — the pipeline queue."""
+    q = (_table("gg_pipeline_runs").select("*")
+         .eq("status", "pending").neq("run_type", "audit")
+         .order("started_at").limit(limit))
+    result = q.execute()
+    return result.data or []
+
+
+def claim_pipeline_run(run_id: str) -> dict:
+    """Move a pending run to running. Empty dict if someone else claimed it."""
+    q = (_table("gg_pipeline_runs")
+         .update({"status": "running", "current_step": "starting"})
+         .eq("id", run_id).eq("status", "pending"))
+    result = q.execute()
+    invalidate("gg_pipeline_runs")
+    return result.data[0] if result.data else {}
+
+
 def get_pipeline_runs(athlete_id: str | None = None, limit: int = 20) -> list[dict]:
     """Get recent pipeline runs, optionally for a specific athlete."""
     q = _table("gg_pipeline_runs").select("*, gg_athletes(name, slug)")
@@ -216,6 +385,7 @@ def update_touchpoint(touchpoint_id: str, data: dict) -> dict:
     return update("gg_touchpoints", data, {"id": touchpoint_id})
 
 
+@cached("gg_touchpoints", ttl=60)
 def count_due_touchpoints() -> int:
     """Count touchpoints due today or earlier that haven't been sent."""
     today = date.today().isoformat()
@@ -267,6 +437,7 @@ def get_nps_scores(limit: int = 100) -> list[dict]:
                   order="created_at", order_desc=True, limit=limit)
 
 
+@cached("gg_nps_scores", ttl=300)
 def get_nps_distribution() -> dict:
     """Get NPS score distribution (0-10)."""
     scores = select("gg_nps_scores", columns="score")
@@ -338,6 +509,16 @@ def log_action(action: str, entity_type: str = "", entity_id: str = "", details:
     })
 
 
+def log_actions(entries: list[tuple[str, str, str, str]]) -> list[dict]:
+    """Log several operator actions, each (action, entity_type, entity_id,
+    details), in one request."""
+    return insert_many("gg_audit_log", [
+        {"action": action, "entity_type": entity_type,
+         "entity_id": entity_id, "details": details}
+        for action, entity_type, entity_id, details in entries
+    ])
+
+
 def get_audit_log(limit: int = 50) -> list[dict]:
     """Get recent audit log entries."""
     return select("gg_audit_log", order="created_at", order_desc=True, limit=limit)
@@ -347,6 +528,7 @@ def get_audit_log(limit: int = 50) -> list[dict]:
 # Settings
 # ---------------------------------------------------------------------------
 
+@cached("gg_settings", ttl=300)
 def get_setting(key: str, default: str = "") -> str:
     """Get a setting value."""
     row = select_one("gg_settings", match={"key": key})
@@ -377,6 +559,7 @@ def get_plan_request(request_id: str) -> dict | None:
 # Unread Communications (v2)
 # ---------------------------------------------------------------------------
 
+@cached("gg_communications", ttl=30)
 def count_unread_inbound() -> int:
     """Count inbound communications not yet acknowledged."""
     q = _table("gg_communications").select("*", count="exact")
@@ -62,6 +62,7 @@ class FakeQueryBuilder:
         self._count_mode = None
         self._upsert_data = None
         self._upsert_conflict = None
+        self._upsert_ignore = False
         self._update_data = None
         self._delete_mode = False
         self._insert_data = None
@@ -75,9 +76,10 @@ class FakeQueryBuilder:
         self._insert_data = data
         return self
 
-    def upsert(self, data, on_conflict=None):
+    def upsert(self, data, on_conflict=None, ignore_duplicates=False):
         self._upsert_data = data
         self._upsert_conflict = on_conflict
+        self._upsert_ignore = ignore_duplicates
         return self
 
     def update(self, data):
@@ -151,28 +153,37 @@ class FakeQueryBuilder:
         table = self._store[self._table]
 
         if self._insert_data is not None:
-            row = dict(self._insert_data)
-            if "id" not in row:
-                row["id"] = str(uuid.uuid4())
-            table.append(row)
-            return FakeQueryResult(data=[row])
+            batch = self._insert_data if isinstance(self._insert_data, list) else [self._insert_data]
+            rows = []
+            for data in batch:
+                row = dict(data)
+                if "id" not in row:
+                    row["id"] = str(uuid.uuid4())
+                table.append(row)
+                rows.append(row)
+            return FakeQueryResult(data=rows)
 
         if self._upsert_data is not None:
-            row = dict(self._upsert_data)
-            if "id" not in row:
-                row["id"] = str(uuid.uuid4())
-            if self._upsert_conflict:
-                conflict_cols = [c.strip() for c in self._upsert_conflict.split(",")]
-                existing_idx = None
-                for i, existing in enumerate(table):
-                    if all(existing.get(c) == row.get(c) for c in conflict_cols):
-                        existing_idx = i
-                        break
-                if existing_idx is not None:
-                    table[existing_idx].update(row)
-                    return FakeQueryResult(data=[table[existing_idx]])
-            table.append(row)
-            return FakeQueryResult(data=[row])
+            batch = self._upsert_data if isinstance(self._upsert_data, list) else [self._upsert_data]
+            rows = []
+            for data in batch:
+                row = dict(data)
+                if "id" not in row:
+                    row["id"] = str(uuid.uuid4())
+                if self._upsert_conflict:
+                    conflict_cols = [c.strip() for c in self._upsert_conflict.split(",")]
+                    existing = next((
+                        r for r in table
+                        if all(r.get(c) == row.get(c) for c in conflict_cols)
+                    ), None)
+                    if existing is not None:
+                        if not self._upsert_ignore:
+                            existing.update(row)
+                            rows.append(existing)
+                        continue
+                table.append(row)
+                rows.append(row)
+            return FakeQueryResult(data=rows)
 
         if self._update_data is not None:
             updated = []
@@ -246,7 +257,10 @@ def _reset_rate_limiter():
 @pytest.fixture
 def fake_db():
     """Provides a clean in-memory DB and patches supabase_client._table."""
+    from mission_control import supabase_client
+
     db = FakeDB()
+    supabase_client.clear_cache()
 
     def fake_table(name):
         return FakeQueryBuilder(db.store, name)
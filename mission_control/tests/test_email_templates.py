@@ -0,0 +1,101 @@
+"""Tests for compiled email templates — blocks, escaping, link and footer slots."""
+
+import os
+
+import pytest
+
+from mission_control.services.email_templates import compile_template, load_template
+
+UTM = "utm_source=gg&utm_medium=email"
+FOOTER = "<div>unsub</div>"
+
+
+def _render(source, values=None, flags=None, **kwargs):
+    return compile_template(source).render(values or {}, flags, **kwargs)
+
+
+class TestBlocks:
+    def test_truthy_and_inverse_blocks(self):
+        src = "{{#race}}Racing {race}.{{/race}}{{^race}}No race yet.{{/race}}"
+        assert _render(src, {"race": "Unbound"}, {"race": "Unbound"}) == "Racing Unbound."
+        assert _render(src, {}, {"race": ""}) == "No race yet."
+
+    def test_nested_blocks(self):
+        src = "{{^ctx}}A{{^off}}in{{/off}}{{#off}}out{{/off}}B{{/ctx}}"
+        assert _render(src, flags={"off": True}) == "AoutB"
+        assert _render(src, flags={"off": False}) == "AinB"
+        assert _render(src, flags={"ctx": 1}) == ""
+
+    def test_unmatched_tags_stay_literal(self):
+        assert _render("{{#a}}x{{/b}}", flags={"a": 1}) == "{{#a}}x{{/b}}"
+
+
+class TestPlaceholders:
+    def test_values_escaped_and_unknown_left_literal(self):
+        out = _render("<p>{name}</p>{unknown}", {"name": '<a href="x">'})
+        assert out == "<p>&lt;a href=&quot;x&quot;&gt;</p>{unknown}"
+
+    def test_escape_opt_out(self):
+        assert _render("{name}", {"name": "A & B"}, escape=False) == "A & B"
+
+    def test_values_are_not_rescanned(self):
+        assert _render("{a} {b}", {"a": "{b}", "b": "x"}) == "{b} x"
+
+
+class TestLinks:
+    def test_brand_links_get_utm(self):
+        src = ('<a href="https://gravelgodcycling.com/a">'
+               '<a href="https://roadielabs.com/b?x=1">'
+               '<a href="https://example.com/c">')
+        out = _render(src, utm=UTM)
+        assert f'href="https://gravelgodcycling.com/a?{UTM}"' in out
+        assert f'href="https://roadielabs.com/b?x=1&{UTM}"' in out
+        assert 'href="https://example.com/c"' in out
+
+    def test_placeholder_link_checked_after_fill(self):
+        src = '<a href="{url}">'
+        assert _render(src, {"url": "https://xcskilabs.com/g"}, utm=UTM) == (
+            f'<a href="https://xcskilabs.com/g?{UTM}">'
+        )
+        assert _render(src, {"url": "https://example.com/g"}, utm=UTM) == (
+            '<a href="https://example.com/g">'
+        )
+
+    def test_no_utm_leaves_links_alone(self):
+        src = '<a href="https://gravelgodcycling.com/race/{slug}/">'
+        assert _render(src, {"slug": "x"}) == '<a href="https://gravelgodcycling.com/race/x/">'
+
+
+class TestFooter:
+    def test_before_body_close(self):
+        out = _render("<html><body>hi</body></html>", footer=FOOTER)
+        assert out == f"<html><body>hi{FOOTER}</body></html>"
+
+    def test_html_close_then_end(self):
+        assert _render("<html>hi</html>", footer=FOOTER) == f"<html>hi{FOOTER}</html>"
+        assert _render("hi", footer=FOOTER) == f"hi{FOOTER}"
+
+    def test_body_close_inside_block(self):
+        src = "<html>{{#a}}x</body>{{/a}}</html>"
+        assert _render(src, flags={"a": 1}, footer=FOOTER) == f"<html>x{FOOTER}</body></html>"
+        assert _render(src, footer=FOOTER) == f"<html>{FOOTER}</html>"
+
+    def test_no_footer_renders_nothing(self):
+        assert _render("<body>hi</body>") == "<body>hi</body>"
+
+
+class TestLoadTemplate:
+    def test_cached_until_file_changes(self, tmp_path):
+        path = tmp_path / "t.html"
+        path.write_text("v1 {x}")
+        first = load_template(path)
+        assert load_template(path) is first
+
+        path.write_text("v2 {x}!")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert load_template(path).render({"x": "y"}) == "v2 y!"
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_template(tmp_path / "missing.html")
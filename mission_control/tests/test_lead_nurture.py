@@ -1,6 +1,9 @@
 """Lead reply ingestion, approval safety, and measurement tests."""
 
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
 
 from mission_control.tests.conftest import make_deal, make_enrollment, make_sequence_send
 
@@ -265,6 +268,113 @@ class TestGmailIngestion:
         assert stored["sequence_send_id"] == send["id"]
         assert stored["attribution_confidence"] == "exact"
 
+    def test_failing_thread_keeps_pauses_from_the_whole_sync(self, fake_db):
+        from mission_control.services import lead_nurture
+
+        first = make_enrollment(contact_email="lead@example.com")
+        second = make_enrollment(contact_email="other@example.com")
+        fake_db.store["gg_sequence_enrollments"].extend([first, second])
+        real_build = lead_nurture.build_reply_suggestion
+
+        def build(**kwargs):
+            if kwargs["seed"].startswith("other@"):
+                raise RuntimeError("suggestion model unavailable")
+            return real_build(**kwargs)
+
+        payload = {"threads": [
+            {"id": "thread-ok", "messages": [_message()]},
+            {"id": "thread-bad", "messages": [_message(
+                message_id="gmail-in-2", sender="Other Lead <other@example.com>",
+            )]},
+        ]}
+        with patch.object(lead_nurture, "build_reply_suggestion", side_effect=build), \
+                pytest.raises(RuntimeError):
+            lead_nurture.ingest_gmail_sync(payload)
+
+        assert first["status"] == "paused_reply"
+        assert second["status"] == "paused_reply"
+        assert [row["gmail_message_id"] for row in fake_db.store["gg_lead_messages"]] == [
+            "gmail-in-1", "gmail-in-2",
+        ]
+
+    def test_flush_failure_does_not_mask_thread_error(self, fake_db):
+        from mission_control.services import lead_nurture
+
+        fake_db.store["gg_sequence_enrollments"].append(
+            make_enrollment(contact_email="lead@example.com"),
+        )
+        payload = {"threads": [{"id": "thread-bad", "messages": [_message()]}]}
+        with patch.object(lead_nurture, "build_reply_suggestion",
+                          side_effect=RuntimeError("suggestion model unavailable")), \
+                patch.object(lead_nurture._SyncBatch, "flush",
+                             side_effect=ConnectionError("database unavailable")), \
+                pytest.raises(RuntimeError, match="suggestion model unavailable"):
+            lead_nurture.ingest_gmail_sync(payload)
+
+    def test_suggestion_sent_in_same_sync_records_sent_at(self, fake_db):
+        from mission_control.services.lead_nurture import ingest_gmail_sync
+
+        fake_db.store["gg_sequence_enrollments"].append(
+            make_enrollment(contact_email="lead@example.com"),
+        )
+        now = datetime.now(timezone.utc)
+        reply_at = now.isoformat()
+        ingest_gmail_sync({"threads": [{"id": "thread-answered", "messages": [
+            _message(message_id="in-1", date=(now - timedelta(minutes=5)).isoformat()),
+            _message(
+                message_id="out-1", sender="Matti <matti@gravelgodcycling.com>",
+                recipients=["lead@example.com"], body="Good to hear.", date=reply_at,
+            ),
+        ]}]})
+
+        [suggestion] = fake_db.store["gg_lead_reply_suggestions"]
+        assert suggestion["status"] == "sent"
+        assert suggestion["sent_at"] == reply_at
+        assert suggestion["updated_at"] is not None
+
+    def test_new_suggestions_always_carry_updated_at(self, fake_db):
+        from mission_control.services.lead_nurture import ingest_gmail_sync
+
+        fake_db.store["gg_sequence_enrollments"].append(
+            make_enrollment(contact_email="lead@example.com"),
+        )
+        ingest_gmail_sync({"threads": [{"id": "thread-new", "messages": [_message()]}]})
+        [suggestion] = fake_db.store["gg_lead_reply_suggestions"]
+        assert suggestion["updated_at"] is not None
+        assert suggestion["sent_at"] is None
+
+    def test_query_count_does_not_grow_with_payload(self, fake_db):
+        from mission_control import supabase_client
+        from mission_control.services.lead_nurture import ingest_gmail_sync
+
+        def payload(leads, per_thread):
+            now = datetime.now(timezone.utc)
+            return {"threads": [{"id": f"thread-{lead}", "messages": [
+                _message(
+                    message_id=f"gmail-{lead}-{i}",
+                    sender=f"Lead {lead} <lead{lead}@example.com>",
+                    recipients=["gravelgodcoaching@gmail.com"],
+                    date=(now + timedelta(minutes=i)).isoformat(),
+                )
+                for i in range(per_thread)
+            ]} for lead in range(leads)]}
+
+        for lead in range(21):
+            fake_db.store["gg_sequence_enrollments"].append(
+                make_enrollment(contact_email=f"lead{lead}@example.com"),
+            )
+
+        ingest_gmail_sync({"threads": payload(1, 1)["threads"]})
+        single = supabase_client._table.call_count
+        supabase_client._table.reset_mock()
+        result = ingest_gmail_sync({"threads": payload(21, 3)["threads"][1:]})
+
+        assert result["messages"] == 60
+        assert result["paused"] == 20
+        assert supabase_client._table.call_count == single
+        assert len(fake_db.store["gg_lead_messages"]) == 61
+        assert len(fake_db.store["gg_lead_conversations"]) == 21
+
 
 class TestDraftApproval:
     def _seed(self, fake_db):
@@ -0,0 +1,57 @@
+import asyncio
+import threading
+import time
+
+from mission_control.services.panel_loader import Panel, load_panels
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _slow(value, seconds=0.2):
+    def load():
+        time.sleep(seconds)
+        return value
+    return load
+
+
+def test_panels_load_concurrently():
+    panels = [Panel(f"p{i}", _slow(i)) for i in range(4)]
+    start = time.monotonic()
+    data, degraded = _run(load_panels(panels))
+    assert time.monotonic() - start < 0.6
+    assert data == {"p0": 0, "p1": 1, "p2": 2, "p3": 3}
+    assert degraded == []
+
+
+def test_failing_panel_degrades_alone():
+    def boom():
+        raise RuntimeError("db down")
+
+    data, degraded = _run(load_panels([
+        Panel("ok", lambda: ["row"]),
+        Panel("bad", boom, fallback=dict),
+    ]))
+    assert data == {"ok": ["row"], "bad": {}}
+    assert degraded == ["bad"]
+
+
+def test_slow_panel_times_out_with_fallback():
+    release = threading.Event()
+    data, degraded = _run(load_panels([
+        Panel("fast", lambda: 1),
+        Panel("stuck", release.wait, timeout=0.1),
+    ]))
+    release.set()
+    assert data == {"fast": 1, "stuck": []}
+    assert degraded == ["stuck"]
+
+
+def test_dependent_panel_receives_results():
+    data, _ = _run(load_panels([
+        Panel("total", lambda a, b: a + b, deps=("a", "b")),
+        Panel("a", _slow(2, 0.05)),
+        Panel("b", lambda: 3),
+    ]))
+    assert data["total"] == 5
@@ -0,0 +1,198 @@
+"""Tests for the pipeline queue — claiming, worker pool, progress, warm workers."""
+
+import subprocess
+
+import pytest
+
+from mission_control import supabase_client as db
+from mission_control.services import pipeline_runner
+from mission_control.services.pipeline_runner import (
+    PipelinePool,
+    _Progress,
+    _WarmWorker,
+    _claim_next_run,
+    queue_position,
+    trigger_pipeline,
+)
+from mission_control.tests.conftest import make_athlete
+
+
+class _FakeWorker:
+    """Stands in for _WarmWorker: replays output and returns an exit code."""
+
+    def __init__(self, output=(), code=0, stderr="", error=None):
+        self.jobs = 0
+        self.closed = False
+        self.output = output
+        self.code = code
+        self.stderr = stderr
+        self.error = error
+        self.seen = []
+
+    def run(self, job, on_output, timeout):
+        self.jobs += 1
+        self.seen.append(job)
+        for text in self.output:
+            on_output(text)
+        if self.error:
+            raise self.error
+        return self.code, self.stderr
+
+    def close(self):
+        self.closed = True
+
+
+class _StubPool:
+    def __init__(self):
+        self.notified = 0
+
+    def notify(self):
+        self.notified += 1
+
+
+def _queue_run(fake_db, athlete, started_at, run_type="draft", status="pending"):
+    run = {
+        "id": f"run-{started_at}", "athlete_id": athlete["id"], "run_type": run_type,
+        "status": status, "current_step": "queued", "steps_completed": [],
+        "skip_pdf": True, "skip_deploy": True, "skip_deliver": True,
+        "started_at": started_at,
+    }
+    fake_db.store["gg_pipeline_runs"].append(run)
+    return run
+
+
+@pytest.fixture
+def athlete(fake_db):
+    row = make_athlete()
+    fake_db.store["gg_athletes"].append(row)
+    return row
+
+
+class TestQueue:
+    def test_trigger_queues_and_wakes_pool(self, fake_db, athlete, tmp_path, monkeypatch):
+        (tmp_path / athlete["slug"]).mkdir()
+        (tmp_path / athlete["slug"] / "intake.json").write_text("{}")
+        monkeypatch.setattr(pipeline_runner, "ATHLETES_DIR", tmp_path)
+        pool = _StubPool()
+        monkeypatch.setattr(pipeline_runner, "_pool", pool)
+
+        run_id = trigger_pipeline(athlete["id"], athlete["slug"])
+
+        run = db.get_pipeline_run(run_id)
+        assert run["status"] == "pending"
+        assert run["current_step"] == "queued"
+        assert pool.notified == 1
+
+    def test_claims_oldest_first_and_only_once(self, fake_db, athlete):
+        _queue_run(fake_db, athlete, "2026-10-01T10:02")
+        _queue_run(fake_db, athlete, "2026-10-01T10:01")
+        _queue_run(fake_db, athlete, "2026-10-01T10:00", run_type="audit")
+
+        first = _claim_next_run()
+        second = _claim_next_run()
+        assert first["id"] == "run-2026-10-01T10:01"
+        assert first["status"] == "running"
+        assert second["id"] == "run-2026-10-01T10:02"
+        assert _claim_next_run() is None
+        assert db.claim_pipeline_run(first["id"]) == {}
+
+    def test_queue_position(self, fake_db, athlete):
+        _queue_run(fake_db, athlete, "2026-10-01T10:00", status="running")
+        _queue_run(fake_db, athlete, "2026-10-01T10:01")
+        _queue_run(fake_db, athlete, "2026-10-01T10:02")
+        assert queue_position("run-2026-10-01T10:02") == 2
+        assert queue_position("run-2026-10-01T10:01") == 1
+        assert queue_position("run-2026-10-01T10:00") is None
+
+    def test_start_fails_runs_orphaned_by_restart(self, fake_db, athlete, monkeypatch):
+        _queue_run(fake_db, athlete, "2026-10-01T10:00", status="running")
+        pool = PipelinePool(concurrency=1)
+        monkeypatch.setattr(pool, "_loop", lambda: None)
+        pool.start()
+        pool.stop()
+        run = db.get_pipeline_run("run-2026-10-01T10:00")
+        assert run["status"] == "failed"
+        assert run["current_step"] == "interrupted"
+
+
+class TestExecute:
+    def test_success_records_steps_and_reuses_worker(self, fake_db, athlete, monkeypatch):
+        monkeypatch.setattr(pipeline_runner, "_sync_athlete_artifacts", lambda *a: None)
+        run = _queue_run(fake_db, athlete, "2026-10-01T10:00", status="running")
+        worker = _FakeWorker(output=[
+            "[Step 1] VALIDATE INTAKE ", "... OK", "\n",
+            "[Step 2] CREATE PROFILE ", "... OK", "\n",
+        ])
+        pool = PipelinePool(concurrency=1)
+
+        assert pool.execute(run, worker) is worker
+
+        stored = db.get_pipeline_run(run["id"])
+        assert stored["status"] == "completed"
+        assert [s["step"] for s in stored["steps_completed"]] == ["VALIDATE INTAKE", "CREATE PROFILE"]
+        assert {s["status"] for s in stored["steps_completed"]} == {"completed"}
+        assert "[Step 2] CREATE PROFILE ... OK" in stored["stdout"]
+        assert worker.seen[0]["intake"].endswith(f"{athlete['slug']}/intake.json")
+        assert db.get_athlete_by_id(athlete["id"])["plan_status"] == "pipeline_complete"
+
+    def test_failure_marks_open_step_failed(self, fake_db, athlete):
+        run = _queue_run(fake_db, athlete, "2026-10-01T10:00", status="running")
+        worker = _FakeWorker(output=["[Step 3] CLASSIFY "], code=1, stderr="GateError: tier")
+
+        assert PipelinePool().execute(run, worker) is worker
+
+        stored = db.get_pipeline_run(run["id"])
+        assert stored["status"] == "failed"
+        assert stored["error_message"] == "GateError: tier"
+        assert stored["steps_completed"][-1]["status"] == "failed"
+
+    def test_timeout_discards_worker(self, fake_db, athlete):
+        run = _queue_run(fake_db, athlete, "2026-10-01T10:00", status="running")
+        worker = _FakeWorker(error=subprocess.TimeoutExpired("pipeline", 600))
+
+        assert PipelinePool().execute(run, worker) is None
+
+        assert worker.closed
+        stored = db.get_pipeline_run(run["id"])
+        assert stored["current_step"] == "timeout"
+
+    def test_worker_recycled_after_max_jobs(self, fake_db, athlete, monkeypatch):
+        monkeypatch.setattr(pipeline_runner, "_sync_athlete_artifacts", lambda *a: None)
+        run = _queue_run(fake_db, athlete, "2026-10-01T10:00", status="running")
+        old = _FakeWorker()
+        old.jobs = pipeline_runner._MAX_JOBS_PER_WORKER
+        fresh = _FakeWorker()
+
+        assert PipelinePool(worker_factory=lambda: fresh).execute(run, old) is fresh
+        assert old.closed
+
+
+class TestProgress:
+    def test_step_lines_update_current_step(self, fake_db, athlete):
+        run = _queue_run(fake_db, athlete, "2026-10-01T10:00", status="running")
+        progress = _Progress(run["id"])
+        progress.feed("[Step 8] GENERATE PDF [SKIPPED] ")
+        stored = db.get_pipeline_run(run["id"])
+        assert stored["current_step"] == "GENERATE PDF [SKIPPED]"
+        assert stored["steps_completed"][0]["message"] == "Step 8"
+        assert stored["steps_completed"][0]["status"] == "running"
+
+        progress.feed("... OK")
+        assert db.get_pipeline_run(run["id"])["steps_completed"][0]["status"] == "completed"
+
+
+class TestWarmWorker:
+    def test_runs_jobs_in_one_process(self):
+        worker = _WarmWorker()
+        try:
+            out = []
+            code, _ = worker.run({"intake": "/nonexistent/intake.json"}, out.append, 60)
+            assert code == 1
+            assert "FATAL: Intake file not found" in "".join(out)
+
+            # sys.exit in the pipeline ended the job, not the worker
+            code, _ = worker.run({"intake": "/nonexistent/intake.json"}, out.append, 60)
+            assert code == 1
+            assert worker.jobs == 2
+        finally:
+            worker.close()
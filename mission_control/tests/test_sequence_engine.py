@@ -1,7 +1,9 @@
 """Tests for the sequence engine — enrollment, A/B assignment, sending, events."""
 
+import re
 import uuid
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -664,6 +666,192 @@ class TestProcessingLock:
         assert result["processed"] == 0
 
 
+class TestBatchedSends:
+    """process_due_sends() sends a due wave concurrently and writes in bulk."""
+
+    def _run(self, fake_db, send):
+        import asyncio
+        from mission_control.services.sequence_engine import process_due_sends
+
+        with patch("mission_control.services.sequence_engine.RESEND_API_KEY", "fake-key"), \
+                patch("mission_control.services.sequence_engine._send_email_sync",
+                      side_effect=send):
+            return asyncio.run(process_due_sends())
+
+    def test_one_failed_send_does_not_block_the_batch(self, fake_db):
+        fake_db.store["gg_athletes"].append(
+            {"id": "cust-1", "email": "buyer@example.com", "plan_status": "delivered"},
+        )
+        emails = [f"lead{i}@example.com" for i in range(5)] + ["buyer@example.com"]
+        for email in emails:
+            fake_db.store["gg_sequence_enrollments"].append(
+                make_enrollment(contact_email=email),
+            )
+
+        def send(to, *args):
+            if to == "lead3@example.com":
+                raise RuntimeError("rate limited")
+            return f"resend-{to}"
+
+        result = self._run(fake_db, send)
+
+        assert result == {"processed": 6, "sent": 5, "errors": 1, "skipped": False}
+        sends = fake_db.store["gg_sequence_sends"]
+        assert sorted(s["resend_id"] for s in sends) == sorted(
+            f"resend-lead{i}@example.com" for i in (0, 1, 2, 4)
+        )
+        rows = {e["contact_email"]: e for e in fake_db.store["gg_sequence_enrollments"]}
+        assert rows["buyer@example.com"]["status"] == "completed"
+        assert rows["lead3@example.com"]["current_step"] == 0
+        advanced = [rows[f"lead{i}@example.com"] for i in (0, 1, 2, 4)]
+        assert all(e["current_step"] == 1 for e in advanced)
+        # Same step, same batch → one shared next_send_at
+        assert len({e["next_send_at"] for e in advanced}) == 1
+
+
+    def test_send_rows_fill_every_required_column(self, fake_db):
+        for i in range(2):
+            fake_db.store["gg_sequence_enrollments"].append(
+                make_enrollment(contact_email=f"lead{i}@example.com"),
+            )
+
+        result = self._run(fake_db, lambda to, *args: "resend-id")
+
+        assert result["sent"] == 2
+        required = _required_columns("gg_sequence_sends")
+        assert "subject" in required
+        for row in fake_db.store["gg_sequence_sends"]:
+            missing = {c for c in required if row.get(c) is None}
+            assert not missing, f"send row missing NOT NULL columns: {missing}"
+
+    def test_failed_send_insert_still_advances_enrollments(self, fake_db):
+        from mission_control import supabase_client
+
+        for i in range(3):
+            fake_db.store["gg_sequence_enrollments"].append(
+                make_enrollment(contact_email=f"lead{i}@example.com"),
+            )
+        sent = []
+
+        def send(to, *args):
+            sent.append(to)
+            return f"resend-{to}"
+
+        original = supabase_client.insert_many
+
+        def insert_many(table, rows):
+            if table == "gg_sequence_sends":
+                raise RuntimeError("null value in column violates not-null constraint")
+            return original(table, rows)
+
+        with patch.object(supabase_client, "insert_many", side_effect=insert_many):
+            first = self._run(fake_db, send)
+            second = self._run(fake_db, send)
+
+        # Unrecorded sends count as errors
+        assert (first["sent"], first["errors"]) == (0, 3)
+        # Emails went out once; the enrollments are no longer due
+        assert second["processed"] == 0
+        assert len(sent) == 3
+        assert all(e["current_step"] == 1
+                   for e in fake_db.store["gg_sequence_enrollments"])
+        assert any(row["action"] == "sequence_send_record_error"
+                   for row in fake_db.store["gg_audit_log"])
+
+    def _enroll(self, fake_db, count):
+        for i in range(count):
+            fake_db.store["gg_sequence_enrollments"].append(
+                make_enrollment(contact_email=f"lead{i}@example.com"),
+            )
+
+    def test_failed_suppression_lookup_skips_only_its_batch(self, fake_db):
+        from mission_control import supabase_client
+        from mission_control.services import sequence_engine
+
+        self._enroll(fake_db, sequence_engine._BATCH_SIZE + 2)
+        sent = []
+        original = supabase_client.select_in
+        calls = []
+
+        def select_in(table, *args):
+            if table == "gg_athletes":
+                calls.append(table)
+                if len(calls) == 1:
+                    raise RuntimeError("connection reset")
+            return original(table, *args)
+
+        def send(to, *args):
+            sent.append(to)
+            return f"resend-{to}"
+
+        with patch.object(supabase_client, "select_in", side_effect=select_in):
+            first = self._run(fake_db, send)
+            second = self._run(fake_db, send)
+
+        batch = sequence_engine._BATCH_SIZE
+        # First batch sent nothing and stays due; the second carried on
+        assert first == {"processed": batch + 2, "sent": 2,
+                         "errors": batch, "skipped": False}
+        assert second["sent"] == batch
+        assert sorted(sent) == sorted(set(sent))
+        assert len(sent) == batch + 2
+        errors = [r for r in fake_db.store["gg_audit_log"]
+                  if r["action"] == "sequence_send_error"]
+        assert len(errors) == batch
+
+    def test_failed_enrollment_update_does_not_resend(self, fake_db):
+        from mission_control import supabase_client
+        from mission_control.services import sequence_engine
+
+        self._enroll(fake_db, sequence_engine._BATCH_SIZE + 2)
+        sent = []
+        original = supabase_client.update_in
+        calls = []
+
+        def update_in(table, data, column, values):
+            if table == "gg_sequence_enrollments":
+                calls.append(table)
+                if len(calls) == 1:
+                    raise RuntimeError("statement timeout")
+            return original(table, data, column, values)
+
+        def send(to, *args):
+            sent.append(to)
+            return f"resend-{to}"
+
+        with patch.object(supabase_client, "update_in", side_effect=update_in):
+            first = self._run(fake_db, send)
+            second = self._run(fake_db, send)
+
+        batch = sequence_engine._BATCH_SIZE
+        assert (first["sent"], first["errors"]) == (2, batch)
+        # Every send was recorded, so the stuck batch advances without resending
+        assert len(fake_db.store["gg_sequence_sends"]) == batch + 2
+        assert second == {"processed": batch, "sent": batch,
+                          "errors": 0, "skipped": False}
+        assert len(sent) == batch + 2
+        assert all(e["current_step"] == 1
+                   for e in fake_db.store["gg_sequence_enrollments"])
+        assert any(r["action"] == "sequence_send_error"
+                   and "update failed" in r["details"]
+                   for r in fake_db.store["gg_audit_log"])
+
+
+def _required_columns(table: str) -> set[str]:
+    """NOT NULL columns without a default, read from the migrations."""
+    migrations = Path(__file__).resolve().parents[2] / "supabase" / "migrations"
+    pattern = re.compile(rf"CREATE TABLE {table} \((.*?)\n\);", re.S)
+    for path in sorted(migrations.glob("*.sql")):
+        match = pattern.search(path.read_text())
+        if match:
+            return {
+                line.split()[0] for line in match.group(1).splitlines()
+                if "NOT NULL" in line and "DEFAULT" not in line
+                and "PRIMARY KEY" not in line
+            }
+    raise AssertionError(f"no CREATE TABLE for {table}")
+
+
 class TestSvixVerification:
     """Resend signs webhooks Svix-style — bearer auth alone never matches."""
 
@@ -0,0 +1,49 @@
+"""Tests for the supabase_client read-through cache."""
+
+from unittest.mock import patch
+
+from mission_control import supabase_client as db
+
+
+class TestReadThroughCache:
+    def test_repeat_reads_hit_cache(self, fake_db):
+        fake_db.store["gg_settings"].append({"key": "mode", "value": "live"})
+        with patch("mission_control.supabase_client._table",
+                   wraps=db._table) as table:
+            assert db.get_setting("mode") == "live"
+            assert db.get_setting("mode") == "live"
+            assert table.call_count == 1
+        assert db.get_setting.cache.hits == 1
+
+    def test_write_to_table_invalidates(self, fake_db):
+        assert db.get_setting("mode", "off") == "off"
+        db.set_setting("mode", "live")
+        assert db.get_setting("mode", "off") == "live"
+
+    def test_unrelated_write_keeps_entries(self, fake_db):
+        db.count_unread_inbound()
+        db.insert("gg_audit_log", {"action": "x"})
+        db.count_unread_inbound()
+        assert db.count_unread_inbound.cache.hits == 1
+
+    def test_entries_expire_after_ttl(self, fake_db):
+        fake_db.store["gg_settings"].append({"key": "mode", "value": "a"})
+        with patch("mission_control.supabase_client.time.monotonic", return_value=1000.0):
+            db.get_setting("mode")
+        fake_db.store["gg_settings"][0]["value"] = "b"
+        with patch("mission_control.supabase_client.time.monotonic", return_value=1000.0 + 299):
+            assert db.get_setting("mode") == "a"
+        with patch("mission_control.supabase_client.time.monotonic", return_value=1000.0 + 301):
+            assert db.get_setting("mode") == "b"
+
+    def test_lru_bound(self, fake_db):
+        cache = db.get_setting.cache
+        for i in range(cache.maxsize + 5):
+            db.get_setting(f"key-{i}")
+        assert len(cache.entries) == cache.maxsize
+        assert (("key-0",), ()) not in cache.entries
+
+    def test_results_are_copies(self, fake_db):
+        fake_db.store["gg_athletes"].append({"id": "a1", "name": "Jane", "created_at": "2026"})
+        db.get_athletes()[0]["name"] = "mutated"
+        assert db.get_athletes()[0]["name"] == "Jane"
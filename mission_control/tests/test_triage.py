@@ -330,6 +330,16 @@ class TestTriageRouteGET:
             assert resp.status_code == 200
             assert "Connection Issue" in resp.text
 
+    def test_one_failing_panel_leaves_others_rendered(self, client, fake_db):
+        fake_db.store["gg_deals"].append(
+            make_deal(stage="lead", updated_at=_hours_ago(72))
+        )
+        with patch("mission_control.routers.triage.get_recent_sends", side_effect=Exception("timeout")):
+            resp = client.get("/triage")
+        assert resp.status_code == 200
+        assert "Could not load recent sends" in resp.text
+        assert "Stale Deals" in resp.text
+
 
 # ---------------------------------------------------------------------------
 # Class 5: Ack Security
@@ -818,6 +828,18 @@ class TestExpandedHealth:
         assert resp.status_code == 200
         assert "Table:" in resp.text
 
+    def test_deep_health_reports_cache_counters(self, fake_db):
+        from mission_control import supabase_client as db
+        from mission_control.services.triage import get_expanded_health
+
+        db.get_setting("missing")
+        db.get_setting("missing")
+        health = get_expanded_health()
+        caches = {c["name"]: c for c in health["caches"]}
+        assert caches["get_setting"]["detail"].startswith("1 hits / 1 misses")
+        # Counters are informational, not health checks
+        assert not any(c["name"].startswith("Cache") for c in health["checks"])
+
     def test_expanded_health_service_returns_structure(self, fake_db):
         from mission_control.services.triage import get_expanded_health
         health = get_expanded_health()
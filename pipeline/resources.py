@@ -0,0 +1,127 @@
+"""
+Shared read-only pipeline resources — loaded once per process.
+
+Plan templates, race JSON and the race-data/ directory are read by several
+steps for every athlete; the race-data scan alone parses ~400 files. These
+loaders cache by path and reload a file when its mtime or size changes, so
+a long-lived process (batch mode, the Mission Control worker) picks up
+edits without a restart.
+
+load_json() hands back a deep copy — steps are free to mutate what they
+get. race_date_index() is shared and must be treated as read-only.
+freeze() turns parsed JSON into read-only views for caches that hand the
+same object to every caller (the plan template library).
+"""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+_json_cache: Dict[Path, Tuple[int, int, Any]] = {}
+_index_cache: Dict[Path, Tuple[tuple, Dict[str, Tuple[str, str]]]] = {}
+
+
+def file_stamp(path: Path) -> Tuple[int, int]:
+    """(mtime_ns, size) — changes whenever the file is rewritten."""
+    st = Path(path).stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("shared pipeline resource is read-only; copy.deepcopy() it to modify")
+
+
+class FrozenDict(dict):
+    """A dict that refuses mutation. deepcopy() gives back a plain dict."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """A list that refuses mutation. deepcopy() gives back a plain list."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze(data: Any) -> Any:
+    """Read-only view of parsed JSON. Still a dict/list to isinstance() and json."""
+    if isinstance(data, dict):
+        return FrozenDict((k, freeze(v)) for k, v in data.items())
+    if isinstance(data, list):
+        return FrozenList(freeze(v) for v in data)
+    return data
+
+
+def load_json(path: Path) -> Any:
+    """Parsed JSON at path (a private copy). Raises like open() would."""
+    path = Path(path)
+    stamp = file_stamp(path)
+    cached = _json_cache.get(path)
+    if cached is None or cached[:2] != stamp:
+        with open(path) as f:
+            cached = (*stamp, json.load(f))
+        _json_cache[path] = cached
+    return copy.deepcopy(cached[2])
+
+
+def race_date_index(race_data_dir: Path) -> Dict[str, Tuple[str, str]]:
+    """Map lowercased race name -> (file name, vitals.date_specific).
+
+    Built from race-data/*.json in sorted order; the first file carrying a
+    name wins. Unreadable files are skipped.
+    """
+    race_data_dir = Path(race_data_dir)
+    files = sorted(race_data_dir.glob("*.json"))
+    key = tuple((f.name, *file_stamp(f)) for f in files)
+    cached = _index_cache.get(race_data_dir)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    index: Dict[str, Tuple[str, str]] = {}
+    for json_file in files:
+        try:
+            with open(json_file) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        race_obj = data.get("race", data)
+        file_name = race_obj.get("name", "") or race_obj.get("display_name", "")
+        name = file_name.lower().strip()
+        if name not in index:
+            index[name] = (json_file.name, race_obj.get("vitals", {}).get("date_specific", ""))
+    _index_cache[race_data_dir] = (key, index)
+    return index
+
+
+def preload(base_dir: Path) -> None:
+    """Warm the caches before fanning out (batch mode worker initializer)."""
+    base_dir = Path(base_dir)
+    if (base_dir / "race-data").exists():
+        race_date_index(base_dir / "race-data")
+    from pipeline.step_05_template import get_library
+    get_library(base_dir).load_all()
+    for race_path in sorted((base_dir / "races").glob("*.json")):
+        load_json(race_path)
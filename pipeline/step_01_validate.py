@@ -5,12 +5,13 @@ Validates raw questionnaire data before processing.
 Adapted from athlete-profiles/athletes/scripts/validate_submission.py
 """
 
-import json
 import re
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from pipeline.resources import race_date_index
+
 # Lead time bounds
 MIN_LEAD_WEEKS = 6    # Can't build a meaningful plan in less than 6 weeks
 MAX_LEAD_WEEKS = 78   # 1.5 years out — beyond this, date is likely wrong
@@ -167,44 +168,30 @@ def cross_reference_race_date(
     if not race_data_dir.exists():
         return result
 
-    name_lower = race_name.lower().strip()
-    for json_file in sorted(race_data_dir.glob("*.json")):
-        try:
-            with open(json_file) as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            continue
+    match = race_date_index(race_data_dir).get(race_name.lower().strip())
+    if match is None:
+        return result
 
-        # Check both top-level and nested structures
-        race_obj = data.get("race", data)
-        file_name = race_obj.get("name", "") or race_obj.get("display_name", "")
-        if file_name.lower().strip() != name_lower:
-            continue
+    # Found a match
+    result["matched"] = True
+    result["race_data_file"], date_specific = match
+    result["date_specific"] = date_specific
+
+    if not date_specific:
+        return result
 
-        # Found a match
-        result["matched"] = True
-        result["race_data_file"] = json_file.name
-
-        vitals = race_obj.get("vitals", {})
-        date_specific = vitals.get("date_specific", "")
-        result["date_specific"] = date_specific
-
-        if not date_specific:
-            break
-
-        # Try to parse date_specific (format: "YYYY: Month Day" or "YYYY: Month Day-Day")
-        parsed = _parse_date_specific(date_specific, rd.year)
-        if parsed:
-            result["parsed_date"] = parsed.isoformat()
-            result["date_match"] = (parsed == rd)
-            if not result["date_match"]:
-                result["warning"] = (
-                    f"Date mismatch: intake says {race_date_str} "
-                    f"({result['day_of_week']}), but race database says "
-                    f"\"{date_specific}\" → {parsed.isoformat()} "
-                    f"({parsed.strftime('%A')}). Please verify."
-                )
-        break
+    # Try to parse date_specific (format: "YYYY: Month Day" or "YYYY: Month Day-Day")
+    parsed = _parse_date_specific(date_specific, rd.year)
+    if parsed:
+        result["parsed_date"] = parsed.isoformat()
+        result["date_match"] = (parsed == rd)
+        if not result["date_match"]:
+            result["warning"] = (
+                f"Date mismatch: intake says {race_date_str} "
+                f"({result['day_of_week']}), but race database says "
+                f"\"{date_specific}\" → {parsed.isoformat()} "
+                f"({parsed.strftime('%A')}). Please verify."
+            )
 
     return result
 
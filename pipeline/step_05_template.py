@@ -4,13 +4,21 @@ Step 5: Select + Extend Plan Template
 Selects the correct 12-week base template for tier+level,
 then extends to the athlete's exact plan duration if needed.
 Adapted from gravel-plans-experimental/races/generate_expanded_race_plans.py
+
+Templates are served by a PlanTemplateLibrary: each plans/*/template.json
+is parsed and schema-checked once per process, and extended variants are
+built once per (template_dir, target_weeks, recovery_cadence). Callers get
+read-only views shared with the cache — deepcopy one to get a mutable copy.
 """
 
 import copy
 import json
 import re
+import threading
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple
+
+from pipeline.resources import file_stamp, freeze
 
 # Map (tier, level) → plan template directory name
 TEMPLATE_MAP = {
@@ -82,17 +90,13 @@ def select_template(derived: Dict, base_dir: Path) -> Dict:
             f"Did you copy plan templates to plans/ directory?"
         )
 
-    with open(template_path) as f:
-        template = json.load(f)
-
-    base_weeks = len(template.get("weeks", []))
-    extended = False
+    library = get_library(base_dir)
+    base_weeks = len(library.base(template_dir_name)["weeks"])
     recovery_cadence = derived.get("recovery_week_cadence", 4)
 
-    # Extend if needed
-    if plan_duration > base_weeks:
-        template = extend_plan_template(template, plan_duration, recovery_cadence=recovery_cadence)
-        extended = True
+    # Extend if needed (the library caches each extended variant)
+    template = library.extended(template_dir_name, plan_duration, recovery_cadence)
+    extended = plan_duration > base_weeks
 
     return {
         "template": template,
@@ -104,6 +108,123 @@ def select_template(derived: Dict, base_dir: Path) -> Dict:
     }
 
 
+# Required fields per week / per workout in a template.json
+_WEEK_SCHEMA = {
+    "week_number": int,
+    "focus": str,
+    "volume_percent": (int, float),
+    "volume_hours": str,
+    "workouts": list,
+}
+_WORKOUT_SCHEMA = {"name": str, "description": str, "blocks": str}
+
+
+def validate_template(template) -> List[str]:
+    """Schema errors for a parsed template.json (empty list = valid)."""
+    if not isinstance(template, dict):
+        return ["template is not a JSON object"]
+    errors = []
+    if not isinstance(template.get("plan_metadata"), dict):
+        errors.append("plan_metadata missing or not an object")
+    weeks = template.get("weeks")
+    if not isinstance(weeks, list) or not weeks:
+        return errors + ["weeks missing or empty"]
+    for i, week in enumerate(weeks, 1):
+        if not isinstance(week, dict):
+            errors.append(f"week {i}: not an object")
+            continue
+        for field, kind in _WEEK_SCHEMA.items():
+            if not isinstance(week.get(field), kind) or isinstance(week.get(field), bool):
+                errors.append(f"week {i}: {field} missing or wrong type")
+        if week.get("week_number") != i:
+            errors.append(f"week {i}: week_number is {week.get('week_number')!r}, expected {i}")
+        for j, workout in enumerate(week.get("workouts") or [], 1):
+            if not isinstance(workout, dict):
+                errors.append(f"week {i} workout {j}: not an object")
+                continue
+            for field, kind in _WORKOUT_SCHEMA.items():
+                if not isinstance(workout.get(field), kind):
+                    errors.append(f"week {i} workout {j}: {field} missing or wrong type")
+    return errors
+
+
+class PlanTemplateLibrary:
+    """Every plan template under plans_dir, loaded and validated once.
+
+    base() and extended() return frozen views that are shared between
+    callers. A template whose file changes on disk is reloaded on next
+    access, dropping its cached extensions.
+    """
+
+    def __init__(self, plans_dir: Path):
+        self.plans_dir = Path(plans_dir)
+        self._base: Dict[str, Tuple[tuple, Dict]] = {}
+        self._extended: Dict[Tuple[str, int, int], Dict] = {}
+        self._lock = threading.Lock()
+
+    def template_dirs(self) -> List[str]:
+        return sorted(p.parent.name for p in self.plans_dir.glob("*/template.json"))
+
+    def load_all(self) -> Dict[str, Dict]:
+        """Load (or refresh) every template; raises on the first invalid one."""
+        return {name: self.base(name) for name in self.template_dirs()}
+
+    def base(self, template_dir: str) -> Dict:
+        """The template as shipped, read-only."""
+        path = self.plans_dir / template_dir / "template.json"
+        stamp = file_stamp(path)
+        with self._lock:
+            cached = self._base.get(template_dir)
+            if cached and cached[0] == stamp:
+                return cached[1]
+            with open(path) as f:
+                data = json.load(f)
+            errors = validate_template(data)
+            if errors:
+                raise ValueError(f"Invalid plan template {path}:\n  " + "\n  ".join(errors[:10]))
+            template = freeze(data)
+            self._base[template_dir] = (stamp, template)
+            self._extended = {k: v for k, v in self._extended.items() if k[0] != template_dir}
+            return template
+
+    def extended(self, template_dir: str, target_weeks: int, recovery_cadence: int = 4) -> Dict:
+        """The template extended to target_weeks, read-only.
+
+        Templates already at least target_weeks long come back unchanged.
+        """
+        base = self.base(template_dir)
+        if target_weeks <= len(base["weeks"]):
+            return base
+        key = (template_dir, target_weeks, recovery_cadence)
+        with self._lock:
+            template = self._extended.get(key)
+        if template is None:
+            template = freeze(extend_plan_template(base, target_weeks, recovery_cadence=recovery_cadence))
+            with self._lock:
+                # Skip if the base was reloaded while we were extending
+                if self._base.get(template_dir, (None, None))[1] is base:
+                    self._extended[key] = template
+        return template
+
+    def clear(self):
+        with self._lock:
+            self._base.clear()
+            self._extended.clear()
+
+
+_libraries: Dict[Path, PlanTemplateLibrary] = {}
+_libraries_lock = threading.Lock()
+
+
+def get_library(base_dir: Path) -> PlanTemplateLibrary:
+    """The process-wide library for base_dir/plans."""
+    plans_dir = Path(base_dir) / "plans"
+    with _libraries_lock:
+        if plans_dir not in _libraries:
+            _libraries[plans_dir] = PlanTemplateLibrary(plans_dir)
+        return _libraries[plans_dir]
+
+
 # Focus text transforms for extended weeks — avoids confusing duplicates
 # like "Build Phase Begins" appearing at both W5 and W9.
 _FOCUS_TRANSFORMS = {
@@ -10,17 +10,24 @@ File naming convention: W{week:02d}_{daynum}{Day}_{MmmDD}_{Type}.zwo
   - Sorts chronologically: by week, then day number (1=Mon..7=Sun)
   - Date in filename for easy drag-and-drop to TrainingPeaks calendar
 
+build_workouts() returns the plan as in-memory Workout objects so gate 6
+can check them before anything touches disk; write_workouts() then writes
+the .zwo files in one pass, plus workouts.zip for delivery.
+
 Adapted from gravel-plans-experimental/races/generation_modules/zwo_generator.py
 """
 
-import json
 import math
 import re
 import html as html_lib
+import zipfile
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from pipeline.resources import load_json
+
 # ── ZWO Template ─────────────────────────────────────────────
 
 ZWO_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
@@ -36,6 +43,27 @@ ZWO_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
 {blocks}    </workout>
 </workout_file>"""
 
+
+@dataclass
+class Workout:
+    """One .zwo file, held in memory until write_workouts()."""
+
+    filename: str
+    name: str
+    description: str
+    blocks: str
+    sport_type: str = "bike"
+
+    def to_zwo(self) -> str:
+        """The ZWO XML, with name and description escaped."""
+        return ZWO_TEMPLATE.format(
+            name=html_lib.escape(self.name),
+            description=html_lib.escape(self.description),
+            blocks=self.blocks,
+            sport_type=self.sport_type,
+        )
+
+
 # ── Day mapping ──────────────────────────────────────────────
 
 DAY_ORDER = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
@@ -446,15 +474,44 @@ def generate_workouts(
     schedule: Dict,
     workouts_dir: Path,
     base_dir: Path,
-):
+) -> List[Workout]:
+    """Build every workout and write them to workouts_dir."""
+    workouts = build_workouts(plan_config, profile, derived, schedule, base_dir)
+    write_workouts(workouts, workouts_dir)
+    return workouts
+
+
+def write_workouts(workouts: List[Workout], workouts_dir: Path,
+                   zip_path: Optional[Path] = None):
+    """Write each workout's .zwo in one pass, and optionally one zip of them all.
+
+    The zip is what step 10 attaches for TrainingPeaks/Zwift import.
     """
-    Generate ZWO files for every day of every week.
+    files = [(w.filename, w.to_zwo()) for w in workouts]
+    for filename, content in files:
+        (workouts_dir / filename).write_text(content, encoding="utf-8")
+    if zip_path is not None:
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for filename, content in files:
+                zf.writestr(filename, content)
+
+
+def build_workouts(
+    plan_config: Dict,
+    profile: Dict,
+    derived: Dict,
+    schedule: Dict,
+    base_dir: Path,
+) -> List[Workout]:
+    """
+    Generate a ZWO workout for every day of every week, in memory.
     Every day gets a file — training days, strength days, and rest days.
 
     Workout durations are scaled to match the athlete's stated weekly hours
     and capped at their stated longest ride. A 5-7 hour/week athlete should
     NEVER get workouts designed for 10-12 hours/week.
     """
+    workouts: List[Workout] = []
     template = plan_config["template"]
     plan_duration = plan_config["plan_duration"]
     ftp_test_weeks = plan_config.get("ftp_test_weeks", [1, 7])
@@ -572,19 +629,19 @@ def generate_workouts(
             template_workout = _find_template_workout(template_workouts, day_abbrev, day_name)
 
             if session_type == "rest":
-                _write_rest_day(workouts_dir, week_num, day_abbrev, date_str)
+                _add_rest_day(workouts, week_num, day_abbrev, date_str)
 
             elif session_type == "strength":
-                _write_strength_workout(workouts_dir, week_num, day_abbrev, date_str, phase, injuries)
+                _add_strength_workout(workouts, week_num, day_abbrev, date_str, phase, injuries)
 
             elif session_type == "intervals" and is_ftp_week and day_name == _first_interval_day(days_schedule):
                 # FTP test replaces the first interval session of FTP test weeks
-                _write_ftp_test(workouts_dir, week_num, day_abbrev, date_str)
+                _add_ftp_test(workouts, week_num, day_abbrev, date_str)
 
             elif is_recovery_week and session_type in ("long_ride", "intervals"):
                 # Recovery weeks: replace long rides and intervals with easy rides
-                _write_default_workout(
-                    workouts_dir, week_num, day_abbrev, date_str,
+                _add_default_workout(
+                    workouts, week_num, day_abbrev, date_str,
                     "easy_ride", race_data, week_num, plan_duration,
                     week_scale, long_ride_cap, 0,  # NO floor on recovery weeks
                     is_recovery_week=True,
@@ -596,8 +653,8 @@ def generate_workouts(
                 # contains high-intensity intervals (e.g. "Light Quality Session" at 102% FTP),
                 # replace it with an easy ride. Recovery means recovery.
                 if is_recovery_week and _template_has_hard_intervals(template_workout):
-                    _write_default_workout(
-                        workouts_dir, week_num, day_abbrev, date_str,
+                    _add_default_workout(
+                        workouts, week_num, day_abbrev, date_str,
                         "easy_ride", race_data, week_num, plan_duration,
                         week_scale, long_ride_cap, 0,
                         is_recovery_week=True,
@@ -618,8 +675,8 @@ def generate_workouts(
                 else:
                     effective_cap = long_ride_cap if session_type == "long_ride" and is_endurance else 99999
                     effective_floor = long_ride_floor if session_type == "long_ride" and is_endurance else 0
-                _write_template_workout(
-                    workouts_dir, week_num, day_abbrev, date_str,
+                _add_template_workout(
+                    workouts, week_num, day_abbrev, date_str,
                     template_workout, race_data, week_num, plan_duration,
                     week_scale, effective_cap, effective_floor,
                     injuries=injuries,
@@ -633,8 +690,8 @@ def generate_workouts(
                 else:
                     effective_cap = long_ride_cap if session_type == "long_ride" else 99999
                     effective_floor = long_ride_floor if session_type == "long_ride" else 0
-                _write_default_workout(
-                    workouts_dir, week_num, day_abbrev, date_str,
+                _add_default_workout(
+                    workouts, week_num, day_abbrev, date_str,
                     session_type, race_data, week_num, plan_duration,
                     week_scale, effective_cap, effective_floor,
                     is_recovery_week=is_recovery_week,
@@ -642,7 +699,11 @@ def generate_workouts(
                 )
 
     # Generate race day workout as final file
-    _write_race_day_workout(workouts_dir, plan_duration, race_data, race_name, race_distance, race_date_str, injuries)
+    _add_race_day_workout(workouts, plan_duration, race_data, race_name, race_distance, race_date_str, injuries)
+
+    # A later workout with the same filename replaces the earlier one,
+    # as overwriting the file used to
+    return list({w.filename: w for w in workouts}.values())
 
 
 def _calculate_start_date(race_date_str: Optional[str], plan_duration: int):
@@ -684,25 +745,12 @@ def _find_template_workout(workouts: List[Dict], day_abbrev: str, day_name: str)
     return None
 
 
-def _write_zwo(workouts_dir: Path, filename: str, name: str, description: str,
-               blocks: str, sport_type: str = "bike"):
-    """Write a ZWO file with proper XML formatting."""
-    safe_desc = html_lib.escape(description)
-    safe_name = html_lib.escape(name)
-
-    # Ensure blocks are properly indented
-    if blocks and not blocks.strip().startswith("<"):
-        pass
+def _add_zwo(workouts: List["Workout"], filename: str, name: str, description: str,
+             blocks: str, sport_type: str = "bike"):
+    """Append a workout; empty blocks fall back to an easy recovery ride."""
     if not blocks or not blocks.strip():
         blocks = RECOVERY_RIDE_BLOCKS
-
-    content = ZWO_TEMPLATE.format(
-        name=safe_name,
-        description=safe_desc,
-        blocks=blocks,
-        sport_type=sport_type,
-    )
-    (workouts_dir / filename).write_text(content, encoding="utf-8")
+    workouts.append(Workout(filename, name, description, blocks, sport_type))
 
 
 def _zwo_name(week_num: int, day_abbrev: str, date_str: str, workout_type: str) -> str:
@@ -718,19 +766,19 @@ def _zwo_name(week_num: int, day_abbrev: str, date_str: str, workout_type: str)
     return f"W{week_num:02d} {day_num}{day_abbrev} {date} - {workout_type}"
 
 
-def _write_rest_day(workouts_dir: Path, week_num: int, day_abbrev: str, date_str: str):
-    """Write a rest day ZWO file — yes, rest days get files for TrainingPeaks."""
+def _add_rest_day(workouts: List["Workout"], week_num: int, day_abbrev: str, date_str: str):
+    """Rest day workout — yes, rest days get files for TrainingPeaks."""
     prefix = _file_prefix(week_num, day_abbrev, date_str)
     filename = f"{prefix}_Rest_Day.zwo"
     blocks = '        <SteadyState Duration="1" Power="0.40"/>\n'
-    _write_zwo(workouts_dir, filename,
-               _zwo_name(week_num, day_abbrev, date_str, "Rest Day"),
-               REST_DAY_DESCRIPTION, blocks)
+    _add_zwo(workouts, filename,
+             _zwo_name(week_num, day_abbrev, date_str, "Rest Day"),
+             REST_DAY_DESCRIPTION, blocks)
 
 
-def _write_strength_workout(workouts_dir: Path, week_num: int, day_abbrev: str,
-                            date_str: str, phase: str, injuries: str = ""):
-    """Write a strength training ZWO file with injury-aware exercise substitution.
+def _add_strength_workout(workouts: List["Workout"], week_num: int, day_abbrev: str,
+                          date_str: str, phase: str, injuries: str = ""):
+    """Strength training workout with injury-aware exercise substitution.
 
     This function ACTUALLY SWAPS exercises — not just warnings.
     Each injury type has a substitution dict that regex-replaces dangerous
@@ -744,9 +792,9 @@ def _write_strength_workout(workouts_dir: Path, week_num: int, day_abbrev: str,
 
     prefix = _file_prefix(week_num, day_abbrev, date_str)
     filename = f"{prefix}_Strength_{phase.title()}.zwo"
-    _write_zwo(workouts_dir, filename,
-               _zwo_name(week_num, day_abbrev, date_str, template['name']),
-               description, template["blocks"])
+    _add_zwo(workouts, filename,
+             _zwo_name(week_num, day_abbrev, date_str, template['name']),
+             description, template["blocks"])
 
 
 def _apply_injury_modifications(description: str, injuries: str) -> str:
@@ -810,21 +858,21 @@ def _has_hip_restriction(injuries: str) -> bool:
     return any(kw in lower for kw in ("hip resurfac", "hip replac", "hip arthroplasty", "labral", "hip impingement"))
 
 
-def _write_ftp_test(workouts_dir: Path, week_num: int, day_abbrev: str, date_str: str):
-    """Write an FTP test workout ZWO file."""
+def _add_ftp_test(workouts: List["Workout"], week_num: int, day_abbrev: str, date_str: str):
+    """FTP test workout."""
     prefix = _file_prefix(week_num, day_abbrev, date_str)
     filename = f"{prefix}_FTP_Test.zwo"
-    _write_zwo(workouts_dir, filename,
-               _zwo_name(week_num, day_abbrev, date_str, "FTP Test"),
-               FTP_TEST_DESCRIPTION, FTP_TEST_BLOCKS)
+    _add_zwo(workouts, filename,
+             _zwo_name(week_num, day_abbrev, date_str, "FTP Test"),
+             FTP_TEST_DESCRIPTION, FTP_TEST_BLOCKS)
 
 
-def _write_template_workout(workouts_dir: Path, week_num: int, day_abbrev: str,
-                            date_str: str, workout: Dict, race_data: Optional[Dict],
-                            current_week: int, total_weeks: int,
-                            scale: float = 1.0, long_ride_cap: int = 99999,
-                            long_ride_floor: int = 0, injuries: str = ""):
-    """Write a workout from the plan template, with duration scaling."""
+def _add_template_workout(workouts: List["Workout"], week_num: int, day_abbrev: str,
+                          date_str: str, workout: Dict, race_data: Optional[Dict],
+                          current_week: int, total_weeks: int,
+                          scale: float = 1.0, long_ride_cap: int = 99999,
+                          long_ride_floor: int = 0, injuries: str = ""):
+    """Workout from the plan template, with duration scaling."""
     name = workout.get("name", f"W{week_num:02d}_{day_abbrev}_Workout")
     description = workout.get("description", "")
     blocks = workout.get("blocks", "")
@@ -844,9 +892,9 @@ def _write_template_workout(workouts_dir: Path, week_num: int, day_abbrev: str,
     prefix = _file_prefix(week_num, day_abbrev, date_str)
     filename = f"{prefix}_{_sanitize_filename(workout_type)}.zwo"
 
-    _write_zwo(workouts_dir, filename,
-               _zwo_name(week_num, day_abbrev, date_str, workout_type),
-               description, blocks)
+    _add_zwo(workouts, filename,
+             _zwo_name(week_num, day_abbrev, date_str, workout_type),
+             description, blocks)
 
 
 def _has_gi_restriction(injuries: str) -> bool:
@@ -875,14 +923,14 @@ def _apply_gi_nutrition_mods(description: str, injuries: str) -> str:
     return description
 
 
-def _write_default_workout(workouts_dir: Path, week_num: int, day_abbrev: str,
-                           date_str: str, session_type: str, race_data: Optional[Dict],
-                           current_week: int, total_weeks: int,
-                           scale: float = 1.0, long_ride_cap: int = 99999,
-                           long_ride_floor: int = 0,
-                           is_recovery_week: bool = False,
-                           injuries: str = ""):
-    """Write a default workout when no template workout exists for this day."""
+def _add_default_workout(workouts: List["Workout"], week_num: int, day_abbrev: str,
+                         date_str: str, session_type: str, race_data: Optional[Dict],
+                         current_week: int, total_weeks: int,
+                         scale: float = 1.0, long_ride_cap: int = 99999,
+                         long_ride_floor: int = 0,
+                         is_recovery_week: bool = False,
+                         injuries: str = ""):
+    """Default workout when no template workout exists for this day."""
     prefix = _file_prefix(week_num, day_abbrev, date_str)
 
     if session_type == "long_ride" and is_recovery_week:
@@ -897,7 +945,7 @@ def _write_default_workout(workouts_dir: Path, week_num: int, day_abbrev: str,
 
         if race_data:
             description = _apply_race_mods(description, race_data, current_week, total_weeks)
-        _write_zwo(workouts_dir, filename, name, description, blocks)
+        _add_zwo(workouts, filename, name, description, blocks)
         return
 
     if session_type == "long_ride":
@@ -958,7 +1006,7 @@ def _write_default_workout(workouts_dir: Path, week_num: int, day_abbrev: str,
     if race_data:
         description = _apply_race_mods(description, race_data, current_week, total_weeks)
 
-    _write_zwo(workouts_dir, filename, name, description, blocks)
+    _add_zwo(workouts, filename, name, description, blocks)
 
 
 def _estimate_race_seconds(race_data: Optional[Dict], race_distance) -> int:
@@ -987,11 +1035,11 @@ def _estimate_race_seconds(race_data: Optional[Dict], race_distance) -> int:
     return 14400  # 4 hour default
 
 
-def _write_race_day_workout(workouts_dir: Path, plan_duration: int,
-                            race_data: Optional[Dict], race_name: str,
-                            race_distance, race_date_str: Optional[str] = None,
-                            injuries: str = ""):
-    """Write the race day execution workout as final ZWO."""
+def _add_race_day_workout(workouts: List["Workout"], plan_duration: int,
+                          race_data: Optional[Dict], race_name: str,
+                          race_distance, race_date_str: Optional[str] = None,
+                          injuries: str = ""):
+    """Race day execution workout, the plan's final ZWO."""
     date_label = _date_label(race_date_str) if race_date_str else "RaceDay"
     name = f"W{plan_duration:02d} {date_label} Race Day - {race_name or 'Race'} {race_distance}mi"
 
@@ -1027,7 +1075,7 @@ def _write_race_day_workout(workouts_dir: Path, plan_duration: int,
     )
     race_date_label = _date_label(race_date_str) if race_date_str else "RaceDay"
     filename = f"W{plan_duration:02d}_{race_date_label}_Race_Day.zwo"
-    _write_zwo(workouts_dir, filename, name, description, blocks)
+    _add_zwo(workouts, filename, name, description, blocks)
 
 
 def _template_has_hard_intervals(workout: Dict) -> bool:
@@ -1060,8 +1108,7 @@ def load_race_data(race_name: str, distance_miles: Optional[int], base_dir: Path
     if not race_path.exists():
         return None
 
-    with open(race_path) as f:
-        race_json = json.load(f)
+    race_json = load_json(race_path)
 
     if "distance_variants" in race_json and distance_miles:
         variants = race_json["distance_variants"]
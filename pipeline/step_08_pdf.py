@@ -5,13 +5,41 @@ Converts HTML guide to PDF using Playwright (Chromium).
 
 Print styling lives in pipeline/print.css and is injected at render time.
 This means print CSS changes only require re-running step 8 — never step 7.
+
+Launching Chromium costs more than rendering a guide, so rendering goes
+through a PdfRenderer: one warm browser kept for the life of the process,
+with a small pool of reusable pages. Guides are loaded with set_content()
+from the already-built HTML (print.css spliced in) rather than a file://
+navigation, and a batch of guides renders concurrently, one per page.
+Inside the Mission Control worker the browser stays warm across runs.
+
+Batch regeneration:
+    python -m pipeline.step_08_pdf athletes/*/guide.html
 """
 
+import asyncio
+import atexit
 import os
+import sys
+import threading
 from pathlib import Path
 
 PRINT_CSS = Path(__file__).parent / "print.css"
 
+# Pages rendering at once; each is a separate tab in the shared browser
+PDF_PAGES = int(os.environ.get("PDF_PAGES", "4"))
+
+PDF_OPTIONS = {
+    "format": "A4",
+    "print_background": True,
+    "margin": {
+        "top": "15mm",
+        "bottom": "15mm",
+        "left": "15mm",
+        "right": "15mm",
+    },
+}
+
 
 def generate_pdf(html_path: Path, pdf_path: Path):
     """Convert HTML guide to PDF using Playwright.
@@ -19,34 +47,160 @@ def generate_pdf(html_path: Path, pdf_path: Path):
     Injects pipeline/print.css at render time so print styling
     is decoupled from guide content generation (step 7).
     """
-    try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        raise RuntimeError(
-            "Playwright not installed. Run: pip install playwright && playwright install chromium"
-        )
+    get_renderer().render(html_path, pdf_path)
+
+
+def generate_pdfs(jobs: list) -> list:
+    """Render (html_path, pdf_path) pairs concurrently.
+
+    Returns one entry per job: None on success, else the exception.
+    """
+    return get_renderer().render_batch(jobs)
+
+
+def _with_print_css(html: str) -> str:
+    """Splice print.css in as the last stylesheet in <head>."""
+    if not PRINT_CSS.exists():
+        return html
+    style = f"<style>{PRINT_CSS.read_text()}</style>"
+    if "</head>" in html:
+        return html.replace("</head>", style + "</head>", 1)
+    return style + html
+
+
+class PdfRenderer:
+    """Warm Chromium plus a pool of pages, driven from a private event loop.
+
+    The async Playwright API runs on a background thread so callers stay
+    synchronous; render_batch() fans jobs out over the page pool.
+    """
+
+    def __init__(self, pages: int = PDF_PAGES):
+        self.size = max(1, pages)
+        self._playwright = None
+        self._browser = None
+        self._pages = None
+        self._launching = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name="pdf-renderer", daemon=True)
+        self._thread.start()
 
-    abs_html = os.path.abspath(html_path)
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto(f"file://{abs_html}")
-        page.wait_for_load_state("networkidle")
-
-        # Inject print stylesheet — owned by step 8, not step 7
-        if PRINT_CSS.exists():
-            page.add_style_tag(content=PRINT_CSS.read_text())
-
-        page.pdf(
-            path=str(pdf_path),
-            format="A4",
-            print_background=True,
-            margin={
-                "top": "15mm",
-                "bottom": "15mm",
-                "left": "15mm",
-                "right": "15mm",
-            },
+    def render(self, html_path: Path, pdf_path: Path):
+        """Render one guide; raises on failure."""
+        error = self.render_batch([(html_path, pdf_path)])[0]
+        if error is not None:
+            raise error
+
+    def render_batch(self, jobs: list) -> list:
+        """Render (html_path, pdf_path) pairs; None or the exception per job."""
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        results = asyncio.run_coroutine_threadsafe(self._batch(jobs), self._loop).result()
+        return [r if isinstance(r, BaseException) else None for r in results]
+
+    def close(self):
+        """Shut the browser down and stop the loop thread."""
+        if not self._loop.is_running():
+            return
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    async def _launch(self):
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError:
+            raise RuntimeError(
+                "Playwright not installed. Run: pip install playwright && playwright install chromium"
+            )
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return await self._playwright.chromium.launch()
+
+    async def _ensure_browser(self):
+        # Batches can arrive from several threads; only one may launch
+        if self._launching is None:
+            self._launching = asyncio.Lock()
+        async with self._launching:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            self._browser = await self._launch()
+            # Page slots are filled lazily; None means "open a page when needed"
+            self._pages = asyncio.Queue()
+            for _ in range(self.size):
+                self._pages.put_nowait(None)
+
+    async def _batch(self, jobs: list) -> list:
+        await self._ensure_browser()
+        return await asyncio.gather(
+            *(self._render(html_path, pdf_path) for html_path, pdf_path in jobs),
+            return_exceptions=True,
         )
-        browser.close()
+
+    async def _render(self, html_path: Path, pdf_path: Path):
+        pages = self._pages
+        page = await pages.get()
+        try:
+            if page is None or page.is_closed():
+                page = await self._browser.new_page()
+            html = _with_print_css(Path(html_path).read_text())
+            await page.set_content(html, wait_until="networkidle")
+            await page.pdf(path=str(pdf_path), **PDF_OPTIONS)
+        except BaseException:
+            # Don't hand a page in an unknown state to the next job
+            if page is not None and not page.is_closed():
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            page = None
+            raise
+        finally:
+            pages.put_nowait(page)
+
+    async def _stop(self):
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> PdfRenderer:
+    """The process-wide renderer; the browser launches on first render."""
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = PdfRenderer()
+            atexit.register(_renderer.close)
+        return _renderer
+
+
+def main(argv: list) -> int:
+    jobs = [(Path(p), Path(p).with_suffix(".pdf")) for p in argv]
+    if not jobs:
+        print("Usage: python -m pipeline.step_08_pdf GUIDE.html [GUIDE.html ...]")
+        return 2
+    failed = 0
+    for (html_path, pdf_path), error in zip(jobs, generate_pdfs(jobs)):
+        if error is None:
+            print(f"  {pdf_path}")
+        else:
+            failed += 1
+            print(f"  FAILED {html_path}: {error}")
+    print(f"{len(jobs) - failed}/{len(jobs)} PDFs rendered")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -9,14 +9,16 @@ import os
 import base64
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 
-def deliver(intake: Dict, guide_url: str, pdf_path: Path, workouts_dir: Path) -> Dict:
+def deliver(intake: Dict, guide_url: str, pdf_path: Path, workouts_dir: Path,
+            zip_path: Optional[Path] = None) -> Dict:
     """
     Send delivery email to athlete.
 
-    Returns receipt dict.
+    Attaches the guide PDF and, when step 6 wrote one, the zip of every
+    ZWO workout. Returns receipt dict.
     """
     try:
         import resend
@@ -45,9 +47,20 @@ def deliver(intake: Dict, guide_url: str, pdf_path: Path, workouts_dir: Path) ->
             "type": "application/pdf",
         })
 
+    # Every ZWO in one zip (written by step 6)
+    zip_attached = zip_path is not None and zip_path.exists()
+    if zip_attached:
+        attachments.append({
+            "filename": f"{athlete_name.replace(' ', '_')}_Workouts.zip",
+            "content": base64.b64encode(zip_path.read_bytes()).decode("utf-8"),
+            "type": "application/zip",
+        })
+
     # Count ZWO files
     zwo_count = len(list(workouts_dir.glob("*.zwo")))
 
+    zip_note = " (zip attached)" if zip_attached else ""
+
     # Build email HTML
     html_body = f"""
     <div style="font-family: 'Courier New', monospace; max-width: 600px; margin: 0 auto;">
@@ -66,7 +79,7 @@ def deliver(intake: Dict, guide_url: str, pdf_path: Path, workouts_dir: Path) ->
                 <li><strong>Training Guide:</strong>
                     <a href="{guide_url}" style="color: #4ecdc4;">View Online</a>
                     (PDF also attached)</li>
-                <li><strong>{zwo_count} ZWO Workouts:</strong> Ready for Zwift / TrainingPeaks</li>
+                <li><strong>{zwo_count} ZWO Workouts:</strong> Ready for Zwift / TrainingPeaks{zip_note}</li>
             </ul>
 
             <div style="background: #4ecdc4; color: #2c2c2c; padding: 15px; margin: 20px 0; font-weight: bold;">
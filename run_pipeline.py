@@ -5,14 +5,25 @@ ENDURE Plan Engine — Single-command training plan pipeline.
 Usage:
     python run_pipeline.py intake.json
     python run_pipeline.py intake.json --skip-deploy --skip-deliver
+    python run_pipeline.py --batch intakes/*.json --jobs 4
 
 Each step writes artifacts to athletes/{athlete_id}/.
 If any quality gate fails, the pipeline HALTS with a clear error.
+
+Batch mode regenerates plans for many athletes after a template or
+methodology change: steps 1–7 and 11 run in a process pool (templates and
+race data loaded once per worker), guides go to one shared PDF renderer
+as they finish, and a per-athlete gate pass/fail table is printed at the
+end. No deploy, delivery or Downloads copy.
 """
 
+import io
 import json
+import os
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
 from pathlib import Path
 from datetime import datetime
 
@@ -21,13 +32,14 @@ from pipeline.step_02_profile import create_profile
 from pipeline.step_03_classify import classify_athlete
 from pipeline.step_04_schedule import build_schedule
 from pipeline.step_05_template import select_template
-from pipeline.step_06_workouts import generate_workouts
+from pipeline.step_06_workouts import build_workouts, write_workouts
 from pipeline.step_06b_methodology import generate_methodology
 from pipeline.step_07_guide import generate_guide
 from pipeline.step_08_pdf import generate_pdf
 from pipeline.step_09_deploy import deploy_guide
 from pipeline.step_10_deliver import deliver
 from pipeline.step_11_touchpoints import generate_touchpoints
+from pipeline.resources import preload
 
 from gates.quality_gates import (
     gate_1_intake,
@@ -62,7 +74,89 @@ def run_pipeline(intake_path: str, skip_pdf: bool = False, skip_deploy: bool = F
     with open(intake_file) as f:
         intake = json.load(f)
 
-    # Generate athlete ID and clean up previous runs
+    athlete_id, athlete_dir = _prepare_athlete_dir(intake, base_dir)
+
+    print(f"\nAthlete: {intake['name']}")
+    print(f"ID:      {athlete_id}")
+    print(f"Output:  {athlete_dir}\n")
+
+    plan = _generate_plan(intake, athlete_dir, base_dir)
+    validated = plan["validated"]
+    workouts_dir = plan["workouts_dir"]
+    guide_path = plan["guide_path"]
+
+    # ── Step 8: Generate PDF ─────────────────────────────────
+    pdf_path = athlete_dir / "guide.pdf"
+    if skip_pdf:
+        _step("8", "GENERATE PDF [SKIPPED]")
+        _ok()
+    else:
+        _step("8", "GENERATE PDF")
+        generate_pdf(guide_path, pdf_path)
+        gate_8_pdf(pdf_path)
+        _ok()
+
+    # ── Step 9: Deploy Guide ─────────────────────────────────
+    if skip_deploy:
+        _step("9", "DEPLOY GUIDE [SKIPPED]")
+        guide_url = f"file://{guide_path.resolve()}"
+        _ok()
+    else:
+        _step("9", "DEPLOY GUIDE")
+        guide_url = deploy_guide(athlete_id, guide_path, base_dir)
+        gate_9_deploy(guide_url)
+        _ok()
+
+    # ── Step 10: Deliver ─────────────────────────────────────
+    if skip_deliver:
+        _step("10", "DELIVER [SKIPPED]")
+        receipt = {
+            "email_sent": False,
+            "recipient": validated["email"],
+            "guide_url": guide_url,
+            "skipped": True,
+            "timestamp": datetime.now().isoformat(),
+        }
+        _ok()
+    else:
+        _step("10", "DELIVER")
+        receipt = deliver(validated, guide_url, pdf_path, workouts_dir,
+                          zip_path=athlete_dir / "workouts.zip")
+        gate_10_deliver(receipt, validated)
+        _ok()
+
+    # Save receipt
+    with open(athlete_dir / "receipt.json", "w") as f:
+        json.dump(receipt, f, indent=2)
+
+    _generate_touchpoints(plan, athlete_dir)
+
+    # ── Pre-delivery audit — BLOCKS if any check fails ────────
+    _step("12", "PRE-DELIVERY AUDIT")
+    from scripts.pre_delivery_audit import audit_athlete
+    failures = audit_athlete(athlete_dir)
+    if failures:
+        print("FAILED")
+        for f in failures:
+            print(f)
+        raise RuntimeError(f"Pre-delivery audit failed with {len(failures)} issues — fix before delivering")
+    _ok()
+
+    # ── Copy deliverables to Downloads ────────────────────────
+    _copy_to_downloads(intake, athlete_dir, pdf_path, workouts_dir, skip_pdf)
+
+    print("\n" + "=" * 60)
+    print("PIPELINE COMPLETE")
+    print(f"  Athlete: {intake['name']}")
+    print(f"  Output:  {athlete_dir}")
+    print(f"  Guide:   {guide_url}")
+    print("=" * 60)
+
+
+# ── Plan generation (shared by single and batch runs) ────────
+
+def _prepare_athlete_dir(intake: dict, base_dir: Path) -> tuple:
+    """Create athletes/{athlete_id}/ with the raw intake saved in it."""
     athlete_id = _make_athlete_id(intake["name"])
     athlete_dir = base_dir / "athletes" / athlete_id
     _cleanup_old_runs(intake["name"], athlete_dir, base_dir)
@@ -72,10 +166,11 @@ def run_pipeline(intake_path: str, skip_pdf: bool = False, skip_deploy: bool = F
     with open(athlete_dir / "intake.json", "w") as f:
         json.dump(intake, f, indent=2)
 
-    print(f"\nAthlete: {intake['name']}")
-    print(f"ID:      {athlete_id}")
-    print(f"Output:  {athlete_dir}\n")
+    return athlete_id, athlete_dir
+
 
+def _generate_plan(intake: dict, athlete_dir: Path, base_dir: Path) -> dict:
+    """Steps 1–7: intake through guide. Returns what the later steps need."""
     # ── Step 1: Validate Intake ──────────────────────────────
     _step("1", "VALIDATE INTAKE")
     validated = validate_intake(intake)
@@ -125,12 +220,12 @@ def run_pipeline(intake_path: str, skip_pdf: bool = False, skip_deploy: bool = F
         import shutil
         shutil.rmtree(workouts_dir)
     workouts_dir.mkdir(parents=True)
-    generate_workouts(plan_config, profile, derived, schedule, workouts_dir, base_dir)
-    gate_6_workouts(workouts_dir, derived)
+    workouts = build_workouts(plan_config, profile, derived, schedule, base_dir)
+    gate_6_workouts(workouts_dir, derived, workouts)
+    write_workouts(workouts, workouts_dir, zip_path=athlete_dir / "workouts.zip")
     _ok()
 
-    zwo_count = len(list(workouts_dir.glob("*.zwo")))
-    print(f"   ZWO files: {zwo_count}")
+    print(f"   ZWO files: {len(workouts)}")
 
     # ── Step 6b: Generate Methodology Document ────────────────
     _step("6b", "GENERATE METHODOLOGY")
@@ -145,77 +240,118 @@ def run_pipeline(intake_path: str, skip_pdf: bool = False, skip_deploy: bool = F
     gate_7_guide(guide_path, validated, derived)
     _ok()
 
-    # ── Step 8: Generate PDF ─────────────────────────────────
-    pdf_path = athlete_dir / "guide.pdf"
-    if skip_pdf:
-        _step("8", "GENERATE PDF [SKIPPED]")
-        _ok()
-    else:
-        _step("8", "GENERATE PDF")
-        generate_pdf(guide_path, pdf_path)
-        gate_8_pdf(pdf_path)
-        _ok()
-
-    # ── Step 9: Deploy Guide ─────────────────────────────────
-    if skip_deploy:
-        _step("9", "DEPLOY GUIDE [SKIPPED]")
-        guide_url = f"file://{guide_path.resolve()}"
-        _ok()
-    else:
-        _step("9", "DEPLOY GUIDE")
-        guide_url = deploy_guide(athlete_id, guide_path, base_dir)
-        gate_9_deploy(guide_url)
-        _ok()
-
-    # ── Step 10: Deliver ─────────────────────────────────────
-    if skip_deliver:
-        _step("10", "DELIVER [SKIPPED]")
-        receipt = {
-            "email_sent": False,
-            "recipient": validated["email"],
-            "guide_url": guide_url,
-            "skipped": True,
-            "timestamp": datetime.now().isoformat(),
-        }
-        _ok()
-    else:
-        _step("10", "DELIVER")
-        receipt = deliver(validated, guide_url, pdf_path, workouts_dir)
-        gate_10_deliver(receipt, validated)
-        _ok()
+    return {
+        "validated": validated,
+        "profile": profile,
+        "derived": derived,
+        "schedule": schedule,
+        "plan_config": plan_config,
+        "workouts_dir": workouts_dir,
+        "guide_path": guide_path,
+    }
 
-    # Save receipt
-    with open(athlete_dir / "receipt.json", "w") as f:
-        json.dump(receipt, f, indent=2)
 
-    # ── Step 11: Generate Touchpoints ─────────────────────────
+def _generate_touchpoints(plan: dict, athlete_dir: Path):
+    """Step 11: schedule lifecycle touchpoints."""
     _step("11", "GENERATE TOUCHPOINTS")
-    touchpoints = generate_touchpoints(profile, derived, plan_config, athlete_dir)
-    gate_11_touchpoints(athlete_dir, derived)
+    touchpoints = generate_touchpoints(plan["profile"], plan["derived"], plan["plan_config"], athlete_dir)
+    gate_11_touchpoints(athlete_dir, plan["derived"])
     _ok()
     print(f"   Touchpoints: {len(touchpoints['touchpoints'])} scheduled")
 
-    # ── Pre-delivery audit — BLOCKS if any check fails ────────
-    _step("12", "PRE-DELIVERY AUDIT")
-    from scripts.pre_delivery_audit import audit_athlete
-    failures = audit_athlete(athlete_dir)
-    if failures:
-        print("FAILED")
-        for f in failures:
-            print(f)
-        raise RuntimeError(f"Pre-delivery audit failed with {len(failures)} issues — fix before delivering")
-    _ok()
 
-    # ── Copy deliverables to Downloads ────────────────────────
-    _copy_to_downloads(intake, athlete_dir, pdf_path, workouts_dir, skip_pdf)
+# ── Batch mode ───────────────────────────────────────────────
 
-    print("\n" + "=" * 60)
-    print("PIPELINE COMPLETE")
-    print(f"  Athlete: {intake['name']}")
-    print(f"  Output:  {athlete_dir}")
-    print(f"  Guide:   {guide_url}")
+# Columns of the summary table, in pipeline order
+BATCH_STEPS = ["1", "2", "3", "4", "5", "6", "6b", "7", "8", "11"]
+
+
+def run_batch(intake_paths: list, jobs: int = 0, skip_pdf: bool = False) -> int:
+    """Regenerate plans for many intakes. Returns a process exit code.
+
+    Steps 1–7 and 11 run per athlete in a process pool; each finished
+    guide is queued to the shared PDF renderer while the rest continue.
+    """
+    base_dir = Path(__file__).parent
+    jobs = jobs or os.cpu_count() or 1
+    print("=" * 60)
+    print(f"ENDURE PLAN ENGINE — BATCH ({len(intake_paths)} intakes, {jobs} jobs)")
     print("=" * 60)
 
+    # Warm the caches here too, so forked workers inherit them
+    preload(base_dir)
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=preload, initargs=(base_dir,)) as pool, \
+            ThreadPoolExecutor(max_workers=4) as pdf_pool:
+        futures = [pool.submit(_batch_one, str(p)) for p in intake_paths]
+        pdf_futures = []
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"  {'ok  ' if not result['error'] else 'FAIL'} {result['name']}")
+            if result["error"]:
+                continue
+            if skip_pdf:
+                result["gates"]["8"] = "skip"
+            else:
+                pdf_futures.append(pdf_pool.submit(_batch_pdf, result))
+        for future in pdf_futures:
+            future.result()
+
+    results.sort(key=lambda r: r["intake"])
+    _print_batch_summary(results)
+    return 1 if any(r["error"] for r in results) else 0
+
+
+def _batch_one(intake_path: str) -> dict:
+    """Steps 1–7 and 11 for one intake (runs in a pool worker)."""
+    base_dir = Path(__file__).parent
+    result = {"intake": intake_path, "name": Path(intake_path).stem,
+              "athlete_dir": None, "gates": {}, "error": None}
+    _steps_started.clear()
+    try:
+        with redirect_stdout(io.StringIO()):
+            with open(intake_path) as f:
+                intake = json.load(f)
+            result["name"] = intake["name"]
+            _, athlete_dir = _prepare_athlete_dir(intake, base_dir)
+            result["athlete_dir"] = str(athlete_dir)
+            plan = _generate_plan(intake, athlete_dir, base_dir)
+            _generate_touchpoints(plan, athlete_dir)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    passed = _steps_started[:-1] if result["error"] else _steps_started
+    result["gates"] = {num: "pass" for num in passed}
+    if result["error"] and _steps_started:
+        result["gates"][_steps_started[-1]] = "FAIL"
+    return result
+
+
+def _batch_pdf(result: dict):
+    """Step 8 for a finished batch plan, on the shared renderer."""
+    athlete_dir = Path(result["athlete_dir"])
+    pdf_path = athlete_dir / "guide.pdf"
+    try:
+        generate_pdf(athlete_dir / "guide.html", pdf_path)
+        gate_8_pdf(pdf_path)
+        result["gates"]["8"] = "pass"
+    except Exception as e:
+        result["gates"]["8"] = "FAIL"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+
+def _print_batch_summary(results: list):
+    width = max([len(r["name"]) for r in results] + [len("Athlete")])
+    print()
+    print(f"{'Athlete':<{width}}  " + " ".join(f"{n:>4}" for n in BATCH_STEPS))
+    for r in results:
+        cells = " ".join(f"{r['gates'].get(n, '-'):>4}" for n in BATCH_STEPS)
+        print(f"{r['name']:<{width}}  {cells}")
+    failed = [r for r in results if r["error"]]
+    print(f"\n{len(results) - len(failed)}/{len(results)} plans generated")
+    for r in failed:
+        print(f"  {r['name']}: {r['error']}")
+
 
 # ── Helpers ──────────────────────────────────────────────────
 
@@ -280,7 +416,13 @@ def _make_athlete_id(name: str) -> str:
     return f"{slug}-{ts}"
 
 
+# Steps announced so far in this process — batch mode reads the last one
+# as the step whose gate failed
+_steps_started: list = []
+
+
 def _step(num: str, label: str):
+    _steps_started.append(num)
     print(f"[Step {num}] {label} ", end="", flush=True)
 
 
@@ -298,12 +440,20 @@ def _save_yaml(path: Path, data: dict):
 
 def main():
     parser = argparse.ArgumentParser(description="ENDURE Plan Engine")
-    parser.add_argument("intake", help="Path to intake JSON file")
+    parser.add_argument("intake", nargs="?", help="Path to intake JSON file")
+    parser.add_argument("--batch", nargs="+", metavar="INTAKE",
+                        help="Regenerate plans for many intakes (steps 1-8, 11; no deploy/deliver)")
+    parser.add_argument("--jobs", type=int, default=0, help="Batch worker processes (default: CPU count)")
     parser.add_argument("--skip-pdf", action="store_true", help="Skip PDF generation (requires Playwright)")
     parser.add_argument("--skip-deploy", action="store_true", help="Skip GitHub Pages deployment")
     parser.add_argument("--skip-deliver", action="store_true", help="Skip email delivery")
     args = parser.parse_args()
 
+    if args.batch:
+        sys.exit(run_batch(args.batch, jobs=args.jobs, skip_pdf=args.skip_pdf))
+    if not args.intake:
+        parser.error("intake is required (or use --batch)")
+
     run_pipeline(args.intake, skip_pdf=args.skip_pdf, skip_deploy=args.skip_deploy, skip_deliver=args.skip_deliver)
 
 
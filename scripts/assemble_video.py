@@ -23,21 +23,30 @@ Usage:
     python scripts/assemble_video.py --brief ... --narration voice.wav
     python scripts/assemble_video.py --batch tier-reveal --tier T1
     python scripts/assemble_video.py --batch tier-reveal --tier T1 --no-broll
+    python scripts/assemble_video.py --batch tier-reveal --single-pass --preset draft
 
 Outputs to video-output/<format>/<slug>/:
     <slug>-rough.mp4, <slug>-teleprompter.md, <slug>.srt,
     <slug>-envelope.json, <slug>-report.json
+
+Rendered cards, Ken Burns clips and text/caption overlays are cached in
+data/beat-cache/ under a hash of their inputs (beat JSON, brand tokens,
+RENDER_VERSION); --batch pre-renders what's missing on a process pool.
 """
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import math
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -57,6 +66,7 @@ PLACEHOLDER_DIR = AVATAR_DIR / "placeholders"
 MUSIC_DIR = ASSETS_DIR / "music"
 OUTPUT_DIR = PROJECT_ROOT / "video-output"
 BROLL_CACHE = PROJECT_ROOT / "data" / "broll-cache"
+BEAT_CACHE = PROJECT_ROOT / "data" / "beat-cache"
 FONTS_DIR = PROJECT_ROOT / "guide" / "fonts"
 
 FONT_MONO = FONTS_DIR / "SometypeMono-Regular.ttf"
@@ -750,12 +760,29 @@ def probe_resolution(path: Path) -> tuple[int, int]:
         return (0, 0)
 
 
-VIDEO_ENC = ["-c:v", "libx264", "-preset", "veryfast", "-crf", "19",
-             "-pix_fmt", "yuv420p", "-r", str(FPS), "-an",
-             # uniform color tags: B-roll (bt709) and PIL cards (untagged)
-             # must produce identical streams or concat breaks downstream
-             "-colorspace", "bt709", "-color_primaries", "bt709",
-             "-color_trc", "bt709"]
+# name -> (x264 preset, crf). "standard" is the historical rough-cut
+# setting; "draft" is for checking timing, "final" for upload masters.
+ENCODER_PRESETS = {
+    "draft": ("ultrafast", 23),
+    "standard": ("veryfast", 19),
+    "final": ("slow", 17),
+}
+DEFAULT_PRESET = "standard"
+
+# uniform color tags: B-roll (bt709) and PIL cards (untagged) must produce
+# identical streams or concat breaks downstream
+COLOR_TAGS = ["-colorspace", "bt709", "-color_primaries", "bt709",
+              "-color_trc", "bt709"]
+
+
+def video_codec_args(preset: str = DEFAULT_PRESET) -> list[str]:
+    """libx264 args for an ENCODER_PRESETS entry. Raises KeyError."""
+    speed, crf = ENCODER_PRESETS[preset]
+    return ["-c:v", "libx264", "-preset", speed, "-crf", str(crf),
+            "-pix_fmt", "yuv420p"]
+
+
+VIDEO_ENC = video_codec_args() + ["-r", str(FPS), "-an"] + COLOR_TAGS
 
 
 def _cover_filter(width: int, height: int) -> str:
@@ -769,16 +796,21 @@ def card_to_clip(card_path: Path, duration: float, size: tuple[int, int],
     """Still card -> clip with a slow Ken Burns push (zoom 1.0 -> ~1.06).
     Card is pre-rendered at 2x and zoompan output downsamples, which avoids
     the classic single-pixel zoompan jitter."""
+    run_ffmpeg(["-loop", "1", "-framerate", str(FPS), "-i", str(card_path),
+                "-t", f"{duration:.3f}", "-vf", ken_burns_filter(duration, size)]
+               + VIDEO_ENC + [str(out_path)])
+    return out_path
+
+
+def ken_burns_filter(duration: float, size: tuple[int, int]) -> str:
+    """zoompan chain for card_to_clip and the single-pass graph."""
     w, h = size
     frames = max(int(duration * FPS), 1)
     zoom_per_frame = 0.06 / frames
-    vf = (f"scale={w * 2}:{h * 2},"
-          f"zoompan=z='1+{zoom_per_frame:.6f}*in':d=1:"
-          f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
-          f"s={w}x{h}:fps={FPS},setsar=1")
-    run_ffmpeg(["-loop", "1", "-framerate", str(FPS), "-i", str(card_path),
-                "-t", f"{duration:.3f}", "-vf", vf] + VIDEO_ENC + [str(out_path)])
-    return out_path
+    return (f"scale={w * 2}:{h * 2},"
+            f"zoompan=z='1+{zoom_per_frame:.6f}*in':d=1:"
+            f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
+            f"s={w}x{h}:fps={FPS},setsar=1")
 
 
 def segment_to_clip(segment_path: Path, duration: float,
@@ -802,41 +834,67 @@ def concat_clips(clips: list[Path], out_path: Path) -> Path:
     return out_path
 
 
-def build_beat_background(beat: dict, brief: dict, size: tuple[int, int],
-                          tmp: Path, use_broll: bool,
-                          race: dict) -> tuple[Path, dict]:
-    """Background track for one beat: B-roll cuts when the beat asks for
+def plan_beat_background(beat: dict, brief: dict, size: tuple[int, int],
+                         tmp: Path, use_broll: bool, race: dict,
+                         cache: BeatCache | None = None
+                         ) -> tuple[list[dict], dict]:
+    """Sources for one beat's background: B-roll cuts when the beat asks for
     real footage and curated videos exist; branded cards otherwise.
-    Returns (path, info) where info reports what was used."""
+
+    Downloads segments and renders card PNGs (into cache when given) but
+    runs no ffmpeg. Returns (cuts, info): each cut is
+    {"kind": "broll"|"card", "path", "duration"}; info reports what was
+    used."""
     cuts = beat_cut_plan(beat)
     beat_id = beat.get("id", "beat")
     info = {"beat": beat_id, "source": "cards", "cuts": len(cuts)}
 
     wants_broll = bool(beat.get("broll_sources")) and not beat.get("evidence_data")
-    clips: list[Path] = []
+    sources: list[dict] = []
     if use_broll and wants_broll:
         videos = broll_videos_for_race(race)
         plan = broll_timestamps(videos, len(cuts))
-        for i, (cut_dur, sample) in enumerate(zip(cuts, plan)):
+        for cut_dur, sample in zip(cuts, plan):
             seg = download_broll_segment(sample["video_id"],
                                          sample["timestamp"], cut_dur)
             if not seg:
                 break
-            clips.append(segment_to_clip(
-                seg, cut_dur, size, tmp / f"{beat_id}_broll{i}.mp4"))
-        if len(clips) == len(cuts):
+            sources.append({"kind": "broll", "path": seg, "duration": cut_dur})
+        if len(sources) == len(cuts):
             info["source"] = "broll"
             info["video_ids"] = [p["video_id"] for p in plan]
         else:
-            clips = []  # all-or-nothing per beat: partial B-roll falls back to cards
+            sources = []  # all-or-nothing per beat: partial B-roll falls back to cards
 
-    if not clips:
+    if not sources:
         for i, cut_dur in enumerate(cuts):
-            card = render_card(beat, brief, size, cut_index=i)
-            card_path = tmp / f"{beat_id}_card{i}.png"
-            card.save(card_path)
-            clips.append(card_to_clip(card_path, cut_dur, size,
-                                      tmp / f"{beat_id}_card{i}.mp4"))
+            card_path = _artifact(
+                cache, card_key(beat, brief, size, i),
+                tmp / f"{beat_id}_card{i}.png",
+                lambda p, i=i: render_card(beat, brief, size, cut_index=i).save(p))
+            sources.append({"kind": "card", "path": card_path,
+                            "duration": cut_dur})
+    return sources, info
+
+
+def build_beat_background(beat: dict, brief: dict, size: tuple[int, int],
+                          tmp: Path, use_broll: bool, race: dict,
+                          cache: BeatCache | None = None) -> tuple[Path, dict]:
+    """Background track for one beat as an intermediate clip.
+    Returns (path, info) where info reports what was used."""
+    sources, info = plan_beat_background(beat, brief, size, tmp,
+                                         use_broll, race, cache)
+    beat_id = info["beat"]
+    clips: list[Path] = []
+    for i, cut in enumerate(sources):
+        if cut["kind"] == "broll":
+            clips.append(segment_to_clip(
+                cut["path"], cut["duration"], size, tmp / f"{beat_id}_broll{i}.mp4"))
+        else:
+            clips.append(_artifact(
+                cache, card_clip_key(cut["path"], cut["duration"], size),
+                tmp / f"{beat_id}_card{i}.mp4",
+                lambda p, cut=cut: card_to_clip(cut["path"], cut["duration"], size, p)))
 
     if len(clips) == 1:
         return clips[0], info
@@ -851,46 +909,42 @@ def _beat_shows_overlay_text(beat: dict, bg_source: str) -> bool:
     return bg_source == "broll"
 
 
-def render_beat(beat: dict, brief: dict, size: tuple[int, int], tmp: Path,
-                use_broll: bool, race: dict) -> tuple[Path, dict]:
-    """Compose one beat: background + avatar layer + text overlays."""
+def beat_overlay_layers(beat: dict, info: dict, size: tuple[int, int],
+                        tmp: Path, cache: BeatCache | None = None) -> list[dict]:
+    """Avatar + text layers for one beat, timed from the beat's start.
+
+    Renders the text PNGs and records the avatar choice in info. Each layer
+    is {"path", "loop": input looping args, "prep": filter run on the layer
+    before overlaying (or None), "overlay": overlay options}."""
     start, end = beat_bounds(beat)
     duration = end - start
     beat_id = beat.get("id", "beat")
     w, h = size
-
-    bg_path, info = build_beat_background(beat, brief, size, tmp,
-                                          use_broll, race)
-
-    inputs = ["-i", str(bg_path)]
-    filters = []
-    last = "[0:v]"
-    input_idx = 1
+    layers: list[dict] = []
 
     # ── avatar layer (loop -> png -> placeholder) ──
     avatar = resolve_avatar(beat.get("avatar_pose", ""))
     info["avatar"] = {"pose": avatar["pose"], "kind": avatar["kind"]}
     avatar_w = int(w * AVATAR_WIDTH_FRAC)
     if avatar["kind"] == "loop":
-        inputs += ["-stream_loop", "-1", "-i", str(avatar["path"])]
-        if avatar["path"].suffix == ".mp4":
+        loop = ["-stream_loop", "-1"]
+        path = avatar["path"]
+        if path.suffix == ".mp4":
             # mp4 loops carry no alpha; generate_avatar_poses.py renders
             # them on solid green, keyed out here
-            filters.append(
-                f"[{input_idx}:v]colorkey=0x00FF00:0.30:0.08,"
-                f"despill=type=green,scale={avatar_w}:-1[av]")
+            prep = (f"colorkey=0x00FF00:0.30:0.08,"
+                    f"despill=type=green,scale={avatar_w}:-1")
         else:
-            filters.append(f"[{input_idx}:v]scale={avatar_w}:-1[av]")
+            prep = f"scale={avatar_w}:-1"
     else:
+        loop = ["-loop", "1"]
         path = avatar["path"] or render_placeholder_avatar(avatar["pose"])
-        inputs += ["-loop", "1", "-i", str(path)]
-        filters.append(f"[{input_idx}:v]scale={avatar_w}:-1[av]")
-    filters.append(
-        f"{last}[av]overlay=x={AVATAR_MARGIN_X}:"
-        f"y=H-h-{AVATAR_BOTTOM_OFFSET}:shortest=0[v{input_idx}]"
-    )
-    last = f"[v{input_idx}]"
-    input_idx += 1
+        prep = f"scale={avatar_w}:-1"
+    layers.append({
+        "path": path, "loop": loop, "prep": prep,
+        "overlay": (f"x={AVATAR_MARGIN_X}:y=H-h-{AVATAR_BOTTOM_OFFSET}:"
+                    f"shortest=0"),
+    })
 
     # ── text overlays ──
     text = (beat.get("text_on_screen") or "").strip()
@@ -900,38 +954,131 @@ def render_beat(beat: dict, brief: dict, size: tuple[int, int], tmp: Path,
         if kinetic:
             schedule = word_reveal_schedule(text, 0.0, duration)
             for j, (cumulative, t_on) in enumerate(schedule):
-                img = render_text_overlay(cumulative, w)
-                p = tmp / f"{beat_id}_txt{j}.png"
-                img.save(p)
+                p = _artifact(
+                    cache, overlay_key("text", cumulative, w),
+                    tmp / f"{beat_id}_txt{j}.png",
+                    lambda out, text=cumulative: render_text_overlay(text, w).save(out))
                 t_off = (schedule[j + 1][1] if j + 1 < len(schedule)
                          else duration)
-                inputs += ["-loop", "1", "-i", str(p)]
-                filters.append(
-                    f"{last}[{input_idx}:v]overlay=x=(W-w)/2:y={text_y}:"
-                    f"enable='between(t,{t_on},{t_off})'[v{input_idx}]"
-                )
-                last = f"[v{input_idx}]"
-                input_idx += 1
+                layers.append({
+                    "path": p, "loop": ["-loop", "1"], "prep": None,
+                    "overlay": (f"x=(W-w)/2:y={text_y}:"
+                                f"enable='between(t,{t_on},{t_off})'"),
+                })
         else:
-            img = render_text_overlay(text, w)
-            p = tmp / f"{beat_id}_txt.png"
-            img.save(p)
-            inputs += ["-loop", "1", "-i", str(p)]
-            filters.append(
-                f"{last}[{input_idx}:v]overlay=x=(W-w)/2:y={text_y}:"
-                f"enable='gte(t,0.2)'[v{input_idx}]"
-            )
-            last = f"[v{input_idx}]"
-            input_idx += 1
+            p = _artifact(cache, overlay_key("text", text, w), tmp / f"{beat_id}_txt.png",
+                          lambda out: render_text_overlay(text, w).save(out))
+            layers.append({
+                "path": p, "loop": ["-loop", "1"], "prep": None,
+                "overlay": f"x=(W-w)/2:y={text_y}:enable='gte(t,0.2)'",
+            })
+    return layers
+
+
+def overlay_graph(layers: list[dict], base_label: str, first_input_idx: int,
+                  prefix: str = "", duration: float | None = None
+                  ) -> tuple[list[str], list[str], str]:
+    """Stack layers over base_label. Returns (inputs, chains, last_label).
+
+    prefix keeps labels unique when several beats share one graph;
+    duration caps each looping input so the graph reaches EOF."""
+    inputs: list[str] = []
+    chains: list[str] = []
+    last = base_label
+    idx = first_input_idx
+    for layer in layers:
+        inputs += layer["loop"]
+        if duration is not None:
+            inputs += ["-t", f"{duration:.3f}"]
+        inputs += ["-i", str(layer["path"])]
+        src = f"[{idx}:v]"
+        if layer["prep"]:
+            chains.append(f"{src}{layer['prep']}[{prefix}av{idx}]")
+            src = f"[{prefix}av{idx}]"
+        out = f"[{prefix}v{idx}]"
+        chains.append(f"{last}{src}overlay={layer['overlay']}{out}")
+        last = out
+        idx += 1
+    return inputs, chains, last
+
+
+def render_beat(beat: dict, brief: dict, size: tuple[int, int], tmp: Path,
+                use_broll: bool, race: dict,
+                cache: BeatCache | None = None) -> tuple[Path, dict]:
+    """Compose one beat: background + avatar layer + text overlays."""
+    start, end = beat_bounds(beat)
+    duration = end - start
+    beat_id = beat.get("id", "beat")
+
+    bg_path, info = build_beat_background(beat, brief, size, tmp,
+                                          use_broll, race, cache)
+    layers = beat_overlay_layers(beat, info, size, tmp, cache)
+    inputs, filters, last = overlay_graph(layers, "[0:v]", 1)
 
     out_path = tmp / f"beat_{beat_id}.mp4"
-    filtergraph = ";".join(filters)
-    run_ffmpeg(inputs + ["-filter_complex", filtergraph,
-                         "-map", last, "-t", f"{duration:.3f}"]
+    run_ffmpeg(["-i", str(bg_path)] + inputs
+               + ["-filter_complex", ";".join(filters),
+                  "-map", last, "-t", f"{duration:.3f}"]
                + VIDEO_ENC + [str(out_path)])
     return out_path, info
 
 
+def single_pass_graph(beat_plans: list[dict], size: tuple[int, int],
+                      cues: list[tuple[float, float, str]], tmp: Path,
+                      cache: BeatCache | None = None
+                      ) -> tuple[list[str], list[str], str]:
+    """Whole-brief video graph for one encode, no intermediate clips.
+
+    beat_plans: [{"duration", "cuts", "layers"}] from plan_beat_background
+    and beat_overlay_layers. Each beat becomes a chain (Ken Burns cards or
+    cover-cropped B-roll, concatenated, then its overlays on beat-local
+    time, trimmed to length); beats are joined with the concat filter and
+    captions are overlaid on the result. Returns (inputs, chains,
+    last_video_label); audio inputs go after these.
+    """
+    w, h = size
+    inputs: list[str] = []
+    chains: list[str] = []
+    beat_labels = []
+    idx = 0
+    for k, plan in enumerate(beat_plans):
+        duration = plan["duration"]
+        cut_labels = []
+        for j, cut in enumerate(plan["cuts"]):
+            cut_dur = f"{cut['duration']:.3f}"
+            if cut["kind"] == "broll":
+                inputs += ["-t", cut_dur, "-i", str(cut["path"])]
+                vf = _cover_filter(w, h)
+            else:
+                inputs += ["-loop", "1", "-framerate", str(FPS),
+                           "-t", cut_dur, "-i", str(cut["path"])]
+                vf = ken_burns_filter(cut["duration"], size)
+            label = f"[b{k}c{j}]"
+            chains.append(f"[{idx}:v]{vf}{label}")
+            cut_labels.append(label)
+            idx += 1
+        if len(cut_labels) == 1:
+            bg = cut_labels[0]
+        else:
+            bg = f"[b{k}bg]"
+            chains.append(f"{''.join(cut_labels)}concat=n={len(cut_labels)}:"
+                          f"v=1:a=0{bg}")
+        layer_inputs, layer_chains, last = overlay_graph(
+            plan["layers"], bg, idx, prefix=f"b{k}", duration=duration)
+        inputs += layer_inputs
+        chains += layer_chains
+        idx += len(plan["layers"])
+        chains.append(f"{last}trim=duration={duration:.3f},"
+                      f"setpts=PTS-STARTPTS[b{k}]")
+        beat_labels.append(f"[b{k}]")
+
+    chains.append(f"{''.join(beat_labels)}concat=n={len(beat_labels)}:"
+                  f"v=1:a=0[body]")
+    cap_inputs, cap_chains, last = caption_overlay_graph(
+        cues, size, tmp, first_input_idx=idx, base_label="[body]", cache=cache)
+    return inputs + cap_inputs, chains + cap_chains, last
+
+
 def build_audio_graph(beats: list[dict], music_track: Path | None,
                       total_duration: float,
                       narration: Path | None = None,
@@ -1008,22 +1155,24 @@ def render_caption_overlay(text: str, frame_width: int) -> "object":
 
 def caption_overlay_graph(cues: list[tuple[float, float, str]],
                           size: tuple[int, int], tmp: Path,
-                          first_input_idx: int
+                          first_input_idx: int,
+                          base_label: str = "[0:v]",
+                          cache: BeatCache | None = None
                           ) -> tuple[list[str], list[str], str]:
     """Build caption-burn inputs and filter chains for the final render.
 
-    Returns (inputs, chains, last_video_label). Chains start from [0:v].
+    Returns (inputs, chains, last_video_label). Chains start from base_label.
     """
     w, h = size
     caption_y = int(h * CAPTION_Y_FRAC)
     inputs: list[str] = []
     chains: list[str] = []
-    last = "[0:v]"
+    last = base_label
     idx = first_input_idx
     for i, (start, end, text) in enumerate(cues):
-        img = render_caption_overlay(text, w)
-        png = tmp / f"caption_{i:03d}.png"
-        img.save(png)
+        png = _artifact(
+            cache, overlay_key("caption", text, w), tmp / f"caption_{i:03d}.png",
+            lambda out, text=text: render_caption_overlay(text, w).save(out))
         inputs += ["-loop", "1", "-i", str(png)]
         out_label = f"[cap{i}]"
         chains.append(
@@ -1035,6 +1184,193 @@ def caption_overlay_graph(cues: list[tuple[float, float, str]],
     return inputs, chains, last
 
 
+# ══════════════════════════════════════════════════════════════════════════
+# Beat render cache — content-hashed card PNGs, Ken Burns clips, overlays
+# ══════════════════════════════════════════════════════════════════════════
+
+# Bump when card/overlay drawing or the Ken Burns filter changes; every
+# cache key includes it, so old artifacts simply stop matching.
+RENDER_VERSION = 1
+
+# Beat fields Pass 2 re-timing rewrites; cards don't draw them, so they
+# stay out of the card key and a narration change reuses every card.
+TIMING_FIELDS = ("time_range", "_bounds", "duration_sec")
+
+
+def artifact_key(kind: str, payload: dict) -> str:
+    """Content hash of one render: payload + brand tokens + RENDER_VERSION."""
+    blob = json.dumps({"kind": kind, "version": RENDER_VERSION,
+                       "colors": COLORS, "tiers": TIER_NAMES,
+                       "payload": payload}, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:24]
+
+
+def card_key(beat: dict, brief: dict, size: tuple[int, int],
+             cut_index: int = 0) -> str:
+    """Key for render_card(): the beat JSON minus timing, plus the brief
+    fields cards draw. Cards without evidence_data ignore cut_index, so
+    every cut of such a beat shares one PNG."""
+    evidence = beat.get("evidence_data") or []
+    by_id = {b.get("id"): b for b in brief.get("beats", [])}
+    setup, cta = by_id.get("setup", {}), by_id.get("cta", {})
+    return artifact_key("card", {
+        "beat": {k: v for k, v in beat.items() if k not in TIMING_FIELDS},
+        "cut": min(cut_index, len(evidence) - 1) if evidence else 0,
+        "size": list(size),
+        "brief": {k: brief.get(k) for k in
+                  ("slug", "race_name", "race_tier", "race_score")},
+        "setup_text": setup.get("text_on_screen"),
+        "cta": [cta.get("text_on_screen"), cta.get("engagement_question")],
+    })
+
+
+def card_clip_key(card_path: Path, duration: float,
+                  size: tuple[int, int]) -> str:
+    """Key for card_to_clip() on a cached card (its stem is the card key)."""
+    return artifact_key("kenburns", {"card": card_path.stem,
+                                     "duration": round(duration, 3),
+                                     "size": list(size), "enc": VIDEO_ENC})
+
+
+def overlay_key(kind: str, text: str, frame_width: int) -> str:
+    """Key for a text ("text") or caption ("caption") overlay PNG."""
+    return artifact_key(kind, {"text": text, "width": frame_width})
+
+
+class BeatCache:
+    """Rendered beat artifacts under root, one file per content key.
+
+    Files are written to a per-process temp name and renamed into place,
+    so pool workers racing on the same key never expose a partial file.
+    """
+
+    def __init__(self, root: Path = BEAT_CACHE):
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key: str, suffix: str) -> Path:
+        return self.root / f"{key}{suffix}"
+
+    def get_or_render(self, key: str, suffix: str, render) -> Path:
+        """Cached path for key, calling render(path) to create it on a miss."""
+        path = self.path(key, suffix)
+        if path.exists():
+            self.hits += 1
+            return path
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{key}.{os.getpid()}{suffix}"
+        try:
+            render(tmp)
+            tmp.replace(path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.misses += 1
+        return path
+
+
+def _artifact(cache: BeatCache | None, key: str, tmp_path: Path, render) -> Path:
+    """render(path) into the cache when there is one, else into tmp_path."""
+    if cache is None:
+        render(tmp_path)
+        return tmp_path
+    return cache.get_or_render(key, tmp_path.suffix, render)
+
+
+def brief_artifacts(brief: dict, *, use_broll: bool, single_pass: bool,
+                    narrated: bool) -> list[tuple]:
+    """Render specs assemble() will need for a brief, known up front.
+
+    Beats that will try B-roll are skipped (their fallback depends on the
+    download). Narrated runs re-time beats and take captions from the
+    voice, so their Ken Burns clips and captions are left to assemble().
+    """
+    size = resolution_for_format(brief["format"])
+    width = size[0]
+    specs: list[tuple] = []
+    for beat in brief["beats"]:
+        wants_broll = bool(beat.get("broll_sources")) and not beat.get("evidence_data")
+        if use_broll and wants_broll:
+            continue
+        for i, cut_dur in enumerate(beat_cut_plan(beat)):
+            if single_pass or narrated:
+                specs.append(("card", beat, brief, size, i))
+            else:
+                specs.append(("kenburns", beat, brief, size, i, cut_dur))
+        text = (beat.get("text_on_screen") or "").strip()
+        if text and _beat_shows_overlay_text(beat, "cards"):
+            start, end = beat_bounds(beat)
+            for cumulative, _ in word_reveal_schedule(text, 0.0, end - start):
+                specs.append(("text", cumulative, width))
+    if not narrated:
+        for _, _, text in draft_caption_cues(brief["beats"]):
+            specs.append(("caption", text, width))
+    return specs
+
+
+def spec_key(spec: tuple) -> str:
+    kind = spec[0]
+    if kind == "card":
+        return card_key(*spec[1:5])
+    if kind == "kenburns":
+        _, beat, brief, size, cut_index, duration = spec
+        card = Path(card_key(beat, brief, size, cut_index))
+        return card_clip_key(card, duration, size)
+    return overlay_key(kind, spec[1], spec[2])
+
+
+def render_spec(spec: tuple, cache_root: Path) -> bool:
+    """Render one brief_artifacts() spec into the cache (pool worker).
+    Returns True if anything was rendered."""
+    cache = BeatCache(cache_root)
+    kind = spec[0]
+    if kind in ("card", "kenburns"):
+        beat, brief, size, cut_index = spec[1:5]
+        card = cache.get_or_render(
+            card_key(beat, brief, size, cut_index), ".png",
+            lambda p: render_card(beat, brief, size, cut_index).save(p))
+        if kind == "kenburns":
+            duration = spec[5]
+            cache.get_or_render(
+                card_clip_key(card, duration, size), ".mp4",
+                lambda p: card_to_clip(card, duration, size, p))
+    else:
+        draw = render_text_overlay if kind == "text" else render_caption_overlay
+        text, width = spec[1], spec[2]
+        cache.get_or_render(overlay_key(kind, text, width), ".png",
+                            lambda p: draw(text, width).save(p))
+    return cache.misses > 0
+
+
+def prerender_batch(brief_paths: list[Path], cache: BeatCache, *,
+                    use_broll: bool, single_pass: bool, narrated: bool,
+                    jobs: int) -> tuple[int, int]:
+    """Render every uncached artifact the batch needs across a process pool,
+    deduplicated across briefs. Returns (rendered, already_cached)."""
+    specs: dict[str, tuple] = {}
+    for path in brief_paths:
+        try:
+            brief = load_brief(path)
+        except (AssemblyError, json.JSONDecodeError, OSError):
+            continue  # assemble() reports it
+        try:
+            for spec in brief_artifacts(brief, use_broll=use_broll,
+                                        single_pass=single_pass,
+                                        narrated=narrated):
+                specs.setdefault(spec_key(spec), spec)
+        except ValueError:
+            continue
+    missing = [spec for key, spec in specs.items()
+               if not cache.path(key, ".mp4" if spec[0] == "kenburns" else ".png").exists()]
+    worker = partial(render_spec, cache_root=cache.root)
+    if jobs > 1 and len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rendered = sum(pool.map(worker, missing, chunksize=4))
+    else:
+        rendered = sum(map(worker, missing))
+    return rendered, len(specs) - len(missing)
+
+
 # ══════════════════════════════════════════════════════════════════════════
 # Orchestration
 # ══════════════════════════════════════════════════════════════════════════
@@ -1053,8 +1389,22 @@ def load_brief(path: Path) -> dict:
 def assemble(brief_path: Path, *, use_broll: bool = True,
              music_dir: Path = MUSIC_DIR, narration: Path | None = None,
              output_root: Path = OUTPUT_DIR,
-             keep_temp: bool = False) -> dict:
-    """Assemble one brief into a rough cut + narration kit. Returns report."""
+             keep_temp: bool = False, single_pass: bool = False,
+             preset: str = DEFAULT_PRESET,
+             cache_dir: Path | None = BEAT_CACHE) -> dict:
+    """Assemble one brief into a rough cut + narration kit. Returns report.
+
+    By default each beat is rendered to an intermediate clip and the clips
+    are concatenated before the caption/audio pass. single_pass compiles
+    the whole brief into one filter graph instead: one encode, and only
+    the card/overlay PNGs touch the temp dir. preset picks the final
+    encode's ENCODER_PRESETS entry.
+
+    Cards, Ken Burns clips and text/caption overlays are read from and
+    written to the content-hashed cache at cache_dir (None disables it),
+    so re-assembling with new narration re-renders no cards or overlays."""
+    if preset not in ENCODER_PRESETS:
+        raise ValueError(f"unknown encoder preset: {preset!r}")
     brief = load_brief(brief_path)
     slug, fmt = brief["slug"], brief["format"]
     size = resolution_for_format(fmt)
@@ -1085,32 +1435,49 @@ def assemble(brief_path: Path, *, use_broll: bool = True,
     srt_path.write_text(build_srt(cues))
 
     tmp_root = Path(tempfile.mkdtemp(prefix=f"assemble-{slug}-"))
+    cache = BeatCache(cache_dir) if cache_dir is not None else None
     beat_infos = []
+    music = pick_music_track(beats, music_dir)
+    final_path = out_dir / f"{slug}-rough.mp4"
     try:
-        beat_clips = []
-        for beat in beats:
-            clip, info = render_beat(beat, brief, size, tmp_root,
-                                     use_broll, race)
-            beat_clips.append(clip)
-            beat_infos.append(info)
-        body = concat_clips(beat_clips, tmp_root / "body.mp4")
-
-        music = pick_music_track(beats, music_dir)
-        cap_inputs, cap_chains, last_video = caption_overlay_graph(
-            cues, size, tmp_root, first_input_idx=1)
+        if single_pass:
+            beat_plans = []
+            for beat in beats:
+                start, end = beat_bounds(beat)
+                cuts, info = plan_beat_background(beat, brief, size, tmp_root,
+                                                  use_broll, race, cache)
+                layers = beat_overlay_layers(beat, info, size, tmp_root, cache)
+                beat_plans.append({"duration": end - start, "cuts": cuts,
+                                   "layers": layers})
+                beat_infos.append(info)
+            video_inputs, video_chains, video_map = single_pass_graph(
+                beat_plans, size, cues, tmp_root, cache)
+        else:
+            beat_clips = []
+            for beat in beats:
+                clip, info = render_beat(beat, brief, size, tmp_root,
+                                         use_broll, race, cache)
+                beat_clips.append(clip)
+                beat_infos.append(info)
+            body = concat_clips(beat_clips, tmp_root / "body.mp4")
+            cap_inputs, video_chains, last_video = caption_overlay_graph(
+                cues, size, tmp_root, first_input_idx=1, cache=cache)
+            video_inputs = ["-i", str(body)] + cap_inputs
+            video_map = (last_video.strip("[]") if last_video == "[0:v]"
+                         else last_video)
+
         audio_inputs, audio_chains, audio_map = build_audio_graph(
             beats, music, total_duration, narration,
-            start_idx=1 + len(cues))
-        chains = cap_chains + audio_chains
-        video_map = last_video.strip("[]") if last_video == "[0:v]" else last_video
-        final_path = out_dir / f"{slug}-rough.mp4"
-        cmd = ["-i", str(body)] + cap_inputs + audio_inputs
+            start_idx=video_inputs.count("-i"))
+        chains = video_chains + audio_chains
+        cmd = video_inputs + audio_inputs
         if chains:
             cmd += ["-filter_complex", ";".join(chains)]
-        cmd += ["-map", video_map, "-map", audio_map,
-                "-c:v", "libx264", "-preset", "veryfast", "-crf", "19",
-                "-pix_fmt", "yuv420p",
-                "-c:a", "aac", "-b:a", "192k",
+        cmd += ["-map", video_map, "-map", audio_map]
+        cmd += video_codec_args(preset)
+        if single_pass:
+            cmd += ["-r", str(FPS)] + COLOR_TAGS
+        cmd += ["-c:a", "aac", "-b:a", "192k",
                 "-t", f"{total_duration:.3f}",
                 "-movflags", "+faststart", str(final_path)]
         run_ffmpeg(cmd)
@@ -1129,6 +1496,10 @@ def assemble(brief_path: Path, *, use_broll: bool = True,
         "duration_sec": round(actual, 2),
         "duration_target_range": brief.get("duration_target_range"),
         "resolution": f"{width}x{height}",
+        "mode": "single-pass" if single_pass else "clips",
+        "preset": preset,
+        "render_cache": ({"reused": cache.hits, "rendered": cache.misses}
+                         if cache else None),
         "beats": beat_infos,
         "music_track": str(music) if music else None,
         "narration": str(narration) if narration else None,
@@ -1210,6 +1581,18 @@ def main():
     parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
     parser.add_argument("--limit", type=int, help="With --batch: stop after N")
     parser.add_argument("--keep-temp", action="store_true")
+    parser.add_argument("--single-pass", action="store_true",
+                        help="Compile each brief into one ffmpeg graph and "
+                             "encode once (no intermediate beat clips)")
+    parser.add_argument("--preset", choices=sorted(ENCODER_PRESETS),
+                        default=DEFAULT_PRESET,
+                        help="Final encode preset (default standard)")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="With --batch: processes pre-rendering uncached "
+                             "cards/overlays (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Render every card/overlay into the temp dir "
+                             f"instead of reusing {BEAT_CACHE.relative_to(PROJECT_ROOT)}/")
     args = parser.parse_args()
 
     if args.narration and not args.narration.exists():
@@ -1243,6 +1626,15 @@ def main():
         print(f"Session WAV split into {len(narrations)} takes "
               f"→ {takes_dir}")
 
+    cache_dir = None if args.no_cache else BEAT_CACHE
+    if cache_dir is not None and len(brief_paths) > 1:
+        rendered, cached = prerender_batch(
+            brief_paths, BeatCache(cache_dir),
+            use_broll=not args.no_broll, single_pass=args.single_pass,
+            narrated=args.narration is not None,
+            jobs=args.jobs or os.cpu_count() or 1)
+        print(f"Beat cache: {rendered} rendered, {cached} reused")
+
     results, failures = [], []
     for path, narration in zip(brief_paths, narrations):
         label = path.stem
@@ -1255,6 +1647,9 @@ def main():
                 narration=narration,
                 output_root=args.output_dir,
                 keep_temp=args.keep_temp,
+                single_pass=args.single_pass,
+                preset=args.preset,
+                cache_dir=cache_dir,
             )
             lo, hi = report.get("duration_target_range") or (0, 10 ** 6)
             in_range = lo <= report["duration_sec"] <= hi + 1
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Content-addressed incremental build manifest for the page generators.
+
+An `--all` run used to rewrite every HTML file even when nothing it
+depends on had changed. Generators now hash each output's inputs (the race
+JSON, the slice of race-index.json the page shows, race-intel events,
+plans-db rows, and the source of the generator and every project module
+it imports) and record the hash in .build-cache/manifest.json next to the
+output's size and mtime. An output whose input hash and file are both
+unchanged is skipped; editing one race regenerates its own pages plus the
+hub pages that list it.
+
+Usage:
+    from build_manifest import BuildManifest, code_version, input_hash
+
+    manifest = BuildManifest("generate_state_hubs", force=args.force)
+    build_key = input_hash(code_version(__file__), CURRENT_YEAR)
+    key = input_hash(build_key, state, races)
+    if not manifest.is_fresh(out_path, key):
+        out_path.write_text(render(...))
+        manifest.record(out_path, key)
+    manifest.save()
+
+    python scripts/build_manifest.py           # Entries per generator
+    python scripts/build_manifest.py --clear   # Forget everything (full rebuild)
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are still atomic, just not serialized
+    fcntl = None
+
+from race_corpus import BUILD_CACHE_DIR, PROJECT_ROOT
+
+MANIFEST_PATH = BUILD_CACHE_DIR / "manifest.json"
+
+# Bump when the manifest layout or key scheme changes; old entries are dropped
+MANIFEST_VERSION = 1
+
+
+def input_hash(*parts) -> str:
+    """sha256 over a canonical JSON encoding of parts (dict order ignored)."""
+    blob = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False,
+                      separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def file_digest(path: Path) -> str | None:
+    """sha256 of a file's bytes, or None if it doesn't exist."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _is_project_source(path: str | None) -> bool:
+    if not path or not path.endswith(".py"):
+        return False
+    p = Path(path).resolve()
+    return PROJECT_ROOT in p.parents and "site-packages" not in p.parts
+
+
+def _imported_names(source: str) -> set[str]:
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    return names
+
+
+_CODE_VERSIONS: dict[Path, str] = {}
+
+
+def code_version(source_file: str | Path) -> str:
+    """Hash of source_file plus every project module it imports, transitively.
+
+    Imports are resolved against sys.modules, so call this after the
+    generator's own imports have run. Third-party packages are ignored.
+    """
+    root = Path(source_file).resolve()
+    cached = _CODE_VERSIONS.get(root)
+    if cached is not None:
+        return cached
+
+    by_file = {}
+    for mod in list(sys.modules.values()):
+        path = getattr(mod, "__file__", None)
+        if _is_project_source(path):
+            by_file.setdefault(getattr(mod, "__name__", ""), Path(path).resolve())
+
+    sources = {}
+    queue = [root]
+    while queue:
+        path = queue.pop()
+        if path in sources:
+            continue
+        sources[path] = source = path.read_bytes()
+        for name in _imported_names(source.decode("utf-8")):
+            dep = by_file.get(name) or by_file.get(name.rsplit(".", 1)[-1])
+            if dep is not None:
+                queue.append(dep)
+
+    digest = hashlib.sha256()
+    for path in sorted(sources):
+        digest.update(_output_id(path).encode())
+        digest.update(hashlib.sha256(sources[path]).digest())
+    _CODE_VERSIONS[root] = version = digest.hexdigest()
+    return version
+
+
+def _output_id(path: Path) -> str:
+    path = Path(path).resolve()
+    try:
+        return str(path.relative_to(PROJECT_ROOT))
+    except ValueError:
+        return str(path)
+
+
+@contextmanager
+def _locked(path: Path):
+    """Exclusive lock so concurrent generators merge rather than clobber."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data.get("generators", {})
+
+
+class BuildManifest:
+    """One generator's view of the manifest: output → (input hash, size, mtime)."""
+
+    def __init__(self, generator: str, path: Path = MANIFEST_PATH, force: bool = False):
+        self.generator = generator
+        self.path = Path(path)
+        self.force = force
+        self.entries: dict[str, list] = dict(_read(self.path).get(generator, {}))
+        self._updates: dict[str, list] = {}
+
+    def is_fresh(self, output: Path, key: str | None) -> bool:
+        """True if output exists, is the file we last wrote, and key is unchanged."""
+        if self.force or key is None:
+            return False
+        entry = self.entries.get(_output_id(output))
+        if not entry or entry[0] != key:
+            return False
+        try:
+            st = Path(output).stat()
+        except OSError:
+            return False
+        return [st.st_size, st.st_mtime_ns] == entry[1:]
+
+    def record(self, output: Path, key: str | None) -> None:
+        """Note that output was just written from inputs hashing to key."""
+        if key is None:
+            return
+        st = Path(output).stat()
+        entry = [key, st.st_size, st.st_mtime_ns]
+        self.entries[_output_id(output)] = entry
+        self._updates[_output_id(output)] = entry
+
+    def save(self) -> None:
+        """Merge this run's records into the manifest file (atomic write)."""
+        if not self._updates:
+            return
+        try:
+            with _locked(self.path):
+                generators = _read(self.path)
+                generators.setdefault(self.generator, {}).update(self._updates)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name,
+                                           suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": MANIFEST_VERSION, "generators": generators},
+                              f, indent=1, sort_keys=True)
+                os.replace(tmp, self.path)
+            self._updates.clear()
+        except OSError as e:
+            print(f"  ⚠ Could not write build manifest {self.path}: {e}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear the incremental build manifest")
+    parser.add_argument("--clear", action="store_true", help="Delete the manifest (full rebuild)")
+    args = parser.parse_args()
+
+    if args.clear:
+        if MANIFEST_PATH.exists():
+            MANIFEST_PATH.unlink()
+        print(f"Cleared {MANIFEST_PATH}")
+        return
+    generators = _read(MANIFEST_PATH)
+    if not generators:
+        print(f"No manifest at {MANIFEST_PATH}")
+    for name, entries in sorted(generators.items()):
+        print(f"  {name:<28} {len(entries):>5} outputs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Delta planning for push_wordpress.py's tar+ssh deploy targets.
+
+Every sync_* target used to tar and upload its whole tree on every deploy,
+whether one page or all of them changed. A DeployRecord remembers the
+sha256 of every file a target last deployed to a remote directory
+(.build-cache/deploy-manifest.json, keyed by target_key(): the target's
+label plus user@host:remote_base), so the next deploy uploads only new or
+changed files and removes exactly the files it deployed before that no
+longer exist locally. Several targets deploy into public_html/race (race
+pages, prep kits, training plans, tire guides); because the label is in the
+key, each keeps its own file list and never deletes another's files.
+
+The record is written only after an upload succeeds. Deploying the same
+target from another machine, or editing files on the server, is not seen
+by it — use push_wordpress.py --full-deploy to upload everything again.
+
+Usage:
+    from deploy_delta import DeployRecord, target_key, write_tar
+
+    record = DeployRecord(target_key("race page", user, host, remote_base))
+    plan = record.plan({"unbound-200/index.html": Path("output/unbound-200.html")})
+    write_tar(plan.upload, ssh_proc.stdin)  # then rm plan.delete remotely
+    record.commit(plan)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tarfile
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are still atomic, just not serialized
+    fcntl = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEPLOY_MANIFEST_PATH = PROJECT_ROOT / ".build-cache" / "deploy-manifest.json"
+
+# A delete list this large is far more likely to come from a half-generated
+# output directory than from real removals, so it is reported, not applied.
+MAX_DELETE_FRACTION = 0.25
+MAX_DELETE_FLOOR = 10
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def target_key(label: str, user: str, host: str, remote_base: str) -> str:
+    """DeployRecord key for one sync_* target deploying to remote_base."""
+    return f"{label}:{user}@{host}:{remote_base}"
+
+
+@dataclass
+class DeltaPlan:
+    """What one deploy of a target has to do."""
+    upload: dict[str, Path] = field(default_factory=dict)  # archive name → local file
+    delete: list[str] = field(default_factory=list)         # archive names gone locally
+    digests: dict[str, str] = field(default_factory=dict)   # archive name → sha256, all local
+    unchanged: int = 0
+    held: list[str] = field(default_factory=list)  # stale, but over the delete limit
+
+    @property
+    def deletes_held(self) -> bool:
+        return bool(self.held)
+
+    @property
+    def changed(self) -> list[str]:
+        """Archive names whose remote copy changes (uploads and deletes)."""
+        return sorted(self.upload) + self.delete
+
+
+@contextmanager
+def _locked(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+class DeployRecord:
+    """Hashes of the files one target last deployed to one remote directory."""
+
+    def __init__(self, target: str, path: Path = DEPLOY_MANIFEST_PATH, full: bool = False):
+        self.target = target
+        self.path = Path(path)
+        self.full = full
+        self.deployed: dict[str, str] = dict(_read(self.path).get(target, {}))
+
+    def plan(self, files: dict[str, Path], retain: tuple[str, ...] = ()) -> DeltaPlan:
+        """Diff local files ({archive name: path}) against the last deploy.
+
+        Stale names starting with a retain prefix are left on the server and
+        dropped from the record (e.g. hashed assets cached pages still use).
+        """
+        plan = DeltaPlan()
+        for name in sorted(files):
+            digest = sha256_file(files[name])
+            plan.digests[name] = digest
+            if not self.full and self.deployed.get(name) == digest:
+                plan.unchanged += 1
+            else:
+                plan.upload[name] = files[name]
+
+        stale = sorted(n for n in set(self.deployed) - set(files)
+                       if not n.startswith(retain))
+        limit = max(MAX_DELETE_FLOOR, int(len(self.deployed) * MAX_DELETE_FRACTION))
+        if len(stale) > limit:
+            plan.held = stale
+        else:
+            plan.delete = stale
+        return plan
+
+    def commit(self, plan: DeltaPlan) -> None:
+        """Record a successful deploy of plan (atomic, merged under a lock)."""
+        deployed = dict(plan.digests)
+        if plan.deletes_held:
+            # Not removed remotely, so still ours to clean up next time
+            for name in plan.held:
+                deployed[name] = self.deployed[name]
+        self.deployed = deployed
+        try:
+            with _locked(self.path):
+                data = _read(self.path)
+                data[self.target] = deployed
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name,
+                                           suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=1, sort_keys=True)
+                os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"  ⚠ Could not write deploy record {self.path}: {e}", file=sys.stderr)
+
+
+def write_tar(files: dict[str, Path], fileobj) -> None:
+    """Stream files ({archive name: local path}) into fileobj as a tar archive.
+
+    Files are read straight from their source paths under their archive
+    names, so a tree can be restructured ({slug}.html → {slug}/index.html)
+    without staging a copy. fileobj only needs write() — e.g. an ssh
+    process's stdin. Parent directories are left for tar -x to create.
+    """
+    with tarfile.open(fileobj=fileobj, mode="w|", dereference=True) as tar:
+        for name in sorted(files):
+            tar.add(files[name], arcname=name, recursive=False)
+
+
+def public_url_path(remote_base: str, name: str) -> str | None:
+    """Site path served for archive name under remote_base, e.g. /race/x/.
+
+    None if remote_base isn't under public_html.
+    """
+    marker = "public_html"
+    if marker not in remote_base:
+        return None
+    prefix = remote_base.split(marker, 1)[1].strip("/")
+    path = "/".join(p for p in (prefix, name) if p)
+    if path == "index.html" or path.endswith("/index.html"):
+        path = path[: -len("index.html")]
+    return "/" + path
@@ -18,7 +18,11 @@ import re
 import sys
 from pathlib import Path
 
-DATA_DIR = Path(__file__).resolve().parent.parent / "race-data"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "race-data"
+
+sys.path.insert(0, str(PROJECT_ROOT / "wordpress"))
+from race_relations import RaceNameMatcher  # noqa: E402
 
 # Well-known aliases
 ALIASES = {
@@ -70,20 +74,17 @@ def build_name_map():
 
 
 def extract_slugs(alt_text, name_map, own_slug):
-    """Extract race slugs mentioned in alternatives text."""
+    """Extract race slugs mentioned in alternatives text.
+
+    name_map may be a prebuilt RaceNameMatcher; a plain dict is compiled
+    on each call.
+    """
     if not alt_text:
         return []
 
-    text_lower = alt_text.lower()
-    found = set()
-
-    # Sort by name length descending (match longest first)
-    for name, slug in sorted(name_map.items(), key=lambda x: len(x[0]), reverse=True):
-        if name in text_lower and slug != own_slug:
-            found.add(slug)
-            # Remove matched text to avoid substring matches
-            text_lower = text_lower.replace(name, "", 1)
-
+    matcher = name_map if isinstance(name_map, RaceNameMatcher) else RaceNameMatcher(name_map, ignore_case=True)
+    # Single longest-first pass, so "unbound xl" never also yields "unbound"
+    found = {slug for _, _, slug in matcher.finditer(alt_text) if slug != own_slug}
     return sorted(found)
 
 
@@ -93,7 +94,7 @@ def main():
     parser.add_argument("--slug", help="Single race")
     args = parser.parse_args()
 
-    name_map = build_name_map()
+    matcher = RaceNameMatcher(build_name_map(), ignore_case=True)
 
     files = sorted(DATA_DIR.glob("*.json"))
     if args.slug:
@@ -110,7 +111,7 @@ def main():
         fv = race.get("final_verdict", {})
         alt_text = fv.get("alternatives", "")
 
-        slugs = extract_slugs(alt_text, name_map, slug)
+        slugs = extract_slugs(alt_text, matcher, slug)
         total += 1
 
         if slugs:
@@ -22,6 +22,8 @@ from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from race_corpus import load_corpus  # noqa: E402
+
 
 RACE_DATA = Path(__file__).parent.parent / "race-data"
 FLAT_DB = Path(__file__).parent.parent / "db" / "gravel_races_full_database.json"
@@ -88,15 +90,11 @@ MIGRATED_ROAD_SLUGS = _load_migrated_road_slugs()
 
 def load_profiles(data_dir: Path = RACE_DATA) -> dict[str, dict]:
     """Load active canonical profiles from race-data/ only (non-recursive)."""
-    profiles = {}
-    for path in sorted(Path(data_dir).glob("*.json")):
-        if path.stem in TOMBSTONED_SLUGS | MIGRATED_ROAD_SLUGS:
-            continue
-        try:
-            profiles[path.stem] = json.loads(path.read_text())
-        except json.JSONDecodeError:
-            print(f"  ⚠ Skipping invalid JSON: {path.name}")
-    return profiles
+    corpus = load_corpus(data_dir)
+    for name in corpus.errors:
+        print(f"  ⚠ Skipping invalid JSON: {name}")
+    excluded = TOMBSTONED_SLUGS | MIGRATED_ROAD_SLUGS
+    return {slug: data for slug, data in corpus.profiles.items() if slug not in excluded}
 
 
 def discipline_sport(discipline: str) -> str:
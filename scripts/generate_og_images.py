@@ -12,18 +12,31 @@ Produces 1200x630 neo-brutalist styled JPEG images optimized for social sharing:
   - Subtle topo-line texture for visual depth
   - Optimized for thumbnail legibility (~200-400px wide in feeds)
 
+Fonts and the static layers (background, topo texture, brand bar) are
+built once per process by an OgRenderContext; each card starts from a copy
+of one of TEXTURE_FAMILIES pre-rendered bases. --all renders across a
+process pool and skips cards whose input fields hash to the value recorded
+for the existing JPEG in .og_inputs.json, so unchanged cards keep their
+bytes and --sync-og only uploads what actually changed.
+
 Usage:
     python scripts/generate_og_images.py unbound-200
     python scripts/generate_og_images.py --all
+    python scripts/generate_og_images.py --all --jobs 8
+    python scripts/generate_og_images.py --all --force
     python scripts/generate_og_images.py --all --output-dir wordpress/output/og
 """
 
 import argparse
+import hashlib
 import json
 import math
+import os
 import random
 import re
 import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -95,6 +108,21 @@ FONT_BOLD_PATHS = [FONT_DATA_BOLD, "/System/Library/Fonts/Helvetica.ttc"]
 FONT_SERIF_PATHS = [FONT_EDITORIAL, "/System/Library/Fonts/Georgia.ttf"]
 
 
+# Layout shared by the static base and the per-race layers
+LEFT_MARGIN = 56
+BRAND_BAR_H = 66
+TOP_BAR_H = 5
+
+# Distinct topo textures; each race maps to one by a stable slug hash
+TEXTURE_FAMILIES = 16
+
+# Bump when the card layout changes so --all re-renders every card
+OG_STYLE_VERSION = 1
+
+# Input hashes of the rendered cards, kept next to the JPEGs
+INPUTS_MANIFEST = ".og_inputs.json"
+
+
 def load_font(paths: list, size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     for p in paths:
         try:
@@ -202,9 +230,8 @@ def draw_score_badge(draw, cx, cy, radius, score, tier, font_big, font_label):
     draw.text((cx - lw // 2, cy + sh // 2 - 6), label, fill=WARM_BROWN, font=font_label)
 
 
-def generate_og_image(race_data: dict, output_path: Path) -> Path:
-    """Generate a single OG image for a race."""
-
+def card_fields(race_data: dict) -> dict:
+    """Everything a card depends on, resolved from the race profile."""
     name = race_data.get('display_name') or race_data.get('name', 'Unknown Race')
     slug = race_data.get('slug', 'unknown')
     tagline = race_data.get('tagline', '')
@@ -221,7 +248,6 @@ def generate_og_image(race_data: dict, output_path: Path) -> Path:
             for d in ALL_DIMS
         )
         overall_score = round(total / 70 * 100) if total > 0 else 0
-    tier = get_tier(overall_score)
 
     location = truncate(vitals.get('location', ''), 30)
     date_specific = vitals.get('date_specific', '')
@@ -242,69 +268,129 @@ def generate_og_image(race_data: dict, output_path: Path) -> Path:
             if m2:
                 short_date = m2.group(1)
 
-    # ── Create image with dark background ─────────────────────
-
-    img = Image.new('RGB', (W, H), BG_DARK)
-    draw = ImageDraw.Draw(img)
-
-    # Subtle topo texture
-    # Use slug hash as seed so each race gets a unique but stable pattern
-    draw_topo_texture(draw, seed=hash(slug) % 10000)
-
-    # Load fonts — editorial (Source Serif 4) for name/tagline, data (Sometype Mono) for labels
-    font_name = load_font(FONT_SERIF_PATHS, 64)          # Race name — editorial serif
-    font_tagline = load_font(FONT_SERIF_PATHS, 22)       # Tagline — editorial serif italic
-    font_tier = load_font(FONT_BOLD_PATHS, 20, bold=True) # Tier badge — data mono bold
-    font_score_big = load_font(FONT_SERIF_PATHS, 60)     # Score number — editorial serif
-    font_score_label = load_font(FONT_PATHS, 18)         # Score label — data mono
-    font_detail = load_font(FONT_PATHS, 22)              # Stats — data mono
-    font_detail_bold = load_font(FONT_BOLD_PATHS, 22, bold=True)  # Location — data mono bold
-    font_brand = load_font(FONT_BOLD_PATHS, 28, bold=True)  # Brand name — data mono bold
-    font_brand_sub = load_font(FONT_PATHS, 16)           # URL — data mono
-
-    # ── Layout ────────────────────────────────────────────────
-
-    left_margin = 56
-    brand_bar_h = 66
-    top_bar_h = 5
-    score_badge_r = 76
-    score_cx = W - left_margin - score_badge_r - 6
-    score_cy = 260
-
-    # ── Top accent bar ────────────────────────────────────────
-
-    draw.rectangle([0, 0, W, top_bar_h], fill=TIER_ACCENT[tier])
-
-    # ── Brand bar (bottom) ────────────────────────────────────
-
-    bottom_bar_y = H - brand_bar_h
+    return {
+        'name': name,
+        'slug': slug,
+        'tagline': tagline,
+        'overall_score': overall_score,
+        'location': location,
+        'short_date': short_date,
+        'distance': distance,
+        'elevation': elevation,
+    }
+
+
+def card_hash(fields: dict) -> str:
+    """Stable digest of a card's inputs (plus the layout version)."""
+    payload = json.dumps([OG_STYLE_VERSION, fields], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def texture_family(slug: str) -> int:
+    # crc32, not hash(): str hashes are salted per process
+    return zlib.crc32(slug.encode()) % TEXTURE_FAMILIES
+
+
+class OgRenderContext:
+    """Fonts and static card layers, loaded once and reused for every card."""
+
+    def __init__(self):
+        # Editorial (Source Serif 4) for name/tagline, data (Sometype Mono) for labels
+        self.font_name = load_font(FONT_SERIF_PATHS, 64)          # Race name — editorial serif
+        self.font_tagline = load_font(FONT_SERIF_PATHS, 22)       # Tagline — editorial serif italic
+        self.font_tier = load_font(FONT_BOLD_PATHS, 20, bold=True) # Tier badge — data mono bold
+        self.font_score_big = load_font(FONT_SERIF_PATHS, 60)     # Score number — editorial serif
+        self.font_score_label = load_font(FONT_PATHS, 18)         # Score label — data mono
+        self.font_detail = load_font(FONT_PATHS, 22)              # Stats — data mono
+        self.font_detail_bold = load_font(FONT_BOLD_PATHS, 22, bold=True)  # Location — data mono bold
+        self.font_brand = load_font(FONT_BOLD_PATHS, 28, bold=True)  # Brand name — data mono bold
+        self.font_brand_sub = load_font(FONT_PATHS, 16)           # URL — data mono
+        self._bases = {}
+
+    def base(self, family: int) -> Image.Image:
+        """Background + topo texture + brand bar for a texture family."""
+        if family not in self._bases:
+            img = Image.new('RGB', (W, H), BG_DARK)
+            draw = ImageDraw.Draw(img)
+            draw_topo_texture(draw, seed=family)
+            draw_brand_bar(draw, self.font_brand, self.font_brand_sub)
+            self._bases[family] = img
+        return self._bases[family]
+
+
+def draw_brand_bar(draw, font_brand, font_brand_sub):
+    """Bottom bar: GRAVEL GOD wordmark, gold underline, site URL."""
+    bottom_bar_y = H - BRAND_BAR_H
     draw.rectangle([0, bottom_bar_y, W, H], fill=DARK_BROWN)
 
     # Brand name
-    draw.text((left_margin, bottom_bar_y + 16), "GRAVEL GOD", fill=WHITE, font=font_brand)
+    draw.text((LEFT_MARGIN, bottom_bar_y + 16), "GRAVEL GOD", fill=WHITE, font=font_brand)
 
     # Gold underline
     brand_w = tw(draw, "GRAVEL GOD", font_brand)
     draw.rectangle(
-        [left_margin, bottom_bar_y + 50, left_margin + brand_w, bottom_bar_y + 53],
+        [LEFT_MARGIN, bottom_bar_y + 50, LEFT_MARGIN + brand_w, bottom_bar_y + 53],
         fill=GOLD
     )
 
     # URL right-aligned
     url_text = "gravelgodcycling.com"
     uw = tw(draw, url_text, font_brand_sub)
-    draw.text((W - left_margin - uw, bottom_bar_y + 26), url_text, fill=WARM_BROWN, font=font_brand_sub)
+    draw.text((W - LEFT_MARGIN - uw, bottom_bar_y + 26), url_text, fill=WARM_BROWN, font=font_brand_sub)
+
+
+_context = None
+
+
+def get_context() -> OgRenderContext:
+    """The process-wide render context (built on first use)."""
+    global _context
+    if _context is None:
+        _context = OgRenderContext()
+    return _context
+
+
+def generate_og_image(race_data: dict, output_path: Path, ctx: OgRenderContext = None) -> Path:
+    """Generate a single OG image for a race."""
+    return render_card(card_fields(race_data), output_path, ctx)
+
+
+def render_card(fields: dict, output_path: Path, ctx: OgRenderContext = None) -> Path:
+    """Draw the per-race layers over a cached base and save the JPEG."""
+    ctx = ctx or get_context()
+    name = fields['name']
+    tagline = fields['tagline']
+    overall_score = fields['overall_score']
+    tier = get_tier(overall_score)
+
+    # ── Start from the static layers ──────────────────────────
+
+    img = ctx.base(texture_family(fields['slug'])).copy()
+    draw = ImageDraw.Draw(img)
+
+    # ── Layout ────────────────────────────────────────────────
+
+    left_margin = LEFT_MARGIN
+    top_bar_h = TOP_BAR_H
+    score_badge_r = 76
+    score_cx = W - left_margin - score_badge_r - 6
+    score_cy = 260
+
+    # ── Top accent bar ────────────────────────────────────────
+
+    draw.rectangle([0, 0, W, top_bar_h], fill=TIER_ACCENT[tier])
 
     # ── Content area ──────────────────────────────────────────
 
+    bottom_bar_y = H - BRAND_BAR_H
     content_top = top_bar_h + 28
     content_bottom = bottom_bar_y - 16
     content_right = score_cx - score_badge_r - 36
 
     # Tier badge
     badge_text = f"TIER {tier}"
-    badge_bw = tw(draw, badge_text, font_tier) + 20
-    badge_bh = th(draw, badge_text, font_tier) + 12
+    badge_bw = tw(draw, badge_text, ctx.font_tier) + 20
+    badge_bh = th(draw, badge_text, ctx.font_tier) + 12
     badge_color = TIER_COLORS[tier]
     badge_txt = TIER_BADGE_TEXT[tier]
 
@@ -312,28 +398,32 @@ def generate_og_image(race_data: dict, output_path: Path) -> Path:
         [left_margin, content_top, left_margin + badge_bw, content_top + badge_bh],
         fill=badge_color, outline=TIER_ACCENT[tier], width=2
     )
-    draw.text((left_margin + 10, content_top + 4), badge_text, fill=badge_txt, font=font_tier)
+    draw.text((left_margin + 10, content_top + 4), badge_text, fill=badge_txt, font=ctx.font_tier)
 
     # Race name — large bold, light text on dark bg. Max 2 lines.
     name_y = content_top + badge_bh + 14
     name_max_w = content_right - left_margin
-    name_lines = wrap_text(draw, name.upper(), font_name, name_max_w)
+    name_lines = wrap_text(draw, name.upper(), ctx.font_name, name_max_w)
     line_h = 72
     for i, line in enumerate(name_lines[:2]):
-        draw.text((left_margin, name_y + i * line_h), line, fill=WARM_PAPER, font=font_name)
+        draw.text((left_margin, name_y + i * line_h), line, fill=WARM_PAPER, font=ctx.font_name)
     name_bottom = name_y + min(len(name_lines), 2) * line_h
 
     # Tagline — the scroll-stopping hook. Cream on dark = high contrast.
     if tagline:
         tag_y = name_bottom + 6
         tag_max_w = content_right - left_margin
-        tag_lines = wrap_text(draw, tagline, font_tagline, tag_max_w)
+        tag_lines = wrap_text(draw, tagline, ctx.font_tagline, tag_max_w)
         for i, line in enumerate(tag_lines[:2]):
-            draw.text((left_margin, tag_y + i * 28), line, fill=TAN, font=font_tagline)
+            draw.text((left_margin, tag_y + i * 28), line, fill=TAN, font=ctx.font_tagline)
 
     # ── Stats strip ───────────────────────────────────────────
 
     strip_y = content_bottom - 24
+    location = fields['location']
+    short_date = fields['short_date']
+    distance = fields['distance']
+    elevation = fields['elevation']
     stats = []
     if location:
         stats.append(location)
@@ -352,9 +442,9 @@ def generate_og_image(race_data: dict, output_path: Path) -> Path:
         for j, stat in enumerate(stats):
             if j > 0:
                 sep = "  \u00b7  "
-                draw.text((stat_x, strip_y), sep, fill=SEC_BROWN, font=font_detail)
-                stat_x += tw(draw, sep, font_detail)
-            f = font_detail_bold if j == 0 else font_detail
+                draw.text((stat_x, strip_y), sep, fill=SEC_BROWN, font=ctx.font_detail)
+                stat_x += tw(draw, sep, ctx.font_detail)
+            f = ctx.font_detail_bold if j == 0 else ctx.font_detail
             c = TAN if j == 0 else WARM_BROWN
             draw.text((stat_x, strip_y), stat, fill=c, font=f)
             stat_x += tw(draw, stat, f)
@@ -362,7 +452,7 @@ def generate_og_image(race_data: dict, output_path: Path) -> Path:
     # ── Score badge ───────────────────────────────────────────
 
     draw_score_badge(draw, score_cx, score_cy, score_badge_r, overall_score, tier,
-                     font_score_big, font_score_label)
+                     ctx.font_score_big, ctx.font_score_label)
 
     # ── Left accent stripe ────────────────────────────────────
 
@@ -386,12 +476,56 @@ REMOVED_FABRICATED_SLUGS = frozenset(
         .read_text())["tombstones"])
 
 
+def load_manifest(output_dir: Path) -> dict:
+    try:
+        return json.loads((output_dir / INPUTS_MANIFEST).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(output_dir: Path, manifest: dict):
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / INPUTS_MANIFEST
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+    tmp.replace(path)
+
+
+def render_slug(slug: str, data_dir: Path, output_dir: Path, previous_hash: str = None) -> tuple:
+    """Render one race's card unless its inputs are unchanged.
+
+    Returns (status, input_hash, error) with status "rendered",
+    "unchanged", "missing" or "error". Runs inside pool workers.
+    """
+    data_file = data_dir / f"{slug}.json"
+    if not data_file.exists():
+        return "missing", None, None
+    try:
+        with open(data_file) as f:
+            raw = json.load(f)
+        race = raw.get('race', raw)
+        race.setdefault('slug', slug)
+        fields = card_fields(race)
+        digest = card_hash(fields)
+        jpeg_path = output_dir / f"{slug}.jpg"
+        if digest == previous_hash and jpeg_path.exists():
+            return "unchanged", digest, None
+        render_card(fields, jpeg_path)
+        return "rendered", digest, None
+    except Exception as e:
+        return "error", None, str(e)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate OG images for gravel race profiles')
     parser.add_argument('slug', nargs='?', help='Race slug (e.g., unbound-200)')
     parser.add_argument('--all', action='store_true', help='Generate for all races')
     parser.add_argument('--data-dir', type=Path, help='Race data directory')
     parser.add_argument('--output-dir', type=Path, help='Output directory for images')
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help='Render processes for --all (default: CPU count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-render cards even when their inputs are unchanged')
     args = parser.parse_args()
 
     if not args.slug and not args.all:
@@ -409,27 +543,39 @@ def main():
     slugs = ([f.stem for f in sorted(data_dir.glob('*.json')) if f.stem not in REMOVED_FABRICATED_SLUGS]
               if args.all else [args.slug])
     total = len(slugs)
-    errors = 0
-
-    for i, slug in enumerate(slugs, 1):
-        data_file = data_dir / f"{slug}.json"
-        if not data_file.exists():
-            print(f"  SKIP: {slug} (no data file)")
-            errors += 1
-            continue
-        try:
-            with open(data_file) as f:
-                raw = json.load(f)
-            race = raw.get('race', raw)
-            race.setdefault('slug', slug)
-            generate_og_image(race, output_dir / f"{slug}.jpg")
+    manifest = load_manifest(output_dir)
+    previous = {} if args.force else manifest
+    jobs = args.jobs or os.cpu_count() or 1
+
+    pool = ProcessPoolExecutor(max_workers=jobs) if args.all and jobs > 1 else None
+    try:
+        if pool:
+            outcomes = pool.map(render_slug, slugs, [data_dir] * total, [output_dir] * total,
+                                [previous.get(slug) for slug in slugs], chunksize=8)
+        else:
+            outcomes = (render_slug(slug, data_dir, output_dir, previous.get(slug)) for slug in slugs)
+
+        errors = rendered = 0
+        for i, (slug, (status, digest, error)) in enumerate(zip(slugs, outcomes), 1):
+            if status == "missing":
+                print(f"  SKIP: {slug} (no data file)")
+                errors += 1
+            elif status == "error":
+                print(f"  ERROR: {slug}: {error}")
+                manifest.pop(slug, None)
+                errors += 1
+            else:
+                manifest[slug] = digest
+                rendered += status == "rendered"
             if args.all and i % 50 == 0:
-                print(f"  [{i}/{total}] Generated {slug}.jpg")
-        except Exception as e:
-            print(f"  ERROR: {slug}: {e}")
-            errors += 1
-
-    print(f"\nDone. {total - errors}/{total} images generated in {output_dir}/")
+                print(f"  [{i}/{total}] {slug}")
+    finally:
+        if pool:
+            pool.shutdown()
+
+    save_manifest(output_dir, manifest)
+    print(f"\nDone. {total - errors}/{total} images up to date in {output_dir}/ "
+          f"({rendered} rendered, {total - errors - rendered} unchanged)")
     if errors:
         print(f"  {errors} errors")
 
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+image_metrics.py — Frame quality heuristics shared by photo_qc.py and
+youtube_screenshots.py. Pillow only.
+
+FrameMetrics converts an image to grayscale and RGB once and derives every
+metric from those two copies: brightness, contrast and the bright-pixel
+text check read one 256-bin histogram, composition reads the histograms
+of two grayscale crops, and sharpness is a single Laplacian filter pass.
+All per-pixel work happens inside Pillow's C code, and each metric is
+computed lazily and cached, so score_frame() followed by is_black() or
+has_text_overlay() on the same frame costs one decode.
+
+motion_score() scores a batch of frames from one clip (the stills from
+extract_multiple_frames) with one downscale per frame.
+"""
+
+from functools import cached_property
+
+from PIL import Image, ImageChops, ImageFilter, ImageStat
+
+# Composite weights (sum to 100)
+WEIGHTS = {
+    "brightness": 20,
+    "contrast": 20,
+    "sharpness": 25,
+    "nature_color": 20,
+    "composition": 15,
+}
+
+LAPLACIAN = ImageFilter.Kernel(
+    size=(3, 3),
+    kernel=[-1, -1, -1, -1, 8, -1, -1, -1, -1],
+    scale=1, offset=0,
+)
+
+MOTION_SIZE = (160, 90)
+
+
+class FrameMetrics:
+    """Quality metrics for one frame; every property is computed at most once."""
+
+    def __init__(self, img: Image.Image):
+        self.img = img
+
+    # ── Shared decodes ────────────────────────────────────────────────────
+    @cached_property
+    def gray(self) -> Image.Image:
+        return self.img.convert("L")
+
+    @cached_property
+    def rgb(self) -> Image.Image:
+        return self.img.convert("RGB")
+
+    @cached_property
+    def gray_histogram(self) -> list:
+        return self.gray.histogram()
+
+    @cached_property
+    def gray_stat(self) -> ImageStat.Stat:
+        return ImageStat.Stat(self.gray_histogram)
+
+    # ── Scores (0-1) ──────────────────────────────────────────────────────
+    @cached_property
+    def brightness(self) -> float:
+        """Penalize too dark (<30 mean) or blown out (>240)."""
+        mean = self.gray_stat.mean[0]
+        if mean < 30:
+            return mean / 30.0 * 0.3
+        if mean > 240:
+            return (255 - mean) / 15.0 * 0.3
+        # Ideal: 80-180
+        if 80 <= mean <= 180:
+            return 1.0
+        if mean < 80:
+            return 0.3 + 0.7 * (mean - 30) / 50.0
+        return 0.3 + 0.7 * (240 - mean) / 60.0
+
+    @cached_property
+    def contrast(self) -> float:
+        """Higher standard deviation = more contrast = better."""
+        # Typical range 20-80; normalize to 0-1
+        return min(self.gray_stat.stddev[0] / 60.0, 1.0)
+
+    @cached_property
+    def sharpness(self) -> float:
+        """Laplacian variance — higher = sharper."""
+        variance = ImageStat.Stat(self.gray.filter(LAPLACIAN)).var[0]
+        # Typical range: blurry ~100, sharp ~2000+
+        return min(variance / 1500.0, 1.0)
+
+    @cached_property
+    def nature_color(self) -> float:
+        """Prefer green/brown (vegetation, dirt) over blue/gray."""
+        r, g, b = ImageStat.Stat(self.rgb).mean
+
+        score = 0.0
+        # Green vegetation: g > r and g > b
+        if g > r and g > b:
+            score += 0.5
+        # Brown/earth: r > b, moderate values
+        if r > b and 60 < r < 200:
+            score += 0.3
+        # Penalize heavy blue (sky-only frames)
+        if b > r and b > g:
+            score -= 0.2
+        # Penalize gray/low saturation
+        spread = max(r, g, b) - min(r, g, b)
+        if spread < 20:
+            score -= 0.3
+
+        return max(0.0, min(1.0, score + 0.3))
+
+    @cached_property
+    def composition(self) -> float:
+        """Penalize mostly-sky or mostly-ground frames."""
+        w, h = self.gray.size
+        top_mean = ImageStat.Stat(self.gray.crop((0, 0, w, h // 3))).mean[0]
+        bottom_mean = ImageStat.Stat(self.gray.crop((0, 2 * h // 3, w, h))).mean[0]
+
+        score = 1.0
+        # Heavy sky: top much brighter than bottom
+        if top_mean > 200 and bottom_mean < 100:
+            score -= 0.4
+        # Mostly ground: bottom dark, top also dark
+        if top_mean < 60 and bottom_mean < 60:
+            score -= 0.3
+        # Uniform: top ≈ bottom (no horizon interest)
+        if abs(top_mean - bottom_mean) < 10:
+            score -= 0.2
+
+        return max(0.0, score)
+
+    @cached_property
+    def score(self) -> float:
+        """Composite quality score 0-100 from weighted heuristics."""
+        return sum(getattr(self, name) * weight for name, weight in WEIGHTS.items())
+
+    # ── Rejection filters ─────────────────────────────────────────────────
+    def is_black(self, threshold: float = 15.0) -> bool:
+        """Mean brightness below threshold."""
+        return self.gray_stat.mean[0] < threshold
+
+    def has_text_overlay(self, edge_threshold: float = 40.0) -> bool:
+        """Title cards, sponsor logos and ad overlays.
+
+        1. Top/bottom 25% strips — catches title cards, subscribe bars
+        2. Bright text clusters — catches white sponsor text on scenery
+        """
+        w, h = self.gray.size
+        strip_h = int(h * 0.25)
+
+        # Top and bottom strips (lower threshold — common for title cards)
+        for box in [(0, 0, w, strip_h), (0, h - strip_h, w, h)]:
+            edges = self.gray.crop(box).filter(ImageFilter.FIND_EDGES)
+            if ImageStat.Stat(edges).mean[0] > edge_threshold:
+                return True
+
+        return self.has_bright_text_clusters()
+
+    def has_bright_text_clusters(self, bright_threshold: int = 230,
+                                 min_bright_pct: float = 0.03,
+                                 max_bright_pct: float = 0.30) -> bool:
+        """Bright text overlays (white/near-white text on darker background).
+
+        - 3-30% of pixels are near-white (text is large but not the whole frame)
+        - The surrounding area is significantly darker (it's overlay, not sky)
+        """
+        hist = self.gray_histogram
+        total = sum(hist)
+        bright_count = sum(hist[bright_threshold:])
+
+        # Must have some bright pixels but not too many (all-sky would be ~60%+)
+        if not (min_bright_pct <= bright_count / total <= max_bright_pct):
+            return False
+
+        # Check that non-bright pixels are significantly darker (confirms overlay vs sky)
+        dark_count = total - bright_count
+        if not dark_count:
+            return False
+        dark_mean = sum(i * n for i, n in enumerate(hist[:bright_threshold])) / dark_count
+
+        # Bright text on darker scenery: big gap between text brightness and background
+        if (bright_threshold - dark_mean) > 100:
+            # Additional check: bright pixels should have sharp edges nearby
+            # (text has defined edges, clouds don't)
+            edges = self.gray.filter(ImageFilter.FIND_EDGES)
+            if ImageStat.Stat(edges).mean[0] > 25:
+                return True
+
+        return False
+
+
+def score_frame(img: Image.Image) -> float:
+    """Composite quality score 0-100."""
+    return FrameMetrics(img).score
+
+
+# ── Motion (for GIF segment selection) ────────────────────────────────────
+def load_frames(paths: list, size: tuple = MOTION_SIZE) -> list:
+    """Decode each frame once as a small grayscale image; unreadable ones are skipped."""
+    frames = []
+    for path in paths:
+        try:
+            with Image.open(path) as img:
+                if img.format == "JPEG":
+                    # Let the JPEG decoder downscale by a power of two first
+                    img.draft("L", (size[0] * 2, size[1] * 2))
+                frames.append(img.convert("L").resize(size))
+        except Exception:
+            continue
+    return frames
+
+
+def motion_score(frames: list) -> float:
+    """Score 0-1 from the mean absolute difference between consecutive frames.
+
+    More difference = more action: mud splashing, tight corners, pack
+    riding, terrain changes.
+    """
+    diffs = [
+        ImageStat.Stat(ImageChops.difference(prev, curr)).mean[0]
+        for prev, curr in zip(frames, frames[1:])
+    ]
+    if not diffs:
+        return 0.0
+
+    avg_diff = sum(diffs) / len(diffs)
+    # Typical range: static=0-2, gentle pan=5-15, action=15-40+
+    return min(avg_diff / 25.0, 1.0)
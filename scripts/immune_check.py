@@ -69,6 +69,7 @@ MONEY_PATH_MARKERS = ("/questionnaire/", "/coaching/")
 # Make audit_race_data.py importable and reuse its logic (don't reinvent it).
 sys.path.insert(0, str(SCRIPT_DIR))
 import audit_race_data  # noqa: E402
+from race_corpus import load_profiles  # noqa: E402
 
 
 @dataclass
@@ -262,12 +263,9 @@ def check_fuzzy_duplicates() -> list[Finding]:
     from difflib import SequenceMatcher
 
     findings: list[Finding] = []
-    profiles: list[tuple[str, dict]] = []
-    for f in sorted(RACE_DATA_DIR.glob("*.json")):
-        try:
-            profiles.append((f.stem, json.loads(f.read_text(encoding="utf-8")).get("race", {})))
-        except (OSError, json.JSONDecodeError):
-            continue
+    profiles: list[tuple[str, dict]] = [
+        (slug, data.get("race", {})) for slug, data in load_profiles(RACE_DATA_DIR).items()
+    ]
 
     def canon(s: str) -> str:
         return re.sub(r"[^a-z0-9]", "", (s or "").lower())
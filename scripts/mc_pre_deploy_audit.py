@@ -256,7 +256,8 @@ def check_unsubscribe():
     check("Unsubscribe injection function exists", has_inject,
           "No _inject_unsubscribe found — emails will lack unsubscribe link" if not has_inject else "")
 
-    has_call = "html = _inject_unsubscribe(html" in content
+    has_call = ("html = _inject_unsubscribe(html" in content
+                or "footer=_unsubscribe_block(" in content)
     check("Unsubscribe injected before sending", has_call,
           "_inject_unsubscribe not called in _send_next_step" if not has_call else "")
 
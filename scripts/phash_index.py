@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+phash_index.py — Perceptual hashes + a BK-tree for Hamming-radius lookups.
+
+Shared by photo_qc.py (Layer 1 duplicate detection) and
+youtube_screenshots.py (frame diversity). Pillow only, no imagehash dep.
+
+Hashes are 64-bit ints from one of two algorithms:
+  ahash — 8x8 average hash (the original photo_qc hash; fast, coarse)
+  dct   — 32x32 DCT pHash (robust to re-encoding, resizing, small crops)
+
+A BKTree answers "every hash within distance r of h" by visiting only the
+subtrees the triangle inequality allows, instead of comparing against
+every stored hash. PhashIndex wraps one with a file -> hash map and is
+persisted as race-photos/_phash_index.json next to _qc_results.json, so
+new photos are checked against the whole library without rehashing it.
+"""
+
+import json
+import math
+from pathlib import Path
+
+from PIL import Image
+
+
+# ── Hashes ─────────────────────────────────────────────────────────────────
+def _gray_pixels(img: Image.Image, size: int) -> list:
+    small = img.convert("L").resize((size, size), Image.LANCZOS)
+    # Use get_flattened_data if available (Pillow >= 11), else getdata
+    if hasattr(small, 'get_flattened_data'):
+        return list(small.get_flattened_data())
+    return list(small.getdata())
+
+
+def average_hash(img: Image.Image) -> int:
+    """8x8 average hash: one bit per pixel, set if >= the mean."""
+    pixels = _gray_pixels(img, 8)
+    avg = sum(pixels) / len(pixels)
+    return sum((1 << i) for i, p in enumerate(pixels) if p >= avg)
+
+
+_DCT_SIZE = 32
+_DCT_KEEP = 8
+# Cosine basis for the lowest 8 frequencies of a 32-point DCT-II
+_DCT_BASIS = [
+    [math.cos((2 * x + 1) * u * math.pi / (2 * _DCT_SIZE)) for x in range(_DCT_SIZE)]
+    for u in range(_DCT_KEEP)
+]
+
+
+def dct_hash(img: Image.Image) -> int:
+    """DCT pHash: low 8x8 frequencies of a 32x32 grayscale, thresholded at the median."""
+    pixels = _gray_pixels(img, _DCT_SIZE)
+    rows = [pixels[y * _DCT_SIZE:(y + 1) * _DCT_SIZE] for y in range(_DCT_SIZE)]
+    # Separable 2D DCT, low frequencies only: rows first, then columns
+    row_freqs = [[sum(b * p for b, p in zip(basis, row)) for basis in _DCT_BASIS] for row in rows]
+    coeffs = [
+        sum(basis[y] * row_freqs[y][u] for y in range(_DCT_SIZE))
+        for basis in _DCT_BASIS
+        for u in range(_DCT_KEEP)
+    ]
+    median = sorted(coeffs)[len(coeffs) // 2]
+    return sum((1 << i) for i, c in enumerate(coeffs) if c > median)
+
+
+PHASH_ALGORITHMS = {
+    "ahash": average_hash,
+    "dct": dct_hash,
+}
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count differing bits between two hashes."""
+    return bin(a ^ b).count('1')
+
+
+# ── BK-tree ────────────────────────────────────────────────────────────────
+class BKTree:
+    """Metric tree over hashes under Hamming distance.
+
+    Each node is [hash, items, {distance: child}]; items sharing a hash
+    share a node. add() is O(depth); query() prunes every child whose edge
+    distance falls outside [d - radius, d + radius].
+    """
+
+    def __init__(self):
+        self._root = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, h: int, item) -> None:
+        self._size += 1
+        if self._root is None:
+            self._root = [h, [item], {}]
+            return
+        node = self._root
+        while True:
+            d = hamming_distance(h, node[0])
+            if d == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [h, [item], {}]
+                return
+            node = child
+
+    def query(self, h: int, radius: int) -> list:
+        """(distance, item) for every item within radius of h, nearest first."""
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            d = hamming_distance(h, node[0])
+            if d <= radius:
+                found.extend((d, item) for item in node[1])
+            for edge, child in node[2].items():
+                if d - radius <= edge <= d + radius:
+                    stack.append(child)
+        found.sort(key=lambda m: m[0])
+        return found
+
+
+# ── Persistent library index ──────────────────────────────────────────────
+class PhashIndex:
+    """Every hashed file in the photo library, searchable by Hamming radius.
+
+    Re-adding a file with a new hash (a re-extracted photo) supersedes the
+    old entry; superseded tree entries are filtered out of matches() and
+    dropped when the index is next loaded.
+    """
+
+    def __init__(self, algorithm: str = "ahash"):
+        if algorithm not in PHASH_ALGORITHMS:
+            raise ValueError(f"Unknown phash algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.hashes: dict[str, int] = {}
+        self._tree = BKTree()
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def hash_image(self, img: Image.Image) -> int:
+        return PHASH_ALGORITHMS[self.algorithm](img)
+
+    def add(self, file: str, h: int) -> None:
+        if self.hashes.get(file) == h:
+            return
+        self.hashes[file] = h
+        self._tree.add(h, (file, h))
+
+    def remove(self, file: str) -> None:
+        self.hashes.pop(file, None)
+
+    def matches(self, h: int, radius: int, exclude: str = None) -> list:
+        """(file, distance) for library files within radius of h, nearest first."""
+        found = {}
+        for d, (file, stored) in self._tree.query(h, radius):
+            # Superseded or removed entries stay in the tree; skip them
+            if file != exclude and self.hashes.get(file) == stored:
+                found.setdefault(file, d)
+        return list(found.items())
+
+    @classmethod
+    def load(cls, path: Path, algorithm: str = "ahash") -> "PhashIndex":
+        """Load a saved index; missing, corrupt or other-algorithm files give an empty one."""
+        index = cls(algorithm)
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, json.JSONDecodeError):
+            return index
+        if data.get("algorithm") != algorithm:
+            return index
+        for file, hex_hash in data.get("entries", []):
+            index.add(file, int(hex_hash, 16))
+        return index
+
+    def save(self, path: Path) -> None:
+        """Write the live entries; load() rebuilds the tree from them."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "algorithm": self.algorithm,
+            "entries": [[file, f"{h:016x}"] for file, h in self.hashes.items()],
+        }
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, indent=0) + "\n")
+        tmp.replace(path)
@@ -14,6 +14,7 @@ Usage:
     python scripts/photo_qc.py --apply-seo                      # Layer 4
     python scripts/photo_qc.py --slug unbound-200 --check       # single race
     python scripts/photo_qc.py --check --dry-run                # preview only
+    python scripts/photo_qc.py --check --phash dct              # DCT pHash dedup
     python scripts/photo_qc.py --status                         # coverage report
 """
 
@@ -27,10 +28,16 @@ from datetime import date
 from pathlib import Path
 
 try:
-    from PIL import Image, ImageFilter, ImageStat
+    from PIL import Image
 except ImportError:
     sys.exit("Pillow is required: pip install Pillow")
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from image_metrics import FrameMetrics  # noqa: E402
+from phash_index import (  # noqa: E402
+    PHASH_ALGORITHMS, BKTree, PhashIndex, average_hash, hamming_distance,
+)
+
 # ── Paths ──────────────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "race-data"
@@ -39,6 +46,7 @@ REPORTS_DIR = PROJECT_ROOT / "reports"
 PROGRESS_FILE = PHOTOS_DIR / "_progress.json"
 QC_RESULTS_FILE = PHOTOS_DIR / "_qc_results.json"
 QC_PROGRESS_FILE = PHOTOS_DIR / "_qc_progress.json"
+PHASH_INDEX_FILE = PHOTOS_DIR / "_phash_index.json"
 TOKENS_PATH = PROJECT_ROOT.parent / "gravel-god-brand" / "tokens" / "tokens.css"
 SITE_BASE_URL = "https://gravelgodcycling.com"
 
@@ -62,101 +70,40 @@ SCORE_FAIL_THRESHOLD = 30
 PHASH_DUPLICATE_THRESHOLD = 10  # hamming distance
 
 
-# ── Perceptual Hash (Pillow-only average hash) ─────────────────────────────
+# ── Perceptual Hash (see phash_index.py) ───────────────────────────────────
 def compute_phash(img: Image.Image) -> int:
     """Compute average perceptual hash — Pillow only, no imagehash dep."""
-    small = img.convert("L").resize((8, 8), Image.LANCZOS)
-    # Use get_flattened_data if available (Pillow >= 11), else getdata
-    if hasattr(small, 'get_flattened_data'):
-        pixels = list(small.get_flattened_data())
-    else:
-        pixels = list(small.getdata())
-    avg = sum(pixels) / len(pixels)
-    return sum((1 << i) for i, p in enumerate(pixels) if p >= avg)
-
+    return average_hash(img)
 
-def hamming_distance(a: int, b: int) -> int:
-    """Count differing bits between two hashes."""
-    return bin(a ^ b).count('1')
 
-
-# ── Scoring (reused from youtube_screenshots.py) ──────────────────────────
+# ── Scoring (shared with youtube_screenshots.py, see image_metrics.py) ─────
 def score_brightness(img: Image.Image) -> float:
-    stat = ImageStat.Stat(img.convert("L"))
-    mean = stat.mean[0]
-    if mean < 30:
-        return mean / 30.0 * 0.3
-    if mean > 240:
-        return (255 - mean) / 15.0 * 0.3
-    if 80 <= mean <= 180:
-        return 1.0
-    if mean < 80:
-        return 0.3 + 0.7 * (mean - 30) / 50.0
-    return 0.3 + 0.7 * (240 - mean) / 60.0
+    return FrameMetrics(img).brightness
 
 
 def score_contrast(img: Image.Image) -> float:
-    stat = ImageStat.Stat(img.convert("L"))
-    return min(stat.stddev[0] / 60.0, 1.0)
+    return FrameMetrics(img).contrast
 
 
 def score_sharpness(img: Image.Image) -> float:
-    gray = img.convert("L")
-    laplacian = gray.filter(ImageFilter.Kernel(
-        size=(3, 3),
-        kernel=[-1, -1, -1, -1, 8, -1, -1, -1, -1],
-        scale=1, offset=0,
-    ))
-    stat = ImageStat.Stat(laplacian)
-    return min(stat.var[0] / 1500.0, 1.0)
+    return FrameMetrics(img).sharpness
 
 
 def score_nature_color(img: Image.Image) -> float:
-    rgb = img.convert("RGB")
-    stat = ImageStat.Stat(rgb)
-    r, g, b = stat.mean
-    score = 0.0
-    if g > r and g > b:
-        score += 0.5
-    if r > b and 60 < r < 200:
-        score += 0.3
-    if b > r and b > g:
-        score -= 0.2
-    spread = max(r, g, b) - min(r, g, b)
-    if spread < 20:
-        score -= 0.3
-    return max(0.0, min(1.0, score + 0.3))
+    return FrameMetrics(img).nature_color
 
 
 def score_composition(img: Image.Image) -> float:
-    w, h = img.size
-    top_third = img.crop((0, 0, w, h // 3)).convert("L")
-    bottom_third = img.crop((0, 2 * h // 3, w, h)).convert("L")
-    top_mean = ImageStat.Stat(top_third).mean[0]
-    bottom_mean = ImageStat.Stat(bottom_third).mean[0]
-    score = 1.0
-    if top_mean > 200 and bottom_mean < 100:
-        score -= 0.4
-    if top_mean < 60 and bottom_mean < 60:
-        score -= 0.3
-    if abs(top_mean - bottom_mean) < 10:
-        score -= 0.2
-    return max(0.0, score)
+    return FrameMetrics(img).composition
 
 
 def score_frame(img: Image.Image) -> float:
     """Composite quality score 0-100."""
-    return (
-        score_brightness(img) * 20 +
-        score_contrast(img) * 20 +
-        score_sharpness(img) * 25 +
-        score_nature_color(img) * 20 +
-        score_composition(img) * 15
-    )
+    return FrameMetrics(img).score
 
 
 # ── Layer 1: Automated Checks ─────────────────────────────────────────────
-def check_photo(filepath: Path) -> dict:
+def check_photo(filepath: Path, phash_fn=compute_phash) -> dict:
     """Run all automated checks on a single photo (JPG). Returns check result dict."""
     result = {
         "file": str(filepath.relative_to(PHOTOS_DIR)),
@@ -217,7 +164,7 @@ def check_photo(filepath: Path) -> dict:
         checks["quality_score"]["pass"] = True
 
     # Perceptual hash (stored for dedup comparison later)
-    phash = compute_phash(img)
+    phash = phash_fn(img)
     result["phash"] = phash
 
     # Determine overall status
@@ -336,28 +283,62 @@ def check_json_disk_parity(slug: str, race_photos: list, slug_dir: Path) -> list
 
 
 def find_duplicates(photo_results: list) -> list:
-    """Find perceptual hash duplicates across photos. Returns list of duplicate pairs."""
-    duplicates = []
+    """Find perceptual hash duplicates across photos. Returns list of duplicate pairs.
+
+    Each photo is looked up in a BK-tree of the ones before it, so the cost
+    grows with the number of near matches rather than every pair.
+    """
+    pairs = []
+    tree = BKTree()
     hashes = [(r["file"], r["phash"]) for r in photo_results if "phash" in r]
 
-    for i in range(len(hashes)):
-        for j in range(i + 1, len(hashes)):
-            dist = hamming_distance(hashes[i][1], hashes[j][1])
-            if dist <= PHASH_DUPLICATE_THRESHOLD:
+    for j, (_, h) in enumerate(hashes):
+        for dist, i in tree.query(h, PHASH_DUPLICATE_THRESHOLD):
+            pairs.append((i, j, dist))
+        tree.add(h, j)
+
+    return [
+        {"file_a": hashes[i][0], "file_b": hashes[j][0], "hamming_distance": dist}
+        for i, j, dist in sorted(pairs)
+    ]
+
+
+def find_library_duplicates(slug: str, photo_results: list, index: PhashIndex) -> list:
+    """Match this race's photos against every other race in the library index,
+    then record them in it. Returns list of cross-race duplicate pairs."""
+    duplicates = []
+    prefix = f"{slug}/"
+    current = set()
+    for r in photo_results:
+        if "phash" not in r:
+            continue
+        current.add(r["file"])
+        for other, dist in index.matches(r["phash"], PHASH_DUPLICATE_THRESHOLD):
+            if not other.startswith(prefix):
                 duplicates.append({
-                    "file_a": hashes[i][0],
-                    "file_b": hashes[j][0],
+                    "file_a": r["file"],
+                    "file_b": other,
                     "hamming_distance": dist,
                 })
+        index.add(r["file"], r["phash"])
 
+    # Photos deleted or re-extracted under new names since the last run
+    for stale in [f for f in index.hashes if f.startswith(prefix) and f not in current]:
+        index.remove(stale)
     return duplicates
 
 
-def run_layer1(slugs: list[str] = None, dry_run: bool = False) -> dict:
+def run_layer1(slugs: list[str] = None, dry_run: bool = False,
+               index: PhashIndex = None) -> dict:
     """Run Layer 1 automated checks on all races (or specified slugs).
 
+    Photos are hashed with the index's algorithm (average hash without one)
+    and matched against the rest of the library through it; the caller
+    saves the index alongside _qc_results.json.
+
     Returns QC results dict ready to write to _qc_results.json.
     """
+    phash_fn = index.hash_image if index is not None else compute_phash
     results = {
         "checked_at": date.today().isoformat(),
         "races": {},
@@ -389,7 +370,8 @@ def run_layer1(slugs: list[str] = None, dry_run: bool = False) -> dict:
 
     for slug in races_to_check:
         slug_dir = PHOTOS_DIR / slug
-        race_result = {"photos": [], "gifs": [], "parity_errors": [], "duplicates": []}
+        race_result = {"photos": [], "gifs": [], "parity_errors": [], "duplicates": [],
+                       "library_duplicates": []}
 
         # Load race JSON for parity check
         race_json_path = DATA_DIR / f"{slug}.json"
@@ -405,7 +387,7 @@ def run_layer1(slugs: list[str] = None, dry_run: bool = False) -> dict:
         if slug_dir.exists():
             for f in sorted(slug_dir.iterdir()):
                 if f.suffix == ".jpg":
-                    r = check_photo(f)
+                    r = check_photo(f, phash_fn)
                     race_result["photos"].append(r)
                     results["summary"]["total_photos"] += 1
                 elif f.suffix == ".gif":
@@ -420,6 +402,11 @@ def run_layer1(slugs: list[str] = None, dry_run: bool = False) -> dict:
         # Perceptual hash duplicates (within this race)
         race_result["duplicates"] = find_duplicates(race_result["photos"])
 
+        # Same photo already used by another race (informational)
+        if index is not None:
+            race_result["library_duplicates"] = find_library_duplicates(
+                slug, race_result["photos"], index)
+
         # Race-level status
         all_statuses = [r["status"] for r in race_result["photos"] + race_result["gifs"]]
         if parity:
@@ -670,6 +657,8 @@ def render_qc_dashboard(qc_results: dict, ai_results: dict = None) -> str:
         dup_html = ""
         for d in race_data.get("duplicates", []):
             dup_html += f'<div class="dup-warn">DUPLICATE: {d["file_a"]} ↔ {d["file_b"]} (hamming={d["hamming_distance"]})</div>'
+        for d in race_data.get("library_duplicates", []):
+            dup_html += f'<div class="dup-warn">ALSO IN ANOTHER RACE: {d["file_a"]} ↔ {d["file_b"]} (hamming={d["hamming_distance"]})</div>'
 
         n_photos = len(race_data.get("photos", []))
         n_gifs = len(race_data.get("gifs", []))
@@ -874,6 +863,8 @@ def main():
                         help="Preview without writing")
     parser.add_argument("--status", action="store_true",
                         help="Print coverage report and exit")
+    parser.add_argument("--phash", choices=sorted(PHASH_ALGORITHMS), default="ahash",
+                        help="Perceptual hash for dedup (switching rebuilds the library index)")
     args = parser.parse_args()
 
     if args.status:
@@ -889,7 +880,8 @@ def main():
         print(f"\n{'=' * 55}")
         print(f"Layer 1: Automated Checks")
         print(f"{'=' * 55}")
-        qc_results = run_layer1(slugs=args.slug, dry_run=args.dry_run)
+        index = PhashIndex.load(PHASH_INDEX_FILE, args.phash)
+        qc_results = run_layer1(slugs=args.slug, dry_run=args.dry_run, index=index)
 
         if not args.dry_run:
             # Save results
@@ -898,6 +890,12 @@ def main():
             save_results = json.loads(json.dumps(qc_results, default=str))
             QC_RESULTS_FILE.write_text(json.dumps(save_results, indent=2) + "\n")
             print(f"\nResults saved: {QC_RESULTS_FILE}")
+            index.save(PHASH_INDEX_FILE)
+            print(f"Hash index: {len(index)} photos ({args.phash}) → {PHASH_INDEX_FILE}")
+
+        cross = sum(len(r.get("library_duplicates", [])) for r in qc_results.get("races", {}).values())
+        if cross:
+            print(f"Cross-race duplicates: {cross}")
 
         s = qc_results.get("summary", {})
         print(f"\nSummary: {s.get('total_races', 0)} races | "
@@ -2,71 +2,258 @@
 """
 Pre-deploy preflight checker.
 
-Runs all validation and generation steps in the correct order, stopping
+Runs all validation and generation steps as a dependency graph, stopping
 on the first failure. Use --generate to also regenerate all output files.
 Use --deploy to regenerate AND deploy to production.
 
+Python steps run in-process: preflight imports every step module and loads
+the race corpus (scripts/race_corpus.py) once, then runs each step as
+`__main__` in a worker forked from that warm process. No step pays
+interpreter startup, imports or a JSON parse of race-data/ again. Steps
+whose dependencies have passed run concurrently, up to --jobs at a time.
+pytest and the deploy itself still run as subprocesses.
+
 Usage:
     python scripts/preflight.py              # Validate only (fast)
     python scripts/preflight.py --generate   # Validate + regenerate all output
     python scripts/preflight.py --deploy     # Validate + regenerate + deploy + post-deploy checks
     python scripts/preflight.py --skip-tests # Skip pytest (useful during rapid iteration)
+    python scripts/preflight.py --generate --jobs 1   # One step at a time, live output
 """
 
+import argparse
+import importlib
+import multiprocessing
+import os
+import runpy
 import subprocess
 import sys
+import tempfile
 import time
+import traceback
+from dataclasses import dataclass
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 WORDPRESS_DIR = PROJECT_ROOT / "wordpress"
 
+STEP_TIMEOUT = 600  # seconds, per step
+POLL_INTERVAL = 0.1
+
+
+@dataclass
+class Step:
+    """One preflight step: a step module run as __main__, or an external command."""
+    name: str                  # dependency key
+    label: str                 # what the report prints
+    script: Path | None = None  # scripts/ or wordpress/ module, run in-process
+    args: tuple = ()
+    cmd: list | None = None    # external command, run as a subprocess
+    deps: tuple = ()
+    optional: bool = False     # failure is a WARN, not a stop
+
+    @property
+    def module(self) -> str | None:
+        return self.script.stem if self.script else None
+
+
+def _fork_context():
+    """Fork start method, or None where it's unavailable (Windows)."""
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+
+def _run_module_step(step: Step, log_path: str | None) -> None:
+    """Forked worker body: run step.script as __main__ and exit with its code.
+
+    Exit codes follow the interpreter's rules so results match running the
+    script directly: sys.exit(n) → n, sys.exit("msg") → 1, uncaught → 1.
+    """
+    if log_path:
+        fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+    os.chdir(PROJECT_ROOT)
+    sys.argv = [str(step.script), *step.args]
+    code = 0
+    try:
+        runpy.run_module(step.module, run_name="__main__", alter_sys=True)
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    os._exit(code)
+
+
+class _Running:
+    """A started step: a forked worker or a subprocess, polled uniformly."""
+
+    def __init__(self, step: Step, log_path: str | None, ctx):
+        self.step = step
+        self.log_path = log_path
+        self.start = time.time()
+        self._proc = None
+        self._popen = None
+        if step.script and ctx is not None:
+            self._proc = ctx.Process(target=_run_module_step, args=(step, log_path))
+            self._proc.start()
+        else:
+            cmd = step.cmd or [sys.executable, str(step.script), *step.args]
+            out = open(log_path, "w") if log_path else None
+            try:
+                self._popen = subprocess.Popen(
+                    cmd, cwd=PROJECT_ROOT, stdout=out,
+                    stderr=subprocess.STDOUT if out else None,
+                )
+            finally:
+                if out:
+                    out.close()
+
+    def poll(self):
+        if self._proc is not None:
+            return None if self._proc.is_alive() else self._proc.exitcode
+        return self._popen.poll()
+
+    def kill(self):
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.join()
+        else:
+            self._popen.kill()
+            self._popen.wait()
+
+    def output(self) -> str:
+        if not self.log_path:
+            return ""
+        try:
+            return Path(self.log_path).read_text(encoding="utf-8", errors="replace")
+        finally:
+            os.unlink(self.log_path)
+
 
 class Preflight:
-    def __init__(self):
+    def __init__(self, jobs=1):
+        self.jobs = max(1, jobs)
         self.passed = 0
         self.failed = 0
         self.skipped = 0
         self.timings = []
+        self.wall_start = time.time()
+        self.ctx = _fork_context()
+
+    def warm(self, steps):
+        """Import every step module and load the race corpus once, pre-fork."""
+        if self.ctx is None:
+            return
+        for path in (str(SCRIPTS_DIR), str(WORDPRESS_DIR)):
+            if path not in sys.path:
+                sys.path.insert(0, path)
+        argv = sys.argv
+        for step in steps:
+            if not step.script:
+                continue
+            try:
+                sys.argv = [str(step.script)]
+                importlib.import_module(step.module)
+            except BaseException:
+                # The forked run re-imports it and reports the failure there
+                pass
+            finally:
+                sys.argv = argv
+        try:
+            import race_corpus
+            race_corpus.load_corpus()
+        except Exception as e:
+            print(f"  WARN  race corpus preload failed: {e}")
 
-    def run_step(self, label, cmd, *, cwd=None, optional=False):
-        """Run a command, print result, return True on success."""
+    def _header(self, label):
         print(f"\n{'─' * 60}")
         print(f"  {label}")
         print(f"{'─' * 60}")
 
-        start = time.time()
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd or PROJECT_ROOT,
-                capture_output=False,
-                timeout=600,
-            )
-            elapsed = time.time() - start
-            self.timings.append((label, elapsed))
-
-            if result.returncode == 0:
-                print(f"\n  PASS  {label} ({elapsed:.1f}s)")
-                self.passed += 1
-                return True
-            else:
-                if optional:
-                    print(f"\n  WARN  {label} (exit {result.returncode}, {elapsed:.1f}s)")
-                    self.skipped += 1
-                    return True
-                else:
-                    print(f"\n  FAIL  {label} (exit {result.returncode}, {elapsed:.1f}s)")
-                    self.failed += 1
-                    return False
-
-        except subprocess.TimeoutExpired:
-            elapsed = time.time() - start
-            self.timings.append((label, elapsed))
-            print(f"\n  FAIL  {label} (TIMEOUT after {elapsed:.0f}s)")
+    def _start(self, step):
+        if self.jobs == 1:
+            self._header(step.label)
+            log_path = None
+        else:
+            print(f"  START {step.label}")
+            fd, log_path = tempfile.mkstemp(prefix="preflight-", suffix=".log")
+            os.close(fd)
+        sys.stdout.flush()
+        return _Running(step, log_path, self.ctx)
+
+    def _finish(self, running, returncode):
+        """Record a finished step; return True unless it's a required failure."""
+        step = running.step
+        elapsed = time.time() - running.start
+        self.timings.append((step.label, elapsed))
+        if self.jobs > 1:
+            self._header(step.label)
+            print(running.output(), end="")
+
+        if returncode is None:
+            print(f"\n  FAIL  {step.label} (TIMEOUT after {elapsed:.0f}s)")
             self.failed += 1
             return False
+        if returncode == 0:
+            print(f"\n  PASS  {step.label} ({elapsed:.1f}s)")
+            self.passed += 1
+            return True
+        if step.optional:
+            print(f"\n  WARN  {step.label} (exit {returncode}, {elapsed:.1f}s)")
+            self.skipped += 1
+            return True
+        print(f"\n  FAIL  {step.label} (exit {returncode}, {elapsed:.1f}s)")
+        self.failed += 1
+        return False
+
+    def run(self, steps):
+        """Run steps in dependency order, up to self.jobs at once.
+
+        After the first required failure no new step starts; steps already
+        running finish and are reported. Returns True if nothing failed.
+        """
+        pending = list(steps)
+        done = set()
+        running = {}
+        stop = False
+        while pending or running:
+            if not stop:
+                for step in list(pending):
+                    if len(running) >= self.jobs:
+                        break
+                    if all(dep in done for dep in step.deps):
+                        pending.remove(step)
+                        running[step.name] = self._start(step)
+            if not running:
+                break
+
+            time.sleep(POLL_INTERVAL)
+            for name, r in list(running.items()):
+                code = r.poll()
+                if code is None and time.time() - r.start > STEP_TIMEOUT:
+                    r.kill()
+                elif code is None:
+                    continue
+                del running[name]
+                if self._finish(r, code):
+                    done.add(name)
+                else:
+                    stop = True
+        return not stop
 
     def summary(self):
         total_time = sum(t for _, t in self.timings)
@@ -77,7 +264,7 @@ class Preflight:
         if self.skipped:
             print(f"  Warned:  {self.skipped}")
         print(f"  Failed:  {self.failed}")
-        print(f"  Total:   {total_time:.1f}s")
+        print(f"  Total:   {total_time:.1f}s (wall {time.time() - self.wall_start:.1f}s)")
         print()
         if self.failed:
             print("  RESULT: FAILED — do NOT deploy")
@@ -86,13 +273,87 @@ class Preflight:
         print(f"{'═' * 60}\n")
 
 
-def main():
-    args = set(sys.argv[1:])
-    do_generate = "--generate" in args or "--deploy" in args
-    do_deploy = "--deploy" in args
-    skip_tests = "--skip-tests" in args
+def validation_steps(skip_tests):
+    steps = []
+    if not skip_tests:
+        steps.append(Step(
+            "pytest", "pytest",
+            cmd=[sys.executable, "-m", "pytest", "tests/", "-q", "--tb=short", "-x"],
+        ))
+    steps += [
+        Step("audit_colors", "audit_colors.py", SCRIPTS_DIR / "audit_colors.py"),
+        Step("validate_citations", "validate_citations.py", SCRIPTS_DIR / "validate_citations.py"),
+        # warn but don't block — known low-confidence profiles have issues
+        Step("audit_race_data", "audit_race_data.py", SCRIPTS_DIR / "audit_race_data.py",
+             optional=True),
+        Step("validate_blog_content", "validate_blog_content.py",
+             SCRIPTS_DIR / "validate_blog_content.py"),
+        Step("youtube_validate", "youtube_validate.py", SCRIPTS_DIR / "youtube_validate.py"),
+    ]
+    return steps
+
+
+def generation_steps(after):
+    """Generators. race-index.json and blog-index.json are the shared inputs."""
+    def step(name, label, script, *args, deps=()):
+        return Step(name, label, script, args, deps=tuple(after) + deps)
+
+    return [
+        step("index", "generate_index.py --with-jsonld",
+             SCRIPTS_DIR / "generate_index.py", "--with-jsonld"),
+        step("season_roundup", "generate_season_roundup.py --all",
+             WORDPRESS_DIR / "generate_season_roundup.py", "--all", deps=("index",)),
+        step("blog_index", "generate_blog_index.py",
+             SCRIPTS_DIR / "generate_blog_index.py", deps=("season_roundup",)),
+        step("blog_index_page", "generate_blog_index_page.py",
+             WORDPRESS_DIR / "generate_blog_index_page.py", deps=("blog_index",)),
+        step("sitemap", "generate_sitemap.py --blog",
+             SCRIPTS_DIR / "generate_sitemap.py", "--blog", deps=("index", "blog_index")),
+        step("race_pages", "generate_neo_brutalist.py --all",
+             WORDPRESS_DIR / "generate_neo_brutalist.py", "--all", deps=("index",)),
+        step("prep_kits", "generate_prep_kit.py --all",
+             WORDPRESS_DIR / "generate_prep_kit.py", "--all", deps=("index",)),
+        step("homepage", "generate_homepage.py",
+             WORDPRESS_DIR / "generate_homepage.py", deps=("index",)),
+        step("methodology", "generate_methodology.py",
+             WORDPRESS_DIR / "generate_methodology.py"),
+        step("tier_hubs", "generate_tier_hubs.py",
+             WORDPRESS_DIR / "generate_tier_hubs.py", deps=("index",)),
+    ]
+
+
+def deploy_steps(after):
+    push = [sys.executable, str(SCRIPTS_DIR / "push_wordpress.py")]
+    deploy_content = Step("deploy_content", "push_wordpress.py --deploy-content",
+                          cmd=push + ["--deploy-content"], deps=tuple(after))
+    sync_homepage = Step("sync_homepage", "push_wordpress.py --sync-homepage",
+                         cmd=push + ["--sync-homepage"], deps=("deploy_content",))
+    deployed = ("deploy_content", "sync_homepage")
+    return [
+        deploy_content,
+        sync_homepage,
+        Step("validate_deploy", "validate_deploy.py", SCRIPTS_DIR / "validate_deploy.py",
+             deps=deployed),
+        # redirect validation is supplementary
+        Step("validate_redirects", "validate_redirects.py",
+             SCRIPTS_DIR / "validate_redirects.py", deps=deployed, optional=True),
+    ]
 
-    pf = Preflight()
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-deploy preflight checker")
+    parser.add_argument("--generate", action="store_true",
+                        help="Also regenerate all output files")
+    parser.add_argument("--deploy", action="store_true",
+                        help="Regenerate, deploy and run post-deploy checks")
+    parser.add_argument("--skip-tests", action="store_true", help="Skip pytest")
+    parser.add_argument("--jobs", "-j", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Steps to run at once (1 = sequential with live output)")
+    args = parser.parse_args()
+    do_generate = args.generate or args.deploy
+    do_deploy = args.deploy
+
+    pf = Preflight(jobs=args.jobs)
 
     print(f"\n{'═' * 60}")
     mode = "DEPLOY" if do_deploy else ("GENERATE" if do_generate else "VALIDATE")
@@ -100,182 +361,21 @@ def main():
     print(f"{'═' * 60}")
 
     # ── Phase 1: Validation ──────────────────────────────────────
-
-    if not skip_tests:
-        ok = pf.run_step(
-            "pytest",
-            [sys.executable, "-m", "pytest", "tests/", "-q",
-             "--tb=short", "-x"],
-        )
-        if not ok:
-            pf.summary()
-            return 1
-    else:
+    steps = validation_steps(args.skip_tests)
+    if args.skip_tests:
         print("\n  SKIP  pytest (--skip-tests)")
         pf.skipped += 1
 
-    ok = pf.run_step(
-        "audit_colors.py",
-        [sys.executable, str(SCRIPTS_DIR / "audit_colors.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "validate_citations.py",
-        [sys.executable, str(SCRIPTS_DIR / "validate_citations.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "audit_race_data.py",
-        [sys.executable, str(SCRIPTS_DIR / "audit_race_data.py")],
-        optional=True,  # warn but don't block — known low-confidence profiles have issues
-    )
-
-    ok = pf.run_step(
-        "validate_blog_content.py",
-        [sys.executable, str(SCRIPTS_DIR / "validate_blog_content.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "youtube_validate.py",
-        [sys.executable, str(SCRIPTS_DIR / "youtube_validate.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    if not do_generate:
-        pf.summary()
-        return 1 if pf.failed else 0
-
     # ── Phase 2: Generation ──────────────────────────────────────
+    if do_generate:
+        steps += generation_steps(after=[s.name for s in steps])
 
-    ok = pf.run_step(
-        "generate_index.py --with-jsonld",
-        [sys.executable, str(SCRIPTS_DIR / "generate_index.py"), "--with-jsonld"],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_season_roundup.py --all",
-        [sys.executable, str(WORDPRESS_DIR / "generate_season_roundup.py"), "--all"],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_blog_index.py",
-        [sys.executable, str(SCRIPTS_DIR / "generate_blog_index.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_blog_index_page.py",
-        [sys.executable, str(WORDPRESS_DIR / "generate_blog_index_page.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_sitemap.py --blog",
-        [sys.executable, str(SCRIPTS_DIR / "generate_sitemap.py"), "--blog"],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_neo_brutalist.py --all",
-        [sys.executable, str(WORDPRESS_DIR / "generate_neo_brutalist.py"), "--all"],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_prep_kit.py --all",
-        [sys.executable, str(WORDPRESS_DIR / "generate_prep_kit.py"), "--all"],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_homepage.py",
-        [sys.executable, str(WORDPRESS_DIR / "generate_homepage.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_methodology.py",
-        [sys.executable, str(WORDPRESS_DIR / "generate_methodology.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "generate_tier_hubs.py",
-        [sys.executable, str(WORDPRESS_DIR / "generate_tier_hubs.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    if not do_deploy:
-        pf.summary()
-        return 1 if pf.failed else 0
-
-    # ── Phase 3: Deploy ──────────────────────────────────────────
-
-    ok = pf.run_step(
-        "push_wordpress.py --deploy-content",
-        [sys.executable, str(SCRIPTS_DIR / "push_wordpress.py"), "--deploy-content"],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "push_wordpress.py --sync-homepage",
-        [sys.executable, str(SCRIPTS_DIR / "push_wordpress.py"), "--sync-homepage"],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    # ── Phase 4: Post-deploy validation ──────────────────────────
-
-    ok = pf.run_step(
-        "validate_deploy.py",
-        [sys.executable, str(SCRIPTS_DIR / "validate_deploy.py")],
-    )
-    if not ok:
-        pf.summary()
-        return 1
-
-    ok = pf.run_step(
-        "validate_redirects.py",
-        [sys.executable, str(SCRIPTS_DIR / "validate_redirects.py")],
-        optional=True,  # redirect validation is supplementary
-    )
+    # ── Phase 3/4: Deploy + post-deploy validation ───────────────
+    if do_deploy:
+        steps += deploy_steps(after=[s.name for s in steps])
 
+    pf.warm(steps)
+    pf.run(steps)
     pf.summary()
     return 1 if pf.failed else 0
 
@@ -4,13 +4,18 @@ Push landing page JSON or race index to WordPress.
 """
 
 import argparse
+import atexit
 import json
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date
 
 import requests
@@ -36,6 +41,11 @@ except ModuleNotFoundError:
         load_approved_map as load_approved_road_migration_map,
     )
 
+try:
+    from scripts.deploy_delta import DeployRecord, public_url_path, target_key, write_tar
+except ModuleNotFoundError:
+    from deploy_delta import DeployRecord, public_url_path, target_key, write_tar
+
 load_dotenv()
 
 SSH_KEY = Path.home() / ".ssh" / "siteground_key"
@@ -84,6 +94,121 @@ def get_ssh_credentials():
     return host, user, port
 
 
+# ── Shared SSH connection ─────────────────────────────────────
+# A deploy runs hundreds of ssh/scp commands; each used to do its own TCP +
+# key handshake with SiteGround, which is slow and trips its WAF rate limits.
+# While a DeploySession is open, every command built by ssh_argv()/scp_argv()
+# rides one ControlMaster connection instead. If the master dies, ssh falls
+# back to a direct connection, so commands never fail because of it.
+
+# -o options added to every ssh/scp while a DeploySession is open
+_SSH_MUX_OPTS: list = []
+
+# Idle seconds before an orphaned master exits on its own (crash safety net)
+MUX_PERSIST = 120
+
+
+def ssh_argv(port: str) -> list:
+    """ssh argv up to the destination, over the deploy session when open."""
+    return ["ssh", *_SSH_MUX_OPTS, "-i", str(SSH_KEY), "-p", port]
+
+
+def scp_argv(port: str) -> list:
+    """scp argv up to the sources, over the deploy session when open."""
+    return ["scp", *_SSH_MUX_OPTS, "-i", str(SSH_KEY), "-P", port]
+
+
+class DeploySession:
+    """One multiplexed SSH connection for the length of a deploy."""
+
+    def __init__(self, ssh):
+        self.host, self.user, self.port = ssh
+        self._dir = None
+        self.control_path = None
+
+    def open(self) -> bool:
+        self._dir = tempfile.mkdtemp(prefix="gg-ssh-")
+        # %C (hash of host/port/user) keeps the socket path under the
+        # 104-byte unix socket limit
+        self.control_path = os.path.join(self._dir, "%C")
+        opts = ["-o", f"ControlPath={self.control_path}"]
+        try:
+            # -f backgrounds after auth; stdio must not be pipes or run()
+            # would wait on the daemonized master
+            result = subprocess.run(
+                ["ssh", *opts, "-o", "ControlMaster=yes",
+                 "-o", f"ControlPersist={MUX_PERSIST}", "-f", "-N",
+                 "-i", str(SSH_KEY), "-p", self.port, f"{self.user}@{self.host}"],
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL, timeout=30,
+            )
+        except subprocess.TimeoutExpired:
+            result = None
+        if result is None or result.returncode != 0:
+            print("⚠️  Could not open a shared SSH connection — using one per command")
+            self.close()
+            return False
+        _SSH_MUX_OPTS[:] = opts + ["-o", "ControlMaster=no"]
+        return True
+
+    def close(self):
+        if self._dir is None:
+            return
+        if _SSH_MUX_OPTS:
+            _SSH_MUX_OPTS.clear()
+            subprocess.run(
+                ["ssh", "-o", f"ControlPath={self.control_path}", "-O", "exit",
+                 "-p", self.port, f"{self.user}@{self.host}"],
+                stdin=subprocess.DEVNULL, capture_output=True, timeout=15,
+            )
+        shutil.rmtree(self._dir, ignore_errors=True)
+        self._dir = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _ThreadedOutput:
+    """sys.stdout stand-in for concurrent targets: each pool thread's prints
+    are held and written as one block when its target finishes, so logs
+    from targets running side by side don't interleave line by line."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        buf = getattr(self._local, "buf", None)
+        if buf is not None:
+            buf.append(text)
+            return len(text)
+        with self._lock:
+            return self._stream.write(text)
+
+    def flush(self):
+        if getattr(self._local, "buf", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    @contextmanager
+    def captured(self):
+        self._local.buf = []
+        try:
+            yield
+        finally:
+            text, self._local.buf = "".join(self._local.buf), None
+            with self._lock:
+                self._stream.write(text)
+                self._stream.flush()
+
+
 def push_to_wordpress(json_path: str):
     """Push JSON to WordPress."""
     creds = get_wp_credentials()
@@ -150,7 +275,7 @@ def sync_index(index_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(index_path),
                 f"{user}@{host}:{remote_path}",
             ],
@@ -188,7 +313,7 @@ def sync_widget(widget_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(widget_path),
                 f"{user}@{host}:{remote_path}",
             ],
@@ -214,7 +339,7 @@ def sync_widget(widget_file: str):
         try:
             subprocess.run(
                 [
-                    "scp", "-i", str(SSH_KEY), "-P", port,
+                    *scp_argv(port),
                     str(js_path),
                     f"{user}@{host}:{remote_js}",
                 ],
@@ -240,7 +365,7 @@ def sync_widget(widget_file: str):
         try:
             subprocess.run(
                 [
-                    "scp", "-i", str(SSH_KEY), "-P", port,
+                    *scp_argv(port),
                     str(css_path),
                     f"{user}@{host}:{remote_css}",
                 ],
@@ -277,7 +402,7 @@ def sync_training(js_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(js_path),
                 f"{user}@{host}:{remote_path}",
             ],
@@ -303,7 +428,7 @@ def sync_training(js_file: str):
         try:
             subprocess.run(
                 [
-                    "scp", "-i", str(SSH_KEY), "-P", port,
+                    *scp_argv(port),
                     str(form_js_path),
                     f"{user}@{host}:{remote_form}",
                 ],
@@ -347,7 +472,7 @@ def sync_guide(guide_dir: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}/guide-assets {remote_base}/media",
             ],
@@ -364,7 +489,7 @@ def sync_guide(guide_dir: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_file),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -385,7 +510,7 @@ def sync_guide(guide_dir: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset_file),
                         f"{user}@{host}:{remote_base}/guide-assets/{asset_file.name}",
                     ],
@@ -411,7 +536,7 @@ def sync_guide(guide_dir: str):
             try:
                 subprocess.run(
                     [
-                        "ssh", "-i", str(SSH_KEY), "-p", port,
+                        *ssh_argv(port),
                         f"{user}@{host}",
                         f"mkdir -p {remote_base}/media",
                     ],
@@ -433,7 +558,7 @@ def sync_guide(guide_dir: str):
                 )
                 ssh_cmd = subprocess.run(
                     [
-                        "ssh", "-i", str(SSH_KEY), "-p", port,
+                        *ssh_argv(port),
                         f"{user}@{host}",
                         f"tar -xf - -C {remote_base}/media",
                     ],
@@ -497,7 +622,7 @@ def sync_guide_cluster(cluster_dir: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base} {chapter_mkdir}",
             ],
@@ -518,7 +643,7 @@ def sync_guide_cluster(cluster_dir: str):
     try:
         tar_cmd = ["tar", "-cf", "-", "-C", str(cluster_path)] + items
         ssh_cmd = [
-            "ssh", "-i", str(SSH_KEY), "-p", port,
+            *ssh_argv(port),
             f"{user}@{host}",
             f"tar -xf - -C {remote_base}",
         ]
@@ -545,7 +670,7 @@ def sync_guide_cluster(cluster_dir: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod -R 755 {remote_base}",
             ],
@@ -584,7 +709,7 @@ def sync_homepage(homepage_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -601,7 +726,7 @@ def sync_homepage(homepage_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -638,12 +763,12 @@ def sync_gravel_tv(gtv_file: str):
 
     try:
         subprocess.run(
-            ["ssh", "-i", str(SSH_KEY), "-p", port, f"{user}@{host}",
+            [*ssh_argv(port), f"{user}@{host}",
              f"mkdir -p {remote_base}"],
             check=True, capture_output=True, text=True, timeout=15,
         )
         subprocess.run(
-            ["scp", "-i", str(SSH_KEY), "-P", port, str(html_path),
+            [*scp_argv(port), str(html_path),
              f"{user}@{host}:{remote_base}/index.html"],
             check=True, capture_output=True, text=True, timeout=30,
         )
@@ -677,7 +802,7 @@ def sync_about(about_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -694,7 +819,7 @@ def sync_about(about_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -716,7 +841,7 @@ def sync_about(about_file: str):
         try:
             subprocess.run(
                 [
-                    "scp", "-i", str(SSH_KEY), "-P", port,
+                    *scp_argv(port),
                     str(avatar_path),
                     f"{user}@{host}:{remote_base}/matti-avatar.png",
                 ],
@@ -736,7 +861,7 @@ def sync_about(about_file: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset),
                         f"{user}@{host}:{remote_assets}/{asset.name}",
                     ],
@@ -772,7 +897,7 @@ def sync_coaching(coaching_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -789,7 +914,7 @@ def sync_coaching(coaching_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -813,7 +938,7 @@ def sync_coaching(coaching_file: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset),
                         f"{user}@{host}:{remote_assets}/{asset.name}",
                     ],
@@ -866,7 +991,7 @@ def sync_success(output_dir: str):
         try:
             subprocess.run(
                 [
-                    "ssh", "-i", str(SSH_KEY), "-p", port,
+                    *ssh_argv(port),
                     f"{user}@{host}",
                     f"mkdir -p {remote_dir}",
                 ],
@@ -883,7 +1008,7 @@ def sync_success(output_dir: str):
         try:
             subprocess.run(
                 [
-                    "scp", "-i", str(SSH_KEY), "-P", port,
+                    *scp_argv(port),
                     str(html_path),
                     f"{user}@{host}:{remote_dir}/index.html",
                 ],
@@ -905,7 +1030,7 @@ def sync_success(output_dir: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset),
                         f"{user}@{host}:{remote_assets}/{asset.name}",
                     ],
@@ -951,7 +1076,7 @@ def sync_consulting(consulting_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -968,7 +1093,7 @@ def sync_consulting(consulting_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -992,7 +1117,7 @@ def sync_consulting(consulting_file: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset),
                         f"{user}@{host}:{remote_assets}/{asset.name}",
                     ],
@@ -1028,7 +1153,7 @@ def sync_consult_intake(consult_intake_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -1045,7 +1170,7 @@ def sync_consult_intake(consult_intake_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -1069,7 +1194,7 @@ def sync_consult_intake(consult_intake_file: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset),
                         f"{user}@{host}:{remote_assets}/{asset.name}",
                     ],
@@ -1107,11 +1232,11 @@ def sync_legal(output_dir: str):
         remote_dir = f"~/www/gravelgodcycling.com/public_html/{slug}"
         try:
             subprocess.run(
-                ["ssh", "-i", str(SSH_KEY), "-p", port, f"{user}@{host}", f"mkdir -p {remote_dir}"],
+                [*ssh_argv(port), f"{user}@{host}", f"mkdir -p {remote_dir}"],
                 check=True, capture_output=True, text=True, timeout=15,
             )
             subprocess.run(
-                ["scp", "-i", str(SSH_KEY), "-P", port, str(html_path), f"{user}@{host}:{remote_dir}/index.html"],
+                [*scp_argv(port), str(html_path), f"{user}@{host}:{remote_dir}/index.html"],
                 check=True, capture_output=True, text=True, timeout=30,
             )
             uploaded.append(slug)
@@ -1130,7 +1255,7 @@ def sync_legal(output_dir: str):
         for asset in assets_dir.glob(pattern):
             try:
                 subprocess.run(
-                    ["scp", "-i", str(SSH_KEY), "-P", port, str(asset), f"{user}@{host}:{remote_assets}/{asset.name}"],
+                    [*scp_argv(port), str(asset), f"{user}@{host}:{remote_assets}/{asset.name}"],
                     check=True, capture_output=True, text=True, timeout=30,
                 )
             except subprocess.CalledProcessError:
@@ -1154,7 +1279,7 @@ def sync_consent():
     remote = "~/www/gravelgodcycling.com/public_html/wp-content/mu-plugins/gg-cookie-consent.php"
     try:
         subprocess.run(
-            ["scp", "-i", str(SSH_KEY), "-P", port, str(mu_plugin), f"{user}@{host}:{remote}"],
+            [*scp_argv(port), str(mu_plugin), f"{user}@{host}:{remote}"],
             check=True, capture_output=True, text=True, timeout=30,
         )
         print("✓ Deployed gg-cookie-consent.php mu-plugin")
@@ -1183,7 +1308,7 @@ def sync_training_plans(training_plans_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -1200,7 +1325,7 @@ def sync_training_plans(training_plans_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -1226,7 +1351,7 @@ def sync_training_plans(training_plans_file: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset),
                         f"{user}@{host}:{remote_assets}/{asset.name}",
                     ],
@@ -1262,7 +1387,7 @@ def sync_coaching_apply(apply_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -1279,7 +1404,7 @@ def sync_coaching_apply(apply_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -1300,37 +1425,133 @@ def sync_coaching_apply(apply_file: str):
     return f"{wp_url}/coaching/apply/"
 
 
-def sync_og(og_dir: str):
-    """Upload OG images to /og/ on SiteGround via tar+ssh pipe.
+# ── Delta tar+ssh deploys ─────────────────────────────────────
+# Tree targets upload only what changed since their last deploy (see
+# scripts/deploy_delta.py) and remove the files they deployed that no longer
+# exist locally.
+
+# --full-deploy: ignore deploy records and upload every file again
+FULL_DEPLOY = False
+
+# Site paths (/race/x/) changed by delta targets this run, for purge_cache()
+DELTA_CHANGED_PATHS: set = set()
+
+# --sync-* names backed by _delta_tar_sync
+DELTA_TARGETS = frozenset({
+    "sync-og", "sync-tp", "sync-pages", "sync-photos", "sync-prep-kits",
+    "sync-plan-pages", "sync-tire-guides", "sync-series", "sync-blog",
+})
+
 
-    Only syncs *.jpg files (ignores stale .png artifacts).
-    Uses tar pipe for efficiency — all files in one connection.
+def _stream_tar(ssh, files: dict, remote_cmd: str, timeout: int = 300) -> str | None:
+    """Pipe files ({archive name: local path}) as a tar stream into
+    remote_cmd's stdin over ssh — no staging copy, no local tar process.
+    Returns None on success, else an error message.
+    """
+    host, user, port = ssh
+    proc = subprocess.Popen([*ssh_argv(port), f"{user}@{host}", remote_cmd],
+                            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE)
+    # Drain stderr on the side so a chatty remote can't block our writes
+    stderr = []
+    reader = threading.Thread(target=lambda: stderr.append(proc.stderr.read()), daemon=True)
+    reader.start()
+    timed_out = threading.Event()
+
+    def _kill():
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, _kill)
+    watchdog.start()
+    write_error = None
+    try:
+        write_tar(files, proc.stdin)
+    except OSError as e:  # BrokenPipeError when ssh exits early
+        write_error = e
+    finally:
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        proc.wait()
+        watchdog.cancel()
+        reader.join()
+
+    if timed_out.is_set():
+        return f"Upload timed out ({timeout}s)"
+    if proc.returncode != 0:
+        return f"tar+ssh failed: {b''.join(stderr).decode(errors='replace').strip()}"
+    if write_error:
+        return f"tar+ssh failed: {write_error}"
+    return None
+
+
+def _delta_tar_sync(ssh, files: dict, remote_base: str, label: str, timeout: int = 300,
+                    retain: tuple = ()):
+    """Upload the changed entries of files ({archive name: local path}) to
+    remote_base in one tar+ssh pipe, then delete stale files this target
+    deployed before (except names under a retain prefix). Returns the
+    DeltaPlan, or None on failure.
     """
-    ssh = get_ssh_credentials()
-    if not ssh:
-        return None
     host, user, port = ssh
+    # Keyed by label too: several targets share public_html/race
+    record = DeployRecord(target_key(label, user, host, remote_base), full=FULL_DEPLOY)
+    plan = record.plan(files, retain=retain)
+    print(f"  {len(plan.upload)} {label} files changed, {plan.unchanged} unchanged, "
+          f"{len(plan.delete)} stale")
+    if plan.deletes_held:
+        print(f"⚠️  {len(plan.held)} previously deployed {label} files are missing locally — "
+              f"not deleting them (partial output dir?)")
+
+    if plan.upload:
+        print(f"  Uploading {len(plan.upload)} {label} files via tar+ssh...")
+        error = _stream_tar(ssh, plan.upload,
+                            f"mkdir -p {remote_base} && tar -xf - -C {remote_base}", timeout)
+        if error:
+            print(f"✗ {error}")
+            return None
 
-    og_path = Path(og_dir)
-    if not og_path.exists():
-        print(f"✗ OG image directory not found: {og_path}")
-        return None
+    if plan.delete:
+        # Archive names are quoted; remote_base stays bare so ~ expands.
+        # rmdir only succeeds on directories the deletes left empty.
+        names = " ".join(shlex.quote(n) for n in plan.delete)
+        parents = sorted({str(Path(n).parent) for n in plan.delete if "/" in n},
+                         key=len, reverse=True)
+        cmd = f"cd {remote_base} && rm -f -- {names}"
+        if parents:
+            cmd += f" && (rmdir -- {' '.join(shlex.quote(p) for p in parents)} 2>/dev/null; true)"
+        try:
+            subprocess.run(
+                [*ssh_argv(port), f"{user}@{host}", cmd],
+                check=True, capture_output=True, text=True, timeout=60,
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"✗ Failed to delete stale {label} files: {e.stderr.strip()}")
+            return None
+        except subprocess.TimeoutExpired:
+            print("✗ Stale file delete timed out (60s)")
+            return None
+        print(f"  Removed {len(plan.delete)} stale files: "
+              f"{' '.join(plan.delete[:6])}{' …' if len(plan.delete) > 6 else ''}")
 
-    jpg_files = list(og_path.glob("*.jpg"))
-    if not jpg_files:
-        print(f"✗ No .jpg files found in {og_path}")
-        return None
+    record.commit(plan)
+    for name in plan.changed:
+        url_path = public_url_path(remote_base, name)
+        if url_path:
+            DELTA_CHANGED_PATHS.add(url_path)
+    return plan
 
-    remote_base = "~/www/gravelgodcycling.com/public_html/og"
 
-    # Create remote directory
+def _mkdir_remote(ssh, remote_base: str, mode: str | None = None) -> bool:
+    """mkdir -p (and optionally chmod) a remote directory."""
+    host, user, port = ssh
+    cmd = f"mkdir -p {remote_base}"
+    if mode:
+        cmd += f" && chmod {mode} {remote_base}"
     try:
         subprocess.run(
-            [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"mkdir -p {remote_base}",
-            ],
+            [*ssh_argv(port), f"{user}@{host}", cmd],
             check=True,
             capture_output=True,
             text=True,
@@ -1338,119 +1559,87 @@ def sync_og(og_dir: str):
         )
     except subprocess.CalledProcessError as e:
         print(f"✗ Failed to create remote directory: {e.stderr.strip()}")
-        return None
+        return False
+    return True
 
-    # tar+ssh pipe: local tar → ssh → remote tar extract
-    # Only include *.jpg files
-    filenames = [f.name for f in jpg_files]
-    print(f"  Uploading {len(filenames)} OG images via tar+ssh...")
 
-    try:
-        tar_cmd = ["tar", "-cf", "-", "-C", str(og_path)] + filenames
-        ssh_cmd = [
-            "ssh", "-i", str(SSH_KEY), "-p", port,
-            f"{user}@{host}",
-            f"tar -xf - -C {remote_base}",
-        ]
+def _flat_pages(html_files, subpath: str = "") -> dict:
+    """{slug}.html → {slug}/{subpath}index.html archive names."""
+    return {f"{f.stem}/{subpath}index.html": f for f in html_files}
 
-        tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-        ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        tar_proc.stdout.close()
-        stdout, stderr = ssh_proc.communicate(timeout=120)
 
-        if ssh_proc.returncode != 0:
-            print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-            return None
+def _tree_files(root: Path, prefix: str = "") -> dict:
+    """Every file under root, keyed by prefix + its path relative to root."""
+    return {
+        prefix + p.relative_to(root).as_posix(): p
+        for p in sorted(root.rglob("*")) if p.is_file()
+    }
 
-        wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-        print(f"✓ Uploaded {len(filenames)} OG images to {wp_url}/og/")
-        return f"{wp_url}/og/"
-    except subprocess.TimeoutExpired:
-        print("✗ Upload timed out (120s)")
-        tar_proc.kill()
-        ssh_proc.kill()
+
+def sync_og(og_dir: str):
+    """Upload OG images to /og/ on SiteGround via tar+ssh pipe.
+
+    Only syncs *.jpg files (ignores stale .png artifacts), and only the
+    ones that changed since the last deploy.
+    """
+    ssh = get_ssh_credentials()
+    if not ssh:
         return None
-    except Exception as e:
-        print(f"✗ Error uploading OG images: {e}")
+
+    og_path = Path(og_dir)
+    if not og_path.exists():
+        print(f"✗ OG image directory not found: {og_path}")
+        return None
+
+    jpg_files = sorted(og_path.glob("*.jpg"))
+    if not jpg_files:
+        print(f"✗ No .jpg files found in {og_path}")
         return None
 
+    remote_base = "~/www/gravelgodcycling.com/public_html/og"
+
+    plan = _delta_tar_sync(ssh, {f.name: f for f in jpg_files}, remote_base,
+                           "OG image", timeout=120)
+    if plan is None:
+        return None
+
+    wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
+    print(f"✓ Synced {len(jpg_files)} OG images to {wp_url}/og/ ({len(plan.upload)} uploaded)")
+    return f"{wp_url}/og/"
+
 
 def sync_tp(tp_dir: str):
     """Upload TP-listing images (header + includes-grid) to /tp/ on
     SiteGround via tar+ssh pipe. Same pattern as sync_og — only syncs
-    *.jpg files (ignores stale artifacts), tar pipe for one connection.
+    *.jpg files (ignores stale artifacts) that changed since the last deploy.
     Does NOT upload manifest.json (that's a build-time artifact, not a
     hosted asset the TP descriptions reference).
     """
     ssh = get_ssh_credentials()
     if not ssh:
         return None
-    host, user, port = ssh
 
     tp_path = Path(tp_dir)
     if not tp_path.exists():
         print(f"✗ TP listing image directory not found: {tp_path}")
         return None
 
-    jpg_files = list(tp_path.glob("*.jpg"))
+    jpg_files = sorted(tp_path.glob("*.jpg"))
     if not jpg_files:
         print(f"✗ No .jpg files found in {tp_path}")
         return None
 
     remote_base = "~/www/gravelgodcycling.com/public_html/tp"
 
-    # Create remote directory
-    try:
-        subprocess.run(
-            [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"mkdir -p {remote_base}",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=15,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to create remote directory: {e.stderr.strip()}")
+    plan = _delta_tar_sync(ssh, {f.name: f for f in jpg_files}, remote_base,
+                           "TP listing image", timeout=120)
+    if plan is None:
         return None
 
-    # tar+ssh pipe: local tar → ssh → remote tar extract
-    # Only include *.jpg files
-    filenames = [f.name for f in jpg_files]
-    print(f"  Uploading {len(filenames)} TP listing images via tar+ssh...")
-
-    try:
-        tar_cmd = ["tar", "-cf", "-", "-C", str(tp_path)] + filenames
-        ssh_cmd = [
-            "ssh", "-i", str(SSH_KEY), "-p", port,
-            f"{user}@{host}",
-            f"tar -xf - -C {remote_base}",
-        ]
-
-        tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-        ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        tar_proc.stdout.close()
-        stdout, stderr = ssh_proc.communicate(timeout=120)
-
-        if ssh_proc.returncode != 0:
-            print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-            return None
-
-        wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-        print(f"✓ Uploaded {len(filenames)} TP listing images to {wp_url}/tp/")
-        return f"{wp_url}/tp/"
-    except subprocess.TimeoutExpired:
-        print("✗ Upload timed out (120s)")
-        tar_proc.kill()
-        ssh_proc.kill()
-        return None
-    except Exception as e:
-        print(f"✗ Error uploading TP listing images: {e}")
-        return None
+    wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
+    print(f"✓ Synced {len(jpg_files)} TP listing images to {wp_url}/tp/ "
+          f"({len(plan.upload)} uploaded)")
+    return f"{wp_url}/tp/"
 
 
 # Utility pages whose canonical URL is the site ROOT — sync_pages must not
@@ -1466,8 +1655,9 @@ def sync_pages(pages_dir: str):
     """Upload race pages to /race/ on SiteGround via tar+ssh pipe.
 
     Converts flat {slug}.html files to {slug}/index.html directory structure.
-    Also uploads shared assets/ directory. Ensures /race/ directory has 755
-    permissions so Apache/Googlebot can access the pages.
+    Also uploads shared assets/ directory. Only files changed since the last
+    deploy are sent. Ensures /race/ directory has 755 permissions so
+    Apache/Googlebot can access the pages.
     """
     ssh = get_ssh_credentials()
     if not ssh:
@@ -1495,86 +1685,30 @@ def sync_pages(pages_dir: str):
     remote_base = "~/www/gravelgodcycling.com/public_html/race"
 
     # Create remote directory with correct permissions
-    try:
-        subprocess.run(
-            [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"mkdir -p {remote_base} && chmod 755 {remote_base}",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=15,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to create remote directory: {e.stderr.strip()}")
+    if not _mkdir_remote(ssh, remote_base, "755"):
         return None
 
-    # Build tar archive with {slug}/index.html directory structure
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-        page_count = 0
-        for html_file in html_files:
-            slug = html_file.stem
-            slug_dir = tmpdir / slug
-            slug_dir.mkdir()
-            shutil.copy2(html_file, slug_dir / "index.html")
-            page_count += 1
-
-        # Also include pre-built subdirectories (e.g., tier-1/, vs pages, state hubs, calendar)
-        SKIP_DIRS = {"assets", "og", "prep-kit", "blog", "race"}
-        for subdir in sorted(pages_path.iterdir()):
-            if subdir.is_dir() and subdir.name not in SKIP_DIRS:
-                # Check for index.html directly or in nested subdirs (e.g., calendar/2026/)
-                has_index = (subdir / "index.html").exists()
-                has_nested = any(subdir.rglob("index.html")) if not has_index else False
-                if has_index or has_nested:
-                    dst = tmpdir / subdir.name
-                    shutil.copytree(subdir, dst, dirs_exist_ok=True)
-                    page_count += 1
-
-        # Also include assets/ if present
-        assets_src = pages_path / "assets"
-        if assets_src.exists():
-            shutil.copytree(assets_src, tmpdir / "assets", dirs_exist_ok=True)
-            print(f"  Including shared assets/")
-
-        print(f"  Uploading {page_count} race pages via tar+ssh...")
-
-        try:
-            # List all items in tmpdir for tar
-            items = [p.name for p in sorted(tmpdir.iterdir())]
-            tar_cmd = ["tar", "-cf", "-", "-C", str(tmpdir)] + items
-            ssh_cmd = [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"tar -xf - -C {remote_base}",
-            ]
-
-            tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-            ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            tar_proc.stdout.close()
-            stdout, stderr = ssh_proc.communicate(timeout=300)
+    # {slug}/index.html pages, pre-built subdirectories (e.g., tier-1/, vs
+    # pages, state hubs, calendar/2026/) and the shared assets/
+    files = _flat_pages(html_files)
+    for subdir in subdirs_with_pages:
+        files.update(_tree_files(subdir, f"{subdir.name}/"))
+    assets_src = pages_path / "assets"
+    if assets_src.exists():
+        files.update(_tree_files(assets_src, "assets/"))
+        print(f"  Including shared assets/")
+    page_count = len(html_files) + len(subdirs_with_pages)
 
-            if ssh_proc.returncode != 0:
-                print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-                return None
-        except subprocess.TimeoutExpired:
-            print("✗ Upload timed out (300s)")
-            tar_proc.kill()
-            ssh_proc.kill()
-            return None
-        except Exception as e:
-            print(f"✗ Error uploading race pages: {e}")
-            return None
+    # Old hashed CSS/JS stay up: browser- and CDN-cached pages still load them
+    plan = _delta_tar_sync(ssh, files, remote_base, "race page", retain=("assets/",))
+    if plan is None:
+        return None
 
     # Fix permissions on /race/ directory (prevents 403 for Googlebot)
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 755 {remote_base}",
             ],
@@ -1583,11 +1717,12 @@ def sync_pages(pages_dir: str):
             text=True,
             timeout=15,
         )
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         print("⚠️  Warning: could not fix /race/ permissions — verify manually")
 
     wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-    print(f"✓ Uploaded {page_count} race pages to {wp_url}/race/")
+    print(f"✓ Synced {page_count} race pages to {wp_url}/race/ "
+          f"({len(plan.upload)} files uploaded, {len(plan.delete)} removed)")
     return f"{wp_url}/race/"
 
 
@@ -1872,7 +2007,7 @@ def sync_redirects():
     try:
         result = subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"cat {remote_htaccess}",
             ],
@@ -1896,7 +2031,7 @@ def sync_redirects():
     # Keep a dated remote backup so a bad block is one `cp` from reverted.
     backup = subprocess.run(
         [
-            "ssh", "-i", str(SSH_KEY), "-p", port,
+            *ssh_argv(port),
             f"{user}@{host}",
             f"cp {remote_htaccess} {remote_htaccess}.bak-$(date +%Y%m%d-%H%M%S)",
         ],
@@ -1924,7 +2059,7 @@ def sync_redirects():
     try:
         proc = subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"cat > {remote_htaccess}",
             ],
@@ -1976,7 +2111,7 @@ def sync_sitemap():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(race_sitemap),
                 f"{user}@{host}:{remote_root}/race-sitemap.xml",
             ],
@@ -1997,7 +2132,7 @@ def sync_sitemap():
         try:
             subprocess.run(
                 [
-                    "scp", "-i", str(SSH_KEY), "-P", port,
+                    *scp_argv(port),
                     str(blog_sitemap),
                     f"{user}@{host}:{remote_root}/blog-sitemap.xml",
                 ],
@@ -2044,7 +2179,7 @@ def sync_sitemap():
     try:
         proc = subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"cat > {remote_root}/sitemap.xml",
             ],
@@ -2101,7 +2236,7 @@ def sync_noindex():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_path}",
             ],
@@ -2113,7 +2248,7 @@ def sync_noindex():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(plugin_file),
                 f"{user}@{host}:{remote_path}/gg-noindex.php",
             ],
@@ -2174,7 +2309,7 @@ def sync_meta_descriptions():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {mu_plugins_path} {uploads_path}",
             ],
@@ -2188,7 +2323,7 @@ def sync_meta_descriptions():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(json_file),
                 f"{user}@{host}:{uploads_path}/gg-meta-descriptions.json",
             ],
@@ -2202,7 +2337,7 @@ def sync_meta_descriptions():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(plugin_file),
                 f"{user}@{host}:{mu_plugins_path}/gg-meta-descriptions.php",
             ],
@@ -2216,7 +2351,7 @@ def sync_meta_descriptions():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 644 {mu_plugins_path}/gg-meta-descriptions.php "
                 f"{uploads_path}/gg-meta-descriptions.json",
@@ -2255,7 +2390,7 @@ def sync_ctas():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(plugin_file),
                 f"{user}@{host}:{remote_path}/gg-race-ctas.php",
             ],
@@ -2293,7 +2428,7 @@ def sync_training_form():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(plugin_file),
                 f"{user}@{host}:{remote_path}/gg-training-form.php",
             ],
@@ -2329,7 +2464,7 @@ def sync_ga4():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(plugin_file),
                 f"{user}@{host}:{remote_path}/gg-ga4.php",
             ],
@@ -2365,7 +2500,7 @@ def sync_header():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(plugin_file),
                 f"{user}@{host}:{remote_path}/gg-header.php",
             ],
@@ -2419,7 +2554,7 @@ def sync_ab():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_ab} && chmod 755 {remote_ab} && "
                 f"rm -f {remote_ab}/gg-ab-tests.*.js",
@@ -2441,7 +2576,7 @@ def sync_ab():
         try:
             subprocess.run(
                 [
-                    "scp", "-i", str(SSH_KEY), "-P", port,
+                    *scp_argv(port),
                     str(local),
                     f"{user}@{host}:{remote}",
                 ],
@@ -2459,28 +2594,45 @@ def sync_ab():
     return True
 
 
-def purge_cache():
-    """Purge all SiteGround caches via wp-cli (static, dynamic, memcached, opcache)."""
+# Above this many changed paths one full purge beats per-URL purges
+PURGE_URL_LIMIT = 50
+
+
+def purge_cache(paths=None):
+    """Purge SiteGround caches via wp-cli.
+
+    With paths (site paths such as /race/unbound-200/), purges just those
+    URLs; otherwise purges everything (static, dynamic, memcached, opcache).
+    """
     ssh = get_ssh_credentials()
     if not ssh:
         return False
     host, user, port = ssh
 
     wp_path = "$HOME/www/gravelgodcycling.com/public_html"
+    if paths:
+        wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com").rstrip("/")
+        remote_cmd = " && ".join(
+            f"wp --path={wp_path} sg purge {shlex.quote(wp_url + path)}" for path in paths
+        ) + " 2>&1"
+        scope = f"{len(paths)} changed URLs"
+    else:
+        remote_cmd = f"wp --path={wp_path} sg purge 2>&1"
+        scope = "static, dynamic, memcached, opcache"
     try:
         result = subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
-                f"wp --path={wp_path} sg purge 2>&1",
+                remote_cmd,
             ],
             capture_output=True,
             text=True,
-            timeout=30,
+            timeout=30 + (len(paths) if paths else 0),
         )
         output = result.stdout.strip()
         if result.returncode == 0:
-            print(f"✓ SiteGround cache purged (static, dynamic, memcached, opcache)")
+            print(f"✓ SiteGround cache purged ({scope})")
             return True
         else:
             print(f"✗ Cache purge failed: {output}")
@@ -2498,13 +2650,13 @@ def purge_cache():
 def sync_photos(photos_dir: str):
     """Upload race photos to /race-photos/ on SiteGround via tar+ssh.
 
-    Uploads {slug}/ directories containing optimized JPG photos.
+    Uploads {slug}/ directories containing optimized JPG photos, sending
+    only the files changed since the last deploy.
     Photos are served from /race-photos/{slug}/{filename}.
     """
     ssh = get_ssh_credentials()
     if not ssh:
         return None
-    host, user, port = ssh
 
     photos_path = Path(photos_dir)
     if not photos_path.exists():
@@ -2520,56 +2672,19 @@ def sync_photos(photos_dir: str):
 
     remote_base = "~/www/gravelgodcycling.com/public_html/race-photos"
 
-    # Create remote directory
-    try:
-        subprocess.run(
-            [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"mkdir -p {remote_base}",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=15,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to create remote directory: {e.stderr.strip()}")
-        return None
-
-    # tar+ssh pipe: upload all slug directories
-    items = [d.name for d in slug_dirs]
-    total_photos = sum(len(list(d.glob("*.jpg"))) for d in slug_dirs)
-    print(f"  Uploading {total_photos} photos from {len(slug_dirs)} races via tar+ssh...")
-
-    try:
-        tar_cmd = ["tar", "-cf", "-", "-C", str(photos_path)] + items
-        ssh_cmd = [
-            "ssh", "-i", str(SSH_KEY), "-p", port,
-            f"{user}@{host}",
-            f"tar -xf - -C {remote_base}",
-        ]
-
-        tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-        ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        tar_proc.stdout.close()
-        stdout, stderr = ssh_proc.communicate(timeout=300)
+    files = {}
+    for d in slug_dirs:
+        files.update(_tree_files(d, f"{d.name}/"))
+    total_photos = sum(1 for name in files if name.endswith(".jpg"))
+    print(f"  {total_photos} photos from {len(slug_dirs)} races")
 
-        if ssh_proc.returncode != 0:
-            print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-            return None
-    except subprocess.TimeoutExpired:
-        print("✗ Upload timed out (300s)")
-        tar_proc.kill()
-        ssh_proc.kill()
-        return None
-    except Exception as e:
-        print(f"✗ Error uploading photos: {e}")
+    plan = _delta_tar_sync(ssh, files, remote_base, "photo")
+    if plan is None:
         return None
 
     wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-    print(f"✓ Uploaded {total_photos} photos ({len(slug_dirs)} races) to {wp_url}/race-photos/")
+    print(f"✓ Synced {total_photos} photos ({len(slug_dirs)} races) to {wp_url}/race-photos/ "
+          f"({len(plan.upload)} uploaded)")
     return f"{wp_url}/race-photos/"
 
 
@@ -2577,12 +2692,11 @@ def sync_prep_kits(prep_kit_dir: str):
     """Upload prep kit pages to /race/{slug}/prep-kit/ on SiteGround via tar+ssh.
 
     Converts flat {slug}.html files to {slug}/prep-kit/index.html directory
-    structure under /race/. Same tar+ssh pattern as sync_pages().
+    structure under /race/. Same delta tar+ssh pattern as sync_pages().
     """
     ssh = get_ssh_credentials()
     if not ssh:
         return None
-    host, user, port = ssh
 
     pk_path = Path(prep_kit_dir)
     if not pk_path.exists():
@@ -2596,59 +2710,25 @@ def sync_prep_kits(prep_kit_dir: str):
 
     remote_base = "~/www/gravelgodcycling.com/public_html/race"
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-        page_count = 0
-        for html_file in html_files:
-            slug = html_file.stem
-            pk_dir = tmpdir / slug / "prep-kit"
-            pk_dir.mkdir(parents=True)
-            shutil.copy2(html_file, pk_dir / "index.html")
-            page_count += 1
-
-        print(f"  Uploading {page_count} prep kit pages via tar+ssh...")
-
-        try:
-            items = [p.name for p in sorted(tmpdir.iterdir())]
-            tar_cmd = ["tar", "-cf", "-", "-C", str(tmpdir)] + items
-            ssh_cmd = [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"tar -xf - -C {remote_base}",
-            ]
-
-            tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-            ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            tar_proc.stdout.close()
-            stdout, stderr = ssh_proc.communicate(timeout=300)
-
-            if ssh_proc.returncode != 0:
-                print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-                return None
-        except subprocess.TimeoutExpired:
-            print("✗ Upload timed out (300s)")
-            tar_proc.kill()
-            ssh_proc.kill()
-            return None
-        except Exception as e:
-            print(f"✗ Error uploading prep kit pages: {e}")
-            return None
+    plan = _delta_tar_sync(ssh, _flat_pages(html_files, "prep-kit/"), remote_base,
+                           "prep kit page")
+    if plan is None:
+        return None
 
     wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-    print(f"✓ Uploaded {page_count} prep kit pages to {wp_url}/race/*/prep-kit/")
+    print(f"✓ Synced {len(html_files)} prep kit pages to {wp_url}/race/*/prep-kit/ "
+          f"({len(plan.upload)} uploaded)")
     return f"{wp_url}/race/"
 
 def sync_plan_pages(plan_dir: str):
     """Upload training-plan pages to /race/{slug}/training-plan/ on SiteGround via tar+ssh.
 
     Converts flat {slug}.html files to {slug}/training-plan/index.html directory
-    structure under /race/. Same tar+ssh pattern as sync_pages().
+    structure under /race/. Same delta tar+ssh pattern as sync_pages().
     """
     ssh = get_ssh_credentials()
     if not ssh:
         return None
-    host, user, port = ssh
 
     plan_path = Path(plan_dir)
     if not plan_path.exists():
@@ -2662,47 +2742,14 @@ def sync_plan_pages(plan_dir: str):
 
     remote_base = "~/www/gravelgodcycling.com/public_html/race"
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-        page_count = 0
-        for html_file in html_files:
-            slug = html_file.stem
-            plan_dir_tmp = tmpdir / slug / "training-plan"
-            plan_dir_tmp.mkdir(parents=True)
-            shutil.copy2(html_file, plan_dir_tmp / "index.html")
-            page_count += 1
-
-        print(f"  Uploading {page_count} training-plan pages via tar+ssh...")
-
-        try:
-            items = [p.name for p in sorted(tmpdir.iterdir())]
-            tar_cmd = ["tar", "-cf", "-", "-C", str(tmpdir)] + items
-            ssh_cmd = [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"tar -xf - -C {remote_base}",
-            ]
-
-            tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-            ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            tar_proc.stdout.close()
-            stdout, stderr = ssh_proc.communicate(timeout=300)
-
-            if ssh_proc.returncode != 0:
-                print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-                return None
-        except subprocess.TimeoutExpired:
-            print("✗ Upload timed out (300s)")
-            tar_proc.kill()
-            ssh_proc.kill()
-            return None
-        except Exception as e:
-            print(f"✗ Error uploading training-plan pages: {e}")
-            return None
+    plan = _delta_tar_sync(ssh, _flat_pages(html_files, "training-plan/"), remote_base,
+                           "training-plan page")
+    if plan is None:
+        return None
 
     wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-    print(f"✓ Uploaded {page_count} training-plan pages to {wp_url}/race/*/training-plan/")
+    print(f"✓ Synced {len(html_files)} training-plan pages to {wp_url}/race/*/training-plan/ "
+          f"({len(plan.upload)} uploaded)")
     return f"{wp_url}/race/"
 
 
@@ -2732,7 +2779,7 @@ def sync_tire_pages(tire_pages_dir: str):
     print(f"  Uploading {len(dirs)} /tire/ pages via tar+ssh...")
     try:
         tar_cmd = ["tar", "-cf", "-", "-C", str(src)] + dirs
-        ssh_cmd = ["ssh", "-i", str(SSH_KEY), "-p", port, f"{user}@{host}",
+        ssh_cmd = [*ssh_argv(port), f"{user}@{host}",
                    f"mkdir -p {remote_base} && tar -xf - -C {remote_base}"]
         tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
         ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
@@ -2749,7 +2796,7 @@ def sync_tire_pages(tire_pages_dir: str):
     # Reconcile: delete remote orphan dirs (bounded to /tire/, name-validated).
     try:
         result = subprocess.run(
-            ["ssh", "-i", str(SSH_KEY), "-p", port, f"{user}@{host}",
+            [*ssh_argv(port), f"{user}@{host}",
              f"ls {remote_base}"],
             capture_output=True, text=True, timeout=30)
         if result.returncode != 0:
@@ -2764,7 +2811,7 @@ def sync_tire_pages(tire_pages_dir: str):
                 # quoting the ~-path would suppress tilde expansion and no-op.
                 rm_names = " ".join(orphans)
                 rm = subprocess.run(
-                    ["ssh", "-i", str(SSH_KEY), "-p", port, f"{user}@{host}",
+                    [*ssh_argv(port), f"{user}@{host}",
                      f"cd {remote_base} && rm -rf {rm_names} && ls | wc -l"],
                     capture_output=True, text=True, timeout=60)
                 if rm.returncode != 0:
@@ -2786,12 +2833,11 @@ def sync_tire_guides(tire_guide_dir: str):
     """Upload tire guide pages to /race/{slug}/tires/ on SiteGround via tar+ssh.
 
     Converts flat {slug}.html files to {slug}/tires/index.html directory
-    structure under /race/. Same tar+ssh pattern as sync_prep_kits().
+    structure under /race/. Same delta tar+ssh pattern as sync_prep_kits().
     """
     ssh = get_ssh_credentials()
     if not ssh:
         return None
-    host, user, port = ssh
 
     tg_path = Path(tire_guide_dir)
     if not tg_path.exists():
@@ -2805,47 +2851,14 @@ def sync_tire_guides(tire_guide_dir: str):
 
     remote_base = "~/www/gravelgodcycling.com/public_html/race"
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-        page_count = 0
-        for html_file in html_files:
-            slug = html_file.stem
-            tg_dir = tmpdir / slug / "tires"
-            tg_dir.mkdir(parents=True)
-            shutil.copy2(html_file, tg_dir / "index.html")
-            page_count += 1
-
-        print(f"  Uploading {page_count} tire guide pages via tar+ssh...")
-
-        try:
-            items = [p.name for p in sorted(tmpdir.iterdir())]
-            tar_cmd = ["tar", "-cf", "-", "-C", str(tmpdir)] + items
-            ssh_cmd = [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"tar -xf - -C {remote_base}",
-            ]
-
-            tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-            ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            tar_proc.stdout.close()
-            stdout, stderr = ssh_proc.communicate(timeout=300)
-
-            if ssh_proc.returncode != 0:
-                print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-                return None
-        except subprocess.TimeoutExpired:
-            print("✗ Upload timed out (300s)")
-            tar_proc.kill()
-            ssh_proc.kill()
-            return None
-        except Exception as e:
-            print(f"✗ Error uploading tire guide pages: {e}")
-            return None
+    plan = _delta_tar_sync(ssh, _flat_pages(html_files, "tires/"), remote_base,
+                           "tire guide page")
+    if plan is None:
+        return None
 
     wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-    print(f"✓ Uploaded {page_count} tire guide pages to {wp_url}/race/*/tires/")
+    print(f"✓ Synced {len(html_files)} tire guide pages to {wp_url}/race/*/tires/ "
+          f"({len(plan.upload)} uploaded)")
     return f"{wp_url}/race/"
 
 
@@ -2853,7 +2866,7 @@ def sync_series(series_dir: str):
     """Upload series hub pages to /race/series/{slug}/ on SiteGround via tar+ssh.
 
     Each series hub is already structured as {slug}/index.html under the
-    series output directory. Deploys to /race/series/ on the server.
+    series output directory. Deploys changed hubs to /race/series/.
     """
     ssh = get_ssh_credentials()
     if not ssh:
@@ -2877,57 +2890,23 @@ def sync_series(series_dir: str):
     remote_base = "~/www/gravelgodcycling.com/public_html/race/series"
 
     # Create remote directory with correct permissions
-    try:
-        subprocess.run(
-            [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"mkdir -p {remote_base} && chmod 755 {remote_base}",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-            timeout=15,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to create remote directory: {e.stderr.strip()}")
+    if not _mkdir_remote(ssh, remote_base, "755"):
         return None
 
+    files = {}
+    for d in series_dirs:
+        files.update(_tree_files(d, f"{d.name}/"))
     page_count = len(series_dirs)
-    print(f"  Uploading {page_count} series hub pages via tar+ssh...")
-
-    try:
-        items = [d.name for d in series_dirs]
-        tar_cmd = ["tar", "-cf", "-", "-C", str(series_path)] + items
-        ssh_cmd = [
-            "ssh", "-i", str(SSH_KEY), "-p", port,
-            f"{user}@{host}",
-            f"tar -xf - -C {remote_base}",
-        ]
 
-        tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-        ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        tar_proc.stdout.close()
-        stdout, stderr = ssh_proc.communicate(timeout=300)
-
-        if ssh_proc.returncode != 0:
-            print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-            return None
-    except subprocess.TimeoutExpired:
-        print("✗ Upload timed out (300s)")
-        tar_proc.kill()
-        ssh_proc.kill()
-        return None
-    except Exception as e:
-        print(f"✗ Error uploading series hub pages: {e}")
+    plan = _delta_tar_sync(ssh, files, remote_base, "series hub")
+    if plan is None:
         return None
 
     # Fix permissions
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 755 {remote_base}",
             ],
@@ -2936,11 +2915,12 @@ def sync_series(series_dir: str):
             text=True,
             timeout=15,
         )
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
         print("⚠️  Warning: could not fix /race/series/ permissions — verify manually")
 
     wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-    print(f"✓ Uploaded {page_count} series hub pages to {wp_url}/race/series/")
+    print(f"✓ Synced {page_count} series hub pages to {wp_url}/race/series/ "
+          f"({len(plan.upload)} files uploaded)")
     return f"{wp_url}/race/series/"
 
 
@@ -2969,7 +2949,7 @@ def sync_blog_index(index_page: str, index_json: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -2986,7 +2966,7 @@ def sync_blog_index(index_page: str, index_json: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(page_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -3004,7 +2984,7 @@ def sync_blog_index(index_page: str, index_json: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(json_path),
                 f"{user}@{host}:{remote_base}/blog-index.json",
             ],
@@ -3022,7 +3002,7 @@ def sync_blog_index(index_page: str, index_json: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 755 {remote_base}",
             ],
@@ -3043,7 +3023,7 @@ def sync_blog(blog_dir: str):
     """Upload blog preview pages to /blog/{slug}/ on SiteGround via tar+ssh.
 
     Converts flat {slug}.html files to {slug}/index.html directory
-    structure under /blog/. Same tar+ssh pattern as sync_prep_kits().
+    structure under /blog/. Same delta tar+ssh pattern as sync_prep_kits().
     """
     ssh = get_ssh_credentials()
     if not ssh:
@@ -3062,47 +3042,22 @@ def sync_blog(blog_dir: str):
 
     remote_base = "~/www/gravelgodcycling.com/public_html/blog"
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-        page_count = 0
-        for html_file in html_files:
-            slug = html_file.stem
-            slug_dir = tmpdir / slug
-            slug_dir.mkdir(parents=True)
-            shutil.copy2(html_file, slug_dir / "index.html")
-            page_count += 1
-
-        print(f"  Uploading {page_count} blog pages via tar+ssh...")
-
-        try:
-            items = [p.name for p in sorted(tmpdir.iterdir())]
-            tar_cmd = ["tar", "-cf", "-", "-C", str(tmpdir)] + items
-            ssh_cmd = [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
-                f"{user}@{host}",
-                f"mkdir -p {remote_base} && tar -xf - -C {remote_base} && chmod 755 {remote_base}",
-            ]
-
-            tar_proc = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE)
-            ssh_proc = subprocess.Popen(ssh_cmd, stdin=tar_proc.stdout,
-                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            tar_proc.stdout.close()
-            stdout, stderr = ssh_proc.communicate(timeout=300)
+    plan = _delta_tar_sync(ssh, _flat_pages(html_files), remote_base, "blog page")
+    if plan is None:
+        return None
 
-            if ssh_proc.returncode != 0:
-                print(f"✗ tar+ssh failed: {stderr.decode().strip()}")
-                return None
-        except subprocess.TimeoutExpired:
-            print("✗ Upload timed out (300s)")
-            tar_proc.kill()
-            ssh_proc.kill()
-            return None
-        except Exception as e:
-            print(f"✗ Error uploading blog pages: {e}")
-            return None
+    try:
+        subprocess.run(
+            [*ssh_argv(port), f"{user}@{host}",
+             f"chmod 755 {remote_base}"],
+            check=True, capture_output=True, text=True, timeout=15,
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        print("⚠️  Warning: could not fix /blog/ permissions — verify manually")
 
     wp_url = os.environ.get("WP_URL", "https://gravelgodcycling.com")
-    print(f"✓ Uploaded {page_count} blog pages to {wp_url}/blog/")
+    print(f"✓ Synced {len(html_files)} blog pages to {wp_url}/blog/ "
+          f"({len(plan.upload)} uploaded)")
     return f"{wp_url}/blog/"
 
 
@@ -3138,7 +3093,7 @@ def sync_courses(course_dir: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -3154,7 +3109,7 @@ def sync_courses(course_dir: str):
         items = [p.name for p in sorted(course_path.iterdir())]
         tar_cmd = ["tar", "-cf", "-", "-C", str(course_path)] + items
         ssh_cmd = [
-            "ssh", "-i", str(SSH_KEY), "-p", port,
+            *ssh_argv(port),
             f"{user}@{host}",
             f"tar -xf - -C {remote_base} && find {remote_base} -type d -exec chmod 755 {{}} \\;",
         ]
@@ -3201,7 +3156,7 @@ def sync_mission_control(mc_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -3218,7 +3173,7 @@ def sync_mission_control(mc_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -3258,7 +3213,7 @@ def sync_insights(insights_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -3275,7 +3230,7 @@ def sync_insights(insights_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -3299,7 +3254,7 @@ def sync_insights(insights_file: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset),
                         f"{user}@{host}:{remote_assets}/{asset.name}",
                     ],
@@ -3315,7 +3270,7 @@ def sync_insights(insights_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 755 {remote_base} && chmod 644 {remote_base}/index.html",
             ],
@@ -3353,13 +3308,13 @@ def sync_latest(latest_file: str):
     remote_root = "~/www/gravelgodcycling.com/public_html"
     try:
         subprocess.run(
-            ["ssh", "-i", str(SSH_KEY), "-p", port, f"{user}@{host}",
+            [*ssh_argv(port), f"{user}@{host}",
              f"mkdir -p {remote_root}/latest {remote_root}/feed"],
             check=True, capture_output=True, text=True, timeout=15,
         )
         for local, remote in uploads:
             subprocess.run(
-                ["scp", "-i", str(SSH_KEY), "-P", port, str(local),
+                [*scp_argv(port), str(local),
                  f"{user}@{host}:{remote_root}/{remote}"],
                 check=True, capture_output=True, text=True, timeout=30,
             )
@@ -3390,7 +3345,7 @@ def sync_whitepaper(whitepaper_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -3407,7 +3362,7 @@ def sync_whitepaper(whitepaper_file: str):
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(html_path),
                 f"{user}@{host}:{remote_base}/index.html",
             ],
@@ -3431,7 +3386,7 @@ def sync_whitepaper(whitepaper_file: str):
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(asset),
                         f"{user}@{host}:{remote_assets}/{asset.name}",
                     ],
@@ -3447,7 +3402,7 @@ def sync_whitepaper(whitepaper_file: str):
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 755 {remote_base} && chmod 644 {remote_base}/index.html",
             ],
@@ -3483,7 +3438,7 @@ def sync_embed():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -3503,7 +3458,7 @@ def sync_embed():
             try:
                 subprocess.run(
                     [
-                        "scp", "-i", str(SSH_KEY), "-P", port,
+                        *scp_argv(port),
                         str(fpath),
                         f"{user}@{host}:{remote_base}/{fpath.name}",
                     ],
@@ -3522,7 +3477,7 @@ def sync_embed():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 755 {remote_base} && chmod 644 {remote_base}/*",
             ],
@@ -3558,7 +3513,7 @@ def sync_rss():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"mkdir -p {remote_base}",
             ],
@@ -3575,7 +3530,7 @@ def sync_rss():
     try:
         subprocess.run(
             [
-                "scp", "-i", str(SSH_KEY), "-P", port,
+                *scp_argv(port),
                 str(feed_file),
                 f"{user}@{host}:{remote_base}/races.xml",
             ],
@@ -3595,7 +3550,7 @@ def sync_rss():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 755 {remote_base} && chmod 644 {remote_base}/races.xml",
             ],
@@ -3659,7 +3614,7 @@ def sync_llms_txt():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 644 {remote_base}/llms.txt 2>/dev/null || true",
             ],
@@ -3697,7 +3652,7 @@ def sync_llms_txt():
         try:
             subprocess.run(
                 [
-                    "scp", "-i", str(SSH_KEY), "-P", port,
+                    *scp_argv(port),
                     str(local_path),
                     f"{user}@{host}:{remote_base}/{remote_filename}",
                 ],
@@ -3730,7 +3685,7 @@ def sync_llms_txt():
     try:
         subprocess.run(
             [
-                "ssh", "-i", str(SSH_KEY), "-p", port,
+                *ssh_argv(port),
                 f"{user}@{host}",
                 f"chmod 644 {remote_targets} 2>/dev/null; "
                 f"chmod 444 {remote_base}/llms.txt 2>/dev/null",
@@ -3783,7 +3738,7 @@ def sync_markdown(markdown_dir: str):
         items = [f.name for f in md_files]
         tar_cmd = ["tar", "-cf", "-", "-C", str(md_path)] + items
         ssh_cmd = [
-            "ssh", "-i", str(SSH_KEY), "-p", port,
+            *ssh_argv(port),
             f"{user}@{host}",
             f"tar -xf - -C {remote_base}",
         ]
@@ -4128,6 +4083,16 @@ if __name__ == "__main__":
         "--purge-cache", action="store_true",
         help="Purge all SiteGround caches (static, dynamic, memcached, opcache)"
     )
+    parser.add_argument(
+        "--full-deploy", action="store_true",
+        help="Upload every file of tree targets, ignoring the last-deploy record "
+             "(.build-cache/deploy-manifest.json)"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=4,
+        help="Tar+ssh targets to upload concurrently over the shared SSH "
+             "connection (default: 4; 1 = one target at a time)"
+    )
     parser.add_argument(
         "--deploy-content", action="store_true",
         help="Shortcut: --sync-pages --sync-index --sync-widget --purge-cache"
@@ -4204,17 +4169,53 @@ if __name__ == "__main__":
     if not has_action:
         parser.error("Provide a sync flag (--sync-pages, --sync-index, etc.), --deploy-content, or --deploy-all")
 
+    FULL_DEPLOY = args.full_deploy
+
+    # One multiplexed SSH connection shared by every target; closed at exit
+    if any(v for k, v in vars(args).items() if k.startswith("sync_")) or args.purge_cache:
+        _ssh = get_ssh_credentials()
+        if _ssh:
+            _session = DeploySession(_ssh)
+            if _session.open():
+                atexit.register(_session.close)
+
+    # Tar+ssh targets write disjoint remote trees, so up to --jobs of them
+    # upload side by side while the rest run in order on the main thread.
+    _pool = ThreadPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+    _pending: list = []
+    if _pool:
+        sys.stdout = _ThreadedOutput(sys.stdout)
+
     # Any sync returning falsy marks the whole run failed — a deploy that
     # half-happens must exit non-zero so CI cannot report silent success.
     _failures: list = []
+    _ran: set = set()
 
     def _run(name, fn, *fn_args):
         # Falsy (False OR None) = failure: several sync_* functions return
         # None on failure paths (sol-caught: sync_consent, sync_markdown) —
         # `is False` alone let those report silent success.
-        if not fn(*fn_args):
+        _ran.add(name)
+        if _pool and name in DELTA_TARGETS:
+            _pending.append((name, _pool.submit(_run_captured, fn, *fn_args)))
+        elif not fn(*fn_args):
             _failures.append(name)
 
+    def _run_captured(fn, *fn_args):
+        with sys.stdout.captured():
+            return fn(*fn_args)
+
+    def _wait_uploads():
+        for name, future in _pending:
+            try:
+                ok = future.result()
+            except Exception as e:
+                print(f"✗ {name} crashed: {e}")
+                ok = False
+            if not ok:
+                _failures.append(name)
+        _pending.clear()
+
     if args.json:
         _run("json", push_to_wordpress, args.json)
     if args.sync_index:
@@ -4310,6 +4311,7 @@ if __name__ == "__main__":
         _run("sync-llms-txt", sync_llms_txt)
     synced_markdown_urls = None
     if args.sync_markdown:
+        _ran.add("sync-markdown")
         synced_markdown_urls = sync_markdown(args.markdown_dir)
         if not synced_markdown_urls:
             _failures.append("sync-markdown")
@@ -4322,8 +4324,17 @@ if __name__ == "__main__":
                 print(f"⚠ IndexNow ping failed (non-fatal): {e}")
         else:
             print("⚠ --ping-indexnow had no synced URLs to ping (did --sync-markdown succeed?)")
+    _wait_uploads()
     if args.purge_cache:
-        _run("purge-cache", purge_cache)
+        # Only delta targets ran: purge just the URLs they changed.
+        # Anything else (SCP'd pages, mu-plugins, .htaccess) needs a full purge.
+        if _ran and _ran <= DELTA_TARGETS and len(DELTA_CHANGED_PATHS) <= PURGE_URL_LIMIT:
+            if DELTA_CHANGED_PATHS:
+                _run("purge-cache", purge_cache, sorted(DELTA_CHANGED_PATHS))
+            else:
+                print("✓ Nothing changed on the server — cache purge skipped")
+        else:
+            _run("purge-cache", purge_cache)
 
     if _failures:
         print(f"\n✗ DEPLOY FAILED — {len(_failures)} step(s): {', '.join(_failures)}")
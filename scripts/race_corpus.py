@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Shared, cached loader for the race-data/ profile corpus.
+
+Every generator used to glob race-data/*.json and json.loads all ~380
+profiles (27 MB) itself, so one preflight run parsed the corpus a dozen
+times. load_corpus() parses it once and writes a pickle snapshot to
+.build-cache/race-corpus.pickle, keyed by every file's name, mtime and
+size. Later calls (in this process or the next one) unpickle the snapshot
+instead of re-parsing, and any added, removed or edited file invalidates it.
+
+Each call returns freshly built dicts, so callers may mutate what they get
+without corrupting the cache for the next caller.
+
+Usage:
+    from race_corpus import load_corpus, load_profiles
+
+    profiles = load_profiles()            # {slug: full profile JSON}
+    corpus = load_corpus()
+    for name, err in corpus.errors.items():
+        print(f"Skipping invalid JSON: {name} ({err})")
+
+    python scripts/race_corpus.py         # Rebuild snapshot, print stats
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RACE_DATA_DIR = PROJECT_ROOT / "race-data"
+BUILD_CACHE_DIR = PROJECT_ROOT / ".build-cache"
+SNAPSHOT_PATH = BUILD_CACHE_DIR / "race-corpus.pickle"
+
+# Bump when the snapshot layout changes so stale snapshots are ignored
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class RaceCorpus:
+    """Parsed race-data/ directory."""
+    profiles: dict[str, dict] = field(default_factory=dict)  # stem → profile JSON
+    errors: dict[str, str] = field(default_factory=dict)  # filename → parse error
+    cached: bool = False  # served from the memo or snapshot, not parsed
+
+
+# resolved data dir → (fingerprint, pickled RaceCorpus state)
+_MEMO: dict[Path, tuple[tuple, bytes]] = {}
+
+
+def fingerprint(data_dir: Path) -> tuple:
+    """(name, mtime_ns, size) for every *.json in data_dir, sorted by name."""
+    entries = []
+    for path in sorted(Path(data_dir).glob("*.json")):
+        st = path.stat()
+        entries.append((path.name, st.st_mtime_ns, st.st_size))
+    return tuple(entries)
+
+
+def snapshot_path_for(data_dir: Path) -> Path | None:
+    """Snapshot location for data_dir — only the canonical race-data/ gets one.
+
+    Other directories (test fixtures, archives) stay memoized in-process
+    only, so they never write into the repo's build cache.
+    """
+    if Path(data_dir).resolve() == RACE_DATA_DIR.resolve():
+        return SNAPSHOT_PATH
+    return None
+
+
+def _parse(data_dir: Path, fp: tuple) -> RaceCorpus:
+    corpus = RaceCorpus()
+    for name, _mtime, _size in fp:
+        path = Path(data_dir) / name
+        try:
+            corpus.profiles[path.stem] = json.loads(path.read_bytes())
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            corpus.errors[name] = str(e)
+    return corpus
+
+
+def _read_snapshot(path: Path, data_dir: Path, fp: tuple) -> bytes | None:
+    try:
+        with open(path, "rb") as f:
+            header = pickle.load(f)
+            if header != (SNAPSHOT_VERSION, str(data_dir), fp):
+                return None
+            return f.read()
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_snapshot(path: Path, data_dir: Path, fp: tuple, payload: bytes) -> None:
+    """Atomic write: concurrent generators never see a half-written snapshot."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((SNAPSHOT_VERSION, str(data_dir), fp), f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"  ⚠ Could not write race corpus snapshot {path}: {e}", file=sys.stderr)
+
+
+def load_corpus(data_dir: Path = RACE_DATA_DIR, snapshot: bool = True) -> RaceCorpus:
+    """Load every *.json profile in data_dir (non-recursive), cached.
+
+    Resolution order: in-process memo → on-disk snapshot → JSON parse.
+    Unparsable files are reported in .errors rather than raised, matching
+    the skip-and-warn behaviour of the loaders this replaces.
+    """
+    data_dir = Path(data_dir).resolve()
+    fp = fingerprint(data_dir)
+
+    memo = _MEMO.get(data_dir)
+    if memo is not None and memo[0] == fp:
+        return _thaw(memo[1])
+
+    snap = snapshot_path_for(data_dir) if snapshot else None
+    payload = _read_snapshot(snap, data_dir, fp) if snap else None
+    if payload is not None:
+        _MEMO[data_dir] = (fp, payload)
+        return _thaw(payload)
+
+    corpus = _parse(data_dir, fp)
+    payload = pickle.dumps((corpus.profiles, corpus.errors), protocol=pickle.HIGHEST_PROTOCOL)
+    _MEMO[data_dir] = (fp, payload)
+    if snap:
+        _write_snapshot(snap, data_dir, fp, payload)
+    return corpus
+
+
+def _thaw(payload: bytes) -> RaceCorpus:
+    profiles, errors = pickle.loads(payload)
+    return RaceCorpus(profiles=profiles, errors=errors, cached=True)
+
+
+def load_profiles(data_dir: Path = RACE_DATA_DIR) -> dict[str, dict]:
+    """{stem: profile JSON} for every parsable profile in data_dir."""
+    return load_corpus(data_dir).profiles
+
+
+def clear_memo() -> None:
+    """Drop the in-process memo (the on-disk snapshot is left alone)."""
+    _MEMO.clear()
+
+
+def main():
+    start = time.time()
+    clear_memo()
+    if SNAPSHOT_PATH.exists():
+        SNAPSHOT_PATH.unlink()
+    corpus = load_corpus()
+    print(f"Parsed {len(corpus.profiles)} profiles in {time.time() - start:.2f}s")
+    for name, err in corpus.errors.items():
+        print(f"  ⚠ Invalid JSON: {name}: {err}")
+
+    clear_memo()
+    start = time.time()
+    load_corpus()
+    print(f"Snapshot reload in {time.time() - start:.2f}s → {SNAPSHOT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
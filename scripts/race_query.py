@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Prebuilt query index over race-index.json entries.
+
+/api/v1/races (mission_control/routers/races_api.py) and the MCP
+search_races tool used to copy the whole index, run up to seven chained
+filter comprehensions (lowercasing every name, location and tagline on
+every request), then sort all survivors. RaceQueryIndex does that work
+once per loaded index:
+
+  - posting sets of row ids for tier, region, discipline and month
+    (keys lowercased; missing discipline counts as "gravel")
+  - distance values sorted once, so a range is two bisects
+  - a trigram index over the lowercased text fields, so free text only
+    checks the rows that contain every trigram of the query
+  - a precomputed rank per sort order, so a page is a top-k over the
+    matching ids instead of a full sort
+
+Matching is unchanged: text is still a case-insensitive substring match
+on the requested fields, and ties keep index order as the old stable
+sorts did.
+
+Usage:
+    from scripts.race_query import RaceQueryIndex
+
+    qi = RaceQueryIndex(entries)
+    total, page = qi.search(tiers=[1, 2], text="kansas", sort="score",
+                            offset=0, limit=20)
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, bisect_right
+
+TEXT_FIELDS = ("name", "location", "tagline")
+# Every field a caller may search; all of them feed the trigram index
+INDEXED_TEXT_FIELDS = ("name", "location", "tagline", "st")
+
+
+def _num(val) -> float:
+    """Coerce to float, 0 for None / garbage ("11,000" → 11000)."""
+    if val is None:
+        return 0.0
+    if isinstance(val, (int, float)):
+        return float(val)
+    try:
+        return float(str(val).replace(",", ""))
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _lower(val) -> str:
+    return str(val).lower() if val else ""
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class RaceQueryIndex:
+    """Filter/sort/paginate race-index entries without scanning them all."""
+
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        n = len(entries)
+        self._all = frozenset(range(n))
+
+        self._tier: dict = {}
+        self._region: dict[str, set[int]] = {}
+        self._discipline: dict[str, set[int]] = {}
+        self._month: dict[str, set[int]] = {}
+        self._text: list[dict[str, str]] = []
+        self._grams: dict[str, set[int]] = {}
+        distances = []
+        for i, r in enumerate(entries):
+            self._tier.setdefault(r.get("tier"), set()).add(i)
+            self._region.setdefault(_lower(r.get("region")), set()).add(i)
+            self._discipline.setdefault(_lower(r.get("discipline") or "gravel"), set()).add(i)
+            self._month.setdefault(_lower(r.get("month")), set()).add(i)
+            distances.append(_num(r.get("distance_mi")))
+
+            fields = {f: _lower(r.get(f)) for f in INDEXED_TEXT_FIELDS}
+            self._text.append(fields)
+            # "\0" joins fields without creating grams a query can match
+            for gram in _trigrams("\0".join(fields.values())):
+                self._grams.setdefault(gram, set()).add(i)
+
+        self._dist_order = sorted(range(n), key=distances.__getitem__)
+        self._dist_sorted = [distances[i] for i in self._dist_order]
+
+        # rank[sort][i] = position of row i in that sort order
+        orders = {
+            "score": sorted(range(n), key=lambda i: -_num(entries[i].get("overall_score"))),
+            "name": sorted(range(n), key=lambda i: self._text[i]["name"]),
+            "distance": sorted(range(n), key=lambda i: -distances[i]),
+        }
+        self._rank = {}
+        for sort, order in orders.items():
+            rank = [0] * n
+            for pos, i in enumerate(order):
+                rank[i] = pos
+            self._rank[sort] = rank
+
+    def match(self, *, tiers=None, region=None, discipline=None, month=None,
+              distance_min=None, distance_max=None, text=None,
+              text_fields=TEXT_FIELDS) -> set[int] | frozenset[int]:
+        """Row ids passing every given filter (None/empty = no filter)."""
+        postings = []
+        if tiers:
+            postings.append(set().union(*(self._tier.get(t, ()) for t in tiers)))
+        for value, index in ((region, self._region), (discipline, self._discipline),
+                             (month, self._month)):
+            if value:
+                postings.append(index.get(value.lower(), set()))
+        if distance_min is not None or distance_max is not None:
+            lo = 0 if distance_min is None else bisect_left(self._dist_sorted, distance_min)
+            hi = (len(self._dist_sorted) if distance_max is None
+                  else bisect_right(self._dist_sorted, distance_max))
+            postings.append(set(self._dist_order[lo:hi]))
+
+        q = text.lower() if text else ""
+        if q:
+            grams = _trigrams(q)
+            if grams:
+                postings.extend(self._grams.get(g, set()) for g in grams)
+
+        if not postings:
+            ids = self._all
+        else:
+            postings.sort(key=len)
+            ids = set(postings[0]).intersection(*postings[1:])
+
+        if q:
+            # Trigrams only narrow candidates (and can't for queries under
+            # three characters); the substring test decides
+            ids = {i for i in ids if any(q in self._text[i][f] for f in text_fields)}
+        return ids
+
+    def top(self, ids, sort: str = "score", offset: int = 0, limit: int = 20) -> list[dict]:
+        """ids ordered by sort ("score"/"distance" descending, "name"
+        ascending), sliced to [offset:offset + limit]."""
+        rank = self._rank.get(sort, self._rank["score"])
+        best = heapq.nsmallest(offset + limit, ids, key=rank.__getitem__)
+        return [self.entries[i] for i in best[offset:]]
+
+    def search(self, *, sort: str = "score", offset: int = 0, limit: int = 20,
+               **filters) -> tuple[int, list[dict]]:
+        """(total matches, one page of entries) for filters (see match())."""
+        ids = self.match(**filters)
+        return len(ids), self.top(ids, sort=sort, offset=offset, limit=limit)
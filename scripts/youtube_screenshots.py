@@ -31,10 +31,14 @@ from pathlib import Path
 warnings.filterwarnings("ignore", message=".*getdata.*deprecated.*", category=DeprecationWarning)
 
 try:
-    from PIL import Image, ImageFilter, ImageStat
+    from PIL import Image, ImageStat
 except ImportError:
     sys.exit("Pillow is required: pip install Pillow")
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from image_metrics import FrameMetrics, load_frames, motion_score  # noqa: E402
+from phash_index import average_hash, hamming_distance  # noqa: E402
+
 # ── Paths ──────────────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "race-data"
@@ -53,6 +57,8 @@ GIF_HEIGHT = 225
 JPEG_QUALITY = 85
 GIF_FPS = 8
 SUBPROCESS_TIMEOUT = 120     # seconds
+FRAME_PHASH_RADIUS = 10      # hamming distance; same scale as photo_qc dedup
+FRAME_FLAT_STDDEV = 4.0      # grayscale stddev below which a frame is too flat to hash
 
 VALID_PHOTO_TYPES = {"video-1", "video-2", "video-3", "preview-gif",
                      "street-1", "street-2", "landscape", "map"}
@@ -222,172 +228,53 @@ def extract_multiple_frames(segment_path: str, tmp_dir: str,
     return paths
 
 
-# ── Frame Quality Scoring (Pillow only) ───────────────────────────────────
+# ── Frame Quality Scoring (see image_metrics.py) ──────────────────────────
 def is_black_frame(img: Image.Image, threshold: float = 15.0) -> bool:
     """Reject frames with mean brightness < threshold."""
-    stat = ImageStat.Stat(img.convert("L"))
-    return stat.mean[0] < threshold
+    return FrameMetrics(img).is_black(threshold)
 
 
 def has_text_overlay(img: Image.Image, edge_threshold: float = 40.0) -> bool:
-    """Detect title cards, sponsor logos, and ad overlays.
-
-    Checks:
-    1. Top/bottom 25% strips — catches title cards, subscribe bars
-    2. Bright text clusters — catches white sponsor text on scenery
-    """
-    w, h = img.size
-    strip_h = int(h * 0.25)
-
-    # Top and bottom strips (lower threshold — common for title cards)
-    for region in [img.crop((0, 0, w, strip_h)), img.crop((0, h - strip_h, w, h))]:
-        gray = region.convert("L")
-        edges = gray.filter(ImageFilter.FIND_EDGES)
-        stat = ImageStat.Stat(edges)
-        if stat.mean[0] > edge_threshold:
-            return True
-
-    # Bright text detection: look for large clusters of near-white pixels
-    # against a non-white background (sponsor overlays are typically white text)
-    if _has_bright_text_clusters(img):
-        return True
-
-    return False
+    """Detect title cards, sponsor logos, and ad overlays."""
+    return FrameMetrics(img).has_text_overlay(edge_threshold)
 
 
 def _has_bright_text_clusters(img: Image.Image, bright_threshold: int = 230,
                               min_bright_pct: float = 0.03,
                               max_bright_pct: float = 0.30) -> bool:
-    """Detect bright text overlays (white/near-white text on darker background).
-
-    Returns True if the frame has a suspicious amount of very bright pixels
-    clustered in a pattern consistent with text overlays:
-    - 3-30% of pixels are near-white (text is large but not the whole frame)
-    - The surrounding area is significantly darker (it's overlay, not sky)
-    """
-    gray = img.convert("L")
-    pixels = list(gray.getdata())
-    total = len(pixels)
-
-    bright_count = sum(1 for p in pixels if p >= bright_threshold)
-    bright_pct = bright_count / total
-
-    # Must have some bright pixels but not too many (all-sky would be ~60%+)
-    if not (min_bright_pct <= bright_pct <= max_bright_pct):
-        return False
-
-    # Check that non-bright pixels are significantly darker (confirms overlay vs sky)
-    dark_pixels = [p for p in pixels if p < bright_threshold]
-    if not dark_pixels:
-        return False
-    dark_mean = sum(dark_pixels) / len(dark_pixels)
-
-    # Bright text on darker scenery: big gap between text brightness and background
-    if (bright_threshold - dark_mean) > 100:
-        # Additional check: bright pixels should have sharp edges nearby
-        # (text has defined edges, clouds don't)
-        edges = gray.filter(ImageFilter.FIND_EDGES)
-        edge_stat = ImageStat.Stat(edges)
-        if edge_stat.mean[0] > 25:
-            return True
-
-    return False
+    """Detect bright text overlays (white/near-white text on darker background)."""
+    return FrameMetrics(img).has_bright_text_clusters(
+        bright_threshold, min_bright_pct, max_bright_pct)
 
 
 def score_brightness(img: Image.Image) -> float:
     """Score 0-1: penalize too dark (<30 mean) or blown out (>240)."""
-    stat = ImageStat.Stat(img.convert("L"))
-    mean = stat.mean[0]
-    if mean < 30:
-        return mean / 30.0 * 0.3
-    if mean > 240:
-        return (255 - mean) / 15.0 * 0.3
-    # Ideal: 80-180
-    if 80 <= mean <= 180:
-        return 1.0
-    if mean < 80:
-        return 0.3 + 0.7 * (mean - 30) / 50.0
-    return 0.3 + 0.7 * (240 - mean) / 60.0
+    return FrameMetrics(img).brightness
 
 
 def score_contrast(img: Image.Image) -> float:
     """Score 0-1: higher standard deviation = more contrast = better."""
-    stat = ImageStat.Stat(img.convert("L"))
-    std = stat.stddev[0]
-    # Typical range 20-80; normalize to 0-1
-    return min(std / 60.0, 1.0)
+    return FrameMetrics(img).contrast
 
 
 def score_sharpness(img: Image.Image) -> float:
     """Score 0-1: Laplacian variance — higher = sharper."""
-    gray = img.convert("L")
-    laplacian = gray.filter(ImageFilter.Kernel(
-        size=(3, 3),
-        kernel=[-1, -1, -1, -1, 8, -1, -1, -1, -1],
-        scale=1, offset=0,
-    ))
-    stat = ImageStat.Stat(laplacian)
-    variance = stat.var[0]
-    # Typical range: blurry ~100, sharp ~2000+
-    return min(variance / 1500.0, 1.0)
+    return FrameMetrics(img).sharpness
 
 
 def score_nature_color(img: Image.Image) -> float:
     """Score 0-1: prefer green/brown (vegetation, dirt) over blue/gray."""
-    rgb = img.convert("RGB")
-    stat = ImageStat.Stat(rgb)
-    r, g, b = stat.mean
-
-    score = 0.0
-    # Green vegetation: g > r and g > b
-    if g > r and g > b:
-        score += 0.5
-    # Brown/earth: r > b, moderate values
-    if r > b and 60 < r < 200:
-        score += 0.3
-    # Penalize heavy blue (sky-only frames)
-    if b > r and b > g:
-        score -= 0.2
-    # Penalize gray/low saturation
-    spread = max(r, g, b) - min(r, g, b)
-    if spread < 20:
-        score -= 0.3
-
-    return max(0.0, min(1.0, score + 0.3))
+    return FrameMetrics(img).nature_color
 
 
 def score_composition(img: Image.Image) -> float:
     """Score 0-1: penalize mostly-sky or mostly-ground frames."""
-    w, h = img.size
-    top_third = img.crop((0, 0, w, h // 3)).convert("L")
-    bottom_third = img.crop((0, 2 * h // 3, w, h)).convert("L")
-
-    top_mean = ImageStat.Stat(top_third).mean[0]
-    bottom_mean = ImageStat.Stat(bottom_third).mean[0]
-
-    score = 1.0
-    # Heavy sky: top much brighter than bottom
-    if top_mean > 200 and bottom_mean < 100:
-        score -= 0.4
-    # Mostly ground: bottom dark, top also dark
-    if top_mean < 60 and bottom_mean < 60:
-        score -= 0.3
-    # Uniform: top ≈ bottom (no horizon interest)
-    if abs(top_mean - bottom_mean) < 10:
-        score -= 0.2
-
-    return max(0.0, score)
+    return FrameMetrics(img).composition
 
 
 def score_frame(img: Image.Image) -> float:
     """Composite quality score 0-100 from weighted heuristics."""
-    return (
-        score_brightness(img) * 20 +
-        score_contrast(img) * 20 +
-        score_sharpness(img) * 25 +
-        score_nature_color(img) * 20 +
-        score_composition(img) * 15
-    )
+    return FrameMetrics(img).score
 
 
 # ── Motion Scoring (for GIF segment selection) ───────────────────────────
@@ -395,32 +282,10 @@ def score_motion(frame_paths: list[str]) -> float:
     """Score 0-1: how much motion/action a clip segment contains.
 
     Compares consecutive frames pixel-by-pixel. More difference = more action.
-    High motion = mud splashing, tight corners, pack riding, terrain changes.
     """
     if len(frame_paths) < 2:
         return 0.0
-
-    diffs = []
-    prev = None
-    for path in frame_paths:
-        try:
-            img = Image.open(path).convert("L").resize((160, 90))
-        except Exception:
-            continue
-        if prev is not None:
-            # Mean absolute pixel difference between consecutive frames
-            prev_data = list(prev.getdata())
-            curr_data = list(img.getdata())
-            diff = sum(abs(a - b) for a, b in zip(prev_data, curr_data)) / len(prev_data)
-            diffs.append(diff)
-        prev = img
-
-    if not diffs:
-        return 0.0
-
-    avg_diff = sum(diffs) / len(diffs)
-    # Typical range: static=0-2, gentle pan=5-15, action=15-40+
-    return min(avg_diff / 25.0, 1.0)
+    return motion_score(load_frames(frame_paths))
 
 
 # ── Frame Diversity Selection ─────────────────────────────────────────────
@@ -436,13 +301,41 @@ def _frame_similarity(a: Image.Image, b: Image.Image) -> float:
     return 1.0 - min(diff / 300.0, 1.0)
 
 
+def _frame_phash(candidate: dict) -> int | None:
+    """Average hash of the frame, or None for a flat frame (its hash carries no structure)."""
+    if "phash" not in candidate:
+        img = candidate["img"]
+        flat = ImageStat.Stat(img.convert("L")).stddev[0] < FRAME_FLAT_STDDEV
+        candidate["phash"] = None if flat else average_hash(img)
+    return candidate["phash"]
+
+
+def _near_duplicate(candidate: dict, selected: list[dict], min_similarity: float) -> bool:
+    """True if the candidate matches any selected frame by colour OR by structure.
+
+    Colour similarity above min_similarity rejects on its own (the original
+    rule). A perceptual hash within FRAME_PHASH_RADIUS also rejects, catching
+    the same shot under a lighting/grade shift. Flat frames have no hash and
+    fall back to the colour check only. At most a handful of frames are ever
+    selected, so a linear scan is all the index this needs.
+    """
+    h = _frame_phash(candidate)
+    for s in selected:
+        if _frame_similarity(candidate["img"], s["img"]) > min_similarity:
+            return True
+        sh = _frame_phash(s)
+        if h is not None and sh is not None and hamming_distance(h, sh) <= FRAME_PHASH_RADIUS:
+            return True
+    return False
+
+
 def select_best_frames(candidates: list[dict], max_frames: int = 3) -> list[dict]:
     """Top frames with diversity constraints.
 
     Each candidate: {path, score, video_index, img, ...}
     Constraints:
     - Max 2 from same video (visual diversity)
-    - Skip near-duplicates (similarity > 0.9)
+    - Skip near-duplicates (similarity > 0.9 or perceptual hash match)
     """
     sorted_candidates = sorted(candidates, key=lambda c: -c["score"])
     selected = []
@@ -458,12 +351,7 @@ def select_best_frames(candidates: list[dict], max_frames: int = 3) -> list[dict
             continue
 
         # Dedup similar frames
-        is_dup = False
-        for s in selected:
-            if _frame_similarity(c["img"], s["img"]) > 0.9:
-                is_dup = True
-                break
-        if is_dup:
+        if _near_duplicate(c, selected, 0.9):
             continue
 
         selected.append(c)
@@ -510,13 +398,7 @@ def select_best_gif_segments(candidates: list[dict], max_gifs: int = 1) -> list[
             continue
 
         # Dedup visually similar segments
-        is_dup = False
-        for s in selected:
-            if s.get("img") and c.get("img"):
-                if _frame_similarity(c["img"], s["img"]) > 0.85:
-                    is_dup = True
-                    break
-        if is_dup:
+        if c.get("img") and _near_duplicate(c, [s for s in selected if s.get("img")], 0.85):
             continue
 
         selected.append(c)
@@ -814,13 +696,14 @@ def extract_screenshots(slug: str, data: dict, dry_run: bool = False,
             except Exception:
                 continue
 
-            # Hard rejection filters
-            if is_black_frame(img):
+            # Hard rejection filters (one decode shared by every metric)
+            metrics = FrameMetrics(img)
+            if metrics.is_black():
                 continue
-            if has_text_overlay(img):
+            if metrics.has_text_overlay():
                 continue
 
-            frame_score = score_frame(img)
+            frame_score = metrics.score
             candidates.append({
                 "path": frame_path,
                 "score": frame_score,
@@ -0,0 +1,284 @@
+"""Tests for assemble_video.py — encoder presets, the single-pass graph and
+the beat render cache.
+
+ffmpeg is never invoked: run_ffmpeg is replaced (it just touches the output
+file) and the graphs are checked as strings.
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import assemble_video as av
+from assemble_video import (
+    ENCODER_PRESETS,
+    VIDEO_ENC,
+    BeatCache,
+    brief_artifacts,
+    card_key,
+    overlay_graph,
+    prerender_batch,
+    single_pass_graph,
+    video_codec_args,
+)
+
+SIZE = (1080, 1920)
+
+BRIEF = {
+    "slug": "test-gravel-100",
+    "format": "tier-reveal",
+    "race_name": "Test Gravel 100",
+    "race_tier": 2,
+    "race_score": 71,
+    "beats": [
+        {"id": "hook", "time_range": "0:00-0:04", "narration": "Where does it land?",
+         "text_on_screen": "Where does it land?", "avatar_pose": "shocked",
+         "cut_frequency_sec": [2, 2], "volume_db": [-8, -12]},
+        {"id": "setup", "time_range": "0:04-0:09",
+         "narration": "A hundred miles of Kansas dust. Scored on everything.",
+         "text_on_screen": "Test Gravel 100 | Emporia, KS", "avatar_pose": "pointing",
+         "cut_frequency_sec": [5, 5], "volume_db": [-18, -22]},
+        {"id": "reveal", "time_range": "0:09-0:12", "narration": "Tier two.",
+         "avatar_pose": "presenting", "volume_db": [-10, -14]},
+    ],
+}
+
+
+def _layer(path, loop=("-loop", "1"), prep=None, overlay="x=0:y=0"):
+    return {"path": Path(path), "loop": list(loop), "prep": prep, "overlay": overlay}
+
+
+def _fake_ffmpeg(calls):
+    def run(args, timeout=0):
+        calls.append(args)
+        Path(args[-1]).write_bytes(b"mp4")
+    return run
+
+
+def _input_indices(chains):
+    return {int(i) for i in re.findall(r"\[(\d+):[va]\]", ";".join(chains))}
+
+
+class TestEncoderPresets:
+    def test_standard_matches_intermediate_encode(self):
+        assert VIDEO_ENC[:len(video_codec_args())] == video_codec_args("standard")
+        assert video_codec_args("standard")[:6] == [
+            "-c:v", "libx264", "-preset", "veryfast", "-crf", "19"]
+
+    def test_presets(self):
+        for name, (speed, crf) in ENCODER_PRESETS.items():
+            args = video_codec_args(name)
+            assert args[args.index("-preset") + 1] == speed
+            assert args[args.index("-crf") + 1] == str(crf)
+        with pytest.raises(KeyError):
+            video_codec_args("lossless")
+
+
+class TestOverlayGraph:
+    def test_prefixed_labels_and_capped_inputs(self):
+        layers = [
+            _layer("av.mov", loop=("-stream_loop", "-1"), prep="scale=324:-1",
+                   overlay="x=48:y=H-h-180:shortest=0"),
+            _layer("txt.png", overlay="x=(W-w)/2:y=268:enable='gte(t,0.2)'"),
+        ]
+        inputs, chains, last = overlay_graph(layers, "[b2bg]", 7, prefix="b2",
+                                             duration=4.5)
+        assert inputs == ["-stream_loop", "-1", "-t", "4.500", "-i", "av.mov",
+                          "-loop", "1", "-t", "4.500", "-i", "txt.png"]
+        assert chains == [
+            "[7:v]scale=324:-1[b2av7]",
+            "[b2bg][b2av7]overlay=x=48:y=H-h-180:shortest=0[b2v7]",
+            "[b2v7][8:v]overlay=x=(W-w)/2:y=268:enable='gte(t,0.2)'[b2v8]",
+        ]
+        assert last == "[b2v8]"
+
+    def test_uncapped_for_per_beat_render(self):
+        inputs, _, last = overlay_graph([_layer("a.png")], "[0:v]", 1)
+        assert inputs == ["-loop", "1", "-i", "a.png"]
+        assert last == "[v1]"
+
+
+class TestSinglePassGraph:
+    def _plans(self):
+        return [
+            {"duration": 4.0,
+             "cuts": [{"kind": "card", "path": Path("c0.png"), "duration": 2.0},
+                      {"kind": "card", "path": Path("c1.png"), "duration": 2.0}],
+             "layers": [_layer("av.png", prep="scale=324:-1"), _layer("t.png")]},
+            {"duration": 3.0,
+             "cuts": [{"kind": "broll", "path": Path("seg.mp4"), "duration": 3.0}],
+             "layers": [_layer("av.png", prep="scale=324:-1")]},
+        ]
+
+    def test_one_graph_for_every_beat(self, tmp_path):
+        inputs, chains, last = single_pass_graph(self._plans(), SIZE, [], tmp_path)
+        assert inputs.count("-i") == 6
+        assert _input_indices(chains) == set(range(6))
+        assert chains[-1] == "[b0][b1]concat=n=2:v=1:a=0[body]"
+        assert last == "[body]"
+        # cards get Ken Burns, B-roll gets cover-cropped
+        assert "zoompan" in chains[0] and chains[0].startswith("[0:v]")
+        assert av._cover_filter(*SIZE) in next(c for c in chains if c.startswith("[4:v]"))
+        assert "[b0c0][b0c1]concat=n=2:v=1:a=0[b0bg]" in chains
+        assert "trim=duration=4.000,setpts=PTS-STARTPTS[b0]" in ";".join(chains)
+        assert "-t 3.000 -i seg.mp4" in " ".join(inputs)
+
+    def test_labels_defined_once(self, tmp_path):
+        _, chains, _ = single_pass_graph(self._plans(), SIZE, [], tmp_path)
+        outputs = [re.search(r"(\[[a-z]\w*\])$", c).group(1) for c in chains]
+        assert len(outputs) == len(set(outputs))
+
+    def test_captions_follow_body(self, tmp_path):
+        cues = [(0.5, 2.0, "A hundred miles."), (4.2, 6.0, "Tier two.")]
+        inputs, chains, last = single_pass_graph(self._plans(), SIZE, cues, tmp_path)
+        assert inputs.count("-i") == 8
+        assert chains[-2].startswith("[body][6:v]overlay=")
+        assert last == "[cap1]"
+        assert len(list(tmp_path.glob("caption_*.png"))) == 2
+
+
+class TestAssemble:
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        placeholder = tmp_path / "placeholder.png"
+        from PIL import Image
+        Image.new("RGBA", (60, 60)).save(placeholder)
+        calls = []
+        monkeypatch.setattr(av, "PROJECT_ROOT", tmp_path)
+        monkeypatch.setattr(av, "run_ffmpeg", _fake_ffmpeg(calls))
+        monkeypatch.setattr(av, "probe_duration", lambda path: 12.0)
+        monkeypatch.setattr(av, "probe_resolution", lambda path: SIZE)
+        monkeypatch.setattr(av, "load_race", lambda slug: {})
+        monkeypatch.setattr(av, "render_placeholder_avatar", lambda pose: placeholder)
+        brief_path = tmp_path / "brief.json"
+        brief_path.write_text(json.dumps(BRIEF))
+        return tmp_path, brief_path, calls
+
+    def _assemble(self, tmp_path, brief_path, **kwargs):
+        kwargs.setdefault("cache_dir", tmp_path / "beat-cache")
+        return av.assemble(brief_path, use_broll=False, music_dir=tmp_path / "none",
+                           output_root=tmp_path / "out", **kwargs)
+
+    def test_single_pass_encodes_once(self, env):
+        tmp_path, brief_path, calls = env
+        report = self._assemble(tmp_path, brief_path, single_pass=True, preset="draft")
+        assert len(calls) == 1
+        cmd = calls[0]
+        assert cmd[cmd.index("-preset") + 1] == "ultrafast"
+        # audio map points at the input after every video input
+        audio_map = cmd[cmd.index("-map", cmd.index("-map") + 1) + 1]
+        assert audio_map == f"{cmd.count('-i') - 1}:a"
+        assert report["mode"] == "single-pass"
+        assert report["preset"] == "draft"
+        assert [b["source"] for b in report["beats"]] == ["cards"] * 3
+
+    def test_clips_mode_unchanged_final_encode(self, env):
+        tmp_path, brief_path, calls = env
+        report = self._assemble(tmp_path, brief_path, cache_dir=None)
+        # 4 card clips + hook background concat + 3 beats + body concat + final
+        assert len(calls) == 10
+        final = calls[-1]
+        assert final[final.index("-preset") + 1] == "veryfast"
+        assert report["mode"] == "clips"
+
+    def test_unknown_preset(self, env):
+        tmp_path, brief_path, calls = env
+        with pytest.raises(ValueError):
+            self._assemble(tmp_path, brief_path, preset="lossless")
+        assert calls == []
+
+    def test_rerun_reuses_cached_artifacts(self, env):
+        tmp_path, brief_path, calls = env
+        first = self._assemble(tmp_path, brief_path)
+        # the hook's two cuts share one card PNG, so its Ken Burns clip is reused too
+        assert first["render_cache"]["reused"] > 0
+        n_first = len(calls)
+        second = self._assemble(tmp_path, brief_path)
+        assert second["render_cache"]["rendered"] == 0
+        # cached card clips: only beat composites, the concats and the final encode run
+        assert len(calls) - n_first == n_first - 3
+
+    def test_narration_reuses_every_visual(self, env, monkeypatch):
+        tmp_path, brief_path, calls = env
+        self._assemble(tmp_path, brief_path, single_pass=True)
+
+        def retime(brief, narration):
+            beats = [dict(b) for b in brief["beats"]]
+            for beat, bounds in zip(beats, [(0, 3.6), (3.6, 9.4), (9.4, 12.8)]):
+                beat["_bounds"] = list(bounds)
+            return beats, {"cues": []}
+
+        import narration_align
+        monkeypatch.setattr(narration_align, "retime_beats_to_narration", retime)
+        report = self._assemble(tmp_path, brief_path, single_pass=True,
+                                narration=tmp_path / "voice.wav")
+        assert report["render_cache"]["rendered"] == 0
+        assert report["render_cache"]["reused"] > 0
+
+
+class TestBeatCache:
+    def test_card_key_ignores_timing_only(self):
+        beat = BRIEF["beats"][2]
+        base = card_key(beat, BRIEF, SIZE)
+        assert card_key(dict(beat, _bounds=[9.2, 12.4], time_range="0:09-0:13"),
+                        BRIEF, SIZE) == base
+        assert card_key(beat, BRIEF, SIZE, cut_index=3) == base
+        assert card_key(beat, dict(BRIEF, race_score=72), SIZE) != base
+        assert card_key(dict(beat, avatar_pose="shrug"), BRIEF, SIZE) != base
+        assert card_key(beat, BRIEF, (1920, 1080)) != base
+
+    def test_key_tracks_brand_and_render_version(self, monkeypatch):
+        base = card_key(BRIEF["beats"][0], BRIEF, SIZE)
+        monkeypatch.setattr(av, "RENDER_VERSION", av.RENDER_VERSION + 1)
+        assert card_key(BRIEF["beats"][0], BRIEF, SIZE) != base
+        monkeypatch.undo()
+        monkeypatch.setitem(av.COLORS, "near_black", "#000000")
+        assert card_key(BRIEF["beats"][0], BRIEF, SIZE) != base
+
+    def test_get_or_render(self, tmp_path):
+        cache = BeatCache(tmp_path)
+        rendered = []
+
+        def render(path):
+            rendered.append(path)
+            path.write_text("png")
+
+        first = cache.get_or_render("abc", ".png", render)
+        assert cache.get_or_render("abc", ".png", render) == first
+        assert len(rendered) == 1 and (cache.hits, cache.misses) == (1, 1)
+        assert [p.name for p in tmp_path.iterdir()] == ["abc.png"]
+
+    def test_failed_render_leaves_nothing(self, tmp_path):
+        cache = BeatCache(tmp_path)
+
+        def render(path):
+            path.write_text("partial")
+            raise av.AssemblyError("ffmpeg failed")
+
+        with pytest.raises(av.AssemblyError):
+            cache.get_or_render("abc", ".mp4", render)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_prerender_batch_dedupes_and_skips_cached(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(av, "run_ffmpeg", _fake_ffmpeg(calls))
+        paths = []
+        for name in ("a", "b"):
+            path = tmp_path / f"{name}.json"
+            path.write_text(json.dumps(BRIEF))  # identical briefs share every artifact
+            paths.append(path)
+        cache = BeatCache(tmp_path / "cache")
+        specs = brief_artifacts(BRIEF, use_broll=False, single_pass=False, narrated=False)
+        assert {s[0] for s in specs} == {"kenburns", "text", "caption"}
+
+        rendered, cached = prerender_batch(paths, cache, use_broll=False,
+                                           single_pass=False, narrated=False, jobs=1)
+        assert cached == 0 and rendered > 0
+        assert len(calls) == len({s[1]["id"] for s in specs if s[0] == "kenburns"})
+        assert prerender_batch(paths, cache, use_broll=False, single_pass=False,
+                               narrated=False, jobs=1) == (0, rendered)
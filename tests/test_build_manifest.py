@@ -0,0 +1,100 @@
+"""Tests for scripts/build_manifest.py — incremental build manifest."""
+
+import importlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import build_manifest
+from build_manifest import BuildManifest, code_version, file_digest, input_hash
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    return tmp_path / "cache" / "manifest.json"
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestInputHash:
+    def test_dict_order_ignored(self):
+        assert input_hash({"a": 1, "b": 2}) == input_hash({"b": 2, "a": 1})
+
+    def test_values_matter(self):
+        assert input_hash({"a": 1}) != input_hash({"a": 2})
+
+    def test_file_digest_missing(self, tmp_path):
+        assert file_digest(tmp_path / "nope.json") is None
+
+
+class TestBuildManifest:
+    def test_fresh_after_record_and_save(self, tmp_path, manifest_path):
+        out = _write(tmp_path / "page.html", "<html>")
+        m = BuildManifest("gen", path=manifest_path)
+        assert not m.is_fresh(out, "k1")
+        m.record(out, "k1")
+        m.save()
+
+        again = BuildManifest("gen", path=manifest_path)
+        assert again.is_fresh(out, "k1")
+        assert not again.is_fresh(out, "k2")
+
+    def test_edited_or_missing_output_is_stale(self, tmp_path, manifest_path):
+        out = _write(tmp_path / "page.html", "<html>")
+        m = BuildManifest("gen", path=manifest_path)
+        m.record(out, "k1")
+        m.save()
+
+        _write(out, "<html>hand edit</html>")
+        assert not BuildManifest("gen", path=manifest_path).is_fresh(out, "k1")
+        out.unlink()
+        assert not BuildManifest("gen", path=manifest_path).is_fresh(out, "k1")
+
+    def test_force_ignores_entries(self, tmp_path, manifest_path):
+        out = _write(tmp_path / "page.html", "<html>")
+        m = BuildManifest("gen", path=manifest_path)
+        m.record(out, "k1")
+        m.save()
+        assert not BuildManifest("gen", path=manifest_path, force=True).is_fresh(out, "k1")
+
+    def test_generators_merge_on_save(self, tmp_path, manifest_path):
+        a = BuildManifest("gen_a", path=manifest_path)
+        b = BuildManifest("gen_b", path=manifest_path)
+        a.record(_write(tmp_path / "a.html", "a"), "ka")
+        b.record(_write(tmp_path / "b.html", "b"), "kb")
+        a.save()
+        b.save()
+        data = json.loads(manifest_path.read_text())
+        assert set(data["generators"]) == {"gen_a", "gen_b"}
+
+    def test_version_mismatch_discards_entries(self, tmp_path, manifest_path):
+        out = _write(tmp_path / "page.html", "<html>")
+        m = BuildManifest("gen", path=manifest_path)
+        m.record(out, "k1")
+        m.save()
+        data = json.loads(manifest_path.read_text())
+        data["version"] = -1
+        manifest_path.write_text(json.dumps(data))
+        assert not BuildManifest("gen", path=manifest_path).is_fresh(out, "k1")
+
+
+class TestCodeVersion:
+    def test_tracks_imported_project_modules(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(build_manifest, "PROJECT_ROOT", tmp_path)
+        monkeypatch.setattr(build_manifest, "_CODE_VERSIONS", {})
+        monkeypatch.syspath_prepend(str(tmp_path))
+        helper = _write(tmp_path / "cv_helper_mod.py", "X = 1\n")
+        gen = _write(tmp_path / "cv_gen_mod.py", "import cv_helper_mod\n")
+        importlib.import_module("cv_gen_mod")
+        first = code_version(gen)
+
+        _write(helper, "X = 2\n")
+        build_manifest._CODE_VERSIONS.clear()
+        assert code_version(gen) != first
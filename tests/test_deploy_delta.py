@@ -0,0 +1,194 @@
+"""Tests for scripts/deploy_delta.py — delta deploy planning."""
+
+import io
+import json
+import sys
+import tarfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from deploy_delta import DeployRecord, public_url_path, sha256_file, target_key, write_tar
+
+TARGET = "u@host:~/www/site/public_html/race"
+
+
+@pytest.fixture
+def record_path(tmp_path):
+    return tmp_path / "cache" / "deploy-manifest.json"
+
+
+def _tree(root, files):
+    out = {}
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        out[name] = path
+    return out
+
+
+def _deployed(record_path, files):
+    record = DeployRecord(TARGET, path=record_path)
+    record.commit(record.plan(files))
+    return DeployRecord(TARGET, path=record_path)
+
+
+class TestPlan:
+    def test_first_deploy_uploads_everything(self, tmp_path, record_path):
+        files = _tree(tmp_path / "out", {"a/index.html": "a", "b/index.html": "b"})
+        plan = DeployRecord(TARGET, path=record_path).plan(files)
+        assert sorted(plan.upload) == ["a/index.html", "b/index.html"]
+        assert plan.delete == [] and plan.unchanged == 0
+
+    def test_only_changed_files_upload(self, tmp_path, record_path):
+        files = _tree(tmp_path / "out", {"a/index.html": "a", "b/index.html": "b"})
+        record = _deployed(record_path, files)
+        files["b/index.html"].write_text("b2")
+        plan = record.plan(files)
+        assert list(plan.upload) == ["b/index.html"]
+        assert plan.unchanged == 1
+
+    def test_removed_files_are_deleted(self, tmp_path, record_path):
+        files = _tree(tmp_path / "out", {"a/index.html": "a", "b/index.html": "b"})
+        record = _deployed(record_path, files)
+        del files["b/index.html"]
+        plan = record.plan(files)
+        assert plan.delete == ["b/index.html"]
+        assert plan.changed == ["b/index.html"]
+
+    def test_mass_delete_is_held(self, tmp_path, record_path):
+        names = {f"r{i}/index.html": str(i) for i in range(40)}
+        files = _tree(tmp_path / "out", names)
+        record = _deployed(record_path, files)
+        plan = record.plan({k: v for k, v in files.items() if k == "r0/index.html"})
+        assert plan.delete == []
+        assert plan.deletes_held and len(plan.held) == 39
+
+    def test_retained_prefixes_never_deleted(self, tmp_path, record_path):
+        files = _tree(tmp_path / "out", {"a/index.html": "a", "assets/x.1.css": "x"})
+        record = _deployed(record_path, files)
+        plan = record.plan({"a/index.html": files["a/index.html"]}, retain=("assets/",))
+        assert plan.delete == []
+
+    def test_full_uploads_unchanged_files(self, tmp_path, record_path):
+        files = _tree(tmp_path / "out", {"a/index.html": "a"})
+        _deployed(record_path, files)
+        plan = DeployRecord(TARGET, path=record_path, full=True).plan(files)
+        assert list(plan.upload) == ["a/index.html"]
+
+
+class TestCommit:
+    def test_round_trip_and_targets_kept_apart(self, tmp_path, record_path):
+        files = _tree(tmp_path / "out", {"a/index.html": "a"})
+        _deployed(record_path, files)
+        other = DeployRecord("u@host:/elsewhere", path=record_path)
+        other.commit(other.plan(files))
+
+        data = json.loads(record_path.read_text())
+        assert set(data) == {TARGET, "u@host:/elsewhere"}
+        assert data[TARGET] == {"a/index.html": sha256_file(files["a/index.html"])}
+
+    def test_held_deletes_stay_recorded(self, tmp_path, record_path):
+        names = {f"r{i}/index.html": str(i) for i in range(40)}
+        files = _tree(tmp_path / "out", names)
+        record = _deployed(record_path, files)
+        record.commit(record.plan({"r0/index.html": files["r0/index.html"]}))
+        assert len(DeployRecord(TARGET, path=record_path).deployed) == 40
+
+
+class TestSharedRemoteBase:
+    """sync_pages, sync_prep_kits, sync_plan_pages and sync_tire_guides all
+    deploy into public_html/race; each target owns only its own files."""
+
+    BASE = "~/www/site/public_html/race"
+
+    def test_targets_do_not_delete_each_others_files(self, tmp_path, record_path):
+        pages = _tree(tmp_path / "pages", {"unbound-200/index.html": "race"})
+        tires = _tree(tmp_path / "tires", {"unbound-200/tires/index.html": "tires"})
+        for label, files in (("race page", pages), ("tire guide page", tires)):
+            record = DeployRecord(target_key(label, "u", "host", self.BASE), path=record_path)
+            record.commit(record.plan(files))
+
+        pages_record = DeployRecord(target_key("race page", "u", "host", self.BASE),
+                                    path=record_path)
+        plan = pages_record.plan(pages)
+        assert plan.delete == [] and plan.unchanged == 1
+
+        tires_record = DeployRecord(target_key("tire guide page", "u", "host", self.BASE),
+                                    path=record_path)
+        assert set(tires_record.deployed) == {"unbound-200/tires/index.html"}
+
+    def test_delta_tar_sync_keys_by_label(self, tmp_path, record_path, monkeypatch):
+        from functools import partial
+
+        from scripts import push_wordpress
+
+        remote_cmds = []
+        monkeypatch.setattr(push_wordpress, "DeployRecord",
+                            partial(DeployRecord, path=record_path))
+        monkeypatch.setattr(push_wordpress, "_stream_tar", lambda *a, **k: None)
+        monkeypatch.setattr(push_wordpress.subprocess, "run",
+                            lambda argv, **k: remote_cmds.append(argv[-1]))
+        ssh = ("host", "u", 22)
+
+        pages = _tree(tmp_path / "pages", {"unbound-200/index.html": "race"})
+        tires = _tree(tmp_path / "tires", {"unbound-200/tires/index.html": "tires",
+                                           "mid-south/tires/index.html": "tires"})
+        push_wordpress._delta_tar_sync(ssh, pages, self.BASE, "race page")
+        push_wordpress._delta_tar_sync(ssh, tires, self.BASE, "tire guide page")
+        plan = push_wordpress._delta_tar_sync(ssh, pages, self.BASE, "race page")
+
+        assert plan.delete == [] and not plan.upload
+        assert remote_cmds == []
+
+
+class TestPostUploadPermissions:
+    def test_chmod_timeout_after_upload_only_warns(self, tmp_path, record_path,
+                                                    monkeypatch, capsys):
+        import subprocess
+        from functools import partial
+
+        from scripts import push_wordpress
+
+        def run(argv, **kwargs):
+            raise subprocess.TimeoutExpired(argv, kwargs.get("timeout"))
+
+        monkeypatch.setattr(push_wordpress, "get_ssh_credentials", lambda: ("host", "u", 22))
+        monkeypatch.setattr(push_wordpress, "DeployRecord",
+                            partial(DeployRecord, path=record_path))
+        monkeypatch.setattr(push_wordpress, "_stream_tar", lambda *a, **k: None)
+        monkeypatch.setattr(push_wordpress.subprocess, "run", run)
+        _tree(tmp_path / "blog", {"unbound-200.html": "<html>post</html>"})
+
+        url = push_wordpress.sync_blog(str(tmp_path / "blog"))
+
+        assert url.endswith("/blog/")
+        out = capsys.readouterr().out
+        assert "could not fix /blog/ permissions" in out
+        assert "(1 uploaded)" in out
+
+
+class TestWriteTar:
+    def test_streams_under_archive_names(self, tmp_path):
+        src = _tree(tmp_path / "out", {"unbound-200.html": "<html>u</html>", "x.html": "x"})
+        buf = io.BytesIO()
+        write_tar({"unbound-200/index.html": src["unbound-200.html"]}, buf)
+
+        buf.seek(0)
+        with tarfile.open(fileobj=buf) as tar:
+            assert tar.getnames() == ["unbound-200/index.html"]
+            assert tar.extractfile("unbound-200/index.html").read() == b"<html>u</html>"
+
+
+class TestPublicUrlPath:
+    @pytest.mark.parametrize("base,name,expected", [
+        ("~/www/site/public_html/race", "unbound-200/index.html", "/race/unbound-200/"),
+        ("~/www/site/public_html/og", "unbound-200.jpg", "/og/unbound-200.jpg"),
+        ("~/www/site/public_html", "index.html", "/"),
+        ("~/backups", "x.html", None),
+    ])
+    def test_paths(self, base, name, expected):
+        assert public_url_path(base, name) == expected
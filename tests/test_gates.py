@@ -307,6 +307,45 @@ class TestGate6:
             gate_6_workouts(tmp_path, valid_derived)
 
 
+class TestGate6InMemory:
+    """Gate 6 on step 6's Workout objects, before anything is written."""
+
+    BLOCKS = '        <SteadyState Duration="600" Power="0.65"/>\n'
+
+    def _workouts(self, derived, blocks=None):
+        from datetime import datetime, timedelta
+        from pipeline.step_06_workouts import Workout
+        start = datetime(2026, 2, 2)  # a Monday
+        workouts = []
+        for w in range(1, derived["plan_duration"] + 1):
+            for day_num, day_abbrev in TestGate6.DAY_INFO:
+                label = (start + timedelta(weeks=w - 1, days=day_num - 1)).strftime("%b%d")
+                kind = {"Wed": "Rest_Day", "Fri": "Strength_Base"}.get(day_abbrev, "Endurance")
+                filename = f"W{w:02d}_{day_num}{day_abbrev}_{label}_{kind}.zwo"
+                workouts.append(Workout(filename, kind, "desc", blocks or self.BLOCKS))
+        return workouts
+
+    def test_valid_workouts_pass_without_files(self, tmp_path, valid_derived):
+        gate_6_workouts(tmp_path, valid_derived, self._workouts(valid_derived))
+        assert not list(tmp_path.iterdir())
+
+    def test_insane_power_fails(self, tmp_path, valid_derived):
+        workouts = self._workouts(valid_derived)
+        workouts[3].blocks = '        <SteadyState Duration="600" Power="5.0"/>\n'
+        with pytest.raises(AssertionError, match="power target"):
+            gate_6_workouts(tmp_path, valid_derived, workouts)
+
+    def test_malformed_blocks_fail(self, tmp_path, valid_derived):
+        workouts = self._workouts(valid_derived)
+        workouts[0].blocks = '        <SteadyState Duration="600" Power="0.6">\n'
+        with pytest.raises(AssertionError, match="Invalid XML"):
+            gate_6_workouts(tmp_path, valid_derived, workouts)
+
+    def test_too_few_workouts_fail(self, tmp_path, valid_derived):
+        with pytest.raises(AssertionError, match="Too few"):
+            gate_6_workouts(tmp_path, valid_derived, self._workouts(valid_derived)[:5])
+
+
 # ── Gate 7 Tests ─────────────────────────────────────────────
 
 class TestGate7:
@@ -0,0 +1,117 @@
+"""Tests for OG card rendering — shared render context and input-hash skipping."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import generate_og_images as og
+from generate_og_images import (
+    card_fields,
+    card_hash,
+    get_context,
+    load_manifest,
+    render_slug,
+    texture_family,
+)
+
+
+RACE = {
+    "name": "Test Gravel 100",
+    "slug": "test-gravel-100",
+    "tagline": "A hundred miles of dust.",
+    "vitals": {
+        "location": "Emporia, Kansas",
+        "date_specific": "2026: May 30",
+        "distance_mi": 100,
+        "elevation_ft": 5400,
+    },
+    "gravel_god_rating": {"overall_score": 82},
+}
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    d = tmp_path / "race-data"
+    d.mkdir()
+    (d / "test-gravel-100.json").write_text(json.dumps({"race": RACE}))
+    return d
+
+
+class TestCardFields:
+    def test_fields_resolved(self):
+        fields = card_fields(RACE)
+        assert fields["short_date"] == "May 30, 2026"
+        assert fields["elevation"] == "5,400 ft"
+        assert fields["overall_score"] == 82
+
+    def test_hash_tracks_visible_inputs_only(self):
+        base = card_hash(card_fields(RACE))
+        assert card_hash(card_fields(dict(RACE, history="unused on the card"))) == base
+        assert card_hash(card_fields(dict(RACE, tagline="New hook"))) != base
+
+    def test_texture_family_is_stable(self):
+        assert texture_family("unbound-200") == texture_family("unbound-200")
+        assert 0 <= texture_family("unbound-200") < og.TEXTURE_FAMILIES
+
+
+class TestRenderContext:
+    def test_fonts_and_bases_loaded_once(self, monkeypatch):
+        ctx = get_context()
+        assert get_context() is ctx
+        assert ctx.base(3) is ctx.base(3)
+
+        calls = []
+        monkeypatch.setattr(og, "load_font", lambda *a, **k: calls.append(a))
+        ctx.base(3)
+        assert calls == []
+
+
+class TestRenderSlug:
+    def test_renders_then_skips_unchanged(self, data_dir, tmp_path):
+        out = tmp_path / "og"
+        status, digest, error = render_slug("test-gravel-100", data_dir, out)
+        assert (status, error) == ("rendered", None)
+        jpeg = out / "test-gravel-100.jpg"
+        assert jpeg.stat().st_size > 10_000
+
+        before = jpeg.stat().st_mtime_ns
+        assert render_slug("test-gravel-100", data_dir, out, digest)[0] == "unchanged"
+        assert jpeg.stat().st_mtime_ns == before
+
+    def test_rerenders_when_jpeg_missing_or_inputs_change(self, data_dir, tmp_path):
+        out = tmp_path / "og"
+        _, digest, _ = render_slug("test-gravel-100", data_dir, out)
+        (out / "test-gravel-100.jpg").unlink()
+        assert render_slug("test-gravel-100", data_dir, out, digest)[0] == "rendered"
+
+        (data_dir / "test-gravel-100.json").write_text(json.dumps({"race": dict(RACE, tagline="New")}))
+        status, new_digest, _ = render_slug("test-gravel-100", data_dir, out, digest)
+        assert status == "rendered" and new_digest != digest
+
+    def test_missing_and_bad_data(self, data_dir, tmp_path):
+        assert render_slug("nope", data_dir, tmp_path)[0] == "missing"
+        (data_dir / "broken.json").write_text("{")
+        status, _, error = render_slug("broken", data_dir, tmp_path)
+        assert status == "error" and error
+
+
+class TestMain:
+    def test_all_writes_manifest_and_skips_second_run(self, data_dir, tmp_path, monkeypatch, capsys):
+        out = tmp_path / "og"
+        argv = ["generate_og_images.py", "--all", "--data-dir", str(data_dir),
+                "--output-dir", str(out), "--jobs", "1"]
+        monkeypatch.setattr(sys, "argv", argv)
+        og.main()
+        assert "(1 rendered, 0 unchanged)" in capsys.readouterr().out
+        assert load_manifest(out) == {"test-gravel-100": card_hash(card_fields(RACE))}
+
+        og.main()
+        assert "(0 rendered, 1 unchanged)" in capsys.readouterr().out
+
+        monkeypatch.setattr(sys, "argv", argv + ["--force"])
+        og.main()
+        assert "(1 rendered, 0 unchanged)" in capsys.readouterr().out
@@ -0,0 +1,100 @@
+"""Tests for the shared frame-quality metrics (photo_qc + youtube_screenshots)."""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw, ImageStat
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import image_metrics
+from image_metrics import FrameMetrics, load_frames, motion_score, score_frame
+
+
+def _scene(seed=0, size=(480, 270)):
+    rng = random.Random(seed)
+    img = Image.new("RGB", size, (90, 120, 60))
+    draw = ImageDraw.Draw(img)
+    for _ in range(60):
+        x, y = rng.randint(0, size[0]), rng.randint(0, size[1])
+        draw.rectangle([x, y, x + rng.randint(5, 80), y + rng.randint(5, 40)],
+                       fill=(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)))
+    return img
+
+
+class TestFrameMetrics:
+    def test_single_conversion_per_frame(self, monkeypatch):
+        img = _scene()
+        conversions = []
+        original = Image.Image.convert
+
+        def counting_convert(self, mode=None, *args, **kwargs):
+            conversions.append(mode)
+            return original(self, mode, *args, **kwargs)
+
+        monkeypatch.setattr(Image.Image, "convert", counting_convert)
+        m = FrameMetrics(img)
+        m.score
+        m.is_black()
+        m.has_text_overlay()
+        assert sorted(conversions) == ["L", "RGB"]
+
+    def test_histogram_stats_match_pixel_stats(self):
+        img = _scene(3)
+        m = FrameMetrics(img)
+        direct = ImageStat.Stat(img.convert("L"))
+        assert m.gray_stat.mean == direct.mean
+        assert m.gray_stat.stddev == direct.stddev
+
+    def test_bright_text_on_dark_scenery(self):
+        img = Image.new("L", (100, 100), 30)
+        draw = ImageDraw.Draw(img)
+        for y in range(20, 80, 5):  # dense glyph-sized blocks
+            for x in range(5, 95, 8):
+                draw.rectangle([x, y, x + 4, y + 3], fill=250)
+        bright_pct = sum(img.histogram()[230:]) / (100 * 100)
+        assert 0.03 <= bright_pct <= 0.30
+        assert FrameMetrics(img).has_bright_text_clusters() is True
+        assert FrameMetrics(img).has_bright_text_clusters(max_bright_pct=bright_pct / 2) is False
+        assert FrameMetrics(Image.new("L", (100, 100), 250)).has_bright_text_clusters() is False
+
+    def test_composite_weights(self):
+        m = FrameMetrics(_scene(5))
+        expected = (m.brightness * 20 + m.contrast * 20 + m.sharpness * 25 +
+                    m.nature_color * 20 + m.composition * 15)
+        assert m.score == pytest.approx(expected)
+        assert 0 <= score_frame(_scene(5)) <= 100
+        assert sum(image_metrics.WEIGHTS.values()) == 100
+
+    def test_black_frame(self):
+        assert FrameMetrics(Image.new("RGB", (64, 36), (5, 5, 5))).is_black() is True
+        assert FrameMetrics(_scene()).is_black() is False
+
+
+class TestMotion:
+    def _write(self, tmp_path, shifts):
+        base = _scene(7, size=(640, 360))
+        paths = []
+        for i, dx in enumerate(shifts):
+            path = tmp_path / f"mf{i}.jpg"
+            base.transform(base.size, Image.AFFINE, (1, 0, dx, 0, 1, 0)).save(path, quality=90)
+            paths.append(str(path))
+        return paths
+
+    def test_static_vs_moving(self, tmp_path):
+        static = motion_score(load_frames(self._write(tmp_path, [0, 0, 0])))
+        moving = motion_score(load_frames(self._write(tmp_path, [0, 40, 80])))
+        assert static < 0.05
+        assert moving > static
+
+    def test_frames_downscaled_and_unreadable_skipped(self, tmp_path):
+        paths = self._write(tmp_path, [0, 10]) + [str(tmp_path / "missing.jpg")]
+        frames = load_frames(paths)
+        assert [f.size for f in frames] == [image_metrics.MOTION_SIZE] * 2
+        assert all(f.mode == "L" for f in frames)
+
+    def test_needs_two_frames(self):
+        assert motion_score([]) == 0.0
+        assert motion_score([Image.new("L", (16, 9))]) == 0.0
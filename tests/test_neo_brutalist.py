@@ -57,8 +57,10 @@ from generate_neo_brutalist import (
     linkify_alternatives,
     load_race_data,
     normalize_race_data,
+    render_all,
     score_bar_color,
 )
+from build_manifest import BuildManifest  # scripts/, on sys.path via the generator
 
 
 class TestSeoMetadata:
@@ -1329,6 +1331,69 @@ class TestUtilities:
         assert score_bar_color(1) == COLORS["tan"]
 
 
+# ── Parallel Rendering ───────────────────────────────────────
+
+class TestRenderAll:
+    def _write_races(self, tmp_path, sample_race_data):
+        data_dir = tmp_path / "race-data"
+        data_dir.mkdir()
+        files = []
+        for n in range(3):
+            race = json.loads(json.dumps(sample_race_data))
+            race["race"]["slug"] = f"test-gravel-{n}"
+            race["race"]["name"] = f"Test Gravel {n}"
+            path = data_dir / f"test-gravel-{n}.json"
+            path.write_text(json.dumps(race))
+            files.append(path)
+        broken = data_dir / "broken-race.json"
+        broken.write_text("{not json")
+        files.append(broken)
+        return files
+
+    def test_process_pool_output_matches_serial(self, tmp_path, sample_race_data, sample_race_index):
+        files = self._write_races(tmp_path, sample_race_data)
+        serial_dir = tmp_path / "serial"
+        pooled_dir = tmp_path / "pooled"
+        serial_dir.mkdir()
+        pooled_dir.mkdir()
+        assets = {"css_tag": "<link>", "js_tag": "<script></script>"}
+
+        serial = list(render_all(files, serial_dir, sample_race_index, assets, {}, jobs=1))
+        pooled = list(render_all(files, pooled_dir, sample_race_index, assets, {}, jobs=2))
+
+        assert [r.slug for r in pooled] == [r.slug for r in serial]
+        assert [r.error is None for r in pooled] == [True, True, True, False]
+        assert pooled[-1] == serial[-1]
+        for n in range(3):
+            name = f"test-gravel-{n}.html"
+            assert (pooled_dir / name).read_bytes() == (serial_dir / name).read_bytes()
+
+    def test_manifest_skips_unchanged_pages(self, tmp_path, sample_race_data, sample_race_index):
+        files = self._write_races(tmp_path, sample_race_data)[:3]
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        assets = {"css_tag": "<link>", "js_tag": "<script></script>"}
+        manifest_path = tmp_path / "manifest.json"
+
+        def build():
+            manifest = BuildManifest("generate_neo_brutalist", path=manifest_path)
+            results = list(render_all(files, out_dir, sample_race_index, assets, {},
+                                      manifest=manifest))
+            for r in results:
+                if not r.skipped:
+                    manifest.record(out_dir / f"{r.slug}.html", r.key)
+            manifest.save()
+            return [r.skipped for r in results]
+
+        assert build() == [False, False, False]
+        assert build() == [True, True, True]
+
+        race = json.loads(files[1].read_text())
+        race["race"]["display_name"] = "Renamed Gravel"
+        files[1].write_text(json.dumps(race))
+        assert build() == [True, False, True]
+
+
 # ── Racer Rating ─────────────────────────────────────────────
 
 class TestRacerRating:
@@ -0,0 +1,122 @@
+"""Tests for perceptual hashes, the BK-tree and the persisted library index."""
+
+import io
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from phash_index import (
+    BKTree,
+    PhashIndex,
+    average_hash,
+    dct_hash,
+    hamming_distance,
+)
+
+
+def _scene(seed, size=(320, 180)):
+    """Random blocky 'landscape' — enough structure for a pHash."""
+    rng = random.Random(seed)
+    img = Image.new("RGB", size, (rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x0, y0 = rng.randint(0, size[0]), rng.randint(0, size[1])
+        x1, y1 = x0 + rng.randint(20, 150), y0 + rng.randint(20, 90)
+        draw.rectangle([x0, y0, x1, y1], fill=(rng.randint(0, 255), rng.randint(0, 255), rng.randint(0, 255)))
+    return img
+
+
+def _reencode(img, quality=40, size=(1200, 675)):
+    buf = io.BytesIO()
+    img.resize(size).save(buf, "JPEG", quality=quality)
+    buf.seek(0)
+    return Image.open(buf)
+
+
+class TestBKTree:
+    def test_query_matches_brute_force(self):
+        rng = random.Random(7)
+        hashes = [rng.getrandbits(64) for _ in range(500)]
+        # Plant some near neighbours
+        hashes += [h ^ (1 << rng.randrange(64)) for h in hashes[:50]]
+        tree = BKTree()
+        for i, h in enumerate(hashes):
+            tree.add(h, i)
+        assert len(tree) == len(hashes)
+
+        for probe in hashes[:40] + [rng.getrandbits(64) for _ in range(10)]:
+            expected = sorted(i for i, h in enumerate(hashes) if hamming_distance(probe, h) <= 10)
+            assert sorted(i for _, i in tree.query(probe, 10)) == expected
+
+    def test_results_nearest_first(self):
+        tree = BKTree()
+        tree.add(0b1111, "far")
+        tree.add(0b0001, "near")
+        tree.add(0b0000, "exact")
+        assert [item for _, item in tree.query(0, 4)] == ["exact", "near", "far"]
+
+    def test_empty(self):
+        assert BKTree().query(123, 10) == []
+
+
+class TestHashes:
+    @pytest.mark.parametrize("hash_fn", [average_hash, dct_hash])
+    def test_survives_resize_and_reencode(self, hash_fn):
+        img = _scene(1)
+        assert hamming_distance(hash_fn(img), hash_fn(_reencode(img))) <= 6
+
+    def test_dct_separates_different_scenes(self):
+        hashes = [dct_hash(_scene(seed)) for seed in range(8)]
+        distances = [hamming_distance(a, b) for i, a in enumerate(hashes) for b in hashes[i + 1:]]
+        assert min(distances) > 10
+
+    def test_dct_hash_is_64_bit(self):
+        assert 0 <= dct_hash(_scene(3)) < 1 << 64
+
+
+class TestPhashIndex:
+    def test_matches_and_supersede(self):
+        index = PhashIndex()
+        index.add("a/a-video-1.jpg", 0b1111)
+        index.add("b/b-video-1.jpg", 0b1110)
+        assert index.matches(0b1111, 2) == [("a/a-video-1.jpg", 0), ("b/b-video-1.jpg", 1)]
+        assert index.matches(0b1111, 2, exclude="a/a-video-1.jpg") == [("b/b-video-1.jpg", 1)]
+
+        # Re-extracted photo: old hash no longer matches
+        index.add("b/b-video-1.jpg", 1 << 40)
+        assert index.matches(0b1111, 2) == [("a/a-video-1.jpg", 0)]
+
+        index.remove("a/a-video-1.jpg")
+        index.add("a/a-video-1.jpg", 0b1111)
+        assert index.matches(0b1111, 0) == [("a/a-video-1.jpg", 0)]
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "_phash_index.json"
+        index = PhashIndex("dct")
+        index.add("a/x.jpg", (1 << 63) | 5)
+        index.add("b/y.jpg", 5)
+        index.save(path)
+
+        loaded = PhashIndex.load(path, "dct")
+        assert loaded.hashes == index.hashes
+        assert loaded.matches(5, 0) == [("b/y.jpg", 0)]
+
+    def test_algorithm_switch_or_corrupt_file_starts_empty(self, tmp_path):
+        path = tmp_path / "_phash_index.json"
+        index = PhashIndex("ahash")
+        index.add("a/x.jpg", 1)
+        index.save(path)
+        assert len(PhashIndex.load(path, "dct")) == 0
+
+        path.write_text("{")
+        assert len(PhashIndex.load(path, "ahash")) == 0
+        assert len(PhashIndex.load(tmp_path / "missing.json")) == 0
+
+    def test_unknown_algorithm(self):
+        with pytest.raises(ValueError):
+            PhashIndex("md5")
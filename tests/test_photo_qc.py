@@ -345,6 +345,33 @@ class TestDuplicateDetection:
         dups = photo_qc.find_duplicates(results)
         assert len(dups) == 0
 
+    def test_pairs_in_file_order(self):
+        results = [{"file": f"{i}.jpg", "phash": (1 << 64) - 1 if i % 2 else 0} for i in range(5)]
+        dups = photo_qc.find_duplicates(results)
+        assert [(d["file_a"], d["file_b"]) for d in dups] == [
+            ("0.jpg", "2.jpg"), ("0.jpg", "4.jpg"), ("1.jpg", "3.jpg"), ("2.jpg", "4.jpg")]
+
+
+class TestLibraryDuplicates:
+    def test_cross_race_match_and_stale_entries_dropped(self):
+        index = photo_qc.PhashIndex()
+        index.add("race-a/race-a-video-1.jpg", 0b1111)
+        index.add("race-b/race-b-video-9.jpg", 1 << 50)
+
+        dups = photo_qc.find_library_duplicates("race-b", [
+            {"file": "race-b/race-b-video-1.jpg", "phash": 0b1110},
+        ], index)
+        assert dups == [{"file_a": "race-b/race-b-video-1.jpg",
+                         "file_b": "race-a/race-a-video-1.jpg", "hamming_distance": 1}]
+        assert set(index.hashes) == {"race-a/race-a-video-1.jpg", "race-b/race-b-video-1.jpg"}
+
+    def test_same_race_photos_not_reported(self):
+        index = photo_qc.PhashIndex()
+        index.add("race-a/race-a-video-1.jpg", 0b1111)
+        assert photo_qc.find_library_duplicates("race-a", [
+            {"file": "race-a/race-a-video-1.jpg", "phash": 0b1111},
+        ], index) == []
+
 
 # ── Layer 1 Integration Tests ─────────────────────────────────────────────
 
@@ -383,6 +410,23 @@ class TestRunLayer1:
         assert slug in results["races"]
         assert results["summary"]["total_photos"] >= 1
 
+    def test_index_hashes_with_its_algorithm(self, tmp_path, sample_photo):
+        slug = "test-race"
+        (tmp_path / slug).mkdir()
+        import shutil
+        shutil.copy(str(sample_photo), str(tmp_path / slug / f"{slug}-video-1.jpg"))
+
+        index = photo_qc.PhashIndex("dct")
+        with patch.object(photo_qc, 'PHOTOS_DIR', tmp_path), \
+             patch.object(photo_qc, 'DATA_DIR', tmp_path / "data"), \
+             patch.object(photo_qc, 'PROGRESS_FILE', tmp_path / "_progress.json"):
+            results = photo_qc.run_layer1(slugs=[slug], index=index)
+
+        photo = results["races"][slug]["photos"][0]
+        assert index.hashes == {f"{slug}/{slug}-video-1.jpg": photo["phash"]}
+        with Image.open(tmp_path / slug / f"{slug}-video-1.jpg") as img:
+            assert photo["phash"] == photo_qc.PHASH_ALGORITHMS["dct"](img)
+
 
 # ── SEO Alt Text Tests ────────────────────────────────────────────────────
 
@@ -15,7 +15,7 @@ from pipeline.step_02_profile import create_profile
 from pipeline.step_03_classify import classify_athlete
 from pipeline.step_04_schedule import build_schedule
 from pipeline.step_05_template import select_template
-from pipeline.step_06_workouts import generate_workouts, load_race_data
+from pipeline.step_06_workouts import build_workouts, generate_workouts, load_race_data, write_workouts
 from pipeline.step_07_guide import generate_guide
 
 from gates.quality_gates import (
@@ -110,6 +110,29 @@ class TestPipelineE2E:
         assert zwo_count > 0
         print(f"Generated {zwo_count} ZWO files")
 
+    def test_step_6_in_memory_matches_written_files(self, sarah_intake, tmp_path):
+        """Gate on the Workout objects, then one write pass + zip."""
+        import zipfile
+        validated = validate_intake(sarah_intake)
+        profile = create_profile(validated)
+        derived = classify_athlete(profile)
+        schedule = build_schedule(profile, derived)
+        plan_config = select_template(derived, BASE_DIR)
+
+        workouts = build_workouts(plan_config, profile, derived, schedule, BASE_DIR)
+        workouts_dir = tmp_path / "workouts"
+        workouts_dir.mkdir()
+        gate_6_workouts(workouts_dir, derived, workouts)
+        write_workouts(workouts, workouts_dir, zip_path=tmp_path / "workouts.zip")
+
+        files = sorted(p.name for p in workouts_dir.glob("*.zwo"))
+        assert files == sorted(w.filename for w in workouts)
+        gate_6_workouts(workouts_dir, derived)
+        with zipfile.ZipFile(tmp_path / "workouts.zip") as zf:
+            assert sorted(zf.namelist()) == files
+            first = workouts[0]
+            assert zf.read(first.filename).decode() == (workouts_dir / first.filename).read_text()
+
     def test_step_7_guide(self, sarah_intake, tmp_path):
         validated = validate_intake(sarah_intake)
         profile = create_profile(validated)
@@ -0,0 +1,117 @@
+"""
+Plan template library — load once, schema check, cached read-only extensions.
+"""
+
+import copy
+import json
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pipeline.step_05_template import (
+    TEMPLATE_MAP,
+    PlanTemplateLibrary,
+    extend_plan_template,
+    get_library,
+    select_template,
+    validate_template,
+)
+
+
+BASE_DIR = Path(__file__).parent.parent
+FINISHER = TEMPLATE_MAP[("finisher", "intermediate")]
+
+
+@pytest.fixture
+def plans_dir(tmp_path):
+    shutil.copytree(BASE_DIR / "plans" / FINISHER, tmp_path / FINISHER)
+    return tmp_path
+
+
+def _derived(plan_weeks, cadence=4):
+    return {
+        "tier": "finisher", "level": "intermediate",
+        "plan_duration": plan_weeks, "plan_weeks": plan_weeks,
+        "recovery_week_cadence": cadence,
+    }
+
+
+class TestShippedTemplates:
+    def test_all_templates_pass_schema(self):
+        library = PlanTemplateLibrary(BASE_DIR / "plans")
+        templates = library.load_all()
+        assert set(TEMPLATE_MAP.values()) <= set(templates)
+        for name, template in templates.items():
+            assert validate_template(template) == [], name
+
+
+class TestPlanTemplateLibrary:
+    def test_extended_variants_are_cached_per_key(self, plans_dir):
+        library = PlanTemplateLibrary(plans_dir)
+        sixteen = library.extended(FINISHER, 16, 4)
+        assert library.extended(FINISHER, 16, 4) is sixteen
+        assert library.extended(FINISHER, 16, 3) is not sixteen
+        assert library.extended(FINISHER, 12, 4) is library.base(FINISHER)
+
+    def test_matches_uncached_extension(self, plans_dir):
+        library = PlanTemplateLibrary(plans_dir)
+        raw = json.loads((plans_dir / FINISHER / "template.json").read_text())
+        for weeks, cadence in [(16, 4), (21, 3)]:
+            assert library.extended(FINISHER, weeks, cadence) == extend_plan_template(raw, weeks, cadence)
+
+    def test_views_are_read_only_and_deepcopy_is_mutable(self, plans_dir):
+        template = PlanTemplateLibrary(plans_dir).extended(FINISHER, 16, 4)
+        with pytest.raises(TypeError):
+            template["weeks"][0]["focus"] = "corrupted"
+        with pytest.raises(TypeError):
+            template["weeks"].append({})
+
+        mine = copy.deepcopy(template)
+        mine["weeks"][0]["focus"] = "mine"
+        assert template["weeks"][0]["focus"] != "mine"
+        assert type(pickle.loads(pickle.dumps(template))["weeks"]) is list
+        assert json.loads(json.dumps(template)) == template
+
+    def test_edited_template_is_reloaded(self, plans_dir):
+        library = PlanTemplateLibrary(plans_dir)
+        before = library.extended(FINISHER, 16, 4)
+
+        path = plans_dir / FINISHER / "template.json"
+        data = json.loads(path.read_text())
+        data["plan_metadata"]["name"] = "EDITED"
+        path.write_text(json.dumps(data))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        after = library.extended(FINISHER, 16, 4)
+        assert after is not before
+        assert after["plan_metadata"]["name"] == "EDITED"
+
+    def test_invalid_template_rejected(self, plans_dir):
+        path = plans_dir / FINISHER / "template.json"
+        data = json.loads(path.read_text())
+        data["weeks"][2]["week_number"] = 7
+        del data["weeks"][4]["workouts"][0]["blocks"]
+        path.write_text(json.dumps(data))
+
+        with pytest.raises(ValueError) as exc:
+            PlanTemplateLibrary(plans_dir).base(FINISHER)
+        assert "week 3: week_number is 7, expected 3" in str(exc.value)
+        assert "week 5 workout 1: blocks missing" in str(exc.value)
+
+
+class TestSelectTemplate:
+    def test_uses_shared_library(self):
+        first = select_template(_derived(20), BASE_DIR)
+        second = select_template(_derived(20), BASE_DIR)
+        assert first["extended"] and len(first["template"]["weeks"]) == 20
+        assert first["template"] is second["template"]
+        assert first["template"] is get_library(BASE_DIR).extended(FINISHER, 20, 4)
+
+    def test_unextended_plan(self):
+        config = select_template(_derived(12), BASE_DIR)
+        assert config["extended"] is False
+        assert config["template"] is get_library(BASE_DIR).base(FINISHER)
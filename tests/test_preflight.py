@@ -0,0 +1,107 @@
+"""Tests for scripts/preflight.py — dependency-graph step runner."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import preflight
+from preflight import Preflight, Step
+
+
+@pytest.fixture
+def make_step(tmp_path, monkeypatch):
+    """Write a throwaway step module under tmp_path and return a Step for it."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    log = tmp_path / "order.log"
+
+    def _make(name, body="", deps=(), optional=False):
+        script = tmp_path / f"pf_step_{name}.py"
+        script.write_text(
+            "import sys, time\n"
+            f"open({str(log)!r}, 'a').write({name!r} + ' start\\n')\n"
+            f"{body}\n"
+            f"open({str(log)!r}, 'a').write({name!r} + ' end\\n')\n"
+        )
+        return Step(name, name, script, deps=deps, optional=optional)
+
+    _make.log = log
+    return _make
+
+
+def _events(log):
+    return log.read_text().split("\n")[:-1] if log.exists() else []
+
+
+class TestRun:
+    def test_dependencies_finish_first(self, make_step):
+        steps = [
+            make_step("b", "time.sleep(0.2)", deps=("a",)),
+            make_step("a", "time.sleep(0.2)"),
+            make_step("c", deps=("a", "b")),
+        ]
+        pf = Preflight(jobs=4)
+        assert pf.run(steps)
+        events = _events(make_step.log)
+        assert events.index("a end") < events.index("b start")
+        assert events.index("b end") < events.index("c start")
+        assert pf.passed == 3
+
+    def test_independent_steps_overlap(self, make_step):
+        steps = [make_step(n, "time.sleep(0.5)") for n in ("x", "y")]
+        pf = Preflight(jobs=2)
+        assert pf.run(steps)
+        events = _events(make_step.log)
+        assert events.index("y start") < events.index("x end")
+
+    def test_stops_after_first_failure(self, make_step):
+        steps = [
+            make_step("bad", "sys.exit(2)"),
+            make_step("after", deps=("bad",)),
+        ]
+        pf = Preflight(jobs=1)
+        assert not pf.run(steps)
+        assert pf.failed == 1
+        assert "after start" not in _events(make_step.log)
+
+    def test_optional_failure_warns_and_continues(self, make_step):
+        steps = [
+            make_step("flaky", "sys.exit(1)", optional=True),
+            make_step("next", deps=("flaky",)),
+        ]
+        pf = Preflight(jobs=1)
+        assert pf.run(steps)
+        assert (pf.passed, pf.skipped, pf.failed) == (1, 1, 0)
+
+    @pytest.mark.parametrize("body,ok", [
+        ("sys.exit(0)", True),
+        ("sys.exit('fatal')", False),
+        ("raise RuntimeError('boom')", False),
+    ])
+    def test_exit_semantics_match_direct_run(self, make_step, body, ok):
+        assert Preflight(jobs=1).run([make_step("s", body)]) is ok
+
+    def test_timeout_fails_step(self, make_step, monkeypatch):
+        monkeypatch.setattr(preflight, "STEP_TIMEOUT", 0.2)
+        pf = Preflight(jobs=2)
+        assert not pf.run([make_step("slow", "time.sleep(5)")])
+        assert pf.failed == 1
+
+
+class TestGraph:
+    def test_generation_waits_for_validation(self):
+        validation = preflight.validation_steps(skip_tests=False)
+        names = [s.name for s in validation]
+        for step in preflight.generation_steps(after=names):
+            assert set(names) <= set(step.deps)
+
+    def test_every_dependency_is_declared_earlier(self):
+        steps = preflight.validation_steps(skip_tests=False)
+        steps += preflight.generation_steps(after=[s.name for s in steps])
+        steps += preflight.deploy_steps(after=[s.name for s in steps])
+        seen = set()
+        for step in steps:
+            assert set(step.deps) <= seen, step.name
+            seen.add(step.name)
@@ -0,0 +1,74 @@
+"""Tests for scripts/race_corpus.py — shared cached race-data loader."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import race_corpus  # noqa: E402
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """A tiny race-data dir treated as the canonical one (snapshot enabled)."""
+    d = tmp_path / "race-data"
+    d.mkdir()
+    (d / "alpha.json").write_text(json.dumps({"race": {"name": "Alpha"}}))
+    (d / "beta.json").write_text(json.dumps({"race": {"name": "Beta"}}))
+    monkeypatch.setattr(race_corpus, "RACE_DATA_DIR", d)
+    monkeypatch.setattr(race_corpus, "SNAPSHOT_PATH", tmp_path / "cache" / "corpus.pickle")
+    race_corpus.clear_memo()
+    yield d
+    race_corpus.clear_memo()
+
+
+class TestLoadCorpus:
+    def test_loads_all_profiles_sorted(self, data_dir):
+        profiles = race_corpus.load_profiles(data_dir)
+        assert list(profiles) == ["alpha", "beta"]
+        assert profiles["alpha"]["race"]["name"] == "Alpha"
+
+    def test_invalid_json_reported_not_raised(self, data_dir):
+        (data_dir / "broken.json").write_text("{nope")
+        corpus = race_corpus.load_corpus(data_dir)
+        assert "broken" not in corpus.profiles
+        assert "broken.json" in corpus.errors
+
+    def test_writes_and_reuses_snapshot(self, data_dir):
+        first = race_corpus.load_corpus(data_dir)
+        assert not first.cached
+        assert race_corpus.SNAPSHOT_PATH.exists()
+        race_corpus.clear_memo()
+        second = race_corpus.load_corpus(data_dir)
+        assert second.cached
+        assert second.profiles == first.profiles
+
+    def test_edit_invalidates(self, data_dir):
+        race_corpus.load_corpus(data_dir)
+        path = data_dir / "alpha.json"
+        path.write_text(json.dumps({"race": {"name": "Alpha Renamed"}}))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        race_corpus.clear_memo()
+        assert race_corpus.load_profiles(data_dir)["alpha"]["race"]["name"] == "Alpha Renamed"
+
+    def test_new_file_invalidates_memo(self, data_dir):
+        race_corpus.load_corpus(data_dir)
+        (data_dir / "gamma.json").write_text("{}")
+        assert "gamma" in race_corpus.load_profiles(data_dir)
+
+    def test_callers_get_independent_copies(self, data_dir):
+        race_corpus.load_profiles(data_dir)["alpha"]["race"]["name"] = "Mutated"
+        assert race_corpus.load_profiles(data_dir)["alpha"]["race"]["name"] == "Alpha"
+
+    def test_non_canonical_dir_never_snapshots(self, data_dir, tmp_path):
+        other = tmp_path / "fixtures"
+        other.mkdir()
+        (other / "x.json").write_text("{}")
+        assert race_corpus.snapshot_path_for(other) is None
+        assert race_corpus.load_profiles(other) == {"x": {}}
+        assert not race_corpus.SNAPSHOT_PATH.exists()
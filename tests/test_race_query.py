@@ -0,0 +1,88 @@
+"""Tests for scripts/race_query.py — prebuilt race-index query engine."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from race_query import RaceQueryIndex
+
+ENTRIES = [
+    {"slug": "unbound-200", "name": "Unbound 200", "location": "Emporia, Kansas",
+     "region": "Midwest", "month": "June", "distance_mi": 200, "tier": 1,
+     "overall_score": 80, "tagline": "The Super Bowl of gravel.", "discipline": "gravel"},
+    {"slug": "leadville-100", "name": "Leadville 100 MTB", "location": "Leadville, Colorado",
+     "region": "West", "month": "August", "distance_mi": 104, "tier": 1,
+     "overall_score": 85, "tagline": "Race across the sky.", "discipline": "mtb"},
+    {"slug": "small-town", "name": "Small Town Gravel", "location": "Nowhere, Kansas",
+     "region": "Midwest", "month": "June", "distance_mi": None, "tier": 4,
+     "overall_score": 40, "tagline": None, "st": "gravel grinder"},
+    {"slug": "mid-south", "name": "Mid South", "location": "Stillwater, Oklahoma",
+     "region": "South", "month": "March", "distance_mi": "100", "tier": 2,
+     "overall_score": 80, "tagline": "Red dirt."},
+]
+
+
+@pytest.fixture
+def qi():
+    return RaceQueryIndex(ENTRIES)
+
+
+def _slugs(page):
+    return [r["slug"] for r in page]
+
+
+class TestFilters:
+    def test_no_filters_returns_all_by_score(self, qi):
+        total, page = qi.search()
+        assert total == 4
+        # Equal scores keep index order
+        assert _slugs(page) == ["leadville-100", "unbound-200", "mid-south", "small-town"]
+
+    def test_postings_intersect(self, qi):
+        total, page = qi.search(tiers=[1, 4], region="midwest", month="JUNE")
+        assert total == 2
+        assert _slugs(page) == ["unbound-200", "small-town"]
+
+    def test_missing_discipline_is_gravel(self, qi):
+        _, page = qi.search(discipline="Gravel")
+        assert _slugs(page) == ["unbound-200", "mid-south", "small-town"]
+
+    def test_distance_range(self, qi):
+        _, page = qi.search(distance_min=100, distance_max=150)
+        assert _slugs(page) == ["leadville-100", "mid-south"]
+        _, page = qi.search(distance_max=10)
+        assert _slugs(page) == ["small-town"]
+
+    def test_unknown_value_matches_nothing(self, qi):
+        assert qi.search(region="Atlantis") == (0, [])
+
+
+class TestText:
+    @pytest.mark.parametrize("text,expected", [
+        ("kansas", ["unbound-200", "small-town"]),
+        ("SKY", ["leadville-100"]),
+        ("ll", ["leadville-100", "mid-south", "small-town"]),
+        ("zzz", []),
+    ])
+    def test_substring_match(self, qi, text, expected):
+        assert _slugs(qi.search(text=text)[1]) == expected
+
+    def test_text_fields_selectable(self, qi):
+        assert _slugs(qi.search(text="grinder")[1]) == []
+        fields = ("name", "location", "tagline", "st")
+        assert _slugs(qi.search(text="grinder", text_fields=fields)[1]) == ["small-town"]
+
+
+class TestSort:
+    def test_name_and_distance(self, qi):
+        assert _slugs(qi.search(sort="name")[1])[0] == "leadville-100"
+        assert _slugs(qi.search(sort="distance")[1]) == [
+            "unbound-200", "leadville-100", "mid-south", "small-town"]
+
+    def test_offset_and_limit(self, qi):
+        total, page = qi.search(offset=1, limit=2)
+        assert total == 4
+        assert _slugs(page) == ["unbound-200", "mid-south"]
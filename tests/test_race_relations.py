@@ -0,0 +1,135 @@
+"""Tests for wordpress/race_relations.py — precomputed race relationship index."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "wordpress"))
+
+from race_relations import (
+    RaceNameMatcher,
+    RaceRelations,
+    extract_state,
+    get_race_relations,
+    similar_relevance,
+)
+
+
+@pytest.fixture
+def race_index():
+    return [
+        {"slug": "unbound-200", "name": "Unbound Gravel 200", "tier": 1,
+         "overall_score": 93, "region": "Midwest", "location": "Emporia, Kansas",
+         "distance_mi": 200},
+        {"slug": "flint-hills", "name": "Flint Hills 100", "tier": 2,
+         "overall_score": 70, "region": "Midwest", "location": "Cottonwood Falls, Kansas",
+         "distance_mi": 100},
+        {"slug": "kansas-dirt", "name": "Kansas Dirt", "tier": 3,
+         "overall_score": 55, "region": "Midwest", "location": "Lawrence, Kansas",
+         "distance_mi": 60},
+        {"slug": "mid-south", "name": "Mid South", "tier": 1, "overall_score": 88,
+         "region": "South", "location": "Stillwater, Oklahoma", "distance_mi": 100},
+        {"slug": "bwr-california", "name": "BWR California", "tier": 1,
+         "overall_score": 90, "region": "West", "location": "San Marcos, CA",
+         "distance_mi": 130},
+    ]
+
+
+def _brute_force_similar(race_index, slug, tier, score, distance):
+    my_region = next((r.get("region", "") for r in race_index if r["slug"] == slug), "")
+    scored = [
+        (similar_relevance(my_region, tier, score, distance, r.get("region", ""),
+                           r.get("tier", 4), r.get("overall_score", 0),
+                           r.get("distance_mi", 0) or 0), r)
+        for r in race_index if r["slug"] != slug
+    ]
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [r for _, r in scored[:6]]
+
+
+class TestExtractState:
+    def test_full_name(self):
+        assert extract_state("Emporia, Kansas") == "Kansas"
+
+    def test_abbreviation(self):
+        assert extract_state("San Marcos, CA") == "CA"
+
+    def test_empty(self):
+        assert extract_state("") == ""
+
+
+class TestNearby:
+    def test_same_state_by_score_excluding_self(self, race_index):
+        rel = RaceRelations(race_index)
+        nearby = rel.nearby_races("kansas-dirt", "Kansas")
+        assert [r["slug"] for r in nearby] == ["unbound-200", "flint-hills"]
+
+    def test_limit(self, race_index):
+        rel = RaceRelations(race_index)
+        assert len(rel.nearby_races("other", "Kansas", k=2)) == 2
+
+    def test_unknown_state(self, race_index):
+        assert RaceRelations(race_index).nearby_races("x", "Vermont") == []
+
+
+class TestSimilar:
+    def test_precomputed_matches_brute_force(self, race_index):
+        rel = RaceRelations(race_index)
+        for r in race_index:
+            args = (r["slug"], r["tier"], r["overall_score"], r["distance_mi"])
+            assert rel.similar_races(*args) == _brute_force_similar(race_index, *args)
+
+    def test_drifted_profile_falls_back_to_exact_ranking(self, race_index):
+        rel = RaceRelations(race_index)
+        args = ("kansas-dirt", 1, 90, 130)
+        assert rel.similar_races(*args) == _brute_force_similar(race_index, *args)
+
+    def test_excludes_self(self, race_index):
+        rel = RaceRelations(race_index)
+        slugs = [r["slug"] for r in rel.similar_races("unbound-200", 1, 93, 200)]
+        assert "unbound-200" not in slugs
+
+
+class TestNameMap:
+    def test_index_names_and_aliases(self, race_index):
+        rel = RaceRelations(race_index)
+        assert rel.name_map["Mid South"] == "mid-south"
+        assert rel.name_map["Unbound"] == "unbound-200"
+
+
+class TestNameMatcher:
+    def test_longest_name_wins(self):
+        m = RaceNameMatcher({"Unbound": "unbound-200", "Unbound XL": "unbound-xl"})
+        assert [slug for _, _, slug in m.finditer("Try Unbound XL.")] == ["unbound-xl"]
+
+    def test_longest_claims_before_leftmost(self):
+        m = RaceNameMatcher({"the crusher": "the-crusher",
+                             "crusher in the tushar": "crusher-in-the-tushar"},
+                            ignore_case=True)
+        found = [slug for _, _, slug in m.finditer("Ride the Crusher in the Tushar")]
+        assert found == ["crusher-in-the-tushar"]
+
+    def test_first_occurrence_only(self):
+        m = RaceNameMatcher({"Mid South": "mid-south"})
+        out = m.sub("Mid South, then Mid South again", lambda n, s: f"[{n}]")
+        assert out == "[Mid South], then Mid South again"
+
+    def test_no_nested_links(self, race_index):
+        rel = RaceRelations(race_index + [
+            {"slug": "bwr-arizona", "name": "BWR Arizona"}])
+        out = rel.linkify("BWR Arizona or BWR")
+        assert out.count("<a ") == 2
+        assert '"><a ' not in out
+
+    def test_empty_table(self):
+        assert RaceNameMatcher({}).sub("anything", lambda n, s: "x") == "anything"
+
+
+class TestCache:
+    def test_reuses_build_for_same_list(self, race_index):
+        assert get_race_relations(race_index) is get_race_relations(race_index)
+
+    def test_rebuilds_for_new_list(self, race_index):
+        first = get_race_relations(race_index)
+        assert get_race_relations(list(race_index)) is not first
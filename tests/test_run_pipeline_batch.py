@@ -0,0 +1,93 @@
+"""
+Batch mode for run_pipeline.py and the shared resource cache behind it.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import run_pipeline
+from pipeline import resources
+
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def intake_path(tmp_path):
+    with open(BASE_DIR / "tests" / "fixtures" / "sarah_printz.json") as f:
+        data = json.load(f)
+    race_day = datetime.now() + timedelta(weeks=20)
+    race_day += timedelta(days=(6 - race_day.weekday()) % 7)
+    for race in data.get("races", []):
+        race["date"] = race_day.strftime("%Y-%m-%d")
+    path = tmp_path / "sarah.json"
+    path.write_text(json.dumps(data))
+    return path
+
+
+@pytest.fixture
+def athlete_dirs(tmp_path, monkeypatch):
+    """Keep batch output out of the repo's athletes/ directory."""
+    def prepare(intake, base_dir):
+        athlete_dir = tmp_path / "athletes" / "sarah"
+        athlete_dir.mkdir(parents=True, exist_ok=True)
+        return "sarah", athlete_dir
+
+    monkeypatch.setattr(run_pipeline, "_prepare_athlete_dir", prepare)
+    return tmp_path / "athletes"
+
+
+class TestBatchOne:
+    def test_all_gates_pass(self, intake_path, athlete_dirs):
+        result = run_pipeline._batch_one(str(intake_path))
+        assert result["error"] is None
+        assert result["name"] == "Sarah Printz"
+        assert result["gates"] == {n: "pass" for n in ["1", "2", "3", "4", "5", "6", "6b", "7", "11"]}
+        assert (athlete_dirs / "sarah" / "guide.html").exists()
+        assert (athlete_dirs / "sarah" / "touchpoints.json").exists()
+
+    def test_failing_gate_is_reported(self, intake_path, athlete_dirs):
+        data = json.loads(intake_path.read_text())
+        data["races"][0]["date"] = "2020-01-05"
+        intake_path.write_text(json.dumps(data))
+
+        result = run_pipeline._batch_one(str(intake_path))
+        assert "in the past" in result["error"]
+        assert result["gates"] == {"1": "FAIL"}
+
+    def test_summary_table(self, capsys):
+        run_pipeline._print_batch_summary([
+            {"name": "A", "gates": {"1": "pass", "2": "FAIL"}, "error": "ValueError: x"},
+            {"name": "Bee", "gates": {n: "pass" for n in run_pipeline.BATCH_STEPS}, "error": None},
+        ])
+        out = capsys.readouterr().out
+        assert "1/2 plans generated" in out
+        assert "A: ValueError: x" in out
+        row = next(line for line in out.splitlines() if line.startswith("A "))
+        assert row.split()[1:4] == ["pass", "FAIL", "-"]
+
+
+class TestResources:
+    def test_load_json_returns_copies_and_reloads(self, tmp_path):
+        path = tmp_path / "t.json"
+        path.write_text('{"weeks": [1]}')
+        first = resources.load_json(path)
+        first["weeks"].append(2)
+        assert resources.load_json(path) == {"weeks": [1]}
+
+        path.write_text('{"weeks": [1, 2, 3]}')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert resources.load_json(path) == {"weeks": [1, 2, 3]}
+
+    def test_race_date_index_first_file_wins(self, tmp_path):
+        (tmp_path / "a.json").write_text(json.dumps(
+            {"race": {"name": "Big Loop", "vitals": {"date_specific": "2026: May 2"}}}))
+        (tmp_path / "b.json").write_text(json.dumps({"name": "big loop"}))
+        (tmp_path / "c.json").write_text("not json")
+        index = resources.race_date_index(tmp_path)
+        assert index == {"big loop": ("a.json", "2026: May 2")}
@@ -0,0 +1,122 @@
+"""Tests for the warm PDF renderer — page pool, print.css, batch errors.
+
+Chromium is replaced with a fake browser so these run without Playwright.
+"""
+
+import asyncio
+
+import pytest
+
+from pipeline import step_08_pdf
+from pipeline.step_08_pdf import PdfRenderer, _with_print_css
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+        self.content = None
+
+    def is_closed(self):
+        return self.closed
+
+    async def set_content(self, html, wait_until=None):
+        assert wait_until == "networkidle"
+        if "BROKEN" in html:
+            raise RuntimeError("render crashed")
+        self.content = html
+
+    async def pdf(self, path, **options):
+        self.browser.active += 1
+        self.browser.peak = max(self.browser.peak, self.browser.active)
+        await asyncio.sleep(0.01)
+        self.browser.active -= 1
+        with open(path, "w") as f:
+            f.write(self.content)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.pages = []
+        self.active = 0
+        self.peak = 0
+
+    def is_connected(self):
+        return True
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    browsers = []
+
+    async def launch(self):
+        browsers.append(FakeBrowser())
+        return browsers[-1]
+
+    monkeypatch.setattr(PdfRenderer, "_launch", launch)
+    r = PdfRenderer(pages=2)
+    r.browsers = browsers
+    yield r
+    r.close()
+
+
+def _guides(tmp_path, n, body="guide"):
+    jobs = []
+    for i in range(n):
+        html = tmp_path / f"g{i}.html"
+        html.write_text(f"<html><head></head><body>{body} {i}</body></html>")
+        jobs.append((html, tmp_path / f"g{i}.pdf"))
+    return jobs
+
+
+class TestPdfRenderer:
+    def test_batch_reuses_one_browser_and_pooled_pages(self, renderer, tmp_path):
+        jobs = _guides(tmp_path, 6)
+        assert renderer.render_batch(jobs) == [None] * 6
+        renderer.render(*jobs[0])
+
+        browser, = renderer.browsers
+        assert len(browser.pages) == 2
+        assert browser.peak == 2
+        assert all(pdf.exists() for _, pdf in jobs)
+
+    def test_print_css_spliced_into_head(self, renderer, tmp_path):
+        html, pdf = _guides(tmp_path, 1)[0]
+        renderer.render(html, pdf)
+        out = pdf.read_text()
+        assert step_08_pdf.PRINT_CSS.read_text() in out
+        assert out.index("<style>") < out.index("</head>")
+
+    def test_failed_job_reported_and_page_replaced(self, renderer, tmp_path):
+        jobs = _guides(tmp_path, 2)
+        bad = tmp_path / "bad.html"
+        bad.write_text("<html><head></head><body>BROKEN</body></html>")
+        jobs.append((bad, tmp_path / "bad.pdf"))
+
+        results = renderer.render_batch(jobs)
+        assert results[:2] == [None, None]
+        assert isinstance(results[2], RuntimeError)
+        with pytest.raises(RuntimeError, match="render crashed"):
+            renderer.render(bad, tmp_path / "bad.pdf")
+
+        # Crashed pages are closed and their slot reopens a fresh page
+        assert renderer.render_batch(_guides(tmp_path, 2)) == [None, None]
+        browser, = renderer.browsers
+        assert sum(p.closed for p in browser.pages) == 2
+
+
+def test_with_print_css_without_head():
+    html = "<p>hi</p>"
+    out = _with_print_css(html)
+    assert out.endswith(html)
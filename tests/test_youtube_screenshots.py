@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
 
 from PIL import Image, ImageDraw, ImageFilter
 
+from phash_index import average_hash, hamming_distance
 from youtube_screenshots import (
     parse_duration_seconds,
     compute_timestamps,
@@ -425,6 +426,38 @@ class TestSelectBestFrames:
     def test_empty_candidates(self):
         assert select_best_frames([], max_frames=3) == []
 
+    def _frame(self, score, video_index, img):
+        return {"score": score, "video_index": video_index, "img": img,
+                "path": "/tmp/test.jpg", "video_id": "test", "channel": "Test",
+                "timestamp": 100}
+
+    def test_colour_match_rejected_without_hash_match(self):
+        """Same mean colour is a duplicate on its own, whatever the structure."""
+        vertical = _make_image(color=(0, 0, 0))
+        ImageDraw.Draw(vertical).rectangle([0, 0, 319, 359], fill=(255, 255, 255))
+        horizontal = _make_image(color=(0, 0, 0))
+        ImageDraw.Draw(horizontal).rectangle([0, 0, 639, 179], fill=(255, 255, 255))
+        a = self._frame(90, 0, vertical)
+        b = self._frame(85, 1, horizontal)
+        assert hamming_distance(average_hash(vertical), average_hash(horizontal)) > 10
+        assert _frame_similarity(vertical, horizontal) > 0.9
+        assert select_best_frames([a, b], max_frames=3) == [a]
+
+    def test_hash_match_rejected_without_colour_match(self):
+        """Same shot under a colour shift is a duplicate by perceptual hash."""
+        base = _make_gradient_image()
+        shifted = base.point(lambda v: min(255, v + 60))
+        a = self._frame(90, 0, base)
+        b = self._frame(85, 1, shifted)
+        assert _frame_similarity(base, shifted) <= 0.9
+        assert select_best_frames([a, b], max_frames=3) == [a]
+
+    def test_flat_frames_fall_back_to_colour(self):
+        """Flat frames share a degenerate hash, so only colour decides."""
+        a = self._candidate(90, video_index=0, color=(40, 40, 40))
+        b = self._candidate(85, video_index=1, color=(220, 220, 220))
+        assert len(select_best_frames([a, b], max_frames=3)) == 2
+
 
 # ── Frame Similarity ──────────────────────────────────────────
 
@@ -790,6 +823,14 @@ class TestSelectBestGifSegments:
     def test_empty_candidates(self):
         assert select_best_gif_segments([], max_gifs=3) == []
 
+    def test_colour_similar_segment_rejected(self):
+        """Visually similar segments from different videos are deduped at 0.85."""
+        a = self._make_candidate("v1", 60, motion=0.9, quality=0.8, video_idx=0)
+        b = self._make_candidate("v2", 60, motion=0.88, quality=0.78, video_idx=1)
+        b["img"] = a["img"].copy()
+        selected = select_best_gif_segments([a, b], max_gifs=2)
+        assert selected == [a]
+
     def test_spreads_when_scores_close(self):
         """When top candidate from each video is close, both get selected."""
         candidates = [
@@ -17,6 +17,7 @@ import json
 import math
 import random
 import re
+import sys
 import urllib.request
 import xml.etree.ElementTree as ET
 from datetime import date, datetime
@@ -43,6 +44,9 @@ from shared_footer import get_mega_footer_css, get_mega_footer_html
 from shared_header import get_site_header_css, get_site_header_html, get_site_header_js
 from scroll_animations import get_scroll_animation_css, get_scroll_animation_js
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from race_corpus import load_profiles  # noqa: E402
+
 OUTPUT_DIR = Path(__file__).parent / "output"
 RACE_INDEX_PATH = Path(__file__).parent.parent / "web" / "race-index.json"
 RACE_DATA_DIR = Path(__file__).parent.parent / "race-data"
@@ -256,9 +260,8 @@ def load_editorial_one_liners(race_data_dir: Path = None) -> list:
     """Load punchy one-liners from T1/T2 race profiles for the ticker."""
     data_dir = race_data_dir or RACE_DATA_DIR
     one_liners = []
-    for f in sorted(data_dir.glob("*.json")):
+    for stem, data in load_profiles(data_dir).items():
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
             race = data.get("race", data)
             rating = race.get("gravel_god_rating", {})
             tier = rating.get("tier", 4)
@@ -268,7 +271,7 @@ def load_editorial_one_liners(race_data_dir: Path = None) -> list:
             if discipline != "gravel":
                 continue
             name = race.get("display_name") or race.get("name", "")
-            slug = race.get("slug", f.stem)
+            slug = race.get("slug", stem)
             score = rating.get("overall_score", 0)
             fv = race.get("final_verdict", {})
             one_liner = fv.get("one_liner", "").strip()
@@ -287,9 +290,8 @@ def load_upcoming_races(race_data_dir: Path = None, today: date = None) -> list:
     data_dir = race_data_dir or RACE_DATA_DIR
     today = today or date.today()
     races = []
-    for f in sorted(data_dir.glob("*.json")):
+    for stem, data in load_profiles(data_dir).items():
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
             race = data.get("race", data)
             rating = race.get("gravel_god_rating", {})
             discipline = (rating.get("discipline") or "gravel")
@@ -305,7 +307,7 @@ def load_upcoming_races(race_data_dir: Path = None, today: date = None) -> list:
             if diff < -14 or diff > 60:
                 continue
             name = race.get("display_name") or race.get("name", "")
-            slug = race.get("slug", f.stem)
+            slug = race.get("slug", stem)
             tier = rating.get("tier", 4)
             score = rating.get("overall_score", 0)
             location = race.get("vitals", {}).get("location", "")
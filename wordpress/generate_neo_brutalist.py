@@ -16,6 +16,11 @@ Usage:
     python generate_neo_brutalist.py unbound-200 --data-dir ../race-data
     python generate_neo_brutalist.py --all --data-dir ../race-data
     python generate_neo_brutalist.py --all --output-dir ./output
+    python generate_neo_brutalist.py --all --jobs 8
+    python generate_neo_brutalist.py --all --force   # ignore .build-cache/manifest.json
+
+`--all` skips pages whose inputs are unchanged since the last build (see
+scripts/build_manifest.py).
 """
 
 import argparse
@@ -26,10 +31,12 @@ import logging
 import math
 import re
 import shutil
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 from brand_tokens import (
     BRAND_FONTS_DIR,
@@ -42,9 +49,14 @@ from brand_tokens import (
     get_ga4_head_snippet,
 )
 from cookie_consent import get_consent_banner_html
+from race_relations import extract_state, get_race_relations, use_race_relations
 from shared_footer import get_mega_footer_css, get_mega_footer_html
 from shared_header import get_site_header_css, get_site_header_html, get_site_header_js
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from build_manifest import BuildManifest, code_version, file_digest, input_hash  # noqa: E402
+from race_corpus import load_profiles  # noqa: E402
+
 # ── Constants ──────────────────────────────────────────────────
 
 COURSE_DIMS = ['logistics', 'length', 'technicality', 'elevation', 'climate', 'altitude', 'adventure']
@@ -111,6 +123,7 @@ MONTH_NUMBERS = {
 
 logger = logging.getLogger(__name__)
 RACE_INTEL_PATH = Path(__file__).resolve().parent.parent / "web" / "race-intel.json"
+RACE_PACKS_DIR = Path(__file__).resolve().parent.parent / "web" / "race-packs"
 
 
 def parse_event_dates(date_str: str) -> tuple[str | None, str | None]:
@@ -2328,12 +2341,7 @@ def build_toc(active_sections=None) -> str:
 </nav>'''
 
 
-def _extract_state(location: str) -> str:
-    """Extract state/country from location string like 'Emporia, Kansas'."""
-    if not location:
-        return ''
-    m = re.match(r'.+,\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*|[A-Z]{2})', location)
-    return m.group(1) if m else ''
+_extract_state = extract_state
 
 
 def _build_nearby_races(rd: dict, race_index: list) -> str:
@@ -2344,21 +2352,12 @@ def _build_nearby_races(rd: dict, race_index: list) -> str:
     state = _extract_state(location)
     if not state:
         return ''
-    slug = rd['slug']
-    # Find other races in same state, prefer higher-tier races
-    nearby = []
-    for r in race_index:
-        if r.get('slug') == slug:
-            continue
-        r_loc = r.get('location', '')
-        if _extract_state(r_loc) == state:
-            nearby.append(r)
+    # Other races in same state, highest score first
+    nearby = get_race_relations(race_index).nearby_races(rd['slug'], state)
     if not nearby:
         return ''
-    # Sort by score descending, take top 3
-    nearby.sort(key=lambda r: r.get('overall_score', 0), reverse=True)
     links = []
-    for r in nearby[:3]:
+    for r in nearby:
         links.append(f'<a href="/race/{esc(r["slug"])}/">{esc(r["name"])}</a>')
     return f'''<div class="gg-nearby-races">
         <span class="gg-nearby-label">MORE IN {esc(state.upper())}:</span> {" &middot; ".join(links)}
@@ -4256,7 +4255,7 @@ def build_prep_strip(rd: dict) -> str:
     slug = rd['slug']
     race_name = rd['name']
 
-    preview_path = Path(__file__).resolve().parent.parent / 'web' / 'race-packs' / f'{slug}.json'
+    preview_path = RACE_PACKS_DIR / f'{slug}.json'
     if not preview_path.exists():
         return ''
     try:
@@ -4316,7 +4315,7 @@ def build_train_for_race(rd: dict) -> str:
     race_name = rd['name']
 
     # Load race-pack preview JSON
-    preview_path = Path(__file__).resolve().parent.parent / 'web' / 'race-packs' / f'{slug}.json'
+    preview_path = RACE_PACKS_DIR / f'{slug}.json'
     if not preview_path.exists():
         return ''
 
@@ -4930,35 +4929,10 @@ def _build_race_name_map(race_index: list) -> dict:
 
 def linkify_alternatives(alt_text: str, race_index: list) -> str:
     """Parse race names from alternatives text and link to profile pages.
-    Builds name→slug mapping from the full race index."""
+    Single pass with the compiled name/alias matcher from RaceRelations."""
     if not alt_text:
         return ''
-
-    # Build mapping from index; include common aliases as fallback
-    name_map = _build_race_name_map(race_index) if race_index else {}
-    # Add well-known aliases that differ from display names
-    aliases = {
-        'Unbound': 'unbound-200',
-        'Unbound Gravel': 'unbound-200',
-        'BWR': 'bwr-california',
-        'Belgian Waffle Ride': 'bwr-california',
-        'Big Sugar': 'big-sugar',
-        'Land Run': 'mid-south',
-        'Leadville': 'leadville-trail-100-mtb',
-    }
-    for alias, slug in aliases.items():
-        if alias not in name_map:
-            name_map[alias] = slug
-
-    result = esc(alt_text)
-    # Sort by length descending to match longer names first
-    for name, slug in sorted(name_map.items(), key=lambda x: len(x[0]), reverse=True):
-        escaped_name = esc(name)
-        if escaped_name in result:
-            link = f'<a href="/race/{slug}/" class="gg-alt-link">{escaped_name}</a>'
-            result = result.replace(escaped_name, link, 1)
-
-    return result
+    return get_race_relations(race_index or []).linkify(esc(alt_text))
 
 
 def build_email_capture(rd: dict) -> str:
@@ -5214,58 +5188,26 @@ def build_visible_faq(rd: dict) -> str:
   </section>'''
 
 
-def build_similar_races(rd: dict, race_index: list) -> str:
-    """Build Similar Races section from the race index.
-    Finds 4 races in same region or adjacent tier, excluding self."""
-    if not race_index:
-        return ''
-
-    slug = rd['slug']
-    tier = rd.get('tier', 4)
-    score = rd.get('overall_score', 0)
-    # Derive region from location
-    location = rd['vitals'].get('location', '')
-
-    # Find region by matching this slug in the index
-    my_region = ''
-    for r in race_index:
-        if r.get('slug') == slug:
-            my_region = r.get('region', '')
-            break
-
+def _similar_races_for(rd: dict, race_index: list) -> list:
+    """Top similar races for rd from the precomputed relations."""
     my_distance = rd['vitals'].get('distance_mi') or 0
     if isinstance(my_distance, str):
         try:
             my_distance = float(re.sub(r'[^\d.]', '', str(my_distance)))
         except (ValueError, TypeError):
             my_distance = 0
+    return get_race_relations(race_index).similar_races(
+        rd['slug'], rd.get('tier', 4), rd.get('overall_score', 0), my_distance)
 
-    candidates = []
-    for r in race_index:
-        if r.get('slug') == slug:
-            continue
-        r_region = r.get('region', '')
-        r_tier = r.get('tier', 4)
-        r_score = r.get('overall_score', 0)
-        r_dist = r.get('distance_mi', 0) or 0
-        # Score: same region = 10, same tier = 5, adjacent tier = 2, score + distance proximity
-        relevance = 0
-        if my_region and r_region == my_region:
-            relevance += 10
-        if r_tier == tier:
-            relevance += 5
-        elif abs(r_tier - tier) == 1:
-            relevance += 2
-        relevance += max(0, 10 - abs(r_score - score) / 5)
-        # Distance similarity bonus (up to 5 points)
-        if my_distance > 0 and r_dist > 0:
-            dist_ratio = min(my_distance, r_dist) / max(my_distance, r_dist)
-            relevance += dist_ratio * 5
-        candidates.append((relevance, r))
-
-    # Sort by relevance descending, take top 6
-    candidates.sort(key=lambda x: x[0], reverse=True)
-    top = [c[1] for c in candidates[:6]]
+
+def build_similar_races(rd: dict, race_index: list) -> str:
+    """Build Similar Races section from the race index.
+    Finds 4 races in same region or adjacent tier, excluding self."""
+    if not race_index:
+        return ''
+
+    # Top 6 by relevance (region, tier, score and distance proximity)
+    top = _similar_races_for(rd, race_index)
 
     if not top:
         return ''
@@ -6566,16 +6508,151 @@ def find_data_file(slug: str, data_dirs: list) -> Optional[Path]:
     return None
 
 
-def load_race_data(filepath: Path) -> dict:
-    """Load and normalize race data from a JSON file."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        raw = json.load(f)
+def load_race_data(filepath: Path, raw: dict | None = None) -> dict:
+    """Load and normalize race data from a JSON file.
+
+    Pass raw (the already-parsed file, e.g. from the race corpus) to skip
+    re-reading it; filepath is still used for the modification date.
+    """
+    if raw is None:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            raw = json.load(f)
     rd = normalize_race_data(raw)
     # Store file mtime for accurate dateModified in JSON-LD
     rd['_file_mtime'] = datetime.fromtimestamp(filepath.stat().st_mtime).strftime('%Y-%m-%d')
     return rd
 
 
+class PageResult(NamedTuple):
+    slug: str
+    error: str | None = None
+    key: str | None = None  # input hash, when rendering against a manifest
+    skipped: bool = False   # output was already up to date
+
+
+def page_build_key(race_index: list, external_assets: dict) -> str:
+    """Hash of the inputs shared by every race page.
+
+    Covers this module and every project module it imports, the year baked
+    into copy, the hashed CSS/JS tags and the race-name link table.
+    """
+    names = sorted(get_race_relations(race_index).name_map.items()) if race_index else []
+    return input_hash(code_version(__file__), CURRENT_YEAR, external_assets, names)
+
+
+def page_input_key(rd: dict, race_index: list, race_intel: dict | None, build_key: str) -> str:
+    """Hash of everything one race page renders from.
+
+    Only the slice of the race index the page actually shows (its nearby
+    and similar races) is included, so editing a race re-renders that
+    race's page and the pages that link to it, not the whole catalog.
+    """
+    slug = rd['slug']
+    nearby, similar = [], []
+    if race_index:
+        state = _extract_state(rd['vitals'].get('location', ''))
+        if state:
+            nearby = get_race_relations(race_index).nearby_races(slug, state)
+        similar = _similar_races_for(rd, race_index)
+    lookup = _load_plans_by_slug()
+    plans = lookup.get(slug) or lookup.get(PLAN_SLUG_ALIASES.get(slug, ''), [])
+    return input_hash(
+        build_key, rd, nearby, similar, (race_intel or {}).get(slug, []), plans,
+        file_digest(RACE_PACKS_DIR / f'{slug}.json'),
+    )
+
+
+def render_race_file(filepath: Path, output_dir: Path, race_index: list,
+                     external_assets: dict, race_intel: dict | None,
+                     raw: dict | None = None, manifest: BuildManifest | None = None,
+                     build_key: str | None = None) -> PageResult:
+    """Load, render and write one race page.
+
+    With a manifest (and the run's page_build_key), a page whose inputs and
+    output file are unchanged since the last build is not re-rendered.
+    Exceptions are caught here rather than in the caller so serial and
+    process-pool runs report failures identically.
+    """
+    slug = filepath.stem.replace('-data', '')
+    out = output_dir / f"{slug}.html"
+    try:
+        rd = load_race_data(filepath, raw)
+        key = None
+        if manifest is not None:
+            key = page_input_key(rd, race_index, race_intel, build_key)
+            if manifest.is_fresh(out, key):
+                return PageResult(slug, key=key, skipped=True)
+        page_html = generate_page(
+            rd, race_index, external_assets=external_assets, race_intel=race_intel
+        )
+        out.write_text(page_html, encoding='utf-8')
+    except Exception as e:
+        return PageResult(slug, error=str(e))
+    return PageResult(slug, key=key)
+
+
+# ── Parallel Rendering ─────────────────────────────────────────
+# Worker processes receive the shared inputs once, via the pool initializer,
+# instead of pickling race_index/race_intel with every task.
+
+_WORKER_CONTEXT: dict = {}
+
+
+def _init_render_worker(output_dir: Path, relations, external_assets: dict,
+                        race_intel: dict, plans_db_path: Path, profiles: dict,
+                        manifest: BuildManifest | None, build_key: str | None) -> None:
+    """Pool initializer: stash shared inputs and warm the plans DB cache."""
+    configure_plans_db(plans_db_path)
+    _load_plans_by_slug()
+    use_race_relations(relations)
+    _WORKER_CONTEXT.update(
+        output_dir=output_dir,
+        race_index=relations.race_index,
+        external_assets=external_assets,
+        race_intel=race_intel,
+        profiles=profiles,
+        manifest=manifest,
+        build_key=build_key,
+    )
+
+
+def _render_in_worker(filepath: Path) -> PageResult:
+    ctx = _WORKER_CONTEXT
+    return render_race_file(
+        filepath, ctx['output_dir'], ctx['race_index'],
+        ctx['external_assets'], ctx['race_intel'], ctx['profiles'].get(filepath.stem),
+        ctx['manifest'], ctx['build_key'],
+    )
+
+
+def render_all(files: list, output_dir: Path, race_index: list, external_assets: dict,
+               race_intel: dict | None, jobs: int = 1, profiles: dict | None = None,
+               manifest: BuildManifest | None = None):
+    """Yield a PageResult for each file, in input order.
+
+    profiles ({stem: parsed JSON}, e.g. from the race corpus) skips
+    re-parsing each file; files missing from it are read from disk.
+    manifest enables incremental rendering (the caller records and saves).
+    With jobs > 1 the pages render on a process pool; output is byte-identical
+    to a serial run because each page depends only on the shared inputs.
+    """
+    profiles = profiles or {}
+    build_key = page_build_key(race_index, external_assets) if manifest is not None else None
+    if jobs <= 1 or len(files) <= 1:
+        for f in files:
+            yield render_race_file(f, output_dir, race_index, external_assets, race_intel,
+                                   profiles.get(f.stem), manifest, build_key)
+        return
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_render_worker,
+        initargs=(output_dir, get_race_relations(race_index), external_assets,
+                  race_intel or {}, PLANS_DB_PATH, profiles, manifest, build_key),
+    ) as pool:
+        yield from pool.map(_render_in_worker, files, chunksize=chunksize)
+
+
 # SITE-SYNC S3 (docs/specs/SITE_SYNC_SPEC.md): fabricated race pages removed
 # 2026-07, 301-redirected to state/region best-of hubs. profiles DELETED 2026-07-22
 # (research-dumps + git history are the audit trail); tombstones are canonical
@@ -6599,10 +6676,21 @@ def main():
         type=Path,
         help='Explicit gravel-god-training-plans db/plans.json path',
     )
+    parser.add_argument(
+        '--jobs', '-j', type=int, default=1,
+        help='Worker processes for --all (0 = one per CPU, default: 1)',
+    )
+    parser.add_argument(
+        '--force', action='store_true',
+        help='Re-render every page, ignoring the incremental build manifest',
+    )
     args = parser.parse_args()
 
     if not args.slug and not args.all:
         parser.error("Provide a race slug or use --all")
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    jobs = args.jobs or os.cpu_count() or 1
 
     if args.plans_db:
         if not args.plans_db.is_file():
@@ -6658,23 +6746,30 @@ def main():
         # Write shared CSS/JS assets
         assets = write_shared_assets(output_dir)
 
-        for i, f in enumerate(files, 1):
-            slug = f.stem.replace('-data', '')
-            try:
-                rd = load_race_data(f)
-                page_html = generate_page(
-                    rd, race_index, external_assets=assets, race_intel=race_intel
-                )
-                out = output_dir / f"{slug}.html"
-                out.write_text(page_html, encoding='utf-8')
-                success += 1
-                if i % 50 == 0 or i == total:
-                    print(f"  [{i}/{total}] Generated {slug}.html")
-            except Exception as e:
-                errors.append((slug, str(e)))
-                print(f"  ERROR: {slug}: {e}", file=sys.stderr)
-
-        print(f"\nDone. {success}/{total} pages generated in {output_dir}/")
+        if jobs > 1:
+            print(f"Rendering with {jobs} worker processes")
+        profiles = load_profiles(primary)
+        manifest = BuildManifest('generate_neo_brutalist', force=args.force)
+        unchanged = 0
+        results = render_all(files, output_dir, race_index, assets, race_intel,
+                             jobs=jobs, profiles=profiles, manifest=manifest)
+        for i, result in enumerate(results, 1):
+            slug = result.slug
+            if result.error is not None:
+                errors.append((slug, result.error))
+                print(f"  ERROR: {slug}: {result.error}", file=sys.stderr)
+                continue
+            success += 1
+            if result.skipped:
+                unchanged += 1
+            else:
+                manifest.record(output_dir / f"{slug}.html", result.key)
+            if i % 50 == 0 or i == total:
+                print(f"  [{i}/{total}] Generated {slug}.html")
+        manifest.save()
+
+        print(f"\nDone. {success}/{total} pages generated in {output_dir}/"
+              f" ({unchanged} unchanged, skipped)")
         if errors:
             print(f"\n{len(errors)} errors:")
             for slug, err in errors:
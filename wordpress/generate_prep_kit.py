@@ -50,6 +50,10 @@ from brand_tokens import (
 from shared_footer import get_mega_footer_css, get_mega_footer_html
 from cookie_consent import get_consent_banner_html
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from build_manifest import BuildManifest, code_version, input_hash  # noqa: E402
+from race_corpus import load_profiles  # noqa: E402
+
 # Disable glossary tooltips in guide renderers (we don't need them here)
 import generate_guide
 generate_guide._GLOSSARY = None
@@ -126,14 +130,16 @@ def load_guide_sections() -> dict:
     return sections
 
 
-def load_raw_training_data(filepath: Path) -> dict:
+def load_raw_training_data(filepath: Path, data: dict | None = None) -> dict:
     """Load raw race JSON and extract training-specific fields.
 
+    Pass data (the already-parsed file) to skip re-reading filepath.
     Returns dict with keys: training_config, non_negotiables, guide_variables,
     race_specific, climate, course_description, vitals, logistics, terrain,
     gravel_god_rating, results, weather, quotes.
     """
-    data = json.loads(filepath.read_text(encoding="utf-8"))
+    if data is None:
+        data = json.loads(filepath.read_text(encoding="utf-8"))
     race = data.get("race", data)
     slug = filepath.stem
 
@@ -3221,6 +3227,8 @@ def main():
     parser.add_argument("--all", action="store_true", help="Generate for all races")
     parser.add_argument("--data-dir", help="Primary data directory")
     parser.add_argument("--output-dir", default=None, help="Output directory")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate every kit, ignoring the incremental build manifest")
     args = parser.parse_args()
 
     if not args.slug and not args.all:
@@ -3251,6 +3259,11 @@ def main():
             return 1
 
         json_files = [f for f in sorted(primary.glob("*.json")) if f.stem not in REMOVED_FABRICATED_SLUGS]
+        # Parsed once (or from the corpus snapshot) and shared by both loaders
+        profiles = load_profiles(primary)
+        manifest = BuildManifest("generate_prep_kit", force=args.force)
+        build_key = input_hash(code_version(__file__), CURRENT_YEAR, guide_sections)
+        unchanged = 0
         ok_count = 0
         fail_count = 0
         full_count = 0
@@ -3262,12 +3275,18 @@ def main():
             if not filepath:
                 fail_count += 1
                 continue
+            parsed = profiles.get(slug) if filepath.parent == primary else None
             try:
-                rd = load_race_data(filepath)
-                raw = load_raw_training_data(filepath)
-                page_html = generate_prep_kit_page(rd, raw, guide_sections)
+                rd = load_race_data(filepath, parsed)
+                raw = load_raw_training_data(filepath, parsed)
                 out_file = output_dir / f"{slug}.html"
-                out_file.write_text(page_html, encoding="utf-8")
+                key = input_hash(build_key, rd, raw)
+                if manifest.is_fresh(out_file, key):
+                    unchanged += 1
+                else:
+                    page_html = generate_prep_kit_page(rd, raw, guide_sections)
+                    out_file.write_text(page_html, encoding="utf-8")
+                    manifest.record(out_file, key)
                 ok_count += 1
                 if has_full_training_data(raw):
                     full_count += 1
@@ -3277,7 +3296,10 @@ def main():
                 print(f"  FAIL  {slug}: {e}")
                 fail_count += 1
 
-        print(f"\nGenerated {ok_count} prep kits ({full_count} full, {generic_count} generic)")
+        manifest.save()
+
+        print(f"\nGenerated {ok_count} prep kits ({full_count} full, {generic_count} generic)"
+              f" — {unchanged} unchanged, skipped")
         if fail_count:
             print(f"Failed: {fail_count}")
         return 1 if fail_count else 0
@@ -26,6 +26,9 @@ from shared_footer import get_mega_footer_css, get_mega_footer_html
 from shared_header import get_site_header_css, get_site_header_html
 from cookie_consent import get_consent_banner_html
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from build_manifest import BuildManifest, code_version, input_hash  # noqa: E402
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 SERIES_DIR = PROJECT_ROOT / "series-data"
 SITE_BASE_URL = "https://gravelgodcycling.com"
@@ -2167,6 +2170,8 @@ def main():
     parser = argparse.ArgumentParser(description="Generate series hub landing pages")
     parser.add_argument("--output-dir", default=None,
                         help="Output directory (default: wordpress/output/race/series/)")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate every page, ignoring the incremental build manifest")
     args = parser.parse_args()
 
     output_base = Path(args.output_dir) if args.output_dir else PROJECT_ROOT / "wordpress" / "output" / "race" / "series"
@@ -2208,19 +2213,35 @@ def main():
     if race_data:
         print(f"Loaded {len(race_data)} full race profiles for enrichment")
 
+    manifest = BuildManifest("generate_series_hubs", force=args.force)
+    build_key = input_hash(code_version(__file__), CURRENT_YEAR)
+    unchanged = 0
     for series in all_series_data:
         slug = series["slug"]
         hub_dir = output_base / slug
         hub_dir.mkdir(parents=True, exist_ok=True)
 
-        page_html = build_hub_page(series, race_lookup, race_data)
+        # Only this series' events are read from the index and profiles
+        event_slugs = sorted({e.get("slug") for e in series.get("events", []) if e.get("slug")})
+        key = input_hash(
+            build_key, series,
+            {s: race_lookup.get(s) for s in event_slugs},
+            {s: race_data.get(s) for s in event_slugs},
+        )
         out_path = hub_dir / "index.html"
+        if manifest.is_fresh(out_path, key):
+            unchanged += 1
+            continue
+        page_html = build_hub_page(series, race_lookup, race_data)
         out_path.write_text(page_html, encoding="utf-8")
+        manifest.record(out_path, key)
 
         event_count = len(series.get("events", []))
         print(f"  Generated series/{slug}/index.html ({event_count} events)")
+    manifest.save()
 
-    print(f"\nDone. {len(all_series_data)} series hub pages in {output_base}/")
+    print(f"\nDone. {len(all_series_data)} series hub pages in {output_base}/"
+          f" ({unchanged} unchanged, skipped)")
 
 
 if __name__ == "__main__":
@@ -34,6 +34,9 @@ from brand_tokens import COLORS, get_font_face_css, get_ga4_head_snippet, get_to
 from shared_header import get_site_header_css, get_site_header_html, get_site_header_js
 from cookie_consent import get_consent_banner_html
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from build_manifest import BuildManifest, code_version, input_hash  # noqa: E402
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CURRENT_YEAR = date.today().year
 MIN_RACES = 3
@@ -1029,6 +1032,8 @@ document.querySelectorAll('[data-cta]').forEach(function(el) {
 def main():
     parser = argparse.ArgumentParser(description="Generate state/region hub pages")
     parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate every page, ignoring the incremental build manifest")
     args = parser.parse_args()
 
     output_dir = Path(args.output_dir) if args.output_dir else PROJECT_ROOT / "wordpress" / "output"
@@ -1060,22 +1065,31 @@ def main():
                 shutil.rmtree(page_dir)
                 removed_stale += 1
 
+    manifest = BuildManifest("generate_state_hubs", force=args.force)
+    build_key = input_hash(code_version(__file__), CURRENT_YEAR, len(all_races))
     generated = 0
+    unchanged = 0
     for state, races in sorted(state_groups.items(), key=lambda x: -len(x[1])):
         slug = _slugify(state)
         page_slug = f"best-gravel-races-{slug}"
         page_dir = output_dir / page_slug
         page_dir.mkdir(parents=True, exist_ok=True)
 
-        page_html = build_state_page(state, races, len(all_races))
         out_path = page_dir / "index.html"
-        out_path.write_text(page_html, encoding="utf-8")
+        key = input_hash(build_key, state, races)
+        if manifest.is_fresh(out_path, key):
+            unchanged += 1
+        else:
+            page_html = build_state_page(state, races, len(all_races))
+            out_path.write_text(page_html, encoding="utf-8")
+            manifest.record(out_path, key)
         generated += 1
         print(f"  {page_slug}/ ({len(races)} races)")
+    manifest.save()
 
     print(
         f"\nDone. {generated} state hub pages generated in {output_dir}/ "
-        f"({removed_stale} stale removed)"
+        f"({removed_stale} stale removed, {unchanged} unchanged, skipped)"
     )
 
 
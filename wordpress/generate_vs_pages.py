@@ -34,6 +34,10 @@ from brand_tokens import COLORS, get_font_face_css, get_ga4_head_snippet, get_to
 from shared_header import get_site_header_css, get_site_header_html, get_site_header_js
 from cookie_consent import get_consent_banner_html
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from build_manifest import BuildManifest, code_version, input_hash  # noqa: E402
+from race_corpus import load_profiles  # noqa: E402
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CURRENT_YEAR = date.today().year
 
@@ -1037,6 +1041,8 @@ def main():
     parser = argparse.ArgumentParser(description="Generate vs comparison pages")
     parser.add_argument("--output-dir", default=None,
                         help="Output directory (default: wordpress/output/)")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate every page, ignoring the incremental build manifest")
     args = parser.parse_args()
 
     output_dir = Path(args.output_dir) if args.output_dir else PROJECT_ROOT / "wordpress" / "output"
@@ -1053,14 +1059,12 @@ def main():
     print(f"Loaded {len(all_races)} races from index")
 
     # Load full race data for verdict/opinion content
-    race_data_dir = PROJECT_ROOT / "race-data"
-    full_race_data = {}
-    for slug in race_map:
-        path = race_data_dir / f"{slug}.json"
-        if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                full_race_data[slug] = data.get("race", {})
+    profiles = load_profiles(PROJECT_ROOT / "race-data")
+    full_race_data = {
+        slug: profiles[slug].get("race", {})
+        for slug in race_map
+        if slug in profiles
+    }
 
     # Select pairs
     pairs = select_pairs(all_races)
@@ -1082,7 +1086,10 @@ def main():
                 shutil.rmtree(page_dir)
                 removed_stale += 1
 
+    manifest = BuildManifest("generate_vs_pages", force=args.force)
+    build_key = input_hash(code_version(__file__), CURRENT_YEAR)
     generated = 0
+    unchanged = 0
     for slug_a, slug_b in pairs:
         race_a = race_map.get(slug_a)
         race_b = race_map.get(slug_b)
@@ -1096,14 +1103,20 @@ def main():
         page_dir = output_dir / page_slug
         page_dir.mkdir(parents=True, exist_ok=True)
 
-        page_html = build_vs_page(race_a, race_b, full_a, full_b)
         out_path = page_dir / "index.html"
-        out_path.write_text(page_html, encoding="utf-8")
+        key = input_hash(build_key, race_a, race_b, full_a, full_b)
+        if manifest.is_fresh(out_path, key):
+            unchanged += 1
+        else:
+            page_html = build_vs_page(race_a, race_b, full_a, full_b)
+            out_path.write_text(page_html, encoding="utf-8")
+            manifest.record(out_path, key)
         generated += 1
+    manifest.save()
 
     print(
         f"\nDone. {generated} vs pages generated in {output_dir}/ "
-        f"({removed_stale} stale removed)"
+        f"({removed_stale} stale removed, {unchanged} unchanged, skipped)"
     )
 
 
@@ -0,0 +1,242 @@
+"""Precomputed relationships between races in web/race-index.json.
+
+Race pages link to other races in three places: "More in [State]" links,
+the Similar Races grid, and linkified race names in the verdict
+alternatives. Each used to rescan the whole index per page, which made
+`generate_neo_brutalist.py --all` quadratic in catalog size. RaceRelations
+builds the state buckets, top-k similar races and a compiled race-name
+matcher once so per-page lookups are constant time.
+
+Usage:
+    from race_relations import get_race_relations
+
+    relations = get_race_relations(race_index)
+    relations.nearby_races("unbound-200", "Kansas")
+    relations.similar_races("unbound-200", tier=1, score=93, distance_mi=200)
+    relations.linkify("Try Unbound or Mid South.")
+
+    # Any generator that links race names in its own text
+    matcher = RaceNameMatcher({"Mid South": "mid-south"})
+    matcher.sub(text, lambda name, slug: f'<a href="/race/{slug}/">{name}</a>')
+"""
+from __future__ import annotations
+
+import heapq
+import html
+import re
+from typing import Callable, Iterator
+
+SIMILAR_RACES_K = 6
+NEARBY_RACES_K = 3
+
+# Well-known aliases that differ from index display names. Index names win
+# when both define the same string.
+RACE_NAME_ALIASES = {
+    'Unbound': 'unbound-200',
+    'Unbound Gravel': 'unbound-200',
+    'BWR': 'bwr-california',
+    'Belgian Waffle Ride': 'bwr-california',
+    'Big Sugar': 'big-sugar',
+    'Land Run': 'mid-south',
+    'Leadville': 'leadville-trail-100-mtb',
+}
+
+_STATE_RE = re.compile(r'.+,\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*|[A-Z]{2})')
+
+
+def extract_state(location: str) -> str:
+    """Extract state/country from location string like 'Emporia, Kansas'."""
+    if not location:
+        return ''
+    m = _STATE_RE.match(location)
+    return m.group(1) if m else ''
+
+
+class RaceNameMatcher:
+    """Compiled single-pass matcher over a name → slug table.
+
+    All names are compiled into one alternation, longest first, and the text
+    is scanned once for the longest name starting at each position. Matches
+    are then claimed longest first, each name at its first free occurrence,
+    never overlapping an earlier claim; so "Crusher in the Tushar" beats
+    "the Crusher" and a link is never nested inside another.
+    """
+
+    def __init__(self, name_map: dict[str, str], ignore_case: bool = False):
+        self.ignore_case = ignore_case
+        self.slugs = {(k.lower() if ignore_case else k): v for k, v in name_map.items() if k}
+        names = sorted(self.slugs, key=len, reverse=True)
+        flags = re.IGNORECASE if ignore_case else 0
+        self._pattern = (
+            re.compile('(?=(' + '|'.join(map(re.escape, names)) + '))', flags)
+            if names else None
+        )
+
+    def _key(self, matched: str) -> str:
+        return matched.lower() if self.ignore_case else matched
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """Yield (start, end, slug) for each claimed name, in text order."""
+        if not text or self._pattern is None:
+            return
+        candidates = [(m.start(), m.end(1)) for m in self._pattern.finditer(text)]
+        candidates.sort(key=lambda c: (c[0] - c[1], c[0]))
+        claimed: list[tuple[int, int]] = []
+        seen = set()
+        for start, end in candidates:
+            key = self._key(text[start:end])
+            if key in seen or any(start < e and s < end for s, e in claimed):
+                continue
+            seen.add(key)
+            claimed.append((start, end))
+        for start, end in sorted(claimed):
+            yield start, end, self.slugs[self._key(text[start:end])]
+
+    def sub(self, text: str, repl: Callable[[str, str], str]) -> str:
+        """Replace claimed names with repl(name, slug)."""
+        if not text or self._pattern is None:
+            return text
+        parts = []
+        pos = 0
+        for start, end, slug in self.finditer(text):
+            parts.append(text[pos:start])
+            parts.append(repl(text[start:end], slug))
+            pos = end
+        parts.append(text[pos:])
+        return ''.join(parts)
+
+
+def similar_relevance(my_region: str, tier: int, score: float, distance_mi: float,
+                      r_region: str, r_tier: int, r_score: float, r_dist: float) -> float:
+    """Similar Races relevance of a candidate race to the page's race.
+
+    Same region = 10, same tier = 5, adjacent tier = 2, plus up to 10 for
+    score proximity and up to 5 for distance similarity.
+    """
+    relevance = 0
+    if my_region and r_region == my_region:
+        relevance += 10
+    if r_tier == tier:
+        relevance += 5
+    elif abs(r_tier - tier) == 1:
+        relevance += 2
+    relevance += max(0, 10 - abs(r_score - score) / 5)
+    if distance_mi > 0 and r_dist > 0:
+        dist_ratio = min(distance_mi, r_dist) / max(distance_mi, r_dist)
+        relevance += dist_ratio * 5
+    return relevance
+
+
+class RaceRelations:
+    """One-time relationship index over a race index list."""
+
+    def __init__(self, race_index: list, similar_k: int = SIMILAR_RACES_K):
+        self.race_index = race_index
+        self.similar_k = similar_k
+
+        self.by_slug: dict[str, dict] = {}
+        for r in race_index:
+            slug = r.get('slug')
+            if slug and slug not in self.by_slug:
+                self.by_slug[slug] = r
+
+        # State buckets, best race first. sort() is stable, so ties keep
+        # index order exactly like the old per-page filter-then-sort.
+        self.by_state: dict[str, list[dict]] = {}
+        for r in race_index:
+            state = extract_state(r.get('location', ''))
+            if state:
+                self.by_state.setdefault(state, []).append(r)
+        for bucket in self.by_state.values():
+            bucket.sort(key=lambda r: r.get('overall_score', 0), reverse=True)
+
+        # name → slug, index names first, then aliases that don't collide
+        self.name_map: dict[str, str] = {}
+        for r in race_index:
+            slug = r.get('slug', '')
+            name = r.get('name', '')
+            if name and slug:
+                self.name_map[name] = slug
+        for alias, slug in RACE_NAME_ALIASES.items():
+            self.name_map.setdefault(alias, slug)
+        # Matched against already-escaped page text, so compile escaped names
+        self.name_matcher = RaceNameMatcher(
+            {html.escape(name): slug for name, slug in self.name_map.items()})
+
+        # Similar-race features, extracted once. Each slug's top-k is keyed by
+        # the (tier, score, distance) it was computed for, so a page whose
+        # profile has drifted from a stale index still gets an exact answer.
+        self._features = [
+            (r.get('slug'), r.get('region', ''), r.get('tier', 4),
+             r.get('overall_score', 0), r.get('distance_mi', 0) or 0, r)
+            for r in race_index
+        ]
+        self._similar: dict[str, tuple[tuple, list[dict]]] = {}
+        for slug, _region, tier, score, dist, _r in self._features:
+            if slug and slug not in self._similar:
+                key = (tier, score, dist)
+                self._similar[slug] = (key, self._rank_similar(slug, tier, score, dist))
+
+    def region_of(self, slug: str) -> str:
+        r = self.by_slug.get(slug)
+        return r.get('region', '') if r else ''
+
+    def linkify(self, escaped_text: str, link_class: str = 'gg-alt-link') -> str:
+        """Link known race names in HTML-escaped text to their profile pages."""
+        return self.name_matcher.sub(
+            escaped_text,
+            lambda name, slug: f'<a href="/race/{slug}/" class="{link_class}">{name}</a>')
+
+    def nearby_races(self, slug: str, state: str, k: int = NEARBY_RACES_K) -> list[dict]:
+        """Top-k races in the same state by score, excluding slug."""
+        nearby = []
+        for r in self.by_state.get(state, ()):
+            if r.get('slug') == slug:
+                continue
+            nearby.append(r)
+            if len(nearby) == k:
+                break
+        return nearby
+
+    def similar_races(self, slug: str, tier: int, score: float, distance_mi: float) -> list[dict]:
+        """Top-k most relevant races for a page, excluding itself."""
+        cached = self._similar.get(slug)
+        if cached is not None and cached[0] == (tier, score, distance_mi):
+            return cached[1]
+        return self._rank_similar(slug, tier, score, distance_mi)
+
+    def _rank_similar(self, slug: str, tier: int, score: float, distance_mi: float) -> list[dict]:
+        my_region = self.region_of(slug)
+        candidates = (
+            (similar_relevance(my_region, tier, score, distance_mi,
+                               r_region, r_tier, r_score, r_dist), r)
+            for r_slug, r_region, r_tier, r_score, r_dist, r in self._features
+            if r_slug != slug
+        )
+        # nlargest is documented equivalent to sorted(..., reverse=True)[:k],
+        # including the stable tie order
+        return [r for _, r in heapq.nlargest(self.similar_k, candidates, key=lambda c: c[0])]
+
+
+_RELATIONS_CACHE: RaceRelations | None = None
+
+
+def get_race_relations(race_index: list) -> RaceRelations:
+    """Return the RaceRelations for race_index, building it on first use.
+
+    Cached at module scope on the identity of the list, so every page of an
+    `--all` run shares one build while tests passing their own small
+    indexes still get a fresh one.
+    """
+    global _RELATIONS_CACHE
+    cached = _RELATIONS_CACHE
+    if cached is not None and cached.race_index is race_index and len(race_index) == len(cached._features):
+        return cached
+    _RELATIONS_CACHE = RaceRelations(race_index)
+    return _RELATIONS_CACHE
+
+
+def use_race_relations(relations: RaceRelations) -> None:
+    """Install a prebuilt RaceRelations as the cache (process-pool workers)."""
+    global _RELATIONS_CACHE
+    _RELATIONS_CACHE = relations